@@ -0,0 +1,694 @@
+"""Offline benchmark runner for the llm-spec core engine.
+
+Measures registry loading, case building, stream parsing, schema / stream
+validation, ``required_fields`` path lookups, asset placeholder resolution and
+end-to-end ``run_suites`` throughput against the local mock LLM server, plus the
+memory held by large numbers of verdicts and stream observations (``tracemalloc``)
+and the import cost of the core package and of the first schema lookups (fresh
+interpreters under ``python -X importtime``). Results are written as JSON so runs can
+be compared across commits.
+
+Usage::
+
+    python packages/core/benchmarks/run.py --out .benchmarks/HEAD.json
+    python packages/core/benchmarks/run.py --compare .benchmarks/main.json -k stream
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextvars
+import gc
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from llm_spec.adapters.api_family import APIFamilyAdapter
+from llm_spec.client.http_client import HTTPClient
+from llm_spec.config.loader import AppConfig, ProviderConfig
+from llm_spec.executor import run_suites
+from llm_spec.json_types import Headers
+from llm_spec.path_utils import compile_paths
+from llm_spec.results.result_types import FailureInfo, TestVerdict
+from llm_spec.runners.asset_resolver import AssetResolver
+from llm_spec.runners.parsers import StreamResponseParser
+from llm_spec.runners.schema_registry import get_schema
+from llm_spec.runners.stream_rules import extract_observations, validate_stream
+from llm_spec.suites.registry import Registry, build_executable_cases, load_SuiteSpecs
+from llm_spec.testing.mock_loader import MockDataLoader
+from llm_spec.testing.mock_server import TEST_NAME_HEADER, MockServerConfig, MockServerThread
+from llm_spec.validation.validator import ResponseValidator
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+REGISTRY_DIR = REPO_ROOT / "suites-registry" / "providers"
+MOCKS_DIR = REPO_ROOT / "packages" / "core" / "tests" / "integration" / "mocks"
+
+
+@dataclass
+class Benchmark:
+    """One measurable callable.
+
+    Attributes:
+        name: Stable identifier used to compare runs.
+        fn: Zero-argument callable timed per call.
+        items: Work units processed per call (for throughput).
+    """
+
+    name: str
+    fn: Callable[[], Any]
+    items: int = 1
+
+
+@dataclass
+class ImportBenchmark:
+    """One import-time measurement in a fresh interpreter.
+
+    Attributes:
+        name: Stable identifier used to compare runs.
+        code: Statement run with ``python -X importtime -c``.
+    """
+
+    name: str
+    code: str
+
+
+@dataclass
+class MemoryBenchmark:
+    """One retained-memory measurement.
+
+    Attributes:
+        name: Stable identifier used to compare runs.
+        build: Zero-argument callable; its return value is what gets measured.
+        items: Objects built per call (for bytes per item).
+    """
+
+    name: str
+    build: Callable[[], Any]
+    items: int = 1
+
+
+# ── Synthetic inputs ──────────────────────────────────────
+
+
+def _synthetic_registry(root: Path, models: int) -> Path:
+    """Copy the openai provider and add *models* synthetic model files."""
+    providers = root / "providers"
+    shutil.copytree(REGISTRY_DIR / "openai", providers / "openai")
+    models_dir = providers / "openai" / "models"
+    for i in range(models):
+        (models_dir / f"synthetic-{i:04d}.toml").write_text(
+            f'name = "Synthetic {i}"\nroutes = ["chat_completions", "responses"]\n',
+            encoding="utf-8",
+        )
+    return providers
+
+
+def _synthetic_chat_stream(chunks: int, fragment: int = 97) -> list[bytes]:
+    """Build an OpenAI chat SSE stream and cut it into network-sized fragments."""
+    frames: list[bytes] = []
+    for i in range(chunks):
+        delta = {"role": "assistant", "content": ""} if i == 0 else {"content": f"tok{i} "}
+        data = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "delta": delta, "logprobs": None, "finish_reason": None}],
+        }
+        frames.append(f"data: {json.dumps(data)}\n\n".encode())
+    final = {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion.chunk",
+        "created": 1700000000,
+        "model": "gpt-4o-mini",
+        "choices": [{"index": 0, "delta": {}, "logprobs": None, "finish_reason": "stop"}],
+    }
+    frames.append(f"data: {json.dumps(final)}\n\n".encode())
+    frames.append(b"data: [DONE]\n\n")
+    blob = b"".join(frames)
+    return [blob[i : i + fragment] for i in range(0, len(blob), fragment)]
+
+
+# ── Benchmark definitions ─────────────────────────────────
+
+
+def _registry_benchmarks(tmp: Path, quick: bool) -> Iterator[Benchmark]:
+    yield Benchmark("load_SuiteSpecs[repo]", lambda: load_SuiteSpecs(REGISTRY_DIR))
+
+    models = 50 if quick else 500
+    synthetic = _synthetic_registry(tmp / "registry", models)
+    suites = load_SuiteSpecs(synthetic)
+    yield Benchmark(
+        f"load_SuiteSpecs[synthetic-{models}-models]",
+        lambda: load_SuiteSpecs(synthetic),
+        items=len(suites),
+    )
+
+    repo_suites = load_SuiteSpecs(REGISTRY_DIR)
+    total_cases = sum(len(build_executable_cases(s)) for s in repo_suites)
+    yield Benchmark(
+        "build_executable_cases[repo]",
+        lambda: [build_executable_cases(s) for s in repo_suites],
+        items=total_cases,
+    )
+
+
+def _stream_benchmarks(quick: bool) -> Iterator[Benchmark]:
+    length = 1_000 if quick else 10_000
+    raw = _synthetic_chat_stream(length)
+
+    def _parse() -> Any:
+        return StreamResponseParser("openai").format_stream_response(raw)
+
+    yield Benchmark(f"format_stream_response[openai-chat-{length}]", _parse, items=length)
+
+    _, parsed = _parse()
+    chat = next(
+        s
+        for s in load_SuiteSpecs(REGISTRY_DIR)
+        if s.provider_id == "openai" and s.route_id == "chat_completions"
+    )
+
+    def _validate() -> Any:
+        observations = extract_observations(
+            provider="openai",
+            endpoint=chat.endpoint,
+            parsed_chunks=parsed,
+            raw_chunks=raw,
+            stream_rules=chat.stream_rules,
+        )
+        return validate_stream(
+            provider="openai",
+            endpoint=chat.endpoint,
+            observations=observations,
+            stream_rules=chat.stream_rules,
+        )
+
+    yield Benchmark(f"validate_stream[openai-chat-{length}]", _validate, items=length)
+
+
+_REQUIRED_FIELDS = (
+    "id",
+    "object",
+    "model",
+    "choices[0].index",
+    "choices[0].message.role",
+    "choices[0].message.content",
+    "choices[0].finish_reason",
+    "choices[*].message.tool_calls",
+    "usage.prompt_tokens",
+    "usage.completion_tokens",
+    "usage.total_tokens",
+)
+
+
+def _path_benchmarks(quick: bool) -> Iterator[Benchmark]:
+    """``required_fields`` checks over many chat responses."""
+    count = 1_000 if quick else 10_000
+    bodies = [
+        {
+            "id": f"chatcmpl-{i}",
+            "object": "chat.completion",
+            "model": "gpt-4o-mini",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "ok", "tool_calls": None},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6},
+        }
+        for i in range(count)
+    ]
+
+    def _required() -> Any:
+        return [compile_paths(_REQUIRED_FIELDS).missing(body) for body in bodies]
+
+    yield Benchmark(f"required_fields[openai-chat-{count}]", _required, items=count)
+
+
+def _schema_benchmarks() -> Iterator[Benchmark]:
+    """``validate_json`` for every response schema that has a baseline fixture."""
+    loader = MockDataLoader(MOCKS_DIR)
+    seen: set[str] = set()
+    for suite in load_SuiteSpecs(REGISTRY_DIR):
+        name = suite.schemas.response
+        if not name or name in seen:
+            continue
+        schema = get_schema(name)
+        if schema is None:
+            continue
+        try:
+            data = loader.load_response(suite.provider_id, suite.endpoint, "baseline")
+        except FileNotFoundError:
+            continue
+        if not isinstance(data, dict) or not isinstance(data.get("body"), dict):
+            continue
+        seen.add(name)
+        body = data["body"]
+        yield Benchmark(
+            f"validate_json[{name}]",
+            lambda body=body, schema=schema: ResponseValidator.validate_json(body, schema),
+        )
+
+
+def _mock_benchmarks() -> Iterator[Benchmark]:
+    """Indexed fixture lookups (what every mock-mode request pays)."""
+    loader = MockDataLoader(MOCKS_DIR)
+    loader.preload()
+    keys = []
+    for path in sorted(MOCKS_DIR.glob("*/*/*.json*")):
+        key = (path.parent.parent.name, path.parent.name, path.stem, path.suffix == ".jsonl")
+        try:
+            loader.get_fixture(*key)
+        except ValueError:
+            continue  # legacy stream fixture stored as `.json`
+        keys.append(key)
+    yield Benchmark(
+        f"mock_loader.get_fixture[all-{len(keys)}]",
+        lambda: [loader.get_fixture(*key) for key in keys],
+        items=len(keys),
+    )
+
+
+def _asset_benchmarks() -> Iterator[Benchmark]:
+    source = REGISTRY_DIR / "anthropic" / "routes" / "messages.json5"
+    resolver = AssetResolver(source)
+    params = {
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": f"message {i}"},
+                    {"type": "image", "data": "$asset_base64(assets/images/1x1.png)"},
+                ],
+            }
+            for i in range(200)
+        ]
+    }
+    yield Benchmark(
+        "resolve_placeholders[200-messages]",
+        lambda: resolver.resolve_placeholders(params),
+        items=200,
+    )
+
+
+_TEST_NAMES = [f"param_{i}" for i in range(20)]
+
+
+def _memory_benchmarks(quick: bool) -> Iterator[MemoryBenchmark]:
+    count = 10_000 if quick else 200_000
+
+    def _verdicts() -> list[TestVerdict]:
+        verdicts = []
+        for i in range(count):
+            # Decoded like verdicts loaded from history: equal strings are distinct objects.
+            test_name, status, code = json.loads(
+                f'["{_TEST_NAMES[i % 20]}", "{"fail" if i % 4 == 0 else "pass"}", "HTTP_500"]'
+            )
+            verdicts.append(
+                TestVerdict(
+                    case_id=f"openai:gpt-4o-mini:chat_completions:{test_name}",
+                    test_name=test_name,
+                    status=status,
+                    started_at=f"2026-01-01T00:00:{i % 60:02d}.{i:06d}+00:00",
+                    finished_at=f"2026-01-01T00:01:{i % 60:02d}.{i:06d}+00:00",
+                    latency_ms=i % 5000,
+                    timings={"request": float(i % 5000)},
+                    http_status=500 if status == "fail" else 200,
+                    failure=FailureInfo(stage="request", code=code) if status == "fail" else None,
+                )
+            )
+        return verdicts
+
+    yield MemoryBenchmark(f"memory.verdicts[{count}]", _verdicts, items=count)
+
+    raw = [b"\x00" * 4096] * count
+
+    def _binary() -> Any:
+        return extract_observations(
+            provider="openai",
+            endpoint="/v1/audio/speech",
+            parsed_chunks=None,
+            raw_chunks=raw,
+            stream_rules={"extractor": "binary"},
+        )
+
+    yield MemoryBenchmark(f"memory.binary_observations[{count}-chunks]", _binary, items=count)
+
+    parsed = [json.loads('{"type": "response.output_text.delta", "delta": "x"}')] * count
+
+    def _events() -> Any:
+        return extract_observations(
+            provider="openai",
+            endpoint="/v1/responses",
+            parsed_chunks=parsed,
+            raw_chunks=None,
+            stream_rules=None,
+        )
+
+    yield MemoryBenchmark(f"memory.event_observations[{count}]", _events, items=count)
+
+
+def _import_benchmarks() -> Iterator[ImportBenchmark]:
+    for module in ("llm_spec.executor", "llm_spec.runners.runner"):
+        yield ImportBenchmark(f"import[{module}]", f"import {module}")
+    # First schema lookup: imports only the family that defines the schema.
+    for schema in ("openai.ChatCompletionResponse", "anthropic.MessagesResponse"):
+        yield ImportBenchmark(
+            f"import[get_schema({schema})]",
+            f"from llm_spec.runners.schema_registry import get_schema\nget_schema({schema!r})",
+        )
+
+
+class _HeaderRoutedAdapter(APIFamilyAdapter):
+    """Forward the current test name so the mock server can pick the fixture."""
+
+    _test_name: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+        "bench_test_name", default=None
+    )
+
+    def set_current_test_name(self, test_name: str | None) -> None:
+        self._test_name.set(test_name)
+
+    def prepare_headers(self, additional_headers: Headers | None = None) -> dict[str, str]:
+        headers = super().prepare_headers(additional_headers)
+        headers[TEST_NAME_HEADER] = self._test_name.get() or "baseline"
+        return headers
+
+
+def _e2e_benchmarks(stack: list[Any], concurrency: int) -> Iterator[Benchmark]:
+    server = MockServerThread(MockServerConfig(base_dir=MOCKS_DIR)).__enter__()
+    stack.append(server)
+
+    registry = Registry.from_directory(REGISTRY_DIR)
+    suites = [
+        s
+        for s in registry.list_suites(provider="openai")
+        if (MOCKS_DIR / "openai" / s.endpoint.strip("/").replace("/", "_")).exists()
+    ]
+    suite_ids = [s.suite_id for s in suites]
+    total = sum(len(build_executable_cases(s)) for s in suites)
+    config = AppConfig()
+    config.provider_configs = {
+        "openai": ProviderConfig(api_key="bench", base_url=server.base_url, api_family="openai")
+    }
+
+    def _factory(provider: str, cfg: AppConfig) -> tuple[HTTPClient, APIFamilyAdapter]:
+        provider_cfg = cfg.get_provider_config(provider)
+        http_client = HTTPClient(default_timeout=provider_cfg.timeout)
+        return http_client, _HeaderRoutedAdapter(provider_cfg, http_client, "openai")
+
+    def _run() -> Any:
+        return asyncio.run(
+            run_suites(
+                registry,
+                config,
+                suite_ids=suite_ids,
+                max_concurrent_tests=concurrency,
+                client_factory=_factory,
+            )
+        )
+
+    yield Benchmark(f"run_suites[openai-mock-http-c{concurrency}]", _run, items=total)
+
+
+# ── Measurement / reporting ───────────────────────────────
+
+
+def _measure(bench: Benchmark, rounds: int, min_round_s: float) -> dict[str, Any]:
+    timer = timeit.Timer(bench.fn)
+    bench.fn()  # warmup
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_round_s or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_round_s / 10 else 2
+    samples = [timer.timeit(number) / number for _ in range(rounds)]
+    median = statistics.median(samples)
+    return {
+        "median_s": median,
+        "min_s": min(samples),
+        "mean_s": statistics.fmean(samples),
+        "stdev_s": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "rounds": rounds,
+        "number": number,
+        "items": bench.items,
+        "items_per_s": bench.items / median if median > 0 else None,
+    }
+
+
+def _measure_memory(bench: MemoryBenchmark) -> dict[str, Any]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = bench.build()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return {
+        "bytes": retained,
+        "peak_bytes": peak,
+        "items": bench.items,
+        "bytes_per_item": retained / bench.items,
+    }
+
+
+_IMPORT_PROBE = """\
+import json, sys, time
+_before = set(sys.modules)
+_start = time.perf_counter()
+{code}
+_elapsed = time.perf_counter() - _start
+print(json.dumps([_elapsed, [m for m in sys.modules if m not in _before]]))
+"""
+
+
+def _measure_import(bench: ImportBenchmark, rounds: int) -> dict[str, Any]:
+    """Wall time and new modules of the statement, with the ``-X importtime`` top offenders.
+
+    ``importlib.import_module`` imports are not logged by ``-X importtime``, so the time
+    and module list come from the probe itself; the log only ranks self times.
+    """
+    samples: list[float] = []
+    modules: list[str] = []
+    slowest: list[tuple[str, int]] = []
+    for _ in range(rounds):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _IMPORT_PROBE.format(code=bench.code)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        elapsed, modules = json.loads(proc.stdout.splitlines()[-1])
+        samples.append(elapsed * 1000)
+        rows = [
+            line.removeprefix("import time:").split("|")
+            for line in proc.stderr.splitlines()
+            if line.startswith("import time:") and "[us]" not in line
+        ]
+        self_us = {row[2].strip(): int(row[0]) for row in rows}
+        slowest = sorted(
+            ((name, us) for name, us in self_us.items() if name in modules),
+            key=lambda item: -item[1],
+        )[:5]
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "rounds": rounds,
+        "modules": len(modules),
+        "llm_spec_modules": sum(1 for m in modules if m.startswith("llm_spec")),
+        "schema_modules": sum(1 for m in modules if m.startswith("llm_spec.validation.schemas.")),
+        "slowest_self_us": dict(slowest),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Print a comparison table and return the names that regressed beyond *threshold*."""
+    regressions = _compare_memory(current, baseline, threshold)
+    regressions += _compare_imports(current, baseline, threshold)
+    base_results = baseline.get("results", {})
+    print(f"\n{'benchmark':<55} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for name, result in current["results"].items():
+        base = base_results.get(name)
+        if base is None:
+            print(f"{name:<55} {'-':>12} {result['median_s']:>12.6f} {'new':>8}")
+            continue
+        ratio = result["median_s"] / base["median_s"] if base["median_s"] else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(
+            f"{name:<55} {base['median_s']:>12.6f} {result['median_s']:>12.6f} {ratio:>8.2f}{flag}"
+        )
+    return regressions
+
+
+def _compare_memory(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Like ``_compare`` for the retained bytes per item of the memory benchmarks."""
+    regressions: list[str] = []
+    base_memory = baseline.get("memory", {})
+    if not current.get("memory"):
+        return regressions
+    print(f"\n{'memory benchmark':<55} {'baseline B':>12} {'current B':>12} {'ratio':>8}")
+    for name, result in current["memory"].items():
+        base = base_memory.get(name)
+        per_item = result["bytes_per_item"]
+        if base is None:
+            print(f"{name:<55} {'-':>12} {per_item:>12.1f} {'new':>8}")
+            continue
+        ratio = per_item / base["bytes_per_item"] if base["bytes_per_item"] else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<55} {base['bytes_per_item']:>12.1f} {per_item:>12.1f} {ratio:>8.2f}{flag}")
+    return regressions
+
+
+def _compare_imports(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Like ``_compare`` for the median import time of the import benchmarks."""
+    regressions: list[str] = []
+    base_imports = baseline.get("imports", {})
+    if not current.get("imports"):
+        return regressions
+    print(f"\n{'import benchmark':<55} {'baseline ms':>12} {'current ms':>12} {'ratio':>8}")
+    for name, result in current["imports"].items():
+        base = base_imports.get(name)
+        ms = result["median_ms"]
+        if base is None:
+            print(f"{name:<55} {'-':>12} {ms:>12.1f} {'new':>8}")
+            continue
+        ratio = ms / base["median_ms"] if base["median_ms"] else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<55} {base['median_ms']:>12.1f} {ms:>12.1f} {ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument("-k", dest="filter", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--min-round-seconds", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--quick", action="store_true", help="Smaller synthetic inputs")
+    parser.add_argument("--out", type=Path, help="Write results JSON to this path")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown ratio")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    results: dict[str, Any] = {}
+    memory: dict[str, Any] = {}
+    imports: dict[str, Any] = {}
+    servers: list[Any] = []
+    with tempfile.TemporaryDirectory(prefix="llm-spec-bench-") as tmp:
+        groups = [
+            _registry_benchmarks(Path(tmp), args.quick),
+            _stream_benchmarks(args.quick),
+            _path_benchmarks(args.quick),
+            _schema_benchmarks(),
+            _mock_benchmarks(),
+            _asset_benchmarks(),
+            _e2e_benchmarks(servers, args.concurrency),
+        ]
+        try:
+            for group in groups:
+                for bench in group:
+                    if args.filter and args.filter not in bench.name:
+                        continue
+                    started = time.perf_counter()
+                    results[bench.name] = _measure(bench, args.rounds, args.min_round_seconds)
+                    r = results[bench.name]
+                    rate = f"{r['items_per_s']:.1f} items/s" if r["items"] > 1 else ""
+                    print(
+                        f"{bench.name:<55} {r['median_s'] * 1e3:>10.3f} ms  {rate}"
+                        f"  ({time.perf_counter() - started:.1f}s)"
+                    )
+        finally:
+            for server in servers:
+                server.__exit__(None, None, None)
+
+    for mem_bench in _memory_benchmarks(args.quick):
+        if args.filter and args.filter not in mem_bench.name:
+            continue
+        memory[mem_bench.name] = m = _measure_memory(mem_bench)
+        print(
+            f"{mem_bench.name:<55} {m['bytes'] / 2**20:>10.2f} MiB  "
+            f"{m['bytes_per_item']:.1f} B/item"
+        )
+
+    for import_bench in _import_benchmarks():
+        if args.filter and args.filter not in import_bench.name:
+            continue
+        imports[import_bench.name] = i = _measure_import(import_bench, args.rounds)
+        print(
+            f"{import_bench.name:<55} {i['median_ms']:>10.1f} ms  "
+            f"{i['modules']} modules ({i['schema_modules']} schema)"
+        )
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "results": results,
+        "memory": memory,
+        "imports": imports,
+    }
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nWrote {args.out}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = _compare(report, baseline, args.threshold)
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -107,7 +107,7 @@ class ProviderAdapter(ABC):
                 headers=headers,
                 data=_serialize_form_data(params),
                 files=files,
-                timeout=self.config.timeout,
+                timeout=self.config.http_timeout(),
             )
 
         # Default: JSON body
@@ -116,7 +116,7 @@ class ProviderAdapter(ABC):
             url=url,
             headers=headers,
             json=params,
-            timeout=self.config.timeout,
+            timeout=self.config.http_timeout(),
         )
 
     async def request_async(
@@ -150,7 +150,8 @@ class ProviderAdapter(ABC):
                 headers=headers,
                 data=_serialize_form_data(params),
                 files=files,
-                timeout=self.config.timeout,
+                timeout=self.config.http_timeout(),
+                deadline=self.config.deadline,
             )
 
         return await self.http_client.request_async(
@@ -158,7 +159,8 @@ class ProviderAdapter(ABC):
             url=url,
             headers=headers,
             json=params,
-            timeout=self.config.timeout,
+            timeout=self.config.http_timeout(),
+            deadline=self.config.deadline,
         )
 
     def stream(
@@ -185,7 +187,7 @@ class ProviderAdapter(ABC):
                 headers=headers,
                 data=_serialize_form_data(params),
                 files=files,
-                timeout=self.config.timeout,
+                timeout=self.config.http_timeout(),
             )
 
         return self.http_client.stream(
@@ -193,7 +195,7 @@ class ProviderAdapter(ABC):
             url=url,
             headers=headers,
             json=params,
-            timeout=self.config.timeout,
+            timeout=self.config.http_timeout(),
         )
 
     async def stream_async(
@@ -220,7 +222,9 @@ class ProviderAdapter(ABC):
                 headers=headers,
                 data=_serialize_form_data(params),
                 files=files,
-                timeout=self.config.timeout,
+                timeout=self.config.http_timeout(),
+                deadline=self.config.deadline,
+                idle_timeout=self.config.stream_idle_timeout,
             )
 
         return await self.http_client.stream_async(
@@ -228,5 +232,7 @@ class ProviderAdapter(ABC):
             url=url,
             headers=headers,
             json=params,
-            timeout=self.config.timeout,
+            timeout=self.config.http_timeout(),
+            deadline=self.config.deadline,
+            idle_timeout=self.config.stream_idle_timeout,
         )
@@ -0,0 +1,660 @@
+"""Record-and-replay cassettes for provider traffic.
+
+``RecordingAdapter`` wraps a real adapter and stores every request/response pair
+(streams as raw chunk bytes plus arrival offsets) in a ``CassetteStore``.
+``ReplayAdapter`` serves the stored responses back without touching the network,
+optionally re-creating the original timing (scaled by ``time_scale``), so schema
+or validator changes can be re-checked against real responses in seconds.
+
+Store layout (content-addressed, deduplicated)::
+
+    <root>/entries/<k[:2]>/<key>.json   # request key → response metadata
+    <root>/blobs/<d[:2]>/<digest>.z     # zlib-compressed body / stream bytes
+
+The request key is a SHA-256 over provider, method, endpoint, canonical JSON
+params and uploaded file contents; auth headers and base URL are not part of it,
+so one cassette replays across channels and credentials.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from llm_spec.adapters.base import ProviderAdapter
+from llm_spec.client.http_client import HTTPClient
+from llm_spec.client.spool import buffer_binary
+from llm_spec.client.trace import TransferTrace, trace_transfer
+from llm_spec.config.loader import ProviderConfig
+from llm_spec.json_types import Headers, JSONValue
+
+CASSETTE_VERSION = 1
+
+# Stored bodies are already decoded; these would make httpx decode/frame them again.
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+)
+
+
+class CassetteMissError(LookupError):
+    """No recorded response matches the request."""
+
+
+@dataclass
+class CassetteEntry:
+    """Recorded response metadata (the body lives in the blob store).
+
+    Attributes:
+        key: Request key.
+        provider: Provider name.
+        method: HTTP method.
+        endpoint: Endpoint path.
+        test_name: Test that issued the request (informational).
+        recorded_at: ISO-8601 UTC timestamp.
+        status_code: HTTP status code.
+        headers: Response headers (lower-cased, transport headers dropped).
+        stream: Whether this was a streaming request.
+        body: Digest of the body blob (streams: all chunks concatenated).
+        chunk_sizes: Byte length of each stream chunk.
+        chunk_offsets_ms: Arrival of each stream chunk since the request started.
+        ttfb_ms: Time until the response headers arrived.
+        elapsed_ms: Total request time.
+    """
+
+    key: str
+    provider: str
+    method: str
+    endpoint: str
+    status_code: int
+    body: str
+    test_name: str | None = None
+    recorded_at: str = ""
+    headers: dict[str, str] = field(default_factory=dict)
+    stream: bool = False
+    chunk_sizes: list[int] = field(default_factory=list)
+    chunk_offsets_ms: list[float] = field(default_factory=list)
+    ttfb_ms: float = 0.0
+    elapsed_ms: float = 0.0
+
+
+def request_key(
+    provider: str,
+    method: str,
+    endpoint: str,
+    params: JSONValue,
+    files: Any | None = None,
+    *,
+    stream: bool = False,
+) -> str:
+    """Compute the content key of a request.
+
+    Args:
+        provider: Provider name.
+        method: HTTP method.
+        endpoint: Endpoint path.
+        params: JSON (or form) params.
+        files: httpx-style files mapping ``{field: (filename, fileobj, mime)}``.
+        stream: Whether the request is streamed.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    canonical = {
+        "provider": provider,
+        "method": method.upper(),
+        "endpoint": "/" + endpoint.strip("/"),
+        "stream": stream,
+        "params": params,
+        "files": _files_digest(files),
+    }
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _files_digest(files: Any | None) -> list[list[str]]:
+    if not files:
+        return []
+    items = files.items() if isinstance(files, dict) else files
+    digests: list[list[str]] = []
+    for name, value in items:
+        filename, mime = "", ""
+        content: Any = value
+        if isinstance(value, tuple):
+            filename = str(value[0]) if len(value) > 0 else ""
+            content = value[1] if len(value) > 1 else b""
+            mime = str(value[2]) if len(value) > 2 else ""
+        if hasattr(content, "read"):
+            # Hash the whole upload, wherever the handle currently points.
+            pos = content.tell()
+            content.seek(0)
+            data = content.read()
+            content.seek(pos)
+        else:
+            data = content
+        if isinstance(data, str):
+            data = data.encode()
+        digests.append([str(name), filename, mime, hashlib.sha256(data or b"").hexdigest()])
+    return sorted(digests)
+
+
+class CassetteStore:
+    """Content-addressed store of recorded responses. Thread-safe.
+
+    Entries are cached in memory after the first read; writes are atomic
+    (temp file + rename), so concurrent recorders never leave partial files.
+    """
+
+    _shared: dict[Path, CassetteStore] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, root: str | Path):
+        """Initialize the store.
+
+        Args:
+            root: Cassette directory (created on first write).
+        """
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._entries: dict[str, CassetteEntry | None] = {}
+
+    @classmethod
+    def shared(cls, root: str | Path) -> CassetteStore:
+        """Return the process-wide store for *root*."""
+        key = Path(root).resolve()
+        with cls._shared_lock:
+            store = cls._shared.get(key)
+            if store is None:
+                store = cls._shared[key] = cls(root)
+            return store
+
+    # ── Entries ───────────────────────────────────────────
+
+    def get(self, key: str) -> CassetteEntry | None:
+        """Return the entry recorded for *key*, if any."""
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+        path = self._entry_path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            entry = None
+        else:
+            data.pop("version", None)
+            entry = CassetteEntry(**data)
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def put(self, entry: CassetteEntry) -> None:
+        """Store (or replace) an entry."""
+        data = {"version": CASSETTE_VERSION, **asdict(entry)}
+        self._write_atomic(self._entry_path(entry.key), json.dumps(data, indent=2).encode())
+        with self._lock:
+            self._entries[entry.key] = entry
+
+    def __len__(self) -> int:
+        return sum(1 for _ in (self.root / "entries").glob("*/*.json"))
+
+    # ── Blobs ─────────────────────────────────────────────
+
+    def put_blob(self, data: bytes) -> str:
+        """Store *data* (once per distinct content) and return its digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not path.exists():
+            self._write_atomic(path, zlib.compress(data))
+        return digest
+
+    def get_blob(self, digest: str) -> bytes:
+        """Return the content stored under *digest*.
+
+        Raises:
+            CassetteMissError: If the blob is missing.
+        """
+        try:
+            return zlib.decompress(self._blob_path(digest).read_bytes())
+        except FileNotFoundError:
+            raise CassetteMissError(f"cassette blob missing: {digest}") from None
+
+    def record(
+        self,
+        *,
+        key: str,
+        provider: str,
+        method: str,
+        endpoint: str,
+        test_name: str | None,
+        status_code: int,
+        headers: httpx.Headers | dict[str, str],
+        chunks: list[bytes],
+        stream: bool,
+        trace: TransferTrace | None = None,
+        elapsed_ms: float = 0.0,
+    ) -> CassetteEntry:
+        """Store one response under *key*.
+
+        Args:
+            key: Request key (``request_key``).
+            provider: Provider name.
+            method: HTTP method.
+            endpoint: Endpoint path.
+            test_name: Issuing test.
+            status_code: Response status.
+            headers: Response headers.
+            chunks: Body chunks (a single chunk for non-stream responses).
+            stream: Whether the request was streamed.
+            trace: Transfer timing, when available.
+            elapsed_ms: Total request time.
+
+        Returns:
+            The stored entry.
+        """
+        offsets = trace.chunk_offsets_ms() if trace is not None else []
+        if len(offsets) != len(chunks):
+            offsets = [elapsed_ms] * len(chunks) if stream else []
+        ttfb = trace.ttfb_ms if trace is not None else None
+        entry = CassetteEntry(
+            key=key,
+            provider=provider,
+            method=method.upper(),
+            endpoint=endpoint,
+            test_name=test_name,
+            recorded_at=datetime.now(UTC).isoformat(),
+            status_code=status_code,
+            headers={k.lower(): v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS},
+            stream=stream,
+            body=self.put_blob(b"".join(chunks)),
+            chunk_sizes=[len(c) for c in chunks] if stream else [],
+            chunk_offsets_ms=[round(o, 3) for o in offsets],
+            ttfb_ms=round(ttfb if ttfb is not None else elapsed_ms, 3),
+            elapsed_ms=round(elapsed_ms, 3),
+        )
+        self.put(entry)
+        return entry
+
+    # ── Paths ─────────────────────────────────────────────
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / "entries" / key[:2] / f"{key}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / f"{digest}.z"
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+# ── Recording ─────────────────────────────────────────────
+
+
+class RecordingAdapter(ProviderAdapter):
+    """Adapter wrapper that records every response of *inner* into a cassette.
+
+    Successful responses, HTTP error responses (including streamed ones, which are
+    re-raised as ``httpx.HTTPStatusError``) are recorded; transport errors are not.
+
+    Attributes:
+        inner: The wrapped adapter that performs the real requests.
+        store: Destination cassette store.
+        provider_name: Provider name used in request keys.
+    """
+
+    def __init__(self, inner: ProviderAdapter, store: CassetteStore, provider_name: str):
+        """Initialize the recorder.
+
+        Args:
+            inner: Adapter performing the real requests.
+            store: Cassette store to write to.
+            provider_name: Provider name used in request keys.
+        """
+        super().__init__(config=inner.config, http_client=inner.http_client)
+        self.inner = inner
+        self.store = store
+        self.provider_name = provider_name
+        self._current_test_name: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+            "cassette_record_test_name", default=None
+        )
+
+    def set_current_test_name(self, test_name: str | None) -> None:
+        self._current_test_name.set(test_name)
+        self.inner.set_current_test_name(test_name)
+
+    def prepare_headers(self, additional_headers: Headers | None = None) -> dict[str, str]:
+        return self.inner.prepare_headers(additional_headers)
+
+    def get_base_url(self) -> str:
+        return self.inner.get_base_url()
+
+    def _key(
+        self, endpoint: str, params: JSONValue, method: str, files: Any | None, *, stream: bool
+    ) -> str:
+        # Computed before sending: the transport reads upload handles to EOF.
+        return request_key(self.provider_name, method, endpoint, params, files, stream=stream)
+
+    def _record(
+        self,
+        call: tuple[str, str, str],
+        status_code: int,
+        headers: httpx.Headers | dict[str, str],
+        chunks: list[bytes],
+        *,
+        stream: bool,
+        trace: TransferTrace,
+    ) -> None:
+        key, endpoint, method = call
+        self.store.record(
+            key=key,
+            provider=self.provider_name,
+            method=method,
+            endpoint=endpoint,
+            test_name=self._current_test_name.get(),
+            status_code=status_code,
+            headers=headers,
+            chunks=chunks,
+            stream=stream,
+            trace=trace,
+            elapsed_ms=(time.perf_counter() - trace.started) * 1000,
+        )
+
+    def _record_error(
+        self,
+        call: tuple[str, str, str],
+        error: httpx.HTTPStatusError,
+        trace: TransferTrace,
+    ) -> None:
+        response = error.response
+        self._record(
+            call,
+            response.status_code,
+            response.headers,
+            [response.content],
+            stream=True,
+            trace=trace,
+        )
+
+    def request(
+        self,
+        endpoint: str,
+        params: JSONValue,
+        additional_headers: Headers | None = None,
+        method: str = "POST",
+        files: Any | None = None,
+    ) -> httpx.Response:
+        """Send the request through *inner* and record the response."""
+        call = (self._key(endpoint, params, method, files, stream=False), endpoint, method)
+        with trace_transfer() as trace:
+            response = self.inner.request(endpoint, params, additional_headers, method, files)
+        self._record(
+            call,
+            response.status_code,
+            response.headers,
+            [response.content],
+            stream=False,
+            trace=trace,
+        )
+        return response
+
+    async def request_async(
+        self,
+        endpoint: str,
+        params: JSONValue,
+        additional_headers: Headers | None = None,
+        method: str = "POST",
+        files: Any | None = None,
+    ) -> httpx.Response:
+        """Send the request through *inner* and record the response."""
+        call = (self._key(endpoint, params, method, files, stream=False), endpoint, method)
+        with trace_transfer() as trace, buffer_binary():
+            response = await self.inner.request_async(
+                endpoint, params, additional_headers, method, files
+            )
+        await asyncio.to_thread(
+            self._record,
+            call,
+            response.status_code,
+            response.headers,
+            [response.content],
+            stream=False,
+            trace=trace,
+        )
+        return response
+
+    def stream(
+        self,
+        endpoint: str,
+        params: JSONValue,
+        additional_headers: Headers | None = None,
+        method: str = "POST",
+        files: Any | None = None,
+    ) -> tuple[int, list[bytes]]:
+        """Stream through *inner* and record the chunks with their timing."""
+        call = (self._key(endpoint, params, method, files, stream=True), endpoint, method)
+        with trace_transfer() as trace:
+            try:
+                status_code, chunks = self.inner.stream(
+                    endpoint, params, additional_headers, method, files
+                )
+            except httpx.HTTPStatusError as e:
+                self._record_error(call, e, trace)
+                raise
+        self._record(call, status_code, trace.headers, chunks, stream=True, trace=trace)
+        return status_code, chunks
+
+    async def stream_async(
+        self,
+        endpoint: str,
+        params: JSONValue,
+        additional_headers: Headers | None = None,
+        method: str = "POST",
+        files: Any | None = None,
+    ) -> tuple[int, list[bytes]]:
+        """Stream through *inner* and record the chunks with their timing."""
+        call = (self._key(endpoint, params, method, files, stream=True), endpoint, method)
+        with trace_transfer() as trace:
+            try:
+                status_code, chunks = await self.inner.stream_async(
+                    endpoint, params, additional_headers, method, files
+                )
+            except httpx.HTTPStatusError as e:
+                await asyncio.to_thread(self._record_error, call, e, trace)
+                raise
+        await asyncio.to_thread(
+            self._record, call, status_code, trace.headers, chunks, stream=True, trace=trace
+        )
+        return status_code, chunks
+
+
+# ── Replay ────────────────────────────────────────────────
+
+
+class ReplayAdapter(ProviderAdapter):
+    """Adapter that serves responses from a cassette instead of the network.
+
+    Attributes:
+        store: Cassette store to read from.
+        provider_name: Provider name used in request keys.
+        time_scale: Multiplier applied to recorded timing: ``0`` replays instantly,
+            ``1`` reproduces the original pacing, ``0.1`` runs ten times faster.
+    """
+
+    def __init__(
+        self,
+        config: ProviderConfig,
+        store: CassetteStore,
+        provider_name: str,
+        *,
+        time_scale: float = 0.0,
+    ):
+        """Initialize the replay adapter.
+
+        Args:
+            config: Provider configuration (only ``base_url``/``timeout`` are used).
+            store: Cassette store to read from.
+            provider_name: Provider name used in request keys.
+            time_scale: Timing multiplier (see class docs).
+        """
+        super().__init__(config=config, http_client=HTTPClient(default_timeout=config.timeout))
+        self.store = store
+        self.provider_name = provider_name
+        self.time_scale = max(0.0, time_scale)
+
+    def prepare_headers(self, additional_headers: Headers | None = None) -> dict[str, str]:
+        return dict(additional_headers or {})
+
+    def _lookup(
+        self, endpoint: str, params: JSONValue, method: str, files: Any | None, stream: bool
+    ) -> tuple[CassetteEntry, bytes]:
+        key = request_key(self.provider_name, method, endpoint, params, files, stream=stream)
+        entry = self.store.get(key)
+        if entry is None:
+            raise CassetteMissError(
+                f"No recorded response for {method.upper()} {self.provider_name}{endpoint} "
+                f"(key {key[:12]}) in {self.store.root}"
+            )
+        return entry, self.store.get_blob(entry.body)
+
+    def _response(self, entry: CassetteEntry, body: bytes) -> httpx.Response:
+        url = self.get_base_url().rstrip("/") + entry.endpoint
+        return httpx.Response(
+            entry.status_code,
+            headers=entry.headers,
+            content=body,
+            request=httpx.Request(entry.method, url),
+        )
+
+    @staticmethod
+    def _split(entry: CassetteEntry, body: bytes) -> list[bytes]:
+        chunks, pos = [], 0
+        for size in entry.chunk_sizes:
+            chunks.append(body[pos : pos + size])
+            pos += size
+        return chunks
+
+    def _delays(self, entry: CassetteEntry) -> tuple[float, list[float]]:
+        """Return (delay before the response, delay before each chunk) in seconds."""
+        scale = self.time_scale / 1000.0
+        if scale <= 0:
+            return 0.0, [0.0] * len(entry.chunk_sizes)
+        previous = entry.ttfb_ms
+        gaps = []
+        for offset in entry.chunk_offsets_ms:
+            gaps.append(max(0.0, offset - previous) * scale)
+            previous = max(previous, offset)
+        gaps += [0.0] * (len(entry.chunk_sizes) - len(gaps))
+        head = entry.ttfb_ms if entry.stream else entry.elapsed_ms
+        return head * scale, gaps
+
+    def _stream_result(self, entry: CassetteEntry, body: bytes) -> tuple[int, list[bytes]]:
+        if entry.status_code >= 400:
+            response = self._response(entry, body)
+            raise httpx.HTTPStatusError(
+                f"Recorded HTTP {entry.status_code}", request=response.request, response=response
+            )
+        return entry.status_code, self._split(entry, body)
+
+    def request(
+        self,
+        endpoint: str,
+        params: JSONValue,
+        additional_headers: Headers | None = None,
+        method: str = "POST",
+        files: Any | None = None,
+    ) -> httpx.Response:
+        """Return the recorded response.
+
+        Raises:
+            CassetteMissError: If the request was never recorded.
+        """
+        entry, body = self._lookup(endpoint, params, method, files, stream=False)
+        head, _ = self._delays(entry)
+        if head:
+            time.sleep(head)
+        return self._response(entry, body)
+
+    async def request_async(
+        self,
+        endpoint: str,
+        params: JSONValue,
+        additional_headers: Headers | None = None,
+        method: str = "POST",
+        files: Any | None = None,
+    ) -> httpx.Response:
+        """Return the recorded response.
+
+        Raises:
+            CassetteMissError: If the request was never recorded.
+        """
+        entry, body = await asyncio.to_thread(
+            self._lookup, endpoint, params, method, files, stream=False
+        )
+        head, _ = self._delays(entry)
+        if head:
+            await asyncio.sleep(head)
+        return self._response(entry, body)
+
+    def stream(
+        self,
+        endpoint: str,
+        params: JSONValue,
+        additional_headers: Headers | None = None,
+        method: str = "POST",
+        files: Any | None = None,
+    ) -> tuple[int, list[bytes]]:
+        """Return the recorded stream chunks.
+
+        Raises:
+            CassetteMissError: If the request was never recorded.
+            httpx.HTTPStatusError: If the recorded response was an HTTP error.
+        """
+        entry, body = self._lookup(endpoint, params, method, files, stream=True)
+        head, gaps = self._delays(entry)
+        total = head + sum(gaps)
+        if total:
+            time.sleep(total)
+        return self._stream_result(entry, body)
+
+    async def stream_async(
+        self,
+        endpoint: str,
+        params: JSONValue,
+        additional_headers: Headers | None = None,
+        method: str = "POST",
+        files: Any | None = None,
+    ) -> tuple[int, list[bytes]]:
+        """Return the recorded stream chunks.
+
+        Raises:
+            CassetteMissError: If the request was never recorded.
+            httpx.HTTPStatusError: If the recorded response was an HTTP error.
+        """
+        entry, body = await asyncio.to_thread(
+            self._lookup, endpoint, params, method, files, stream=True
+        )
+        head, gaps = self._delays(entry)
+        total = head + sum(gaps)
+        if total:
+            await asyncio.sleep(total)
+        return self._stream_result(entry, body)
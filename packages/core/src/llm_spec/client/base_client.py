@@ -9,6 +9,9 @@ import httpx
 
 from llm_spec.json_types import Headers, JSONValue
 
+Timeout = float | httpx.Timeout
+"""A single limit in seconds, or per-phase (connect/read/write/pool) limits."""
+
 
 class BaseHTTPClient(ABC):
     """Abstract HTTP client defining the interface for all HTTP operations."""
@@ -22,7 +25,7 @@ class BaseHTTPClient(ABC):
         json: JSONValue | None = None,
         data: Any | None = None,
         files: Any | None = None,
-        timeout: float | None = None,
+        timeout: Timeout | None = None,
     ) -> httpx.Response:
         """Send a synchronous HTTP request.
 
@@ -33,7 +36,7 @@ class BaseHTTPClient(ABC):
             json: JSON request body
             data: form data
             files: upload files
-            timeout: timeout in seconds
+            timeout: timeout in seconds, or an ``httpx.Timeout`` with per-phase limits
 
         Returns:
             httpx.Response
@@ -52,7 +55,8 @@ class BaseHTTPClient(ABC):
         json: JSONValue | None = None,
         data: Any | None = None,
         files: Any | None = None,
-        timeout: float | None = None,
+        timeout: Timeout | None = None,
+        deadline: float | None = None,
     ) -> httpx.Response:
         """Send an asynchronous HTTP request.
 
@@ -63,12 +67,14 @@ class BaseHTTPClient(ABC):
             json: JSON request body
             data: form data
             files: upload files
-            timeout: timeout in seconds
+            timeout: timeout in seconds, or an ``httpx.Timeout`` with per-phase limits
+            deadline: limit in seconds for the whole exchange
 
         Returns:
             httpx.Response
 
         Raises:
+            DeadlineExceededError: if *deadline* expires.
             Exception: various HTTP/network errors
         """
         pass
@@ -82,7 +88,7 @@ class BaseHTTPClient(ABC):
         json: JSONValue | None = None,
         data: Any | None = None,
         files: Any | None = None,
-        timeout: float | None = None,
+        timeout: Timeout | None = None,
     ) -> tuple[int, list[bytes]]:
         """Send a synchronous streaming request (Server-Sent Events).
 
@@ -95,7 +101,7 @@ class BaseHTTPClient(ABC):
             json: JSON request body
             data: form data
             files: upload files
-            timeout: timeout in seconds
+            timeout: timeout in seconds, or an ``httpx.Timeout`` with per-phase limits
 
         Returns:
             ``(status_code, chunks)`` tuple.
@@ -114,7 +120,9 @@ class BaseHTTPClient(ABC):
         json: JSONValue | None = None,
         data: Any | None = None,
         files: Any | None = None,
-        timeout: float | None = None,
+        timeout: Timeout | None = None,
+        deadline: float | None = None,
+        idle_timeout: float | None = None,
     ) -> tuple[int, list[bytes]]:
         """Send an asynchronous streaming request (Server-Sent Events).
 
@@ -127,12 +135,16 @@ class BaseHTTPClient(ABC):
             json: JSON request body
             data: form data
             files: upload files
-            timeout: timeout in seconds
+            timeout: timeout in seconds, or an ``httpx.Timeout`` with per-phase limits
+            deadline: limit in seconds for the whole exchange, stream included
+            idle_timeout: limit in seconds between two stream chunks
 
         Returns:
             ``(status_code, chunks)`` tuple.
 
         Raises:
             httpx.HTTPStatusError: on 4xx/5xx responses.
+            StreamStalledError: if *idle_timeout* expires.
+            DeadlineExceededError: if *deadline* expires.
         """
         pass
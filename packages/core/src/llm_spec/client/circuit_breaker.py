@@ -0,0 +1,162 @@
+"""Per-provider circuit breaker.
+
+When a provider or gateway goes down, every remaining case would otherwise wait out
+its full timeout while holding a concurrency slot. ``run_suites(circuit_breakers=...)``
+asks the provider's breaker before sending each case:
+
+- **closed**: requests flow; outcomes are kept in a sliding window. Once the window
+  holds ``min_requests`` outcomes and the share of outage failures (connection errors,
+  timeouts, 5xx) reaches ``failure_rate``, the breaker opens.
+- **open**: cases fail immediately with ``CIRCUIT_OPEN`` for ``cooldown_s`` seconds.
+- **half-open**: up to ``probes`` requests go through. A success closes the breaker,
+  a failure opens it again for another cooldown.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from llm_spec.client.errors import OUTAGE_CODES
+
+if TYPE_CHECKING:
+    from llm_spec.results.result_types import TestVerdict
+
+logger = logging.getLogger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Thresholds shared by every breaker of a ``CircuitBreakers`` set."""
+
+    failure_rate: float = 0.5
+    min_requests: int = 5
+    window_s: float = 30.0
+    cooldown_s: float = 10.0
+    probes: int = 1
+
+
+def is_outage(verdict: TestVerdict) -> bool:
+    """Whether *verdict* counts as an upstream outage (connection error, timeout, 5xx)."""
+    failure = verdict.failure
+    if failure is None or failure.stage != "request":
+        return False
+    if verdict.http_status is not None:
+        return verdict.http_status >= 500
+    return failure.code in OUTAGE_CODES
+
+
+class CircuitBreaker:
+    """Failure-rate breaker for one provider (not thread-safe; use from one loop)."""
+
+    def __init__(
+        self,
+        name: str,
+        config: CircuitBreakerConfig | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.config = config or CircuitBreakerConfig()
+        self._clock = clock
+        self._state: CircuitState = "closed"
+        self._window: deque[tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == "open" and self.retry_after() == 0:
+            return "half_open"
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a probe through (0 when not open)."""
+        if self._state != "open":
+            return 0.0
+        return max(0.0, self._opened_at + self.config.cooldown_s - self._clock())
+
+    def allow(self) -> bool:
+        """Reserve a request; ``False`` means fail fast.
+
+        Every allowed request must be followed by ``record()`` (or ``release()`` if it
+        was never sent).
+        """
+        if self._state == "open":
+            if self.retry_after() > 0:
+                return False
+            self._state = "half_open"
+            self._probes = 0
+            logger.info("circuit %s half-open", self.name)
+        if self._state == "half_open":
+            if self._probes >= self.config.probes:
+                return False
+            self._probes += 1
+        return True
+
+    def release(self) -> None:
+        """Give back a reservation whose request was not sent."""
+        if self._state == "half_open" and self._probes:
+            self._probes -= 1
+
+    def record(self, failure: bool) -> None:
+        """Record the outcome of an allowed request."""
+        now = self._clock()
+        if self._state == "half_open":
+            self._probes = max(0, self._probes - 1)
+            if failure:
+                self._open(now)
+            else:
+                self._state = "closed"
+                self._window.clear()
+                logger.info("circuit %s closed", self.name)
+            return
+        if self._state == "open":
+            return  # late result of a request sent before the breaker opened
+        window = self._window
+        window.append((now, failure))
+        while window and window[0][0] < now - self.config.window_s:
+            window.popleft()
+        failures = sum(1 for _, failed in window if failed)
+        if (
+            len(window) >= self.config.min_requests
+            and failures / len(window) >= self.config.failure_rate
+        ):
+            self._open(now)
+
+    def _open(self, now: float) -> None:
+        self._state = "open"
+        self._opened_at = now
+        self._window.clear()
+        logger.warning(
+            "circuit %s open for %.1fs after upstream failures", self.name, self.config.cooldown_s
+        )
+
+
+class CircuitBreakers:
+    """Breakers keyed by provider, created on first use with a shared config."""
+
+    def __init__(
+        self,
+        config: CircuitBreakerConfig | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.config = config or CircuitBreakerConfig()
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, provider: str) -> CircuitBreaker:
+        breaker = self._breakers.get(provider)
+        if breaker is None:
+            breaker = CircuitBreaker(provider, self.config, self._clock)
+            self._breakers[provider] = breaker
+        return breaker
+
+    def states(self) -> dict[str, CircuitState]:
+        """Current state per provider."""
+        return {name: breaker.state for name, breaker in self._breakers.items()}
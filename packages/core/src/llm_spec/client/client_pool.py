@@ -0,0 +1,49 @@
+"""Shared HTTPClient pool.
+
+Long-lived callers (e.g. the web execution service) keep one pool per event loop so
+that consecutive tasks reuse keep-alive connections instead of opening a fresh
+connection pool for every run.
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+
+from llm_spec.client.http_client import HTTPClient
+from llm_spec.client.spool import BlobStore
+
+
+class HTTPClientPool:
+    """Cache of ``HTTPClient`` instances keyed by ``(provider, base_url)``.
+
+    httpx async clients are bound to the event loop they were first used on, so a
+    pool must only be used from a single loop. The caller owns the pool and must
+    call ``close_async()`` on shutdown. Spooled binary bodies go to *blob_store*, if given.
+    """
+
+    def __init__(self, blob_store: BlobStore | None = None) -> None:
+        self.blob_store = blob_store
+        self._clients: dict[tuple[str, str], HTTPClient] = {}
+        self._lock = Lock()
+
+    def get(self, provider: str, base_url: str, default_timeout: float = 30.0) -> HTTPClient:
+        """Return the pooled client for one provider endpoint, creating it on first use."""
+        key = (provider, base_url)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = HTTPClient(default_timeout=default_timeout, blob_store=self.blob_store)
+                self._clients[key] = client
+            return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    async def close_async(self) -> None:
+        """Close every pooled client and forget them."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+            await client.close_async()
@@ -0,0 +1,64 @@
+"""Transport failures and the verdict codes they map to.
+
+``TestRunner`` reports every request that raised with ``transport_error_code(exc)``:
+
+- ``CONNECT_TIMEOUT`` / ``READ_TIMEOUT`` / ``WRITE_TIMEOUT`` / ``POOL_TIMEOUT``: the
+  matching ``httpx.Timeout`` phase expired (``ProviderConfig.connect_timeout`` etc.)
+- ``STREAM_STALLED``: no stream chunk for ``ProviderConfig.stream_idle_timeout``
+- ``DEADLINE_EXCEEDED``: the whole exchange outlived ``ProviderConfig.deadline``
+- ``CONNECTION_ERROR``: anything else (DNS, refused, reset, TLS, ...)
+"""
+
+from __future__ import annotations
+
+import httpx
+
+OUTAGE_CODES = frozenset(
+    {
+        "CONNECTION_ERROR",
+        "CONNECT_TIMEOUT",
+        "READ_TIMEOUT",
+        "WRITE_TIMEOUT",
+        "STREAM_STALLED",
+        "DEADLINE_EXCEEDED",
+    }
+)
+"""Codes that point at the upstream (``POOL_TIMEOUT`` is local congestion)."""
+
+UNREACHABLE_CODES = frozenset({"CONNECTION_ERROR", "CONNECT_TIMEOUT"})
+"""Codes meaning no request reached the upstream at all."""
+
+_TIMEOUT_CODES: tuple[tuple[type[httpx.TimeoutException], str], ...] = (
+    (httpx.ConnectTimeout, "CONNECT_TIMEOUT"),
+    (httpx.ReadTimeout, "READ_TIMEOUT"),
+    (httpx.WriteTimeout, "WRITE_TIMEOUT"),
+    (httpx.PoolTimeout, "POOL_TIMEOUT"),
+)
+
+
+class StreamStalledError(Exception):
+    """A stream produced no chunk within its idle timeout."""
+
+    def __init__(self, idle_timeout: float) -> None:
+        super().__init__(f"no stream data for {idle_timeout:g}s")
+        self.idle_timeout = idle_timeout
+
+
+class DeadlineExceededError(Exception):
+    """A request (including its whole stream) outlived its deadline."""
+
+    def __init__(self, deadline: float) -> None:
+        super().__init__(f"request exceeded its {deadline:g}s deadline")
+        self.deadline = deadline
+
+
+def transport_error_code(exc: BaseException) -> str:
+    """Return the verdict failure code for an exception raised by a request."""
+    if isinstance(exc, StreamStalledError):
+        return "STREAM_STALLED"
+    if isinstance(exc, DeadlineExceededError):
+        return "DEADLINE_EXCEEDED"
+    for exc_type, code in _TIMEOUT_CODES:
+        if isinstance(exc, exc_type):
+            return code
+    return "CONNECTION_ERROR"
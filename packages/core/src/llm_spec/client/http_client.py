@@ -2,16 +2,38 @@
 
 Transport-only layer: does not handle logging, schema validation, or other business logic.
 Those responsibilities belong to upper layers (adapters/runners).
+
+``timeout`` accepts a float or an ``httpx.Timeout`` (separate connect/read/write/pool
+limits). The async methods additionally take a ``deadline`` for the whole exchange
+(``DeadlineExceededError``) and ``stream_async`` an ``idle_timeout`` between chunks
+(``StreamStalledError``); httpx's read timeout alone lets a stream that trickles a
+byte just under it hold its slot indefinitely.
+
+Successful binary bodies (audio, images) of ``request_async`` are spooled rather than
+buffered (see ``llm_spec.client.spool``) unless ``spool_binary=False``.
 """
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
 
-from llm_spec.client.base_client import BaseHTTPClient
+from llm_spec.client.base_client import BaseHTTPClient, Timeout
+from llm_spec.client.errors import DeadlineExceededError, StreamStalledError
+from llm_spec.client.spool import (
+    BODY_EXTENSION,
+    BinarySpool,
+    BlobStore,
+    buffering_binary,
+    is_binary_content_type,
+)
+from llm_spec.client.trace import current_trace
 from llm_spec.json_types import Headers, JSONValue
+from llm_spec.telemetry import http_attempt
 
 
 class HTTPClient(BaseHTTPClient):
@@ -21,13 +43,24 @@ class HTTPClient(BaseHTTPClient):
     Single responsibility: HTTP transport only (no logging/validation).
     """
 
-    def __init__(self, default_timeout: float = 30.0):
+    def __init__(
+        self,
+        default_timeout: float = 30.0,
+        *,
+        spool_binary: bool = True,
+        blob_store: BlobStore | None = None,
+    ):
         """Initialize the HTTP client.
 
         Args:
             default_timeout: default timeout in seconds
+            spool_binary: summarise binary bodies of async requests while they stream in
+                instead of holding them in memory
+            blob_store: keep spooled bodies here (by default only their summary is kept)
         """
         self.default_timeout = default_timeout
+        self.spool_binary = spool_binary
+        self.blob_store = blob_store
         # Lazy-initialized clients (connection pooling)
         self._sync_client: httpx.Client | None = None
         self._async_client: httpx.AsyncClient | None = None
@@ -66,7 +99,7 @@ class HTTPClient(BaseHTTPClient):
         json: JSONValue | None = None,
         data: Any | None = None,
         files: Any | None = None,
-        timeout: float | None = None,
+        timeout: Timeout | None = None,
     ) -> httpx.Response:
         """Send a synchronous HTTP request.
 
@@ -74,18 +107,24 @@ class HTTPClient(BaseHTTPClient):
         """
         timeout_val = timeout if timeout is not None else self.default_timeout
 
-        # Use the pooled client
-        response = self.sync_client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=json,
-            data=data,
-            files=files,
-            timeout=timeout_val,
-        )
-
-        return response
+        with http_attempt(method, url):
+            trace = current_trace()
+            # Use the pooled client
+            response = self.sync_client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json,
+                data=data,
+                files=files,
+                timeout=timeout_val,
+                extensions=trace.extensions(is_async=False) if trace else None,
+            )
+            if trace is not None:
+                trace.on_response(response)
+                trace.on_complete(response)
+
+            return response
 
     async def request_async(
         self,
@@ -95,25 +134,62 @@ class HTTPClient(BaseHTTPClient):
         json: JSONValue | None = None,
         data: Any | None = None,
         files: Any | None = None,
-        timeout: float | None = None,
+        timeout: Timeout | None = None,
+        deadline: float | None = None,
     ) -> httpx.Response:
         """Send an asynchronous HTTP request.
 
         Transport only; logging is handled by upper layers.
+
+        Raises:
+            DeadlineExceededError: if the exchange takes longer than *deadline* seconds.
         """
         timeout_val = timeout if timeout is not None else self.default_timeout
 
-        response = await self.async_client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=json,
-            data=data,
-            files=files,
-            timeout=timeout_val,
-        )
-
-        return response
+        with http_attempt(method, url):
+            trace = current_trace()
+            async with _deadline(deadline):
+                request = self.async_client.build_request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    json=json,
+                    data=data,
+                    files=files,
+                    timeout=timeout_val,
+                    extensions=trace.extensions(is_async=True) if trace else None,
+                )
+                response = await self.async_client.send(request, stream=True)
+                try:
+                    if trace is not None:
+                        trace.on_response(response)
+                    await self._read_body(response)
+                finally:
+                    await response.aclose()
+            if trace is not None:
+                trace.on_complete(response)
+
+            return response
+
+    async def _read_body(self, response: httpx.Response) -> None:
+        """Read the body, or spool it when it is a successful binary one."""
+        content_type = response.headers.get("content-type", "")
+        if (
+            not self.spool_binary
+            or not response.is_success
+            or not is_binary_content_type(content_type)
+            or buffering_binary()
+        ):
+            await response.aread()
+            return
+        spool = BinarySpool(content_type, self.blob_store)
+        try:
+            async for chunk in response.aiter_bytes():
+                spool.write(chunk)
+        except BaseException:
+            spool.abort()
+            raise
+        response.extensions[BODY_EXTENSION] = spool.close()
 
     def stream(
         self,
@@ -123,7 +199,7 @@ class HTTPClient(BaseHTTPClient):
         json: JSONValue | None = None,
         data: Any | None = None,
         files: Any | None = None,
-        timeout: float | None = None,
+        timeout: Timeout | None = None,
     ) -> tuple[int, list[bytes]]:
         """Send a synchronous streaming request (Server-Sent Events).
 
@@ -137,19 +213,31 @@ class HTTPClient(BaseHTTPClient):
         """
         timeout_val = timeout if timeout is not None else self.default_timeout
 
-        with self.sync_client.stream(
-            method=method,
-            url=url,
-            headers=headers,
-            json=json,
-            data=data,
-            files=files,
-            timeout=timeout_val,
-        ) as response:
-            if response.status_code >= 400:
-                response.read()
-                response.raise_for_status()
-            return response.status_code, list(response.iter_bytes())
+        with http_attempt(method, url):
+            trace = current_trace()
+            with self.sync_client.stream(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json,
+                data=data,
+                files=files,
+                timeout=timeout_val,
+                extensions=trace.extensions(is_async=False) if trace else None,
+            ) as response:
+                if trace is not None:
+                    trace.on_response(response)
+                if response.status_code >= 400:
+                    response.read()
+                    response.raise_for_status()
+                if trace is None:
+                    return response.status_code, list(response.iter_bytes())
+                chunks: list[bytes] = []
+                for chunk in response.iter_bytes():
+                    trace.on_chunk()
+                    chunks.append(chunk)
+                trace.on_complete(response)
+                return response.status_code, chunks
 
     async def stream_async(
         self,
@@ -159,7 +247,9 @@ class HTTPClient(BaseHTTPClient):
         json: JSONValue | None = None,
         data: Any | None = None,
         files: Any | None = None,
-        timeout: float | None = None,
+        timeout: Timeout | None = None,
+        deadline: float | None = None,
+        idle_timeout: float | None = None,
     ) -> tuple[int, list[bytes]]:
         """Send an asynchronous streaming request (Server-Sent Events).
 
@@ -170,19 +260,67 @@ class HTTPClient(BaseHTTPClient):
 
         Raises:
             httpx.HTTPStatusError: on 4xx/5xx responses.
+            StreamStalledError: if no chunk arrives for *idle_timeout* seconds.
+            DeadlineExceededError: if the exchange takes longer than *deadline* seconds.
         """
         timeout_val = timeout if timeout is not None else self.default_timeout
 
-        async with self.async_client.stream(
-            method=method,
-            url=url,
-            headers=headers,
-            json=json,
-            data=data,
-            files=files,
-            timeout=timeout_val,
-        ) as response:
-            if response.status_code >= 400:
-                await response.aread()
-                response.raise_for_status()
-            return response.status_code, [chunk async for chunk in response.aiter_bytes()]
+        with http_attempt(method, url):
+            trace = current_trace()
+            async with (
+                _deadline(deadline),
+                self.async_client.stream(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    json=json,
+                    data=data,
+                    files=files,
+                    timeout=timeout_val,
+                    extensions=trace.extensions(is_async=True) if trace else None,
+                ) as response,
+            ):
+                if trace is not None:
+                    trace.on_response(response)
+                if response.status_code >= 400:
+                    await response.aread()
+                    response.raise_for_status()
+                chunks: list[bytes] = []
+                async for chunk in _aiter_chunks(response, idle_timeout):
+                    if trace is not None:
+                        trace.on_chunk()
+                    chunks.append(chunk)
+                if trace is not None:
+                    trace.on_complete(response)
+                return response.status_code, chunks
+
+
+@asynccontextmanager
+async def _deadline(seconds: float | None) -> AsyncIterator[None]:
+    if seconds is None:
+        yield
+        return
+    try:
+        async with asyncio.timeout(seconds):
+            yield
+    except TimeoutError as exc:
+        raise DeadlineExceededError(seconds) from exc
+
+
+async def _aiter_chunks(
+    response: httpx.Response, idle_timeout: float | None
+) -> AsyncIterator[bytes]:
+    chunks = response.aiter_bytes()
+    if idle_timeout is None:
+        async for chunk in chunks:
+            yield chunk
+        return
+    while True:
+        try:
+            async with asyncio.timeout(idle_timeout):
+                chunk = await anext(chunks)
+        except StopAsyncIteration:
+            return
+        except TimeoutError as exc:
+            raise StreamStalledError(idle_timeout) from exc
+        yield chunk
@@ -0,0 +1,201 @@
+"""Spooling of binary response bodies.
+
+Audio and image routes answer with megabytes of bytes that the runner only reports
+as a summary. ``HTTPClient.request_async`` streams such bodies (``BINARY_CONTENT_TYPES``,
+2xx only) through a ``BinarySpool`` instead of buffering them: size, SHA-256 and the
+magic-byte content type are computed chunk by chunk, and the bytes either go to a
+content-addressed ``BlobStore`` or are dropped. The result is attached to the response
+as a ``BinaryBody`` (``spooled_body(response)``) and ``response.content`` stays unread.
+
+Code that needs the bytes themselves (e.g. cassette recording) runs inside
+``buffer_binary()``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+BINARY_CONTENT_TYPES = ("audio/", "image/", "video/", "application/octet-stream")
+
+BODY_EXTENSION = "llm_spec.binary_body"
+"""``httpx.Response.extensions`` key of the ``BinaryBody`` of a spooled response."""
+
+SNIFF_BYTES = 16
+
+_MAGIC: tuple[tuple[int, bytes, str], ...] = (
+    (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"GIF87a", "image/gif"),
+    (0, b"GIF89a", "image/gif"),
+    (8, b"WEBP", "image/webp"),
+    (8, b"WAVE", "audio/wav"),
+    (0, b"OggS", "audio/ogg"),
+    (0, b"fLaC", "audio/flac"),
+    (0, b"ID3", "audio/mpeg"),
+    (0, b"\x1aE\xdf\xa3", "video/webm"),
+    (0, b"%PDF", "application/pdf"),
+)
+
+_FTYP_BRANDS = {b"M4A ": "audio/mp4", b"M4B ": "audio/mp4", b"avif": "image/avif"}
+
+_buffering: ContextVar[bool] = ContextVar("llm_spec_buffer_binary", default=False)
+
+
+def is_binary_content_type(content_type: str) -> bool:
+    """Whether a ``Content-Type`` value names a binary body."""
+    return content_type.lower().startswith(BINARY_CONTENT_TYPES)
+
+
+def sniff_content_type(head: bytes) -> str | None:
+    """Content type from the first bytes of a body (``None`` when unrecognised)."""
+    for offset, magic, content_type in _MAGIC:
+        if head[offset : offset + len(magic)] == magic:
+            if offset == 8 and not head.startswith(b"RIFF"):
+                continue
+            return content_type
+    if head[4:8] == b"ftyp":
+        return _FTYP_BRANDS.get(head[8:12], "video/mp4")
+    if len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0:
+        # MPEG frame sync: layer bits 00 are AAC in ADTS framing, anything else MP3.
+        return "audio/aac" if head[1] & 0x06 == 0 else "audio/mpeg"
+    return None
+
+
+@dataclass
+class BinaryBody:
+    """Summary of a binary body that was not kept in memory.
+
+    Attributes:
+        content_type: Declared ``Content-Type``.
+        size_bytes: Body size.
+        sha256: Hex digest of the body.
+        sniffed_type: Content type recognised from the magic bytes, if any.
+        path: Blob file holding the body when a ``BlobStore`` was used.
+    """
+
+    content_type: str
+    size_bytes: int
+    sha256: str
+    sniffed_type: str | None = None
+    path: Path | None = None
+
+    @classmethod
+    def from_bytes(cls, content_type: str, content: bytes) -> BinaryBody:
+        """Summarise a body that is already in memory."""
+        return cls(
+            content_type=content_type,
+            size_bytes=len(content),
+            sha256=hashlib.sha256(content).hexdigest(),
+            sniffed_type=sniff_content_type(content[:SNIFF_BYTES]),
+        )
+
+    def summary(self) -> dict[str, Any]:
+        """Response body reported in place of the bytes."""
+        summary: dict[str, Any] = {
+            "binary": True,
+            "content_type": self.content_type,
+            "size_bytes": self.size_bytes,
+            "sha256": self.sha256,
+            "sniffed_type": self.sniffed_type,
+        }
+        if self.path is not None:
+            summary["path"] = str(self.path)
+        return summary
+
+
+class BlobStore:
+    """Content-addressed files under *root* (``<root>/<sha256[:2]>/<sha256>``)."""
+
+    def __init__(self, root: Path | str) -> None:
+        self.root = Path(root)
+
+    def path(self, sha256: str) -> Path:
+        return self.root / sha256[:2] / sha256
+
+    def open_temp(self) -> IO[bytes]:
+        """Open a temporary file in the store for a body being spooled."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        return tempfile.NamedTemporaryFile(dir=self.root, prefix=".spool-", delete=False)
+
+    def commit(self, temp: Path, sha256: str) -> Path:
+        """Move a spooled temp file to its content address (dropping duplicates)."""
+        target = self.path(sha256)
+        if target.exists():
+            temp.unlink()
+        else:
+            target.parent.mkdir(exist_ok=True)
+            os.replace(temp, target)
+        return target
+
+
+class BinarySpool:
+    """Incremental size/hash/sniff of one body, optionally written to a ``BlobStore``."""
+
+    def __init__(self, content_type: str, store: BlobStore | None = None) -> None:
+        self.content_type = content_type
+        self._store = store
+        self._file = store.open_temp() if store is not None else None
+        self._hash = hashlib.sha256()
+        self._size = 0
+        self._head = b""
+
+    def write(self, chunk: bytes) -> None:
+        if len(self._head) < SNIFF_BYTES:
+            self._head += chunk[: SNIFF_BYTES - len(self._head)]
+        self._hash.update(chunk)
+        self._size += len(chunk)
+        if self._file is not None:
+            self._file.write(chunk)
+
+    def close(self) -> BinaryBody:
+        """Finish the body and return its summary."""
+        sha256 = self._hash.hexdigest()
+        path = None
+        if self._file is not None and self._store is not None:
+            self._file.close()
+            path = self._store.commit(Path(self._file.name), sha256)
+        return BinaryBody(
+            content_type=self.content_type,
+            size_bytes=self._size,
+            sha256=sha256,
+            sniffed_type=sniff_content_type(self._head),
+            path=path,
+        )
+
+    def abort(self) -> None:
+        """Drop a partially received body."""
+        if self._file is not None:
+            self._file.close()
+            Path(self._file.name).unlink(missing_ok=True)
+
+
+def spooled_body(response: object) -> BinaryBody | None:
+    """The ``BinaryBody`` of a response whose body was spooled, else ``None``."""
+    extensions = getattr(response, "extensions", None)
+    if not isinstance(extensions, dict):
+        return None
+    body = extensions.get(BODY_EXTENSION)
+    return body if isinstance(body, BinaryBody) else None
+
+
+def buffering_binary() -> bool:
+    """Whether binary bodies must be read into memory in this context."""
+    return _buffering.get()
+
+
+@contextmanager
+def buffer_binary() -> Iterator[None]:
+    """Read binary bodies into ``response.content`` inside the block."""
+    token = _buffering.set(True)
+    try:
+        yield
+    finally:
+        _buffering.reset(token)
@@ -0,0 +1,163 @@
+"""Per-request transfer tracing.
+
+``HTTPClient`` reports response and chunk arrival times to the ``TransferTrace``
+active in the current context, if any, and subscribes it to httpx's ``trace``
+request extension for connection-level events (connect, TLS, request sent,
+response headers received). Tracing is opt-in and costs one context variable
+lookup per request when unused.
+
+Usage::
+
+    with trace_transfer() as trace:
+        status, chunks = await http_client.stream_async("POST", url, json=params)
+    trace.chunk_offsets_ms()  # arrival time of each chunk since the request started
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import httpx
+
+
+@dataclass
+class TransferTrace:
+    """Timing of one HTTP exchange (``time.perf_counter()`` timestamps).
+
+    Attributes:
+        started: When tracing started (just before the request is sent).
+        response_at: When the response headers arrived.
+        chunk_at: Arrival time of each streamed body chunk.
+        completed_at: When the response body was fully read.
+        status_code: Response status (``None`` until the response arrives).
+        headers: Response headers.
+        connect_s: Seconds spent opening the connection (TCP + TLS).
+        sent_at: When the request started being written.
+        headers_at: When the response headers were parsed (connection events).
+        bytes_received: Response body bytes read off the wire.
+    """
+
+    started: float = field(default_factory=time.perf_counter)
+    response_at: float | None = None
+    completed_at: float | None = None
+    chunk_at: list[float] = field(default_factory=list)
+    status_code: int | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+    connect_s: float = 0.0
+    sent_at: float | None = None
+    headers_at: float | None = None
+    bytes_received: int = 0
+    _connect_started: float | None = field(default=None, repr=False)
+
+    def on_response(self, response: httpx.Response) -> None:
+        self.response_at = time.perf_counter()
+        self.status_code = response.status_code
+        self.headers = dict(response.headers)
+
+    def on_chunk(self) -> None:
+        self.chunk_at.append(time.perf_counter())
+
+    def on_complete(self, response: httpx.Response) -> None:
+        self.completed_at = time.perf_counter()
+        self.bytes_received = response.num_bytes_downloaded
+
+    # ── httpx ``trace`` extension ─────────────────────────
+
+    def extensions(self, *, is_async: bool) -> dict[str, object]:
+        """Request extensions that subscribe this trace to httpcore events."""
+        return {"trace": self._on_event_async if is_async else self._on_event}
+
+    def _on_event(self, name: str, info: dict[str, object]) -> None:
+        now = time.perf_counter()
+        if name.startswith(_CONNECT_EVENTS):
+            if name.endswith(".started"):
+                self._connect_started = now
+            elif self._connect_started is not None:
+                self.connect_s += now - self._connect_started
+                self._connect_started = None
+        elif name.endswith(".send_request_headers.started") and self.sent_at is None:
+            self.sent_at = now
+        elif name.endswith(".receive_response_headers.complete"):
+            self.headers_at = now
+
+    async def _on_event_async(self, name: str, info: dict[str, object]) -> None:
+        self._on_event(name, info)
+
+    def phases_ms(self) -> dict[str, float]:
+        """Split the exchange into phases (milliseconds).
+
+        With connection events: ``serialize`` (building the request until it is
+        written, including pool wait), ``connect`` (TCP + TLS, ``0`` on a reused
+        connection), ``ttfb`` (request sent → response headers) and ``download``
+        (headers → last body byte). Transports without events (mocks, ASGI) get
+        ``ttfb``/``download`` from response and chunk arrival when streaming, or a
+        single ``request`` phase otherwise (also when no response arrived).
+        """
+        end = self.completed_at or (self.chunk_at[-1] if self.chunk_at else self.response_at)
+        if end is None:  # failed before a response arrived
+            end = time.perf_counter()
+        headers_at = self.headers_at
+        if headers_at is not None and self.sent_at is not None:
+            connect = self.connect_s
+            return {
+                "serialize": max(0.0, self.sent_at - self.started - connect) * 1000,
+                "connect": connect * 1000,
+                "ttfb": max(0.0, headers_at - self.sent_at) * 1000,
+                "download": max(0.0, end - headers_at) * 1000,
+            }
+        if self.chunk_at and self.response_at is not None:
+            return {
+                "ttfb": (self.response_at - self.started) * 1000,
+                "download": max(0.0, end - self.response_at) * 1000,
+            }
+        return {"request": (end - self.started) * 1000}
+
+    @property
+    def ttfb_ms(self) -> float | None:
+        """Milliseconds until the response headers arrived."""
+        if self.response_at is None:
+            return None
+        return (self.response_at - self.started) * 1000
+
+    def chunk_offsets_ms(self) -> list[float]:
+        """Chunk arrival times in milliseconds since ``started``."""
+        return [(t - self.started) * 1000 for t in self.chunk_at]
+
+
+_CONNECT_EVENTS = (
+    "connection.connect_tcp.",
+    "connection.connect_unix_socket.",
+    "connection.start_tls.",
+)
+
+_current_trace: ContextVar[TransferTrace | None] = ContextVar(
+    "llm_spec_transfer_trace", default=None
+)
+
+
+def current_trace() -> TransferTrace | None:
+    """Return the trace active in this context, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def trace_transfer() -> Iterator[TransferTrace]:
+    """Trace the HTTP exchange made inside the block.
+
+    A nested block shares the enclosing trace, so wrappers (e.g. cassette
+    recording) and the runner observe the same exchange.
+    """
+    outer = _current_trace.get()
+    if outer is not None:
+        yield outer
+        return
+    trace = TransferTrace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
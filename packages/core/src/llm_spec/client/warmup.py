@@ -0,0 +1,96 @@
+"""Connection pre-warming.
+
+Without it the first wave of cases of every task opens its connections itself, so
+DNS + TCP + TLS setup lands in their measured latency. ``warm_up`` sends a few
+concurrent lightweight requests (``HEAD`` on the provider base URL by default) so the
+client's pool holds that many keep-alive connections before cases are dispatched,
+and reports the setup cost separately. ``run_suites(warmup_connections=...)`` does this
+for every HTTP client it gets from the client factory.
+
+Any HTTP response, whatever its status, leaves a connection in the pool; transport
+errors are recorded in the report and never fail the run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from llm_spec.client.base_client import Timeout
+from llm_spec.client.http_client import HTTPClient
+from llm_spec.client.trace import trace_transfer
+
+
+@dataclass
+class WarmupReport:
+    """Setup cost paid before the first case of a client was sent.
+
+    Attributes:
+        url: The warmed URL.
+        requested: Connections asked for.
+        opened: Warm-up requests that got a response (connections left in the pool).
+        new_connections: Responses that needed a new connection (the rest reused one).
+        elapsed_ms: Wall time of the whole warm-up.
+        connect_ms: TCP + TLS time of each new connection.
+        errors: Transport errors of the requests that got no response.
+    """
+
+    url: str
+    requested: int
+    opened: int = 0
+    new_connections: int = 0
+    elapsed_ms: float = 0.0
+    connect_ms: list[float] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly form (connect times rounded to 0.1 ms)."""
+        data = asdict(self)
+        data["connect_ms"] = [round(ms, 1) for ms in self.connect_ms]
+        data["elapsed_ms"] = round(self.elapsed_ms, 1)
+        return data
+
+
+async def warm_up(
+    http_client: HTTPClient,
+    url: str,
+    connections: int,
+    *,
+    method: str = "HEAD",
+    headers: dict[str, str] | None = None,
+    timeout: Timeout | None = None,
+) -> WarmupReport:
+    """Open up to *connections* keep-alive connections to *url* in *http_client*'s pool.
+
+    Args:
+        http_client: Client whose async connection pool is warmed.
+        url: Request URL; only its origin matters for connection reuse.
+        connections: Concurrent requests to send (one connection each).
+        method: Lightweight method to use (``HEAD``/``OPTIONS``, or ``GET`` on a cheap
+            endpoint such as a model list).
+        headers: Request headers (e.g. the provider's auth headers).
+        timeout: Per-request timeout.
+
+    Returns:
+        The warm-up report; failures are listed in ``errors``.
+    """
+    report = WarmupReport(url=url, requested=connections)
+
+    async def _open() -> None:
+        with trace_transfer() as trace:
+            try:
+                await http_client.request_async(method, url, headers=headers, timeout=timeout)
+            except Exception as exc:
+                report.errors.append(f"{type(exc).__name__}: {exc}")
+                return
+        report.opened += 1
+        if trace.connect_s > 0:
+            report.new_connections += 1
+            report.connect_ms.append(trace.connect_s * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_open() for _ in range(connections)))
+    report.elapsed_ms = (time.perf_counter() - start) * 1000
+    return report
@@ -5,19 +5,46 @@ from __future__ import annotations
 import tomllib
 from pathlib import Path
 
+import httpx
 from pydantic import BaseModel, Field
 
 
 class ProviderConfig(BaseModel):
-    """Provider configuration."""
+    """Provider configuration.
+
+    ``timeout`` is the default for every httpx phase; ``connect_timeout``,
+    ``read_timeout`` (between received bytes), ``write_timeout`` and ``pool_timeout``
+    (waiting for a pooled connection) override it per phase. ``stream_idle_timeout``
+    limits the gap between stream chunks and ``deadline`` the whole exchange, stream
+    included; both apply to async requests only. All values are in seconds.
+    """
 
     api_key: str
     base_url: str
     timeout: float = 30.0
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+    write_timeout: float | None = None
+    pool_timeout: float | None = None
+    stream_idle_timeout: float | None = None
+    deadline: float | None = None
     api_family: str | None = None
     headers: dict[str, str] = Field(default_factory=dict)
     channel: str | None = None
 
+    def http_timeout(self) -> httpx.Timeout:
+        """Per-phase httpx timeout, unset phases falling back to ``timeout``."""
+
+        def phase(value: float | None) -> float:
+            return self.timeout if value is None else value
+
+        return httpx.Timeout(
+            connect=phase(self.connect_timeout),
+            read=phase(self.read_timeout),
+            write=phase(self.write_timeout),
+            pool=phase(self.pool_timeout),
+        )
+
 
 class ChannelProviderConfig(BaseModel):
     """Per-provider selection inside a channel."""
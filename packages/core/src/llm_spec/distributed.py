@@ -0,0 +1,386 @@
+"""Multi-process case execution.
+
+``ProcessCaseRunner`` shards ``ExecutableCase`` execution across local worker
+processes so HTTP I/O, stream parsing and schema validation run outside the
+caller's GIL. Scheduling, callbacks and persistence stay in the caller: each case
+is sent to a worker, executed there with the regular ``Executor``/``TestRunner``,
+and its ``TestVerdict`` is streamed back as soon as it finishes.
+
+A worker that dies (OOM kill, segfault, ``os._exit`` in an adapter) is detected by the
+result reader thread: its in-flight cases resolve with a ``WORKER_DIED`` error verdict
+and a replacement worker is spawned with the open sessions.
+
+Usage::
+
+    with ProcessCaseRunner(processes=4, concurrency_per_process=16) as runner:
+        await run_suites(registry, config, case_runner=runner)
+
+The client factory handed to ``run_suites`` is pickled to the workers, so it must
+be a module-level callable (or a ``functools.partial`` of one).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Any
+
+from llm_spec.adapters.base import ProviderAdapter
+from llm_spec.client.http_client import HTTPClient
+from llm_spec.config.loader import AppConfig
+from llm_spec.results.result_types import TestVerdict
+from llm_spec.runners.runner import error_verdict
+from llm_spec.suites.types import ExecutableCase
+
+logger = logging.getLogger(__name__)
+
+WorkerClientFactory = Callable[[str, AppConfig], tuple[HTTPClient, ProviderAdapter]]
+
+# Message kinds (parent → worker)
+_OPEN_SESSION = "open"
+_CLOSE_SESSION = "close"
+_RUN = "run"
+_CANCEL = "cancel"
+_STOP = "stop"
+
+# How often the result reader checks for dead workers.
+_WATCH_INTERVAL_S = 0.5
+
+
+# ── Worker process ────────────────────────────────────────
+
+
+def _worker_main(inbox: Any, outbox: Any, concurrency: int) -> None:
+    """Entry point of one worker process."""
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_worker_loop(inbox, outbox, concurrency))
+
+
+async def _worker_loop(inbox: Any, outbox: Any, concurrency: int) -> None:
+    from llm_spec.executor import Executor
+
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(max(1, concurrency))
+    sessions: dict[str, tuple[WorkerClientFactory, AppConfig]] = {}
+    clients: dict[tuple[str, str], tuple[HTTPClient, ProviderAdapter]] = {}
+    executors: dict[tuple[str, str, Path | None], Executor] = {}
+    inflight: dict[int, asyncio.Task[None]] = {}
+
+    def _executor_for(session_id: str, provider: str, source_path: Path | None) -> Executor:
+        key = (session_id, provider, source_path)
+        executor = executors.get(key)
+        if executor is None:
+            client_key = (session_id, provider)
+            if client_key not in clients:
+                factory, config = sessions[session_id]
+                clients[client_key] = factory(provider, config)
+            executor = Executor(clients[client_key][1], source_path=source_path)
+            executors[key] = executor
+        return executor
+
+    async def _execute(job_id: int, executor: Executor, case: ExecutableCase) -> None:
+        try:
+            async with sem:
+                verdict = await executor.run_one(case)
+            outbox.put((job_id, verdict))
+        finally:
+            inflight.pop(job_id, None)
+
+    async def _close_session(session_id: str) -> None:
+        for key in [k for k in executors if k[0] == session_id]:
+            executors.pop(key)
+        for key in [k for k in clients if k[0] == session_id]:
+            http_client, _ = clients.pop(key)
+            http_client.close()
+            await http_client.close_async()
+        sessions.pop(session_id, None)
+
+    while True:
+        msg = await loop.run_in_executor(None, inbox.get)
+        kind = msg[0]
+        if kind == _STOP:
+            break
+        if kind == _OPEN_SESSION:
+            _, session_id, factory, config = msg
+            sessions[session_id] = (factory, config)
+        elif kind == _CLOSE_SESSION:
+            await _close_session(msg[1])
+        elif kind == _RUN:
+            _, job_id, session_id, provider, case, source_path = msg
+            try:
+                executor = _executor_for(session_id, provider, source_path)
+            except Exception as exc:
+                outbox.put((job_id, error_verdict(case, message=str(exc), code="WORKER_ERROR")))
+                continue
+            inflight[job_id] = asyncio.create_task(_execute(job_id, executor, case))
+        elif kind == _CANCEL:
+            task = inflight.get(msg[1])
+            if task is not None:
+                task.cancel()
+
+    for task in list(inflight.values()):
+        task.cancel()
+    await asyncio.gather(*inflight.values(), return_exceptions=True)
+    for session_id in list(sessions):
+        await _close_session(session_id)
+
+
+# ── Parent-side runner ────────────────────────────────────
+
+
+class ProcessCaseRunner:
+    """Pool of worker processes executing cases on behalf of ``run_suites``.
+
+    Thread-safe: one runner can be shared by several event loops (e.g. every
+    worker loop of the web execution pool). Each ``run()`` call resolves on the
+    caller's loop when the worker reports the verdict.
+    """
+
+    def __init__(
+        self,
+        processes: int | None = None,
+        *,
+        concurrency_per_process: int = 16,
+        start_method: str = "spawn",
+    ) -> None:
+        """Initialize the runner (processes are started lazily).
+
+        Args:
+            processes: Number of worker processes (default: CPU count).
+            concurrency_per_process: Maximum in-flight cases inside each worker.
+            start_method: ``multiprocessing`` start method.
+        """
+        self._num_processes = max(1, processes or os.cpu_count() or 1)
+        self._concurrency = max(1, concurrency_per_process)
+        # Typed loosely: typeshed's ``BaseContext`` does not declare ``Process``.
+        self._ctx: Any = multiprocessing.get_context(start_method)
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._inboxes: list[Any] = []
+        self._processes: list[Any] = []
+        self._load: list[int] = []
+        # job id → (loop, future, worker index, case)
+        self._pending: dict[
+            int, tuple[asyncio.AbstractEventLoop, asyncio.Future[Any], int, ExecutableCase]
+        ] = {}
+        # Open sessions, replayed to respawned workers
+        self._sessions: dict[str, tuple[WorkerClientFactory, AppConfig]] = {}
+        self._outbox: Any = None
+        self._reader: threading.Thread | None = None
+
+    @property
+    def processes(self) -> int:
+        return self._num_processes
+
+    def __enter__(self) -> ProcessCaseRunner:
+        self.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Spawn worker processes and the result reader thread (idempotent)."""
+        with self._lock:
+            if self._processes:
+                return
+            self._outbox = self._ctx.Queue()
+            for i in range(self._num_processes):
+                inbox, proc = self._spawn(i)
+                self._inboxes.append(inbox)
+                self._processes.append(proc)
+                self._load.append(0)
+            self._reader = threading.Thread(
+                target=self._read_results, name="llm-spec-case-results", daemon=True
+            )
+            self._reader.start()
+
+    def _spawn(self, index: int) -> tuple[Any, Any]:
+        """Start worker *index* with a fresh inbox holding the open sessions."""
+        inbox = self._ctx.Queue()
+        for session_id, (factory, config) in self._sessions.items():
+            inbox.put((_OPEN_SESSION, session_id, factory, config))
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(inbox, self._outbox, self._concurrency),
+            name=f"llm-spec-case-worker-{index}",
+            daemon=True,
+        )
+        proc.start()
+        return inbox, proc
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Stop workers, fail pending jobs and join all processes."""
+        with self._lock:
+            processes, self._processes = self._processes, []
+            inboxes, self._inboxes = self._inboxes, []
+            pending, self._pending = self._pending, {}
+            self._load = []
+            self._sessions = {}
+        if not processes:
+            return
+
+        for inbox in inboxes:
+            inbox.put((_STOP,))
+        for proc in processes:
+            proc.join(timeout)
+            if proc.is_alive():
+                proc.terminate()
+        self._outbox.put(None)
+        if self._reader is not None:
+            self._reader.join(timeout)
+            self._reader = None
+
+        for loop, fut, _, _ in pending.values():
+            try:
+                loop.call_soon_threadsafe(
+                    _set_exception, fut, RuntimeError("ProcessCaseRunner closed")
+                )
+            except RuntimeError:
+                continue
+
+    # ── Sessions ──────────────────────────────────────────
+
+    def open_session(self, factory: WorkerClientFactory, config: AppConfig) -> str:
+        """Register a client factory + config with every worker.
+
+        Workers build (and cache) one client per provider for the session's lifetime.
+
+        Returns:
+            Session ID to pass to ``run()``.
+        """
+        self.start()
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self._sessions[session_id] = (factory, config)
+            for inbox in self._inboxes:
+                inbox.put((_OPEN_SESSION, session_id, factory, config))
+        return session_id
+
+    def close_session(self, session_id: str) -> None:
+        """Close the worker-side clients of one session."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+            for inbox in self._inboxes:
+                inbox.put((_CLOSE_SESSION, session_id))
+
+    # ── Execution ─────────────────────────────────────────
+
+    async def run(
+        self,
+        session_id: str,
+        provider: str,
+        case: ExecutableCase,
+        source_path: Path | None = None,
+    ) -> TestVerdict:
+        """Execute one case on the least-loaded worker and await its verdict.
+
+        Cancelling the awaiting coroutine also cancels the case in the worker. If the
+        worker dies first, the case resolves with a ``WORKER_DIED`` error verdict.
+        """
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[TestVerdict] = loop.create_future()
+        with self._lock:
+            if not self._processes:
+                raise RuntimeError("ProcessCaseRunner is not started")
+            job_id = next(self._ids)
+            worker = min(range(len(self._load)), key=self._load.__getitem__)
+            self._load[worker] += 1
+            self._pending[job_id] = (loop, fut, worker, case)
+            inbox = self._inboxes[worker]
+        inbox.put((_RUN, job_id, session_id, provider, case, source_path))
+
+        try:
+            return await fut
+        except asyncio.CancelledError:
+            with self._lock:
+                entry = self._pending.pop(job_id, None)
+                if entry is not None:
+                    self._load[worker] -= 1
+            if entry is not None:
+                with contextlib.suppress(ValueError, OSError):
+                    inbox.put((_CANCEL, job_id))
+            raise
+
+    def _read_results(self) -> None:
+        next_check = time.monotonic() + _WATCH_INTERVAL_S
+        while True:
+            try:
+                msg = self._outbox.get(timeout=_WATCH_INTERVAL_S)
+            except queue.Empty:
+                msg = ()
+            except (EOFError, OSError):
+                return
+            if msg is None:
+                return
+            if msg:
+                job_id, verdict = msg
+                with self._lock:
+                    entry = self._pending.pop(job_id, None)
+                    if entry is not None and entry[2] < len(self._load):
+                        self._load[entry[2]] -= 1
+                if entry is not None:
+                    _resolve(entry[0], entry[1], verdict, job_id)
+            if time.monotonic() >= next_check:
+                self._reap_dead_workers()
+                next_check = time.monotonic() + _WATCH_INTERVAL_S
+
+    def _reap_dead_workers(self) -> None:
+        """Fail the cases of workers that exited and spawn replacements."""
+        with self._lock:
+            processes = list(self._processes)
+        dead = set(wait([proc.sentinel for proc in processes], timeout=0))
+        for index, proc in enumerate(processes):
+            if proc.sentinel not in dead:
+                continue
+            with self._lock:
+                if index >= len(self._processes) or self._processes[index] is not proc:
+                    continue  # closed or already replaced
+                lost = {
+                    job_id: entry for job_id, entry in self._pending.items() if entry[2] == index
+                }
+                for job_id in lost:
+                    del self._pending[job_id]
+                self._load[index] = 0
+                inbox, replacement = self._spawn(index)
+                self._inboxes[index], self._processes[index] = inbox, replacement
+            logger.warning(
+                "Case worker %s exited with code %s; failing %d in-flight case(s)",
+                proc.name,
+                proc.exitcode,
+                len(lost),
+            )
+            message = f"Case worker {proc.name} exited with code {proc.exitcode}"
+            for job_id, (loop, fut, _, case) in lost.items():
+                verdict = error_verdict(case, message=message, code="WORKER_DIED")
+                _resolve(loop, fut, verdict, job_id)
+
+
+def _resolve(
+    loop: asyncio.AbstractEventLoop, fut: asyncio.Future[Any], verdict: TestVerdict, job_id: int
+) -> None:
+    try:
+        loop.call_soon_threadsafe(_set_result, fut, verdict)
+    except RuntimeError:
+        logger.debug("Dropping verdict for job %s: event loop closed", job_id)
+
+
+def _set_result(fut: asyncio.Future[Any], value: Any) -> None:
+    if not fut.done():
+        fut.set_result(value)
+
+
+def _set_exception(fut: asyncio.Future[Any], exc: BaseException) -> None:
+    if not fut.done():
+        fut.set_exception(exc)
@@ -1,13 +1,18 @@
 """Concurrent test execution engine.
 
 The Executor handles:
-- Concurrent test scheduling with semaphore-based throttling
+- Concurrent test scheduling with semaphore-based throttling (each verdict records when
+  it was queued and dispatched, so slot waits are kept out of request latency)
 - Progress callbacks (callers inject side-effects like DB writes, SSE pushes)
 - Cancellation (immediate, no DB polling required)
 
 ``run_suites()`` provides a high-level API for multi-suite orchestration:
 - Creates HTTPClient + adapter per provider automatically (or uses caller-supplied factory)
-- Controls global test concurrency across all suites
+- Controls global test concurrency across all suites (optionally shared across calls)
+- Limits how many suites are in flight at once
+- Optionally executes cases in worker processes (``ProcessCaseRunner``)
+- Optionally pre-opens keep-alive connections per client before its cases run
+- Imports the response schemas a suite references before its cases run
 - Delivers suite-level callbacks (on_suite_start / on_suite_done / on_suite_error)
 - Aggregates per-suite results
 - Manages client lifecycle (cleanup on completion)
@@ -16,23 +21,38 @@ The Executor handles:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import contextvars
+import heapq
+import math
+import time
+from collections import deque
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from llm_spec import telemetry
 from llm_spec.adapters.api_family import create_api_family_adapter
 from llm_spec.adapters.base import ProviderAdapter
 from llm_spec.cancellation_registry import cancellation_registry
+from llm_spec.client.circuit_breaker import CircuitBreakers, is_outage
 from llm_spec.client.http_client import HTTPClient
+from llm_spec.client.warmup import WarmupReport, warm_up
 from llm_spec.config.loader import AppConfig
+from llm_spec.profiling import PhaseTimer
 from llm_spec.results.result_types import FailureInfo, RunResult, TestVerdict
 from llm_spec.results.task_result import build_run_result
 from llm_spec.runners.runner import TestRunner, error_verdict
+from llm_spec.runners.schema_registry import preload_schemas
+from llm_spec.scheduling import is_infrastructure_failure
 from llm_spec.suites.registry import Registry, build_executable_cases
 from llm_spec.suites.types import ExecutableCase, SuiteSpec
 
+if TYPE_CHECKING:
+    from llm_spec.distributed import ProcessCaseRunner
+
 # ── Client factory type ───────────────────────────────────
 
 
@@ -68,6 +88,17 @@ class SuiteResult:
     verdicts: list[TestVerdict]
     run_result: RunResult
     error: str | None = None
+    warmup: WarmupReport | None = None
+
+    @property
+    def timings(self) -> dict[str, dict[str, float]]:
+        """Per-phase timing summary of the suite's verdicts."""
+        return self.run_result.timing_summary()
+
+    @property
+    def queue(self) -> dict[str, float]:
+        """Concurrency-slot wait summary of the suite's verdicts."""
+        return self.run_result.queue_summary()
 
 
 OnSuiteStart = Callable[[SuiteContext], Awaitable[None]] | None
@@ -77,6 +108,12 @@ OnSuiteError = Callable[[SuiteContext, Exception], Awaitable[None]] | None
 ClientFactory = Callable[[str, AppConfig], tuple[HTTPClient, ProviderAdapter]]
 """``(provider_id, app_config) → (http_client, adapter)``"""
 
+CasePriority = Callable[[SuiteSpec, ExecutableCase], float]
+"""``(suite, case) → sort key``; lower keys are dispatched first."""
+
+SuitePriority = Callable[[SuiteSpec], float]
+"""``suite → sort key``; lower keys are opened first."""
+
 
 # ── Suite-level callback types ────────────────────────────
 
@@ -98,19 +135,66 @@ def _cancelled_verdict(case: ExecutableCase) -> TestVerdict:
     )
 
 
+def _skipped_verdict(case: ExecutableCase, baseline: TestVerdict) -> TestVerdict:
+    now = datetime.now(UTC).isoformat()
+    reason = baseline.failure.code if baseline.failure else baseline.status
+    return TestVerdict(
+        case_id=case.case_id,
+        test_name=case.test_name,
+        focus=case.focus,
+        status="skipped",
+        started_at=now,
+        finished_at=now,
+        failure=FailureInfo(
+            stage="baseline",
+            code="BASELINE_FAILED",
+            message=f"Skipped: baseline {baseline.case_id} failed ({reason})",
+        ),
+    )
+
+
+@dataclass
+class _QueueClock:
+    """Queued → dispatched timestamps of one case (copied onto its verdict).
+
+    One clock is started when a batch of cases is handed over; each case gets a copy
+    (``dataclasses.replace``) that it dispatches when it acquires a slot.
+    """
+
+    queued_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+    queued: float = field(default_factory=time.perf_counter)
+    dispatched_at: str = ""
+    queue_ms: float | None = None
+
+    def dispatch(self) -> float:
+        """Mark the concurrency slot as acquired and return the wait in ms."""
+        self.dispatched_at = datetime.now(UTC).isoformat()
+        self.queue_ms = round((time.perf_counter() - self.queued) * 1000, 3)
+        return self.queue_ms
+
+    def stamp(self, verdict: TestVerdict) -> TestVerdict:
+        verdict.queued_at = self.queued_at
+        verdict.dispatched_at = self.dispatched_at
+        verdict.queue_ms = self.queue_ms
+        return verdict
+
+
 def create_provider_adapter(
     provider: str,
     config: AppConfig,
+    http_client: HTTPClient | None = None,
 ) -> tuple[HTTPClient, ProviderAdapter]:
     """Create HTTPClient + ProviderAdapter from application config.
 
     The caller owns the returned HTTPClient and must close it when done.
+    Pass *http_client* to reuse an existing (e.g. pooled) client instead.
 
     Returns:
         ``(http_client, adapter)`` tuple.
     """
     provider_cfg = config.get_provider_config(provider)
-    http_client = HTTPClient(default_timeout=provider_cfg.timeout)
+    if http_client is None:
+        http_client = HTTPClient(default_timeout=provider_cfg.timeout)
     adapter = create_api_family_adapter(
         provider=provider,
         config=provider_cfg,
@@ -172,52 +256,68 @@ class Executor:
         """Clear tracked tasks (used by external schedulers)."""
         self._inflight_tasks.clear()
 
+    def untrack_task(self, task: asyncio.Task[Any]) -> None:
+        """Forget a finished task registered with ``track_task``."""
+        with contextlib.suppress(ValueError):
+            self._inflight_tasks.remove(task)
+
     async def run_all(self, cases: list[ExecutableCase]) -> list[TestVerdict]:
         """Execute *cases* concurrently and return ordered verdicts.
 
-        Respects ``max_concurrent`` via an asyncio.Semaphore.
+        ``max_concurrent`` worker coroutines pull cases in order, so only that many
+        case tasks exist at once regardless of ``len(cases)``.
         Delivers ``on_test_start`` / ``on_test_done`` callbacks as each test
-        begins / completes.
+        is dispatched (holds a slot) / completes.
         """
         if not cases:
             return []
 
         total = len(cases)
-        sem = asyncio.Semaphore(self._max_concurrent)
         results: dict[int, TestVerdict] = {}
         self._done_count = 0
+        queued = _QueueClock()
+        pending = iter(enumerate(cases))
 
         async def _run_one(idx: int, case: ExecutableCase) -> None:
             if self._cancelled:
                 results[idx] = _cancelled_verdict(case)
                 return
 
+            clock = replace(queued)
+            clock.dispatch()
             if self._on_test_start:
                 await self._on_test_start(case, idx, total)
-
-            async with sem:
-                if self._cancelled:
-                    results[idx] = _cancelled_verdict(case)
-                    return
-                verdict = await self.run_one(case)
+            verdict = clock.stamp(await self.run_one(case))
 
             results[idx] = verdict
             self._done_count += 1
 
             if self._on_test_done:
-                await self._on_test_done(
-                    ExecutionProgress(
-                        case=case,
-                        verdict=verdict,
-                        index=idx,
-                        done=self._done_count,
-                        total=total,
+                with PhaseTimer(case, verdict.timings).phase("callback"):
+                    await self._on_test_done(
+                        ExecutionProgress(
+                            case=case,
+                            verdict=verdict,
+                            index=idx,
+                            done=self._done_count,
+                            total=total,
+                        )
                     )
-                )
 
-        self._inflight_tasks = [asyncio.create_task(_run_one(i, c)) for i, c in enumerate(cases)]
-        await asyncio.gather(*self._inflight_tasks, return_exceptions=True)
-        self._inflight_tasks.clear()
+        async def _worker() -> None:
+            for idx, case in pending:
+                task = asyncio.create_task(_run_one(idx, case))
+                self.track_task(task)
+                await asyncio.gather(task, return_exceptions=True)
+                self.untrack_task(task)
+
+        workers = [asyncio.create_task(_worker()) for _ in range(min(self._max_concurrent, total))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            self._inflight_tasks.clear()
 
         # Return ordered verdicts; fill gaps with cancelled placeholders
         return [results.get(i, _cancelled_verdict(cases[i])) for i in range(total)]
@@ -245,34 +345,78 @@ async def run_suites(
     suite_ids: list[str] | None = None,
     selected_tests: dict[str, set[str]] | None = None,
     max_concurrent_tests: int = 5,
+    max_concurrent_suites: int | None = None,
+    global_semaphore: asyncio.Semaphore | None = None,
     on_test_start: OnTestStart = None,
     on_test_done: OnTestDone = None,
     on_suite_start: OnSuiteStart = None,
     on_suite_done: OnSuiteDone = None,
     on_suite_error: OnSuiteError = None,
     client_factory: ClientFactory | None = None,
+    close_clients: bool = True,
+    case_runner: ProcessCaseRunner | None = None,
+    case_priority: CasePriority | None = None,
+    suite_priority: SuitePriority | None = None,
+    baseline_first: bool = False,
+    circuit_breakers: CircuitBreakers | None = None,
+    warmup_connections: int = 0,
 ) -> list[SuiteResult]:
     """Execute multiple suites with suite-level and test-level concurrency.
 
     This is the top-level entry point for external callers who want to run
     multiple suites without managing HTTPClient/adapter lifecycle manually.
 
+    Cases are scheduled on ``max_concurrent_tests`` worker coroutines pulling from a
+    priority queue of ready cases, so the number of live tasks follows the concurrency
+    limit rather than the size of the plan. A suite is opened (cases built,
+    ``on_suite_start``) only when the workers run out of ready cases.
+
     Args:
         registry: Parsed suite registry snapshot.
         config: Application config with provider credentials.
         suite_ids: Which suites to run (default: all in registry).
         selected_tests: Per-suite test selection, keyed by suite_id.
         max_concurrent_tests: Global test concurrency across all suites.
-        on_test_start: Callback fired before each test begins.
+        max_concurrent_suites: How many suites may be in flight at once (default: no limit
+            beyond the lazy opening above).
+        global_semaphore: Optional gate shared with other ``run_suites`` calls on the same
+            event loop. Each test acquires its own ``max_concurrent_tests`` slot first, so a
+            single call never holds more than ``max_concurrent_tests`` shared slots.
+        on_test_start: Callback fired when a test acquires its concurrency slot.
         on_test_done: Callback fired after each test completes.
         on_suite_start: Callback fired before a suite begins (receives SuiteContext).
         on_suite_done: Callback fired after a suite completes successfully.
         on_suite_error: Callback fired when a suite fails with an exception.
         client_factory: Custom ``(provider, config) → (http_client, adapter)`` factory.
             Defaults to ``create_provider_adapter``.
+        close_clients: Close the factory-created HTTPClients when a suite finishes.
+            Set to False when the factory hands out pooled clients owned by the caller.
+        case_runner: Execute cases in worker processes instead of this event loop.
+            The client factory is pickled to the workers, so it must be a module-level
+            callable (or a ``functools.partial`` of one). Callbacks still run here.
+        case_priority: ``(suite, case) → key``; among ready cases (those of opened
+            suites), lower keys are dispatched first. Ties (and the default) keep suite
+            and registry order.
+            ``llm_spec.scheduling.LatencyEstimator`` orders longest-expected first.
+        suite_priority: ``suite → key``; suites with lower keys are opened first.
+        baseline_first: Hold each suite's other cases until its baseline has run. If the
+            baseline hit an infrastructure failure (``is_infrastructure_failure``: auth,
+            unknown model, unreachable host), they are reported as ``skipped`` without
+            sending a request; otherwise they are released to the workers.
+        circuit_breakers: Per-provider breakers (``llm_spec.client.circuit_breaker``).
+            While a provider's breaker is open its cases fail fast with ``CIRCUIT_OPEN``
+            instead of waiting out the timeout. Share one instance between calls to
+            let an outage seen by one task protect the others.
+        warmup_connections: Before a suite's cases are dispatched, open up to this many
+            (capped at ``max_concurrent_tests``) keep-alive connections in its HTTP
+            client with ``HEAD`` requests on the provider base URL, so connection setup
+            stays out of case latency. The cost is reported on ``SuiteResult.warmup`` of
+            the suite that warmed the client; suites sharing a pooled client warm it once.
+            Ignored with *case_runner* (the workers own their clients).
 
     Returns:
-        A ``SuiteResult`` per requested suite, in the same order as *suite_ids*.
+        A ``SuiteResult`` per requested suite, in the same order as *suite_ids*
+        (whatever order they ran in).
     """
     ids = suite_ids if suite_ids is not None else registry.suite_ids
     suites: list[SuiteSpec] = []
@@ -283,6 +427,7 @@ async def run_suites(
         suites.append(s)
 
     factory = client_factory or create_provider_adapter
+    session_id = case_runner.open_session(factory, config) if case_runner is not None else None
 
     # ── Flattened execution: single global concurrency gate ───────────
 
@@ -296,11 +441,40 @@ async def run_suites(
         started_at: str | None = None
         finished_at: str | None = None
         done_count: int = 0
+        settled: int = 0
+        gate: int | None = None  # baseline index while the other cases are held
+        held: list[int] = field(default_factory=list)
+        queued: _QueueClock = field(default_factory=_QueueClock)
+        warmup: WarmupReport | None = None
+        finished: asyncio.Event = field(default_factory=asyncio.Event)
+        context: contextvars.Context = field(default_factory=contextvars.copy_context)
 
-    suite_states: list[_SuiteState | None] = [None] * len(suites)
     results_by_index: list[SuiteResult | None] = [None] * len(suites)
+    # id(http_client) → (client, warm-up); the client is kept so its id is not reused.
+    warmups: dict[int, tuple[HTTPClient, asyncio.Task[WarmupReport]]] = {}
+
+    async def _warm_up(
+        suite: SuiteSpec, http_client: HTTPClient, adapter: ProviderAdapter
+    ) -> WarmupReport | None:
+        """Warm *http_client* once per call; only the first suite gets the report."""
+        shared = warmups.get(id(http_client))
+        if shared is not None:
+            await shared[1]
+            return None
+        with telemetry.span("llm_spec.warmup", provider=suite.provider_id):
+            task = asyncio.create_task(
+                warm_up(
+                    http_client,
+                    adapter.get_base_url(),
+                    min(warmup_connections, max(1, max_concurrent_tests)),
+                    headers=adapter.prepare_headers(),
+                    timeout=adapter.config.http_timeout(),
+                )
+            )
+            warmups[id(http_client)] = (http_client, task)
+            return await task
 
-    for idx, suite in enumerate(suites):
+    async def _open_suite(idx: int, suite: SuiteSpec) -> _SuiteState | None:
         http_client: HTTPClient | None = None
         executor: Executor | None = None
         ctx: SuiteContext | None = None
@@ -308,6 +482,13 @@ async def run_suites(
             cases = build_executable_cases(
                 suite, selected_tests=selected_tests.get(suite.suite_id) if selected_tests else None
             )
+            if case_runner is None:
+                # Import the schema families this suite uses before its first case is timed.
+                preload_schemas(
+                    name
+                    for case in cases
+                    for name in (case.checks.response_schema, case.checks.stream_chunk_schema)
+                )
             http_client, adapter = factory(suite.provider_id, config)
             executor = Executor(
                 client=adapter,
@@ -319,18 +500,22 @@ async def run_suites(
             ctx = SuiteContext(suite=suite, cases=cases, executor=executor)
             if on_suite_start:
                 await on_suite_start(ctx)
+            warmup = None
+            if warmup_connections > 0 and case_runner is None and cases:
+                warmup = await _warm_up(suite, http_client, adapter)
 
-            suite_states[idx] = _SuiteState(
+            return _SuiteState(
                 suite=suite,
                 cases=cases,
                 verdicts=[None] * len(cases),
                 executor=executor,
                 http_client=http_client,
+                warmup=warmup,
             )
         except Exception as exc:
             if on_suite_error and ctx is not None:
                 await on_suite_error(ctx, exc)
-            if http_client is not None:
+            if http_client is not None and close_clients:
                 await http_client.close_async()
             error_result = SuiteResult(
                 suite=suite,
@@ -349,8 +534,7 @@ async def run_suites(
                 error=str(exc),
             )
             results_by_index[idx] = error_result
-
-    sem = asyncio.Semaphore(max(1, max_concurrent_tests))
+            return None
 
     async def _run_case(state: _SuiteState, case_idx: int) -> None:
         case = state.cases[case_idx]
@@ -358,64 +542,80 @@ async def run_suites(
             state.verdicts[case_idx] = _cancelled_verdict(case)
             return
 
-        if on_test_start:
-            await on_test_start(case, case_idx, len(state.cases))
-        if state.started_at is None:
-            state.started_at = datetime.now(UTC).isoformat()
-
+        with telemetry.span(
+            "llm_spec.case", case_id=case.case_id, test_name=case.test_name
+        ) as case_span:
+            clock = replace(state.queued)
+            try:
+                async with global_semaphore or contextlib.nullcontext():
+                    telemetry.record_semaphore_wait(clock.dispatch())
+                    if state.executor.cancelled:
+                        state.verdicts[case_idx] = clock.stamp(_cancelled_verdict(case))
+                        return
+                    if on_test_start:
+                        await on_test_start(case, case_idx, len(state.cases))
+                    if state.started_at is None:
+                        state.started_at = clock.dispatched_at
+                    verdict = await _send(state, case)
+            except asyncio.CancelledError:
+                verdict = _cancelled_verdict(case)
+            except Exception as exc:
+                verdict = error_verdict(case, message=str(exc), code="REQUEST_ERROR")
+            clock.stamp(verdict)
+            telemetry.record_case(case_span, verdict)
+
+        await _record(state, case_idx, verdict)
+
+    async def _send(state: _SuiteState, case: ExecutableCase) -> TestVerdict:
+        provider = state.suite.provider_id
+        breaker = circuit_breakers.get(provider) if circuit_breakers is not None else None
+        if breaker is not None and not breaker.allow():
+            return error_verdict(
+                case,
+                message=(
+                    f"Circuit open for provider {provider} after upstream failures; "
+                    f"next probe in {breaker.retry_after():.1f}s"
+                ),
+                code="CIRCUIT_OPEN",
+            )
         try:
-            async with sem:
-                if state.executor.cancelled:
-                    state.verdicts[case_idx] = _cancelled_verdict(case)
-                    return
-                verdict = await state.executor.run_one(case)
-        except asyncio.CancelledError:
-            verdict = _cancelled_verdict(case)
-        except Exception as exc:
-            verdict = error_verdict(case, message=str(exc), code="REQUEST_ERROR")
-
+            with telemetry.in_flight():
+                if case_runner is not None and session_id is not None:
+                    verdict = await case_runner.run(
+                        session_id, provider, case, state.suite.source_path
+                    )
+                else:
+                    verdict = await state.executor.run_one(case)
+        except BaseException:
+            if breaker is not None:
+                breaker.release()
+            raise
+        if breaker is not None:
+            if verdict.failure is not None and verdict.failure.code == "CANCELLED":
+                breaker.release()
+            else:
+                breaker.record(is_outage(verdict))
+        return verdict
+
+    async def _record(state: _SuiteState, case_idx: int, verdict: TestVerdict) -> None:
+        case = state.cases[case_idx]
         state.verdicts[case_idx] = verdict
         state.done_count += 1
         state.finished_at = datetime.now(UTC).isoformat()
 
         if on_test_done:
-            await on_test_done(
-                ExecutionProgress(
-                    case=case,
-                    verdict=verdict,
-                    index=case_idx,
-                    done=state.done_count,
-                    total=len(state.cases),
+            with PhaseTimer(case, verdict.timings).phase("callback"):
+                await on_test_done(
+                    ExecutionProgress(
+                        case=case,
+                        verdict=verdict,
+                        index=case_idx,
+                        done=state.done_count,
+                        total=len(state.cases),
+                    )
                 )
-            )
-
-    tasks: list[asyncio.Task[Any]] = []
-    for state in suite_states:
-        if state is None:
-            continue
-        for case_idx in range(len(state.cases)):
-            task = asyncio.create_task(_run_case(state, case_idx))
-            state.executor.track_task(task)
-            tasks.append(task)
-
-    try:
-        await asyncio.gather(*tasks, return_exceptions=True)
-    except asyncio.CancelledError:
-        for t in tasks:
-            if not t.done():
-                t.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
-        raise
-    finally:
-        for state in suite_states:
-            if state is None:
-                continue
-            state.executor.clear_tracked_tasks()
-            await state.http_client.close_async()
 
-    for idx, state in enumerate(suite_states):
-        if state is None:
-            continue
+    async def _finish_suite(idx: int, state: _SuiteState) -> None:
         suite = state.suite
         verdicts: list[TestVerdict] = [
             v if v is not None else _cancelled_verdict(state.cases[i])
@@ -434,7 +634,9 @@ async def run_suites(
             suite_name=suite.suite_name,
             verdicts=verdicts,
         )
-        result = SuiteResult(suite=suite, verdicts=verdicts, run_result=run_result)
+        result = SuiteResult(
+            suite=suite, verdicts=verdicts, run_result=run_result, warmup=state.warmup
+        )
         results_by_index[idx] = result
 
         if on_suite_done:
@@ -442,6 +644,155 @@ async def run_suites(
                 SuiteContext(suite=suite, cases=state.cases, executor=state.executor), result
             )
 
+    # ── Scheduler: workers pull ready cases, suites open on demand ───────
+
+    ready: list[tuple[float, int, _SuiteState, int]] = []
+    seq = 0
+    order = list(enumerate(suites))
+    if suite_priority is not None:
+        order.sort(key=lambda item: suite_priority(item[1]))
+    pending = deque(order)
+    suite_limit = max(1, max_concurrent_suites) if max_concurrent_suites is not None else math.inf
+    open_suites = 0
+    opening = 0
+    gated = 0  # suites whose cases wait for their baseline
+    cond = asyncio.Condition()
+    suite_tasks: list[asyncio.Task[None]] = []
+
+    async def _run_suite(
+        idx: int, suite: SuiteSpec, opened: asyncio.Future[_SuiteState | None]
+    ) -> None:
+        nonlocal open_suites
+        try:
+            with telemetry.span(
+                "llm_spec.suite",
+                suite_id=suite.suite_id,
+                provider=suite.provider_id,
+                model=suite.model_id,
+                route=suite.route_id,
+                endpoint=suite.endpoint,
+            ):
+                state = await _open_suite(idx, suite)
+                if state is None:
+                    return
+                # Case tasks run in this context so their spans nest under the suite span.
+                state.context = contextvars.copy_context()
+                if not state.cases:
+                    state.finished.set()
+                opened.set_result(state)
+
+                try:
+                    await state.finished.wait()
+                finally:
+                    state.executor.clear_tracked_tasks()
+                    if close_clients:
+                        await state.http_client.close_async()
+
+                await _finish_suite(idx, state)
+        finally:
+            if not opened.done():
+                opened.set_result(None)
+            async with cond:
+                open_suites -= 1
+                cond.notify_all()
+
+    async def _open_next(idx: int, suite: SuiteSpec) -> None:
+        nonlocal opening, gated
+        opened: asyncio.Future[_SuiteState | None] = asyncio.get_running_loop().create_future()
+        suite_tasks.append(asyncio.create_task(_run_suite(idx, suite, opened)))
+        try:
+            state = await opened
+        finally:
+            async with cond:
+                opening -= 1
+                cond.notify_all()
+        if state is None:
+            return
+        indices = list(range(len(state.cases)))
+        if baseline_first and len(indices) > 1:
+            state.gate = next((i for i, c in enumerate(state.cases) if c.is_baseline), None)
+        async with cond:
+            if state.gate is not None:
+                state.held = [i for i in indices if i != state.gate]
+                indices = [state.gate]
+                gated += 1
+            _push(state, indices)
+            cond.notify_all()
+
+    def _push(state: _SuiteState, indices: list[int]) -> None:
+        nonlocal seq
+        for case_idx in indices:
+            case = state.cases[case_idx]
+            key = case_priority(state.suite, case) if case_priority is not None else 0.0
+            heapq.heappush(ready, (key, seq, state, case_idx))
+            seq += 1
+
+    async def _release(state: _SuiteState, baseline: TestVerdict | None) -> None:
+        """Skip or dispatch the cases held behind a settled baseline."""
+        nonlocal gated
+        held, state.gate, state.held = state.held, None, []
+        if baseline is not None and is_infrastructure_failure(baseline):
+            await asyncio.gather(
+                *(_record(state, i, _skipped_verdict(state.cases[i], baseline)) for i in held),
+                return_exceptions=True,
+            )
+            state.settled += len(held)
+            held = []
+        async with cond:
+            gated -= 1
+            _push(state, held)
+            cond.notify_all()
+
+    async def _next_case() -> tuple[_SuiteState, int] | None:
+        nonlocal open_suites, opening
+        while True:
+            async with cond:
+                while True:
+                    if ready:
+                        _key, _seq, state, case_idx = heapq.heappop(ready)
+                        return state, case_idx
+                    if pending and open_suites < suite_limit:
+                        idx, suite = pending.popleft()
+                        open_suites += 1
+                        opening += 1
+                        break
+                    if not pending and not opening and not gated:
+                        return None
+                    await cond.wait()
+            await _open_next(idx, suite)
+
+    async def _worker() -> None:
+        while (item := await _next_case()) is not None:
+            state, case_idx = item
+            task = asyncio.create_task(_run_case(state, case_idx), context=state.context.copy())
+            state.executor.track_task(task)
+            await asyncio.gather(task, return_exceptions=True)
+            state.executor.untrack_task(task)
+            state.settled += 1
+            if case_idx == state.gate:
+                await _release(state, state.verdicts[case_idx])
+            if state.settled == len(state.cases):
+                state.finished.set()
+
+    with telemetry.span("llm_spec.task", suites=len(suites)):
+        workers = [asyncio.create_task(_worker()) for _ in range(max(1, max_concurrent_tests))]
+        try:
+            await asyncio.gather(*workers)
+            outcomes = await asyncio.gather(*suite_tasks, return_exceptions=True)
+        except BaseException:
+            for t in [*workers, *suite_tasks]:
+                if not t.done():
+                    t.cancel()
+            await asyncio.gather(*workers, *suite_tasks, return_exceptions=True)
+            raise
+        finally:
+            if case_runner is not None and session_id is not None:
+                case_runner.close_session(session_id)
+
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+
     if any(result is None for result in results_by_index):
         missing = [idx for idx, result in enumerate(results_by_index) if result is None]
         raise RuntimeError(f"Missing suite results for indices: {missing}")
@@ -467,7 +818,8 @@ async def run_task_suites(
         cancellation_registry.register_task(task_id, asyncio.get_running_loop(), current)
 
     try:
-        return await run_suites(registry, config, **kwargs)
+        with telemetry.scope(task_id=task_id):
+            return await run_suites(registry, config, **kwargs)
     finally:
         cancellation_registry.unregister_task(task_id)
 
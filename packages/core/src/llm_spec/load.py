@@ -0,0 +1,390 @@
+"""Load testing: repeat suite cases at a target rate or concurrency.
+
+``run_load`` drives cases through an ``Executor`` (same request building and
+validation as a normal run) and aggregates what matters under load: throughput,
+latency / TTFT percentiles, error rate (non-2xx responses and transport errors),
+validation failure rate (a 2xx response that failed schema / field / stream checks),
+and a per-window timeline that shows degradation over time.
+
+Modes (``LoadProfile``):
+
+- closed loop (``concurrency=N``): N workers send requests back to back
+- open loop (``rps=R``): requests start on a fixed schedule however slowly the
+  target answers, up to ``max_in_flight``; ``lag`` reports how far starts slipped
+  behind the schedule once that cap was reached
+
+A run stops after ``duration_s`` seconds or ``requests`` requests, whichever comes
+first. Cases are picked at random by ``weights`` (test name → weight, default 1).
+
+CLI::
+
+    python -m llm_spec.load --suite openai:gpt-4o-mini:chat_completions --tests baseline \\
+        --rps 20 --duration 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from llm_spec.config.loader import load_config
+from llm_spec.executor import Executor, create_provider_adapter
+from llm_spec.suites.registry import Registry, build_executable_cases
+from llm_spec.suites.types import ExecutableCase
+
+
+@dataclass
+class LoadProfile:
+    """Shape of a load run.
+
+    Attributes:
+        rps: Open-loop arrival rate (requests started per second).
+        concurrency: Closed-loop worker count.
+        duration_s: Stop issuing requests after this many seconds.
+        requests: Stop after this many requests.
+        weights: Relative pick weight per test name (unlisted tests weigh 1).
+        max_in_flight: Cap on concurrent requests in open-loop mode.
+        window_s: Timeline bucket width.
+        seed: Seed for case selection (reproducible mixes).
+    """
+
+    rps: float | None = None
+    concurrency: int | None = None
+    duration_s: float | None = None
+    requests: int | None = None
+    weights: dict[str, float] = field(default_factory=dict)
+    max_in_flight: int = 256
+    window_s: float = 1.0
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if (self.rps is None) == (self.concurrency is None):
+            raise ValueError("set exactly one of rps or concurrency")
+        if self.rps is not None and self.rps <= 0:
+            raise ValueError("rps must be positive")
+        if self.concurrency is not None and self.concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if self.duration_s is None and self.requests is None:
+            raise ValueError("set duration_s and/or requests")
+
+
+@dataclass
+class LoadSample:
+    """One request issued during a load run.
+
+    Attributes:
+        offset_s: Start time relative to the beginning of the run.
+        test_name: Case that was sent.
+        status: Verdict status (``pass``, ``fail``, ``error``).
+        latency_ms: Wall time of the request including validation.
+        ttft_ms: Time to first stream chunk (streaming cases).
+        lag_ms: How late the request started versus its schedule (open loop).
+        stage: Failure stage, if any (``request`` = the request itself failed).
+        code: Failure code, if any.
+    """
+
+    offset_s: float
+    test_name: str
+    status: str
+    latency_ms: float
+    ttft_ms: float | None = None
+    lag_ms: float = 0.0
+    stage: str | None = None
+    code: str | None = None
+
+    @property
+    def is_error(self) -> bool:
+        """The request failed (transport error or non-2xx response)."""
+        return self.status == "error" or self.stage == "request"
+
+    @property
+    def is_invalid(self) -> bool:
+        """The provider answered but the response failed validation."""
+        return self.status == "fail" and not self.is_error
+
+
+OnSample = Callable[[LoadSample], Awaitable[None]] | None
+
+
+@dataclass
+class LoadReport:
+    """Samples of one load run plus their aggregates."""
+
+    profile: LoadProfile
+    started_at: str
+    elapsed_s: float
+    samples: list[LoadSample] = field(default_factory=list)
+
+    def summary(self) -> dict[str, Any]:
+        """Whole-run aggregates.
+
+        Returns:
+            Request count, throughput, error / validation failure rates, latency,
+            TTFT and lag percentiles, failure codes, and the same rates and
+            latency percentiles per test.
+        """
+        samples = self.samples
+        by_test: dict[str, list[LoadSample]] = {}
+        for sample in samples:
+            by_test.setdefault(sample.test_name, []).append(sample)
+        return {
+            "requests": len(samples),
+            "elapsed_s": round(self.elapsed_s, 3),
+            "throughput_rps": round(len(samples) / self.elapsed_s, 3) if self.elapsed_s else 0.0,
+            **_rates(samples),
+            "latency_ms": _percentiles(s.latency_ms for s in samples),
+            "ttft_ms": _percentiles(s.ttft_ms for s in samples if s.ttft_ms is not None),
+            "lag_ms": _percentiles(s.lag_ms for s in samples),
+            "codes": dict(Counter(s.code for s in samples if s.code)),
+            "tests": {
+                name: {
+                    "requests": len(group),
+                    **_rates(group),
+                    "latency_ms": _percentiles(s.latency_ms for s in group),
+                }
+                for name, group in sorted(by_test.items())
+            },
+        }
+
+    def timeline(self) -> list[dict[str, Any]]:
+        """Per-window aggregates, by request start time.
+
+        Returns:
+            One entry per ``window_s`` bucket: start offset, requests, achieved rate,
+            error / validation failure rates and latency p50/p95.
+        """
+        window = self.profile.window_s
+        buckets: dict[int, list[LoadSample]] = {}
+        for sample in self.samples:
+            buckets.setdefault(int(sample.offset_s // window), []).append(sample)
+        timeline = []
+        for index in sorted(buckets):
+            group = buckets[index]
+            latency = _percentiles(s.latency_ms for s in group)
+            timeline.append(
+                {
+                    "t_s": round(index * window, 3),
+                    "requests": len(group),
+                    "rps": round(len(group) / window, 3),
+                    **_rates(group),
+                    "p50_ms": latency["p50"],
+                    "p95_ms": latency["p95"],
+                }
+            )
+        return timeline
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the profile, summary and timeline (samples omitted)."""
+        return {
+            "profile": asdict(self.profile),
+            "started_at": self.started_at,
+            "summary": self.summary(),
+            "timeline": self.timeline(),
+        }
+
+
+async def run_load(
+    executor: Executor,
+    cases: list[ExecutableCase],
+    profile: LoadProfile,
+    *,
+    on_sample: OnSample = None,
+) -> LoadReport:
+    """Repeat *cases* through *executor* according to *profile*.
+
+    ``executor.cancel()`` stops the run early; requests already in flight are
+    cancelled and the report covers what finished.
+
+    Args:
+        executor: Executor bound to the target provider.
+        cases: Cases to pick from (e.g. ``build_executable_cases(suite, {...})``).
+        profile: Rate / concurrency, stop condition and case weights.
+        on_sample: Awaited after every request.
+
+    Returns:
+        The collected samples.
+
+    Raises:
+        ValueError: If *cases* is empty or all weights are zero.
+    """
+    weights = [max(0.0, profile.weights.get(c.test_name, 1.0)) for c in cases]
+    if not cases or not any(weights):
+        raise ValueError("no cases to run")
+    rng = random.Random(profile.seed)
+    report = LoadReport(profile=profile, started_at=datetime.now(UTC).isoformat(), elapsed_s=0.0)
+    start = time.perf_counter()
+    deadline = start + profile.duration_s if profile.duration_s is not None else math.inf
+    issued = 0
+
+    def _next_case() -> ExecutableCase | None:
+        nonlocal issued
+        if executor.cancelled or time.perf_counter() >= deadline:
+            return None
+        if profile.requests is not None and issued >= profile.requests:
+            return None
+        issued += 1
+        return rng.choices(cases, weights)[0]
+
+    async def _send(case: ExecutableCase, scheduled: float) -> None:
+        began = time.perf_counter()
+        verdict = await executor.run_one(case)
+        sample = LoadSample(
+            offset_s=round(began - start, 6),
+            test_name=case.test_name,
+            status=verdict.status,
+            latency_ms=round((time.perf_counter() - began) * 1000, 3),
+            ttft_ms=verdict.ttft_ms,
+            lag_ms=round(max(0.0, began - scheduled) * 1000, 3),
+            stage=verdict.failure.stage if verdict.failure else None,
+            code=verdict.failure.code if verdict.failure else None,
+        )
+        report.samples.append(sample)
+        if on_sample:
+            await on_sample(sample)
+
+    if profile.concurrency is not None:
+
+        async def _worker() -> None:
+            while (case := _next_case()) is not None:
+                await _send(case, time.perf_counter())
+
+        workers = [asyncio.create_task(_worker()) for _ in range(profile.concurrency)]
+        for task in workers:
+            executor.track_task(task)
+        await asyncio.gather(*workers, return_exceptions=True)
+    else:
+        assert profile.rps is not None
+        interval = 1.0 / profile.rps
+        slots = asyncio.Semaphore(max(1, profile.max_in_flight))
+        in_flight: set[asyncio.Task[None]] = set()
+
+        async def _one(case: ExecutableCase, scheduled: float) -> None:
+            try:
+                await _send(case, scheduled)
+            finally:
+                slots.release()
+
+        while True:
+            scheduled = start + issued * interval
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            case = _next_case()
+            if case is None:
+                break
+            await slots.acquire()
+            task = asyncio.create_task(_one(case, scheduled))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        if executor.cancelled:
+            for task in in_flight:
+                task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+    executor.clear_tracked_tasks()
+    report.elapsed_s = time.perf_counter() - start
+    return report
+
+
+def _rates(samples: list[LoadSample]) -> dict[str, float]:
+    n = len(samples)
+    errors = sum(1 for s in samples if s.is_error)
+    failures = sum(1 for s in samples if s.is_invalid)
+    return {
+        "error_rate": round(errors / n, 4) if n else 0.0,
+        "fail_rate": round(failures / n, 4) if n else 0.0,
+    }
+
+
+def _percentiles(values: Iterable[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+    last = len(ordered) - 1
+    stats = {f"p{q}": round(ordered[min(last, round(q / 100 * last))], 3) for q in (50, 90, 95, 99)}
+    stats["mean"] = round(sum(ordered) / len(ordered), 3)
+    stats["max"] = round(ordered[-1], 3)
+    return stats
+
+
+# ── CLI ───────────────────────────────────────────────────
+
+
+async def _run_cli(args: argparse.Namespace, profile: LoadProfile) -> LoadReport:
+    registry = Registry.from_directory(args.registry)
+    suite = registry.get_suite(args.suite)
+    if suite is None:
+        raise SystemExit(f"Suite not found: {args.suite}")
+    selected = set(args.tests.split(",")) if args.tests else None
+    cases = build_executable_cases(suite, selected_tests=selected)
+    http_client, adapter = create_provider_adapter(suite.provider_id, load_config(args.config))
+    executor = Executor(client=adapter, source_path=suite.source_path)
+
+    async def _progress(sample: LoadSample) -> None:
+        if sample.status != "pass":
+            print(f"{sample.offset_s:8.2f}s {sample.test_name}: {sample.status} {sample.code}")
+
+    try:
+        return await run_load(executor, cases, profile, on_sample=_progress)
+    finally:
+        await http_client.close_async()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Run llm-spec suite cases as a load test.")
+    parser.add_argument("--suite", required=True, help="suite id (see the registry)")
+    parser.add_argument("--tests", default=None, help="comma-separated test names (default all)")
+    parser.add_argument(
+        "--weight", action="append", default=[], metavar="TEST=W", help="pick weight per test"
+    )
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--rps", type=float, help="open loop: requests started per second")
+    mode.add_argument("--concurrency", type=int, help="closed loop: concurrent workers")
+    parser.add_argument("--duration", type=float, default=None, help="seconds")
+    parser.add_argument("--requests", type=int, default=None, help="total requests")
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--window", type=float, default=1.0, help="timeline window (seconds)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--config", type=Path, default=Path("llm-spec.toml"))
+    parser.add_argument("--registry", type=Path, default=Path("suites-registry/providers"))
+    parser.add_argument("--output", type=Path, default=None, help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    weights: dict[str, float] = {}
+    for item in args.weight:
+        name, _, value = item.partition("=")
+        weights[name] = float(value or 1.0)
+    try:
+        profile = LoadProfile(
+            rps=args.rps,
+            concurrency=args.concurrency,
+            duration_s=args.duration,
+            requests=args.requests,
+            weights=weights,
+            max_in_flight=args.max_in_flight,
+            window_s=args.window,
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    report = asyncio.run(_run_cli(args, profile))
+    output = json.dumps(report.to_dict(), indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    print(json.dumps(report.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,81 @@
-"""Shared helpers for dotted/bracketed JSON-like paths."""
+"""Shared helpers for dotted/bracketed JSON-like paths.
+
+Paths are parsed once into cached accessors (``compile_path``) and resolved without
+re-splitting or regex matching; ``compile_paths`` resolves a whole set of paths (the
+``required_fields`` of a case) in one walk of the response.
+"""
 
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 _INDEXED_PART_RE = re.compile(r"^(\w+)\[(\d+|\*)\]$")
 
+# A compiled path is a tuple of steps: ``str`` (dict key), ``int`` (list index) or
+# ``WILDCARD`` (first list item for which the rest of the path resolves).
+WILDCARD = None
+Step = str | int | None
+
+
+def _parse(path: str) -> tuple[Step, ...]:
+    steps: list[Step] = []
+    for part in path.split("."):
+        indexed = _INDEXED_PART_RE.match(part)
+        if indexed is None:
+            steps.append(part)
+            continue
+        key, idx = indexed.groups()
+        steps.append(key)
+        steps.append(WILDCARD if idx == "*" else int(idx))
+    return tuple(steps)
+
+
+def _resolve(obj: Any, steps: tuple[Step, ...], start: int = 0) -> Any:
+    current = obj
+    for i in range(start, len(steps)):
+        step = steps[i]
+        if type(step) is str:
+            if not isinstance(current, dict) or step not in current:
+                return None
+            current = current[step]
+        elif not isinstance(current, list):
+            return None
+        elif step is WILDCARD:
+            for item in current:
+                val = _resolve(item, steps, i + 1)
+                if val is not None:
+                    return val
+            return None
+        elif step < len(current):  # type: ignore[operator]
+            current = current[step]  # type: ignore[index]
+        else:
+            return None
+    return current
+
+
+class PathAccessor:
+    """A path parsed once; calling it resolves the path like ``get_value_at_path``."""
+
+    __slots__ = ("path", "steps")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.steps = _parse(path)
+
+    def __call__(self, obj: Any) -> Any:
+        return _resolve(obj, self.steps)
+
+    def __repr__(self) -> str:
+        return f"PathAccessor({self.path!r})"
+
+
+@lru_cache(maxsize=4096)
+def compile_path(path: str) -> PathAccessor:
+    """Return the cached accessor of *path* (parsed on first use only)."""
+    return PathAccessor(path)
+
 
 def get_value_at_path(obj: Any, path: str | None) -> Any:
     """Get a nested value by path.
@@ -18,42 +87,82 @@ def get_value_at_path(obj: Any, path: str | None) -> Any:
     """
     if not path:
         return None
+    return _resolve(obj, compile_path(path).steps)
 
-    current = obj
-    parts = path.split(".")
-    for i, part in enumerate(parts):
-        indexed = _INDEXED_PART_RE.match(part)
-        if indexed:
-            key, idx_str = indexed.groups()
-            if not (isinstance(current, dict) and key in current):
-                return None
-            current = current[key]
-            if not isinstance(current, list):
-                return None
-            if idx_str == "*":
-                remaining_path = ".".join(parts[i + 1 :])
-                for item in current:
-                    if remaining_path:
-                        val = get_value_at_path(item, remaining_path)
-                        if val is not None:
-                            return val
-                    else:
-                        if item is not None:
-                            return item
-                return None
-            idx = int(idx_str)
-            if idx >= len(current):
-                return None
-            current = current[idx]
-            continue
 
-        if isinstance(current, dict) and part in current:
-            current = current[part]
-            continue
+# ── Batch resolution ──────────────────────────────────────
 
-        return None
 
-    return current
+class _Node:
+    __slots__ = ("children", "ends", "paths")
+
+    def __init__(self) -> None:
+        self.children: dict[Step, _Node] = {}
+        self.ends: list[str] = []  # paths ending here
+        self.paths: list[str] = []  # paths ending here or below
+
+
+class PathSet:
+    """Several paths resolved together in one walk of the shared prefixes.
+
+    ``required_fields`` of a case mostly share prefixes (``choices[0].message...``);
+    a ``PathSet`` walks each prefix once instead of once per path.
+    """
+
+    __slots__ = ("paths", "_root")
+
+    def __init__(self, paths: tuple[str, ...]) -> None:
+        self.paths = paths
+        self._root = _Node()
+        for path in paths:
+            if not path:
+                continue
+            node = self._root
+            node.paths.append(path)
+            for step in compile_path(path).steps:
+                node = node.children.setdefault(step, _Node())
+                node.paths.append(path)
+            node.ends.append(path)
+
+    def resolve(self, obj: Any) -> dict[str, Any]:
+        """Value of every path (``None`` when absent), as ``get_value_at_path`` returns it."""
+        found: dict[str, Any] = {}
+        _walk(self._root, obj, found)
+        return {path: found.get(path) for path in self.paths}
+
+    def missing(self, obj: Any) -> list[str]:
+        """Paths that resolve to ``None``, in declaration order."""
+        found: dict[str, Any] = {}
+        _walk(self._root, obj, found)
+        return [path for path in self.paths if found.get(path) is None]
+
+
+def _walk(node: _Node, obj: Any, found: dict[str, Any]) -> None:
+    if obj is None:
+        return
+    for path in node.ends:
+        if path not in found:
+            found[path] = obj
+    for step, child in node.children.items():
+        if type(step) is str:
+            if isinstance(obj, dict) and step in obj:
+                _walk(child, obj[step], found)
+        elif not isinstance(obj, list):
+            continue
+        elif step is WILDCARD:
+            # Each path below takes the first item it resolves in.
+            for item in obj:
+                if all(path in found for path in child.paths):
+                    break
+                _walk(child, item, found)
+        elif step < len(obj):  # type: ignore[operator]
+            _walk(child, obj[step], found)  # type: ignore[index]
+
+
+@lru_cache(maxsize=1024)
+def compile_paths(paths: tuple[str, ...]) -> PathSet:
+    """Return the cached ``PathSet`` of *paths*."""
+    return PathSet(paths)
 
 
 def extract_param_paths(
@@ -0,0 +1,174 @@
+"""Per-phase timing of test execution.
+
+``TestRunner`` times each phase of a case with a ``PhaseTimer`` and stores the
+result on ``TestVerdict.timings`` (milliseconds per phase):
+
+- ``resolve``: asset placeholder resolution and upload file preparation
+- ``serialize`` / ``connect`` / ``ttfb`` / ``download``: the HTTP exchange, split
+  by httpx connection events (``request`` when the transport reports none)
+- ``parse``: response / stream chunk parsing
+- ``schema``, ``required_fields``, ``stream_rules``: validation checks
+- ``callback``: the caller's ``on_test_done`` side effects (DB writes, events)
+
+Phase hooks registered with ``add_phase_hook`` see every measurement as it is
+taken (e.g. to feed a profiler or metrics exporter). ``summarize_timings``
+aggregates verdict timings per suite or run; ``summarize_queue`` does the same
+for the time cases spent waiting for a concurrency slot (``TestVerdict.queue_ms``),
+which is not part of any phase.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from llm_spec.client.trace import TransferTrace
+    from llm_spec.results.result_types import TestVerdict
+    from llm_spec.suites.types import ExecutableCase
+
+logger = logging.getLogger(__name__)
+
+PHASES: tuple[str, ...] = (
+    "resolve",
+    "serialize",
+    "connect",
+    "ttfb",
+    "download",
+    "request",
+    "parse",
+    "schema",
+    "required_fields",
+    "stream_rules",
+    "callback",
+)
+
+PhaseHook = Callable[["ExecutableCase", str, float], None]
+"""``(case, phase, duration_ms) → None``"""
+
+_hooks: list[PhaseHook] = []
+
+
+def add_phase_hook(hook: PhaseHook) -> None:
+    """Register *hook* to receive every phase measurement."""
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def remove_phase_hook(hook: PhaseHook) -> None:
+    """Unregister a hook added with ``add_phase_hook``."""
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+class PhaseTimer:
+    """Accumulates phase durations for one case.
+
+    Attributes:
+        case: The case being timed (passed to hooks).
+        timings: Milliseconds per phase (repeated phases accumulate).
+        ttft_ms: Milliseconds until the first stream chunk (streaming cases only).
+        first_byte_at: When the response headers arrived (ISO timestamp).
+    """
+
+    def __init__(self, case: ExecutableCase, timings: dict[str, float] | None = None):
+        self.case = case
+        self.timings = timings if timings is not None else {}
+        self.ttft_ms: float | None = None
+        self.first_byte_at = ""
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as *name* (also when it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000)
+
+    def add(self, name: str, duration_ms: float) -> None:
+        """Record *duration_ms* for phase *name* and notify hooks."""
+        self.timings[name] = round(self.timings.get(name, 0.0) + duration_ms, 3)
+        for hook in _hooks:
+            try:
+                hook(self.case, name, duration_ms)
+            except Exception:
+                logger.exception("phase hook %r failed", hook)
+
+    def add_transfer(self, trace: TransferTrace) -> None:
+        """Record the HTTP exchange phases captured by *trace*."""
+        for name, duration_ms in trace.phases_ms().items():
+            self.add(name, duration_ms)
+        if trace.chunk_at:
+            self.ttft_ms = round(trace.chunk_offsets_ms()[0], 3)
+        if trace.response_at is not None:
+            ago = timedelta(seconds=time.perf_counter() - trace.response_at)
+            self.first_byte_at = (datetime.now(UTC) - ago).isoformat()
+
+
+def summarize_timings(verdicts: Iterable[TestVerdict]) -> dict[str, dict[str, float]]:
+    """Aggregate per-phase timings across verdicts.
+
+    Args:
+        verdicts: Verdicts carrying ``timings``.
+
+    Returns:
+        ``{phase: {count, total_ms, mean_ms, p50_ms, p95_ms, max_ms, share}}`` in
+        ``PHASES`` order; ``share`` is the phase's fraction of all timed work.
+    """
+    samples: dict[str, list[float]] = {}
+    for verdict in verdicts:
+        for name, value in verdict.timings.items():
+            samples.setdefault(name, []).append(value)
+    grand_total = sum(sum(values) for values in samples.values())
+    order = {name: i for i, name in enumerate(PHASES)}
+    summary: dict[str, dict[str, float]] = {}
+    for name in sorted(samples, key=lambda n: (order.get(n, len(order)), n)):
+        stats = _stats(samples[name])
+        stats["share"] = round(stats["total_ms"] / grand_total, 4) if grand_total else 0.0
+        summary[name] = stats
+    return summary
+
+
+def summarize_queue(verdicts: Iterable[TestVerdict], *, waited_ms: float = 1.0) -> dict[str, float]:
+    """Aggregate the time cases waited for a concurrency slot.
+
+    A high ``waited`` fraction with a large ``p95_ms`` means ``max_concurrent`` is the
+    bottleneck; near-zero waits mean the limit could be lowered without slowing the run.
+
+    Args:
+        verdicts: Verdicts carrying ``queue_ms``.
+        waited_ms: Waits at or above this count as having queued.
+
+    Returns:
+        ``{count, waited, total_ms, mean_ms, p50_ms, p95_ms, max_ms}`` where ``waited``
+        is the fraction of cases that queued; empty when no verdict was queued.
+    """
+    values = [v.queue_ms for v in verdicts if v.queue_ms is not None]
+    if not values:
+        return {}
+    stats = _stats(values)
+    stats["waited"] = round(sum(1 for v in values if v >= waited_ms) / len(values), 4)
+    return stats
+
+
+def _stats(values: list[float]) -> dict[str, float]:
+    values = sorted(values)
+    total = sum(values)
+    return {
+        "count": len(values),
+        "total_ms": round(total, 3),
+        "mean_ms": round(total / len(values), 3),
+        "p50_ms": round(_percentile(values, 0.50), 3),
+        "p95_ms": round(_percentile(values, 0.95), 3),
+        "max_ms": round(values[-1], 3),
+    }
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    idx = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
@@ -1,17 +1,23 @@
 """Result types — Layer 4 of the data model.
 
 FailureInfo → TestVerdict → RunResult
+
+Like the case types, these are slotted and intern their repeated strings (see
+``llm_spec.suites.types``), so load tests and history analysis can hold hundreds of
+thousands of verdicts.
 """
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
-from llm_spec.suites.types import FocusParam
+from llm_spec.profiling import summarize_queue, summarize_timings
+from llm_spec.suites.types import FocusParam, intern_str
 
 
-@dataclass
+@dataclass(slots=True)
 class FailureInfo:
     """Failure details, only present when status != 'pass'."""
 
@@ -21,8 +27,12 @@ class FailureInfo:
     missing_fields: list[str] = field(default_factory=list)
     missing_events: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        self.stage = sys.intern(self.stage)
+        self.code = intern_str(self.code)
+
 
-@dataclass
+@dataclass(slots=True)
 class TestVerdict:
     """Execution verdict for a single ExecutableCase."""
 
@@ -33,12 +43,21 @@ class TestVerdict:
     focus: FocusParam | None = None
 
     # Verdict
-    status: Literal["pass", "fail", "error"] = "error"
+    status: Literal["pass", "fail", "error", "skipped"] = "error"
 
     # Timing
     started_at: str = ""
     finished_at: str = ""
     latency_ms: int | None = None
+    timings: dict[str, float] = field(default_factory=dict)  # phase → ms (see llm_spec.profiling)
+    ttft_ms: float | None = None  # first stream chunk (streaming cases)
+
+    # Scheduling: queued_at → dispatched_at (concurrency slot acquired) → first_byte_at
+    # (response headers) → finished_at; queue_ms is the wait for the slot.
+    queued_at: str = ""
+    dispatched_at: str = ""
+    first_byte_at: str = ""
+    queue_ms: float | None = None
 
     # HTTP layer
     http_status: int | None = None
@@ -55,8 +74,13 @@ class TestVerdict:
     request_snapshot: dict[str, Any] | None = None
     response_body: Any = None
 
+    def __post_init__(self) -> None:
+        self.case_id = sys.intern(self.case_id)
+        self.test_name = sys.intern(self.test_name)
+        self.status = sys.intern(self.status)  # type: ignore[assignment]
 
-@dataclass
+
+@dataclass(slots=True)
 class RunResult:
     """Aggregated result for one SuiteSpec run."""
 
@@ -77,6 +101,12 @@ class RunResult:
     # Verdicts
     verdicts: list[TestVerdict] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        self.provider = sys.intern(self.provider)
+        self.model = intern_str(self.model)
+        self.route = intern_str(self.route)
+        self.endpoint = sys.intern(self.endpoint)
+
     @property
     def total(self) -> int:
         return len(self.verdicts)
@@ -87,7 +117,19 @@ class RunResult:
 
     @property
     def failed(self) -> int:
-        return sum(1 for v in self.verdicts if v.status != "pass")
+        return sum(1 for v in self.verdicts if v.status not in ("pass", "skipped"))
+
+    @property
+    def skipped(self) -> int:
+        return sum(1 for v in self.verdicts if v.status == "skipped")
+
+    def timing_summary(self) -> dict[str, dict[str, float]]:
+        """Per-phase timing aggregated over all verdicts (see ``summarize_timings``)."""
+        return summarize_timings(self.verdicts)
+
+    def queue_summary(self) -> dict[str, float]:
+        """Concurrency-slot wait aggregated over all verdicts (see ``summarize_queue``)."""
+        return summarize_queue(self.verdicts)
 
 
 __all__ = [
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     pass
 
 
+from llm_spec.client.spool import BinaryBody, is_binary_content_type, spooled_body
 from llm_spec.json_types import JSONValue
 
 
@@ -289,10 +290,15 @@ class ResponseParser:
         """Best-effort extract response body for reporting.
 
         Preference order:
-        1) JSON (dict/list/primitive) if response.json() succeeds
-        2) text fallback
+        1) summary of a spooled binary body (``llm_spec.client.spool``)
+        2) JSON (dict/list/primitive) if response.json() succeeds
+        3) summary of an in-memory binary body
+        4) text fallback
         """
         # Keep this method dependency-light (no hard dependency on httpx at runtime).
+        spooled = spooled_body(response)
+        if spooled is not None:
+            return spooled.summary()
         try:
             json_method = getattr(response, "json", None)
             if callable(json_method):
@@ -313,18 +319,11 @@ class ResponseParser:
                 if isinstance(content_type_val, str):
                     content_type = content_type_val
 
-            if content_type is not None and (
-                content_type.startswith("audio/")
-                or content_type.startswith("image/")
-                or content_type.startswith("application/octet-stream")
-            ):
+            if content_type is not None and is_binary_content_type(content_type):
                 content = getattr(response, "content", b"")
-                size = len(content) if isinstance(content, (bytes, bytearray)) else None
-                return {
-                    "binary": True,
-                    "content_type": content_type,
-                    "size_bytes": size,
-                }
+                if isinstance(content, (bytes, bytearray)):
+                    return BinaryBody.from_bytes(content_type, bytes(content)).summary()
+                return {"binary": True, "content_type": content_type, "size_bytes": None}
         except Exception:
             pass
 
@@ -13,7 +13,10 @@ if TYPE_CHECKING:
     from pydantic import BaseModel
 
 from llm_spec.adapters.base import ProviderAdapter
-from llm_spec.path_utils import get_value_at_path
+from llm_spec.client.errors import transport_error_code
+from llm_spec.client.trace import trace_transfer
+from llm_spec.path_utils import compile_paths
+from llm_spec.profiling import PhaseTimer
 from llm_spec.results.result_types import FailureInfo, TestVerdict
 from llm_spec.runners.asset_resolver import AssetResolver
 from llm_spec.runners.parsers import ResponseParser, StreamResponseParser
@@ -26,6 +29,14 @@ from .schema_registry import get_schema
 # ── Shared verdict helpers ────────────────────────────────
 
 
+def _transport_error_message(exc: Exception) -> str:
+    """Verdict message for an exception raised while sending a request."""
+    code = transport_error_code(exc)
+    if code == "CONNECTION_ERROR":
+        return f"Connection error: {exc}"
+    return f"{code.replace('_', ' ').capitalize()}: {exc}"
+
+
 def error_verdict(
     case: ExecutableCase,
     *,
@@ -64,7 +75,7 @@ class TestRunner:
     1. Resolve asset placeholders in request params (via AssetResolver)
     2. Execute HTTP requests (normal or streaming)
     3. Validate responses (schema + required fields + stream rules)
-    4. Return TestVerdict (no reporting side effects)
+    4. Return TestVerdict with per-phase timings (no reporting side effects)
     """
 
     def __init__(
@@ -81,22 +92,34 @@ class TestRunner:
     def run(self, case: ExecutableCase) -> TestVerdict:
         """Execute a ExecutableCase synchronously and return a TestVerdict."""
         self.client.set_current_test_name(case.test_name)
+        timer = PhaseTimer(case)
         try:
             if case.request.stream:
-                return self._run_stream(case)
-            return self._run_normal(case)
+                verdict = self._run_stream(case, timer)
+            else:
+                verdict = self._run_normal(case, timer)
         finally:
             self.client.set_current_test_name(None)
+        verdict.timings = timer.timings
+        verdict.ttft_ms = timer.ttft_ms
+        verdict.first_byte_at = timer.first_byte_at
+        return verdict
 
     async def run_async(self, case: ExecutableCase) -> TestVerdict:
         """Execute a ExecutableCase asynchronously and return a TestVerdict."""
         self.client.set_current_test_name(case.test_name)
+        timer = PhaseTimer(case)
         try:
             if case.request.stream:
-                return await self._run_stream_async(case)
-            return await self._run_normal_async(case)
+                verdict = await self._run_stream_async(case, timer)
+            else:
+                verdict = await self._run_normal_async(case, timer)
         finally:
             self.client.set_current_test_name(None)
+        verdict.timings = timer.timings
+        verdict.ttft_ms = timer.ttft_ms
+        verdict.first_byte_at = timer.first_byte_at
+        return verdict
 
     # ── Asset resolution (delegated to AssetResolver) ───
 
@@ -194,10 +217,12 @@ class TestRunner:
         response: httpx.Response,
         started_at: str,
         start_mono: float,
+        timer: PhaseTimer,
     ) -> TestVerdict:
         """Validate a normal HTTP response (schema + required fields)."""
         status_code = response.status_code
-        response_body = ResponseParser.parse_response(response)
+        with timer.phase("parse"):
+            response_body = ResponseParser.parse_response(response)
         http_success = 200 <= status_code < 300
 
         schema_valid = True
@@ -206,10 +231,11 @@ class TestRunner:
 
         response_schema: type[BaseModel] | None = get_schema(case.checks.response_schema)
         if response_schema and http_success:
-            if isinstance(response_body, dict):
-                result = ResponseValidator.validate_json(response_body, response_schema)
-            else:
-                result = ResponseValidator.validate_response(response, response_schema)
+            with timer.phase("schema"):
+                if isinstance(response_body, dict):
+                    result = ResponseValidator.validate_json(response_body, response_schema)
+                else:
+                    result = ResponseValidator.validate_response(response, response_schema)
             if not result.is_valid:
                 schema_valid = False
                 schema_missing = list(result.missing_fields)
@@ -217,10 +243,10 @@ class TestRunner:
 
         missing_required: list[str] = []
         if http_success and isinstance(response_body, dict):
-            for field_path in case.checks.required_fields:
-                val = get_value_at_path(response_body, field_path)
-                if val is None:
-                    missing_required.append(field_path)
+            with timer.phase("required_fields"):
+                required = compile_paths(tuple(case.checks.required_fields))
+                missing_required = required.missing(response_body)
+                for field_path in missing_required:
                     validation_errors.append(f"Missing required field: {field_path}")
 
         all_missing = schema_missing + missing_required
@@ -252,13 +278,15 @@ class TestRunner:
         all_raw_chunks: list[bytes],
         started_at: str,
         start_mono: float,
+        timer: PhaseTimer,
     ) -> TestVerdict:
         """Validate stream chunks (parse → schema → stream rules)."""
         parser = StreamResponseParser(case.provider)
 
         # Parse chunks
         try:
-            _formatted, parsed_chunks = parser.format_stream_response(all_raw_chunks)
+            with timer.phase("parse"):
+                _formatted, parsed_chunks = parser.format_stream_response(all_raw_chunks)
         except Exception as e:
             finished_at = datetime.now(UTC).isoformat()
             latency_ms = int((time.monotonic() - start_mono) * 1000)
@@ -295,13 +323,14 @@ class TestRunner:
         chunk_schema: type[BaseModel] | None = get_schema(case.checks.stream_chunk_schema)
         validation_errors: list[str] = []
         if chunk_schema and parsed_chunks:
-            for i, parsed in enumerate(parsed_chunks):
-                if isinstance(parsed, dict) and parsed.get("done") is True:
-                    continue
-                result = ResponseValidator.validate_json(parsed, chunk_schema)
-                if not result.is_valid:
-                    err = result.error_message or "Chunk schema validation failed"
-                    validation_errors.append(f"Chunk {i}: {err}")
+            with timer.phase("schema"):
+                for i, parsed in enumerate(parsed_chunks):
+                    if isinstance(parsed, dict) and parsed.get("done") is True:
+                        continue
+                    result = ResponseValidator.validate_json(parsed, chunk_schema)
+                    if not result.is_valid:
+                        err = result.error_message or "Chunk schema validation failed"
+                        validation_errors.append(f"Chunk {i}: {err}")
 
             if validation_errors:
                 finished_at = datetime.now(UTC).isoformat()
@@ -322,19 +351,20 @@ class TestRunner:
 
         # Validate stream rules
         stream_rules = case.checks.stream_rules
-        observations = extract_observations(
-            provider=case.provider,
-            endpoint=case.request.endpoint,
-            parsed_chunks=parsed_chunks,
-            raw_chunks=all_raw_chunks,
-            stream_rules=stream_rules,
-        )
-        missing_events = validate_stream(
-            provider=case.provider,
-            endpoint=case.request.endpoint,
-            observations=observations,
-            stream_rules=stream_rules,
-        )
+        with timer.phase("stream_rules"):
+            observations = extract_observations(
+                provider=case.provider,
+                endpoint=case.request.endpoint,
+                parsed_chunks=parsed_chunks,
+                raw_chunks=all_raw_chunks,
+                stream_rules=stream_rules,
+            )
+            missing_events = validate_stream(
+                provider=case.provider,
+                endpoint=case.request.endpoint,
+                observations=observations,
+                stream_rules=stream_rules,
+            )
         if missing_events:
             validation_errors.append(f"Missing required stream events: {', '.join(missing_events)}")
 
@@ -370,25 +400,31 @@ class TestRunner:
 
     # ── Normal (non-streaming) test execution ─────────────
 
-    def _run_normal(self, case: ExecutableCase) -> TestVerdict:
+    def _run_normal(self, case: ExecutableCase, timer: PhaseTimer) -> TestVerdict:
         started_at = datetime.now(UTC).isoformat()
         start_mono = time.monotonic()
-        params = self._resolve_asset_placeholders(case.request.params)
-        files, opened = self._prepare_upload_files(case)
+        with timer.phase("resolve"):
+            params = self._resolve_asset_placeholders(case.request.params)
+            files, opened = self._prepare_upload_files(case)
         try:
-            response = self.client.request(
-                endpoint=case.request.endpoint,
-                params=params,
-                files=files,
-                method=case.request.method,
-                additional_headers=case.request.headers or None,
-            )
+            with trace_transfer() as trace:
+                try:
+                    response = self.client.request(
+                        endpoint=case.request.endpoint,
+                        params=params,
+                        files=files,
+                        method=case.request.method,
+                        additional_headers=case.request.headers or None,
+                    )
+                finally:
+                    timer.add_transfer(trace)
         except Exception as e:
             finished_at = datetime.now(UTC).isoformat()
             latency_ms = int((time.monotonic() - start_mono) * 1000)
             return error_verdict(
                 case,
-                message=f"Connection error: {e}",
+                message=_transport_error_message(e),
+                code=transport_error_code(e),
                 started_at=started_at,
                 finished_at=finished_at,
                 latency_ms=latency_ms,
@@ -396,27 +432,33 @@ class TestRunner:
         finally:
             for f in opened:
                 f.close()
-        return self._validate_normal_response(case, response, started_at, start_mono)
+        return self._validate_normal_response(case, response, started_at, start_mono, timer)
 
-    async def _run_normal_async(self, case: ExecutableCase) -> TestVerdict:
+    async def _run_normal_async(self, case: ExecutableCase, timer: PhaseTimer) -> TestVerdict:
         started_at = datetime.now(UTC).isoformat()
         start_mono = time.monotonic()
-        params = self._resolve_asset_placeholders(case.request.params)
-        files, opened = self._prepare_upload_files(case)
+        with timer.phase("resolve"):
+            params = self._resolve_asset_placeholders(case.request.params)
+            files, opened = self._prepare_upload_files(case)
         try:
-            response = await self.client.request_async(
-                endpoint=case.request.endpoint,
-                params=params,
-                files=files,
-                method=case.request.method,
-                additional_headers=case.request.headers or None,
-            )
+            with trace_transfer() as trace:
+                try:
+                    response = await self.client.request_async(
+                        endpoint=case.request.endpoint,
+                        params=params,
+                        files=files,
+                        method=case.request.method,
+                        additional_headers=case.request.headers or None,
+                    )
+                finally:
+                    timer.add_transfer(trace)
         except Exception as e:
             finished_at = datetime.now(UTC).isoformat()
             latency_ms = int((time.monotonic() - start_mono) * 1000)
             return error_verdict(
                 case,
-                message=f"Connection error: {e}",
+                message=_transport_error_message(e),
+                code=transport_error_code(e),
                 started_at=started_at,
                 finished_at=finished_at,
                 latency_ms=latency_ms,
@@ -424,23 +466,28 @@ class TestRunner:
         finally:
             for f in opened:
                 f.close()
-        return self._validate_normal_response(case, response, started_at, start_mono)
+        return self._validate_normal_response(case, response, started_at, start_mono, timer)
 
     # ── Streaming test execution ──────────────────────────
 
-    def _run_stream(self, case: ExecutableCase) -> TestVerdict:
+    def _run_stream(self, case: ExecutableCase, timer: PhaseTimer) -> TestVerdict:
         started_at = datetime.now(UTC).isoformat()
         start_mono = time.monotonic()
-        params = self._resolve_asset_placeholders(case.request.params)
-        files, opened = self._prepare_upload_files(case)
+        with timer.phase("resolve"):
+            params = self._resolve_asset_placeholders(case.request.params)
+            files, opened = self._prepare_upload_files(case)
         try:
             try:
-                http_status_code, all_raw_chunks = self.client.stream(
-                    endpoint=case.request.endpoint,
-                    params=params,
-                    method=case.request.method,
-                    files=files,
-                )
+                with trace_transfer() as trace:
+                    try:
+                        http_status_code, all_raw_chunks = self.client.stream(
+                            endpoint=case.request.endpoint,
+                            params=params,
+                            method=case.request.method,
+                            files=files,
+                        )
+                    finally:
+                        timer.add_transfer(trace)
             except httpx.HTTPStatusError as e:
                 finished_at = datetime.now(UTC).isoformat()
                 latency_ms = int((time.monotonic() - start_mono) * 1000)
@@ -457,7 +504,8 @@ class TestRunner:
                 latency_ms = int((time.monotonic() - start_mono) * 1000)
                 return error_verdict(
                     case,
-                    message=f"Connection error: {e}",
+                    message=_transport_error_message(e),
+                    code=transport_error_code(e),
                     started_at=started_at,
                     finished_at=finished_at,
                     latency_ms=latency_ms,
@@ -480,6 +528,7 @@ class TestRunner:
                 all_raw_chunks,
                 started_at,
                 start_mono,
+                timer,
             )
         except Exception as e:
             finished_at = datetime.now(UTC).isoformat()
@@ -496,19 +545,24 @@ class TestRunner:
             for f in opened:
                 f.close()
 
-    async def _run_stream_async(self, case: ExecutableCase) -> TestVerdict:
+    async def _run_stream_async(self, case: ExecutableCase, timer: PhaseTimer) -> TestVerdict:
         started_at = datetime.now(UTC).isoformat()
         start_mono = time.monotonic()
-        params = self._resolve_asset_placeholders(case.request.params)
-        files, opened = self._prepare_upload_files(case)
+        with timer.phase("resolve"):
+            params = self._resolve_asset_placeholders(case.request.params)
+            files, opened = self._prepare_upload_files(case)
         try:
             try:
-                http_status_code, all_raw_chunks = await self.client.stream_async(
-                    endpoint=case.request.endpoint,
-                    params=params,
-                    method=case.request.method,
-                    files=files,
-                )
+                with trace_transfer() as trace:
+                    try:
+                        http_status_code, all_raw_chunks = await self.client.stream_async(
+                            endpoint=case.request.endpoint,
+                            params=params,
+                            method=case.request.method,
+                            files=files,
+                        )
+                    finally:
+                        timer.add_transfer(trace)
             except httpx.HTTPStatusError as e:
                 finished_at = datetime.now(UTC).isoformat()
                 latency_ms = int((time.monotonic() - start_mono) * 1000)
@@ -525,7 +579,8 @@ class TestRunner:
                 latency_ms = int((time.monotonic() - start_mono) * 1000)
                 return error_verdict(
                     case,
-                    message=f"Connection error: {e}",
+                    message=_transport_error_message(e),
+                    code=transport_error_code(e),
                     started_at=started_at,
                     finished_at=finished_at,
                     latency_ms=latency_ms,
@@ -548,6 +603,7 @@ class TestRunner:
                 all_raw_chunks,
                 started_at,
                 start_mono,
+                timer,
             )
         except Exception as e:
             finished_at = datetime.now(UTC).isoformat()
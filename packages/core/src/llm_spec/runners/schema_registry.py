@@ -1,88 +1,68 @@
-"""Schema registry for response validation schemas."""
+"""Schema registry for response validation schemas.
+
+Names map to the module defining each schema; a module is imported (and its pydantic
+models built) the first time one of its schemas is looked up, so a plan that only
+runs OpenAI chat suites never imports the Gemini, Anthropic or xAI schema families.
+"""
 
 from __future__ import annotations
 
+import importlib
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pydantic import BaseModel
 
-# Lazy import to avoid circular dependencies
-_REGISTRY: dict[str, type[BaseModel]] = {}
-_INITIALIZED = False
-
-
-def _init_registry() -> None:
-    """Initialize the schema registry."""
-    global _INITIALIZED
-    if _INITIALIZED:
-        return
-
-    # Import all schemas
-    from llm_spec.validation.schemas.anthropic import (
-        AnthropicStreamChunk,
-        MessagesResponse,
-    )
-    from llm_spec.validation.schemas.gemini import (
-        BatchCreateResponse,
-        CountTokensResponse,
-        EmbedContentResponse,
-        GeminiStreamChunk,
-        GenerateContentResponse,
-    )
-    from llm_spec.validation.schemas.openai.audio import (
-        AudioStreamEvent,
-        AudioTranscriptionResponse,
-        AudioTranslationResponse,
-        TranscriptionStreamEvent,
-    )
-    from llm_spec.validation.schemas.openai.chat import (
-        ChatCompletionChunkResponse,
-        ChatCompletionResponse,
-    )
-    from llm_spec.validation.schemas.openai.embeddings import (
-        EmbeddingResponse as OpenAIEmbeddingResponse,
-    )
-    from llm_spec.validation.schemas.openai.images import ImageResponse, ImageStreamEvent
-    from llm_spec.validation.schemas.openai.responses import ResponseObject, ResponsesStreamEvent
-    from llm_spec.validation.schemas.xai import (
-        ChatCompletionResponse as XAIChatResponse,
-    )
-
-    # Register OpenAI schemas
-    _REGISTRY["openai.ChatCompletionResponse"] = ChatCompletionResponse
-    _REGISTRY["openai.ChatCompletionChunkResponse"] = ChatCompletionChunkResponse
-    _REGISTRY["openai.ResponseObject"] = ResponseObject
-    _REGISTRY["openai.ResponsesStreamEvent"] = ResponsesStreamEvent
-    _REGISTRY["openai.EmbeddingResponse"] = OpenAIEmbeddingResponse
-    _REGISTRY["openai.ImageResponse"] = ImageResponse
-    _REGISTRY["openai.ImageStreamEvent"] = ImageStreamEvent
-    _REGISTRY["openai.AudioTranscriptionResponse"] = AudioTranscriptionResponse
-    _REGISTRY["openai.AudioTranslationResponse"] = AudioTranslationResponse
-    _REGISTRY["openai.AudioStreamEvent"] = AudioStreamEvent
-    _REGISTRY["openai.TranscriptionStreamEvent"] = TranscriptionStreamEvent
-
-    # Register Gemini schemas
-    _REGISTRY["gemini.GenerateContentResponse"] = GenerateContentResponse
-    _REGISTRY["gemini.GeminiStreamChunk"] = GeminiStreamChunk
-    _REGISTRY["gemini.EmbedContentResponse"] = EmbedContentResponse
-    _REGISTRY["gemini.BatchCreateResponse"] = BatchCreateResponse
-    _REGISTRY["gemini.CountTokensResponse"] = CountTokensResponse
-
-    # Register Anthropic schemas
-    _REGISTRY["anthropic.MessagesResponse"] = MessagesResponse
-    _REGISTRY["anthropic.AnthropicStreamChunk"] = AnthropicStreamChunk
-
-    # Register xAI schemas
-    _REGISTRY["xai.ChatCompletionResponse"] = XAIChatResponse
+_SCHEMAS = "llm_spec.validation.schemas"
+
+# name → (module, attribute); imported on first lookup
+_SCHEMA_MODULES: dict[str, tuple[str, str]] = {
+    # OpenAI
+    "openai.ChatCompletionResponse": (f"{_SCHEMAS}.openai.chat", "ChatCompletionResponse"),
+    "openai.ChatCompletionChunkResponse": (
+        f"{_SCHEMAS}.openai.chat",
+        "ChatCompletionChunkResponse",
+    ),
+    "openai.ResponseObject": (f"{_SCHEMAS}.openai.responses", "ResponseObject"),
+    "openai.ResponsesStreamEvent": (f"{_SCHEMAS}.openai.responses", "ResponsesStreamEvent"),
+    "openai.EmbeddingResponse": (f"{_SCHEMAS}.openai.embeddings", "EmbeddingResponse"),
+    "openai.ImageResponse": (f"{_SCHEMAS}.openai.images", "ImageResponse"),
+    "openai.ImageStreamEvent": (f"{_SCHEMAS}.openai.images", "ImageStreamEvent"),
+    "openai.AudioTranscriptionResponse": (
+        f"{_SCHEMAS}.openai.audio",
+        "AudioTranscriptionResponse",
+    ),
+    "openai.AudioTranslationResponse": (f"{_SCHEMAS}.openai.audio", "AudioTranslationResponse"),
+    "openai.AudioStreamEvent": (f"{_SCHEMAS}.openai.audio", "AudioStreamEvent"),
+    "openai.TranscriptionStreamEvent": (f"{_SCHEMAS}.openai.audio", "TranscriptionStreamEvent"),
+    # Gemini
+    "gemini.GenerateContentResponse": (
+        f"{_SCHEMAS}.gemini.generate_content",
+        "GenerateContentResponse",
+    ),
+    "gemini.GeminiStreamChunk": (f"{_SCHEMAS}.gemini.generate_content", "GeminiStreamChunk"),
+    "gemini.EmbedContentResponse": (f"{_SCHEMAS}.gemini.embeddings", "EmbedContentResponse"),
+    "gemini.BatchCreateResponse": (
+        f"{_SCHEMAS}.gemini.batch_generate_content",
+        "BatchCreateResponse",
+    ),
+    "gemini.CountTokensResponse": (f"{_SCHEMAS}.gemini.tokens", "CountTokensResponse"),
+    # Anthropic
+    "anthropic.MessagesResponse": (f"{_SCHEMAS}.anthropic.messages", "MessagesResponse"),
+    "anthropic.AnthropicStreamChunk": (f"{_SCHEMAS}.anthropic.messages", "AnthropicStreamChunk"),
+    # xAI
+    "xai.ChatCompletionResponse": (f"{_SCHEMAS}.xai", "ChatCompletionResponse"),
     # xAI uses OpenAI-compatible format; streaming schema is the same as OpenAI.
-    _REGISTRY["xai.ChatCompletionChunkResponse"] = ChatCompletionChunkResponse
+    "xai.ChatCompletionChunkResponse": (f"{_SCHEMAS}.openai.chat", "ChatCompletionChunkResponse"),
+}
 
-    _INITIALIZED = True
+# Schemas already imported or registered at runtime
+_REGISTRY: dict[str, type[BaseModel]] = {}
 
 
 def get_schema(name: str | None) -> type[BaseModel] | None:
-    """Get a schema class by name.
+    """Get a schema class by name, importing its module on first use.
 
     Args:
         name: schema name, formatted as "provider.SchemaClass"
@@ -92,9 +72,37 @@ def get_schema(name: str | None) -> type[BaseModel] | None:
     """
     if not name:
         return None
+    schema = _REGISTRY.get(name)
+    if schema is not None:
+        return schema
+    location = _SCHEMA_MODULES.get(name)
+    if location is None:
+        return None
+    module, attr = location
+    schema = getattr(importlib.import_module(module), attr)
+    _REGISTRY[name] = schema
+    return schema
+
+
+def preload_schemas(names: Iterable[str | None]) -> list[str]:
+    """Import the schemas a plan references ahead of its first case.
 
-    _init_registry()
-    return _REGISTRY.get(name)
+    Import failures are left for the case's own ``get_schema`` call to report.
+
+    Args:
+        names: schema names (``None`` entries are skipped)
+
+    Returns:
+        The names that are now loaded.
+    """
+    loaded: list[str] = []
+    for name in dict.fromkeys(names):
+        try:
+            if get_schema(name) is not None:
+                loaded.append(name)  # type: ignore[arg-type]
+        except ImportError:
+            continue
+    return loaded
 
 
 def register_schema(name: str, schema_class: type[BaseModel]) -> None:
@@ -104,11 +112,9 @@ def register_schema(name: str, schema_class: type[BaseModel]) -> None:
         name: schema name
         schema_class: Pydantic model class
     """
-    _init_registry()
     _REGISTRY[name] = schema_class
 
 
 def list_schemas() -> list[str]:
-    """List all registered schema names."""
-    _init_registry()
-    return list(_REGISTRY.keys())
+    """List all registered schema names (without importing them)."""
+    return list(dict.fromkeys([*_SCHEMA_MODULES, *_REGISTRY]))
@@ -9,11 +9,31 @@ Notes:
 from __future__ import annotations
 
 import re
+import sys
+from dataclasses import dataclass
 from typing import Any
 
-from llm_spec.path_utils import get_value_at_path
+from llm_spec.path_utils import compile_path
 
-Observation = dict[str, Any]
+
+@dataclass(slots=True)
+class Observation:
+    """One observed stream item (or a run of identical ones).
+
+    Attributes:
+        kind: ``"event"`` (parsed chunk), ``"bytes"`` (raw chunks) or ``"terminal"``.
+        name: Event name matched by the stream checks (interned).
+        data: Parsed chunk of an ``"event"``.
+        n: Byte count of a ``"bytes"`` run.
+        count: How many consecutive items this observation stands for; a binary
+            stream is one ``"bytes"`` run instead of one object per network chunk.
+    """
+
+    kind: str
+    name: str
+    data: dict[str, Any] | None = None
+    n: int = 0
+    count: int = 1
 
 
 def extract_observations(
@@ -74,12 +94,14 @@ def validate_stream(
 
     missing: list[str] = []
 
-    observation_names = [o.get("name") for o in observations if isinstance(o, dict)]
-    observed_event_names = [n for n in observation_names if isinstance(n, str)]
-    event_observations = [
-        o for o in observations if isinstance(o, dict) and o.get("kind") == "event"
-    ]
-    observed_data = [o.get("data") for o in event_observations]
+    observed_event_names: list[str] = []
+    for o in observations:
+        if o.count == 1:
+            observed_event_names.append(o.name)
+        else:
+            observed_event_names.extend([o.name] * o.count)
+    event_observations = [o for o in observations if o.kind == "event"]
+    observed_data = [o.data for o in event_observations]
 
     min_observations = effective_rules.get("min_observations")
     if isinstance(min_observations, int) and len(observed_event_names) < min_observations:
@@ -91,7 +113,7 @@ def validate_stream(
         # Auto-enable event_type_match when stream data carries event/type fields,
         # even if callers did not explicitly configure it.
         has_event_or_type = any(
-            isinstance(o.get("data"), dict) and (("event" in o["data"]) or ("type" in o["data"]))
+            isinstance(o.data, dict) and ("event" in o.data or "type" in o.data)
             for o in event_observations
         )
         has_event_type_match = any(
@@ -161,10 +183,9 @@ def _evaluate_stream_checks(
         elif ct == "required_field":
             field_path = check.get("field")
             found = False
-            for data in observed_data:
-                if data and get_value_at_path(data, field_path) is not None:
-                    found = True
-                    break
+            if isinstance(field_path, str) and field_path:
+                accessor = compile_path(field_path)
+                found = any(data and accessor(data) is not None for data in observed_data)
             if not found:
                 missing.append(f"field:{field_path}")
 
@@ -173,7 +194,7 @@ def _evaluate_stream_checks(
             # and that its value matches data["type"].
             if event_observations:
                 for idx, obs in enumerate(event_observations):
-                    data = obs.get("data")
+                    data = obs.data
                     if not isinstance(data, dict):
                         continue
                     # Skip [DONE] / terminal markers
@@ -279,31 +300,20 @@ def _default_stream_rules_for_endpoint(*, provider: str, endpoint: str) -> dict[
 def _extract_event_observations(
     *, provider: str, parsed_chunks: list[dict[str, Any]]
 ) -> list[Observation]:
-    observations: list[Observation] = []
-    for chunk in parsed_chunks:
-        event_name = _infer_event_name(provider=provider, chunk=chunk)
-        obs: Observation = {
-            "kind": "event",
-            "name": event_name,
-            "data": chunk,
-        }
-        observations.append(obs)
-    return observations
+    return [
+        Observation("event", sys.intern(_infer_event_name(provider=provider, chunk=chunk)), chunk)
+        for chunk in parsed_chunks
+    ]
 
 
 def _extract_binary_observations(raw_chunks: list[bytes]) -> list[Observation]:
-    observations: list[Observation] = []
-    for b in raw_chunks:
-        observations.append(
-            {
-                "kind": "bytes",
-                "name": "bytes",
-                "n": len(b),
-            }
-        )
-    if raw_chunks:
-        observations.append({"kind": "terminal", "name": "eof"})
-    return observations
+    if not raw_chunks:
+        return []
+    size = sum(len(b) for b in raw_chunks)
+    return [
+        Observation("bytes", "bytes", n=size, count=len(raw_chunks)),
+        Observation("terminal", "eof"),
+    ]
 
 
 def _infer_event_name(*, provider: str, chunk: dict[str, Any]) -> str:
@@ -0,0 +1,137 @@
+"""Case ordering and gating policies for ``run_suites``.
+
+``LatencyEstimator`` implements longest-processing-time-first (LPT) ordering: the
+cases expected to take longest are dispatched first, so a slow image generation or
+long stream does not start last and stretch the whole task. Expected latency comes
+from past results, keyed by ``(provider, model, route, test_name)``, and falls back to:
+
+1. the mean of the known tests of the same ``(provider, model, route)``,
+2. the mean of the known tests of the same route on any provider/model,
+3. ``ROUTE_DEFAULT_MS`` for the route, then ``DEFAULT_MS``.
+
+``run_suites`` opens suites lazily, so this is LPT per open suite set rather than a
+global ranking: ``suite_priority`` opens the suite with the slowest expected case
+first, and ``case_priority`` orders the ready cases of the suites opened so far.
+
+Usage::
+
+    estimator = LatencyEstimator(history)
+    await run_suites(
+        registry,
+        config,
+        case_priority=estimator.case_priority,
+        suite_priority=estimator.suite_priority,
+    )
+
+With ``run_suites(baseline_first=True)`` each suite's baseline runs before its other
+cases; when ``is_infrastructure_failure`` says the baseline failure (bad credentials,
+unknown model, unreachable host) would repeat for every case, the rest are ``skipped``.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from llm_spec.client.errors import UNREACHABLE_CODES
+from llm_spec.results.result_types import TestVerdict
+from llm_spec.suites.types import ExecutableCase, SuiteSpec
+
+HistoryKey = tuple[str, str | None, str | None, str]
+"""``(provider, model, route, test_name)``"""
+
+DEFAULT_MS = 2000.0
+
+ROUTE_DEFAULT_MS: dict[str, float] = {
+    "images_generations": 20000.0,
+    "images_edits": 20000.0,
+    "audio_speech": 5000.0,
+    "audio_transcriptions": 5000.0,
+    "audio_translations": 5000.0,
+    "embeddings": 500.0,
+}
+"""Expected latency of routes with no recorded history."""
+
+INFRA_HTTP_STATUSES = frozenset({401, 402, 403, 404})
+"""Baseline statuses every other case of the suite would repeat (auth, billing, route/model)."""
+
+_MODEL_NOT_FOUND = re.compile(
+    r"model\b.{0,80}\b(not[ _]found|does not exist|not supported)|(unknown|invalid)[ _]model",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _mean(values: list[float]) -> float:
+    return sum(values) / len(values)
+
+
+@dataclass
+class LatencyEstimator:
+    """Expected case latency from recorded history, with route-level fallbacks.
+
+    Attributes:
+        history: Mean latency in ms per ``(provider, model, route, test_name)``.
+        route_defaults: Latency in ms of routes without history.
+        default_ms: Latency of anything else.
+    """
+
+    history: Mapping[HistoryKey, float]
+    route_defaults: Mapping[str, float] = field(default_factory=lambda: dict(ROUTE_DEFAULT_MS))
+    default_ms: float = DEFAULT_MS
+
+    def __post_init__(self) -> None:
+        by_suite: dict[tuple[str, str | None, str | None], list[float]] = defaultdict(list)
+        by_route: dict[str | None, list[float]] = defaultdict(list)
+        for (provider, model, route, _test), latency in self.history.items():
+            by_suite[provider, model, route].append(latency)
+            by_route[route].append(latency)
+        self._by_suite = {k: _mean(v) for k, v in by_suite.items()}
+        self._by_route = {k: _mean(v) for k, v in by_route.items()}
+
+    def estimate(self, provider: str, model: str | None, route: str | None, test: str) -> float:
+        """Return the expected latency of one test in ms."""
+        known = self.history.get((provider, model, route, test))
+        if known is not None:
+            return known
+        known = self._by_suite.get((provider, model, route))
+        if known is not None:
+            return known
+        known = self._by_route.get(route)
+        if known is not None:
+            return known
+        return self.route_defaults.get(route or "", self.default_ms)
+
+    def case_priority(self, suite: SuiteSpec, case: ExecutableCase) -> float:
+        """``run_suites(case_priority=...)``: slowest expected case first."""
+        return -self.estimate(suite.provider_id, suite.model_id, suite.route_id, case.test_name)
+
+    def suite_priority(self, suite: SuiteSpec) -> float:
+        """``run_suites(suite_priority=...)``: suite with the slowest expected case first."""
+        estimates = [
+            self.estimate(suite.provider_id, suite.model_id, suite.route_id, test.name)
+            for test in suite.tests
+        ]
+        return -max(estimates, default=0.0)
+
+
+# ── Baseline gating ───────────────────────────────────────
+
+
+def is_infrastructure_failure(verdict: TestVerdict) -> bool:
+    """Whether a failed baseline dooms the rest of its suite.
+
+    True for request-stage failures that do not depend on the test parameters:
+    unreachable hosts (``UNREACHABLE_CODES``), ``INFRA_HTTP_STATUSES`` and 400/422
+    responses naming an unknown model. Rate limits, 5xx, validation failures and
+    local errors (``REQUEST_ERROR``, ``CANCELLED``) are not.
+    """
+    failure = verdict.failure
+    if verdict.status in ("pass", "skipped") or failure is None or failure.stage != "request":
+        return False
+    if verdict.http_status is None:
+        return failure.code in UNREACHABLE_CODES
+    if verdict.http_status in INFRA_HTTP_STATUSES:
+        return True
+    return verdict.http_status in (400, 422) and bool(_MODEL_NOT_FOUND.search(failure.message))
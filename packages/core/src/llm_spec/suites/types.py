@@ -4,10 +4,15 @@ Layer 1: Config Specs (ProviderSpec, RouteSpec, ModelSpec, TestDef)
 Layer 2: SuiteSpec (expanded provider × model × route)
 Layer 3: ExecutableCase (self-contained executable test) with HttpRequest + ValidationSpec
 Layer 4: Results (TestVerdict, RunResult) — see results/result_types.py
+
+Layer 3 and 4 types exist once per case or verdict, so they are slotted and intern
+the identity strings (provider, model, route, status, ...) that repeat across
+thousands of instances.
 """
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -15,7 +20,12 @@ from typing import Any
 # ── Value objects ──────────────────────────────────────────
 
 
-@dataclass(frozen=True)
+def intern_str(value: str | None) -> str | None:
+    """``sys.intern`` for optional strings."""
+    return None if value is None else sys.intern(value)
+
+
+@dataclass(frozen=True, slots=True)
 class FocusParam:
     """Marks which parameter this test is exercising."""
 
@@ -127,7 +137,7 @@ class SuiteSpec:
 # ── Layer 3: ExecutableCase (execution-ready) ───────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class HttpRequest:
     """Fully resolved HTTP request description."""
 
@@ -138,8 +148,12 @@ class HttpRequest:
     files: dict[str, str] | None = None
     stream: bool = False
 
+    def __post_init__(self) -> None:
+        self.method = sys.intern(self.method)
+        self.endpoint = sys.intern(self.endpoint)
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationSpec:
     """Validation rules for a test case."""
 
@@ -149,7 +163,7 @@ class ValidationSpec:
     stream_rules: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutableCase:
     """Self-contained executable test case."""
 
@@ -175,3 +189,10 @@ class ExecutableCase:
     model: str | None = None
     route: str | None = None
     api_family: str = ""
+
+    def __post_init__(self) -> None:
+        self.test_name = sys.intern(self.test_name)
+        self.provider = sys.intern(self.provider)
+        self.model = intern_str(self.model)
+        self.route = intern_str(self.route)
+        self.api_family = sys.intern(self.api_family)
@@ -0,0 +1,368 @@
+"""OpenTelemetry tracing and metrics for executions (optional).
+
+Requires the ``otel`` extra (``pip install 'llm-spec[otel]'``). Until
+``configure_telemetry()`` is called every helper here is a no-op, so the
+instrumentation in the executor, runner and HTTP client costs nothing when
+telemetry is off.
+
+Spans (each inherits the attributes of its parents)::
+
+    llm_spec.task                      run_suites() call (llm_spec.task_id)
+      llm_spec.suite                   one suite (provider / model / route / endpoint)
+        llm_spec.case                  one case (test name, status, HTTP status)
+          HTTP <method>                one HTTP attempt (url, status, bytes); runner phases
+                                       are added to the case span as ``phase.*`` events
+
+Metrics (attributes: provider, model, route, endpoint, plus the listed ones):
+
+- ``llm_spec.http.request.duration`` (ms; method, status code, error type)
+- ``llm_spec.http.ttfb`` / ``llm_spec.http.ttft`` (ms; headers / first stream chunk)
+- ``llm_spec.http.response.size`` (bytes)
+- ``llm_spec.case.duration`` (ms; status)
+- ``llm_spec.cases.in_flight`` (cases holding a concurrency slot)
+- ``llm_spec.semaphore.wait`` (ms a case waited for a concurrency slot)
+- ``llm_spec.case.retries`` (manual re-executions)
+- ``llm_spec.phase.duration`` (ms; phase, see ``llm_spec.profiling``)
+
+Exporters: ``otlp`` (OTLP/HTTP; endpoint from ``OTEL_EXPORTER_OTLP_ENDPOINT``),
+``file`` (JSON lines, for offline testing) or ``global`` (the host application's
+already-configured OpenTelemetry providers). Cases executed in worker processes
+(``ProcessCaseRunner``) report their case span and metrics from the parent only.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from llm_spec.client.trace import trace_transfer
+from llm_spec.profiling import add_phase_hook, remove_phase_hook
+
+if TYPE_CHECKING:
+    from llm_spec.results.result_types import TestVerdict
+    from llm_spec.suites.types import ExecutableCase
+
+Exporter = Literal["otlp", "file", "global", "none"]
+
+# Scope attributes that are low-cardinality enough for metric labels.
+METRIC_ATTRIBUTES = ("llm_spec.provider", "llm_spec.model", "llm_spec.route", "llm_spec.endpoint")
+
+# Unset (None) until the first scope() opens; read through _scope_attributes().
+_scope: ContextVar[Mapping[str, Any] | None] = ContextVar("llm_spec_telemetry_scope", default=None)
+
+
+class Telemetry:
+    """Configured tracer, meter and instruments."""
+
+    def __init__(
+        self, tracer_provider: Any, meter_provider: Any, *, owned: bool, output: Any = None
+    ) -> None:
+        from opentelemetry import trace
+
+        self.tracer_provider = tracer_provider
+        self.meter_provider = meter_provider
+        self.owned = owned
+        self._output = output
+        self.tracer = tracer_provider.get_tracer("llm_spec")
+        self.client_kind = trace.SpanKind.CLIENT
+        self._get_current_span = trace.get_current_span
+
+        meter = meter_provider.get_meter("llm_spec")
+        self.request_duration = meter.create_histogram(
+            "llm_spec.http.request.duration", unit="ms", description="HTTP attempt duration"
+        )
+        self.ttfb = meter.create_histogram(
+            "llm_spec.http.ttfb", unit="ms", description="Time to response headers"
+        )
+        self.ttft = meter.create_histogram(
+            "llm_spec.http.ttft", unit="ms", description="Time to first stream chunk"
+        )
+        self.response_size = meter.create_histogram(
+            "llm_spec.http.response.size", unit="By", description="Response body bytes"
+        )
+        self.case_duration = meter.create_histogram(
+            "llm_spec.case.duration", unit="ms", description="Case wall time"
+        )
+        self.in_flight = meter.create_up_down_counter(
+            "llm_spec.cases.in_flight", description="Cases holding a concurrency slot"
+        )
+        self.semaphore_wait = meter.create_histogram(
+            "llm_spec.semaphore.wait", unit="ms", description="Wait for a concurrency slot"
+        )
+        self.retries = meter.create_counter(
+            "llm_spec.case.retries", description="Manual case re-executions"
+        )
+        self.phase_duration = meter.create_histogram(
+            "llm_spec.phase.duration", unit="ms", description="Runner phase duration"
+        )
+
+    def on_phase(self, case: ExecutableCase, phase: str, duration_ms: float) -> None:
+        """Phase hook: span event on the current span + phase histogram."""
+        self._get_current_span().add_event(f"phase.{phase}", {"duration_ms": duration_ms})
+        self.phase_duration.record(duration_ms, {**_metric_attributes(), "llm_spec.phase": phase})
+
+    def shutdown(self) -> None:
+        if not self.owned:
+            return
+        self.tracer_provider.shutdown()
+        self.meter_provider.shutdown()
+        if self._output is not None:
+            self._output.close()
+
+
+_telemetry: Telemetry | None = None
+
+
+# ── Configuration ─────────────────────────────────────────
+
+
+def configure_telemetry(
+    exporter: Exporter = "otlp",
+    *,
+    file_path: str | Path = "llm-spec-telemetry.jsonl",
+    service_name: str = "llm-spec",
+    export_interval_ms: int = 10_000,
+) -> Telemetry | None:
+    """Enable (or, with ``none``, disable) telemetry for this process.
+
+    Args:
+        exporter: ``otlp``, ``file``, ``global`` or ``none``.
+        file_path: JSON-lines output for the ``file`` exporter (spans and metrics).
+        service_name: ``service.name`` resource attribute.
+        export_interval_ms: Metric export interval.
+
+    Returns:
+        The active ``Telemetry`` (``None`` when disabled).
+
+    Raises:
+        RuntimeError: If the OpenTelemetry SDK is not installed.
+        ValueError: If *exporter* is unknown.
+    """
+    global _telemetry
+    shutdown_telemetry()
+    if exporter == "none":
+        return None
+    if exporter not in ("otlp", "file", "global"):
+        raise ValueError(f"unknown telemetry exporter: {exporter}")
+    try:
+        from opentelemetry import metrics, trace
+    except ImportError as exc:
+        raise RuntimeError(
+            "telemetry requires OpenTelemetry (install with: pip install 'llm-spec[otel]')"
+        ) from exc
+
+    if exporter == "global":
+        telemetry = Telemetry(
+            trace.get_tracer_provider(), metrics.get_meter_provider(), owned=False
+        )
+    else:
+        tracer_provider, meter_provider, output = _sdk_providers(
+            exporter, Path(file_path), service_name, export_interval_ms
+        )
+        telemetry = Telemetry(tracer_provider, meter_provider, owned=True, output=output)
+    _telemetry = telemetry
+    add_phase_hook(telemetry.on_phase)
+    return telemetry
+
+
+def _sdk_providers(
+    exporter: str, file_path: Path, service_name: str, export_interval_ms: int
+) -> tuple[Any, Any, Any]:
+    try:
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import (
+            ConsoleMetricExporter,
+            PeriodicExportingMetricReader,
+        )
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    except ImportError as exc:
+        raise RuntimeError(
+            "telemetry requires the OpenTelemetry SDK (install with: pip install 'llm-spec[otel]')"
+        ) from exc
+
+    if exporter == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+                OTLPMetricExporter,
+            )
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError as exc:
+            raise RuntimeError(
+                "the otlp exporter requires opentelemetry-exporter-otlp-proto-http "
+                "(install with: pip install 'llm-spec[otel]')"
+            ) from exc
+        span_exporter: Any = OTLPSpanExporter()
+        metric_exporter: Any = OTLPMetricExporter()
+        out = None
+    else:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        out = open(file_path, "a", encoding="utf-8")  # noqa: SIM115 - closed by Telemetry
+        span_exporter = ConsoleSpanExporter(
+            out=out, formatter=lambda span: span.to_json(indent=None) + os.linesep
+        )
+        metric_exporter = ConsoleMetricExporter(
+            out=out, formatter=lambda data: data.to_json(indent=None) + os.linesep
+        )
+
+    resource = Resource.create({"service.name": service_name})
+    tracer_provider = TracerProvider(resource=resource)
+    tracer_provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    reader = PeriodicExportingMetricReader(
+        metric_exporter, export_interval_millis=export_interval_ms
+    )
+    meter_provider = MeterProvider(resource=resource, metric_readers=[reader])
+    return tracer_provider, meter_provider, out
+
+
+def shutdown_telemetry() -> None:
+    """Flush and disable telemetry."""
+    global _telemetry
+    telemetry, _telemetry = _telemetry, None
+    if telemetry is not None:
+        remove_phase_hook(telemetry.on_phase)
+        telemetry.shutdown()
+
+
+def get_telemetry() -> Telemetry | None:
+    """Return the active telemetry, if configured."""
+    return _telemetry
+
+
+# ── Instrumentation helpers ───────────────────────────────
+
+
+def _scope_attributes() -> Mapping[str, Any]:
+    return _scope.get() or {}
+
+
+def _metric_attributes(extra: Mapping[str, Any] | None = None) -> dict[str, Any]:
+    scope = _scope_attributes()
+    attrs = {k: scope[k] for k in METRIC_ATTRIBUTES if k in scope}
+    if extra:
+        attrs.update(extra)
+    return attrs
+
+
+@contextmanager
+def scope(**attributes: Any) -> Iterator[None]:
+    """Attach attributes to spans and metrics recorded inside the block."""
+    if _telemetry is None:
+        yield
+        return
+    token = _scope.set(
+        {
+            **_scope_attributes(),
+            **{f"llm_spec.{k}": v for k, v in attributes.items() if v is not None},
+        }
+    )
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """Open a span carrying the scope attributes plus *attributes* (which also
+    become scope attributes for everything inside). Yields ``None`` when disabled.
+    """
+    telemetry = _telemetry
+    if telemetry is None:
+        yield None
+        return
+    with (
+        scope(**attributes),
+        telemetry.tracer.start_as_current_span(
+            name, attributes=dict(_scope_attributes())
+        ) as current,
+    ):
+        yield current
+
+
+@contextmanager
+def in_flight() -> Iterator[None]:
+    """Count the enclosed block in ``llm_spec.cases.in_flight``."""
+    telemetry = _telemetry
+    if telemetry is None:
+        yield
+        return
+    attrs = _metric_attributes()
+    telemetry.in_flight.add(1, attrs)
+    try:
+        yield
+    finally:
+        telemetry.in_flight.add(-1, attrs)
+
+
+def record_semaphore_wait(wait_ms: float) -> None:
+    """Record how long a case waited for a concurrency slot."""
+    if _telemetry is not None:
+        _telemetry.semaphore_wait.record(wait_ms, _metric_attributes())
+
+
+def record_retry() -> None:
+    """Count one manual case re-execution."""
+    if _telemetry is not None:
+        _telemetry.retries.add(1, _metric_attributes())
+
+
+def record_case(case_span: Any, verdict: TestVerdict) -> None:
+    """Annotate the case span with the verdict and record ``llm_spec.case.duration``."""
+    telemetry = _telemetry
+    if telemetry is None or case_span is None:
+        return
+    case_span.set_attribute("llm_spec.status", verdict.status)
+    if verdict.http_status is not None:
+        case_span.set_attribute("http.response.status_code", verdict.http_status)
+    if verdict.failure is not None and verdict.failure.code:
+        case_span.set_attribute("llm_spec.failure_code", verdict.failure.code)
+    if verdict.latency_ms is not None:
+        telemetry.case_duration.record(
+            verdict.latency_ms, _metric_attributes({"llm_spec.status": verdict.status})
+        )
+
+
+@contextmanager
+def http_attempt(method: str, url: str) -> Iterator[None]:
+    """Wrap one HTTP exchange in a client span and record HTTP metrics."""
+    telemetry = _telemetry
+    if telemetry is None:
+        yield
+        return
+    attrs = {"http.request.method": method.upper(), "url.full": url}
+    with (
+        trace_transfer() as trace,
+        telemetry.tracer.start_as_current_span(
+            f"HTTP {method.upper()}", kind=telemetry.client_kind, attributes=attrs
+        ) as current,
+    ):
+        error_type: str | None = None
+        try:
+            yield
+        except BaseException as exc:
+            error_type = type(exc).__name__
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - trace.started) * 1000
+            metric_attrs = _metric_attributes({"http.request.method": method.upper()})
+            if trace.status_code is not None:
+                current.set_attribute("http.response.status_code", trace.status_code)
+                metric_attrs["http.response.status_code"] = trace.status_code
+            if error_type is not None:
+                metric_attrs["error.type"] = error_type
+            telemetry.request_duration.record(elapsed_ms, metric_attrs)
+            headers_at = trace.headers_at or trace.response_at
+            if headers_at is not None:
+                telemetry.ttfb.record((headers_at - trace.started) * 1000, metric_attrs)
+            if trace.chunk_at:
+                telemetry.ttft.record((trace.chunk_at[0] - trace.started) * 1000, metric_attrs)
+            if trace.bytes_received:
+                current.set_attribute("http.response.body.size", trace.bytes_received)
+                telemetry.response_size.record(trace.bytes_received, metric_attrs)
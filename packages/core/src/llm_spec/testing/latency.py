@@ -0,0 +1,191 @@
+"""Latency profiles for mock execution.
+
+A ``LatencyProfile`` describes how long a mocked provider takes to answer: the
+delay before the response (or the stream's first byte), the extra time to the
+first stream chunk, and the pacing between chunks. Delays are drawn from seeded
+distributions keyed by test name, so a mock run is reproducible regardless of
+the order in which concurrent cases are scheduled.
+
+Built-in profiles (``get_latency_profile(name)``):
+
+- ``zero``: no delay at all (CI).
+- ``fast``: small fixed delays, enough to watch progress in the UI.
+- ``realistic``: long-tailed (log-normal) response and TTFT delays, paced chunks.
+- ``legacy``: the historical 1-3 s uniform delay.
+
+``LatencyProfile.from_recorded()`` builds a profile that replays latencies
+measured in real runs.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+from typing import Literal
+
+
+@dataclass
+class LatencyDistribution:
+    """Delay distribution in milliseconds.
+
+    Attributes:
+        kind: ``fixed`` (always *mean_ms*), ``uniform`` (*mean_ms* ± *spread_ms*),
+            ``normal`` (stdev *spread_ms*, clamped at 0), ``lognormal``
+            (mean *mean_ms*, stdev *spread_ms*; long right tail) or ``recorded``
+            (uniform draw from *samples_ms*).
+        mean_ms: Mean delay.
+        spread_ms: Spread around the mean (ignored for ``fixed``).
+        samples_ms: Observed delays for ``recorded``.
+    """
+
+    kind: Literal["fixed", "uniform", "normal", "lognormal", "recorded"] = "fixed"
+    mean_ms: float = 0.0
+    spread_ms: float = 0.0
+    samples_ms: tuple[float, ...] = ()
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one delay in seconds."""
+        if self.kind == "recorded":
+            return max(0.0, rng.choice(self.samples_ms)) / 1000.0 if self.samples_ms else 0.0
+        mean, spread = self.mean_ms, self.spread_ms
+        if mean <= 0 and spread <= 0:
+            return 0.0
+        if self.kind == "fixed" or spread <= 0:
+            value = mean
+        elif self.kind == "uniform":
+            value = rng.uniform(mean - spread, mean + spread)
+        elif self.kind == "normal":
+            value = rng.gauss(mean, spread)
+        elif self.kind == "lognormal":
+            sigma2 = math.log1p((spread / mean) ** 2) if mean > 0 else 0.0
+            value = rng.lognormvariate(math.log(max(mean, 1e-9)) - sigma2 / 2, math.sqrt(sigma2))
+        else:
+            raise ValueError(f"unknown latency distribution: {self.kind}")
+        return max(0.0, value) / 1000.0
+
+
+@dataclass
+class LatencyProfile:
+    """Mock latency profile.
+
+    Attributes:
+        name: Profile name (for display/logging).
+        response: Delay before a non-stream response or the start of a stream.
+        ttft: Extra delay before the first stream chunk.
+        chunk_interval: Delay between stream chunks.
+        seed: Seed combined with each test name; ``None`` draws fresh randomness.
+    """
+
+    name: str = "zero"
+    response: LatencyDistribution = field(default_factory=LatencyDistribution)
+    ttft: LatencyDistribution = field(default_factory=LatencyDistribution)
+    chunk_interval: LatencyDistribution = field(default_factory=LatencyDistribution)
+    seed: int | None = 0
+
+    @property
+    def is_zero(self) -> bool:
+        return all(
+            d.kind != "recorded" and d.mean_ms <= 0 and d.spread_ms <= 0
+            for d in (self.response, self.ttft, self.chunk_interval)
+        )
+
+    def sampler(self, key: str = "") -> LatencySampler:
+        """Return a sampler whose draws depend only on the seed and *key*."""
+        rng = random.Random() if self.seed is None else random.Random(f"{self.seed}:{key}")
+        return LatencySampler(self, rng)
+
+    @classmethod
+    def from_recorded(
+        cls,
+        latencies_ms: Iterable[float],
+        *,
+        name: str = "recorded",
+        chunk_interval_ms: float = 0.0,
+        seed: int | None = 0,
+    ) -> LatencyProfile:
+        """Build a profile replaying end-to-end latencies measured in real runs.
+
+        Args:
+            latencies_ms: Observed per-test latencies.
+            name: Profile name.
+            chunk_interval_ms: Fixed pacing between stream chunks.
+            seed: Sampling seed.
+
+        Returns:
+            A profile drawing response delays from the recorded samples (zero delay
+            when no samples were given).
+        """
+        samples = tuple(float(v) for v in latencies_ms if v is not None and v >= 0)
+        return cls(
+            name=name,
+            response=LatencyDistribution("recorded", samples_ms=samples),
+            chunk_interval=LatencyDistribution(mean_ms=chunk_interval_ms),
+            seed=seed,
+        )
+
+
+class LatencySampler:
+    """Seeded delay source for one mocked request."""
+
+    def __init__(self, profile: LatencyProfile, rng: random.Random) -> None:
+        self.profile = profile
+        self._rng = rng
+
+    def response(self) -> float:
+        """Delay (seconds) before the response / stream start."""
+        return self.profile.response.sample(self._rng)
+
+    def first_chunk(self) -> float:
+        """Delay (seconds) before the first stream chunk."""
+        return self.profile.ttft.sample(self._rng)
+
+    def chunk(self) -> float:
+        """Delay (seconds) before each subsequent stream chunk."""
+        return self.profile.chunk_interval.sample(self._rng)
+
+
+LATENCY_PROFILES: dict[str, LatencyProfile] = {
+    "zero": LatencyProfile(name="zero"),
+    "fast": LatencyProfile(
+        name="fast",
+        response=LatencyDistribution(mean_ms=50),
+        ttft=LatencyDistribution(mean_ms=20),
+        chunk_interval=LatencyDistribution(mean_ms=2),
+    ),
+    "realistic": LatencyProfile(
+        name="realistic",
+        response=LatencyDistribution("lognormal", mean_ms=800, spread_ms=500),
+        ttft=LatencyDistribution("lognormal", mean_ms=400, spread_ms=250),
+        chunk_interval=LatencyDistribution("uniform", mean_ms=25, spread_ms=15),
+    ),
+    "legacy": LatencyProfile(
+        name="legacy",
+        response=LatencyDistribution("uniform", mean_ms=2000, spread_ms=1000),
+        chunk_interval=LatencyDistribution("uniform", mean_ms=30, spread_ms=20),
+        seed=None,
+    ),
+}
+
+
+def get_latency_profile(name: str, *, seed: int | None = None) -> LatencyProfile:
+    """Look up a built-in profile.
+
+    Args:
+        name: One of ``LATENCY_PROFILES``.
+        seed: Override the profile seed.
+
+    Returns:
+        The profile (a copy when *seed* is given).
+
+    Raises:
+        ValueError: If *name* is unknown.
+    """
+    try:
+        profile = LATENCY_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"unknown latency profile: {name} (choose from {', '.join(LATENCY_PROFILES)})"
+        ) from None
+    return replace(profile, seed=seed) if seed is not None else profile
@@ -2,30 +2,98 @@
 
 Loads mock HTTP response data from JSON/JSONL files to support offline testing
 without requiring real API credentials.
+
+Fixtures are indexed once (``provider/endpoint/file`` → path + file signature) and
+parsed on first use; non-stream bodies are kept pre-encoded and stream files as
+ready-to-send SSE frames, so repeated lookups do no disk I/O. At most every
+``check_interval`` seconds the fixture directories and indexed files are stat'ed
+(not listed); the tree is re-scanned only when a directory mtime or a file's
+``(mtime_ns, size)`` changed, i.e. a file was added, removed, replaced or edited.
+Scans and parsing run outside the loader lock, so lookups never wait for disk I/O.
 """
 
 from __future__ import annotations
 
+import copy
 import json
+import os
 import re
+import threading
+import time
 from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
+
+_Signature = tuple[int, int]  # (mtime_ns, size)
+
+
+@dataclass(frozen=True)
+class MockFixture:
+    """One parsed mock response.
+
+    Attributes:
+        path: Source file.
+        is_stream: Whether this is a streaming response.
+        status_code: HTTP status code.
+        headers: Response headers (``content-type`` always set).
+        raw: Parsed file content for non-streaming fixtures
+            (``{status_code, headers, body, ...}``).
+        body_bytes: JSON-encoded response body (non-streaming).
+        frames: SSE-encoded frames (streaming).
+    """
+
+    path: Path
+    is_stream: bool
+    status_code: int = 200
+    headers: dict[str, str] = field(default_factory=dict)
+    raw: dict[str, Any] = field(default_factory=dict)
+    body_bytes: bytes = b""
+    frames: tuple[bytes, ...] = ()
+
+    @property
+    def body(self) -> Any:
+        """Parsed response body (shared; do not mutate)."""
+        return self.raw.get("body")
 
 
 class MockDataLoader:
     """Loader for mock HTTP response data.
 
     Supports both streaming (JSONL) and non-streaming (JSON) response formats.
-    Mock files are organized by provider/endpoint/test_name.
+    Mock files are organized by provider/endpoint/test_name. Thread-safe.
     """
 
-    def __init__(self, base_dir: Path):
+    _shared: dict[Path, MockDataLoader] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, base_dir: Path, *, check_interval: float | None = 1.0):
         """Initialize the mock data loader.
 
         Args:
             base_dir: Base directory containing mock data files.
+            check_interval: Minimum seconds between checks of the fixture directories
+                and files (``None`` never re-checks after the first index build; call
+                ``reload()`` instead).
         """
         self.base_dir = base_dir
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._index: dict[tuple[str, str], dict[str, tuple[Path, _Signature]]] | None = None
+        self._fixtures: dict[tuple[Path, bool], tuple[_Signature, MockFixture]] = {}
+        # Indexed directories and their mtimes when the index was built.
+        self._dir_mtimes: dict[Path, int] = {}
+        self._checked_at = 0.0
+
+    @classmethod
+    def shared(cls, base_dir: Path) -> MockDataLoader:
+        """Return the process-wide loader for *base_dir* (one index per directory)."""
+        key = Path(base_dir).resolve()
+        with cls._shared_lock:
+            loader = cls._shared.get(key)
+            if loader is None:
+                loader = cls._shared[key] = cls(Path(base_dir))
+            return loader
 
     def load_response(
         self,
@@ -49,54 +117,182 @@ class MockDataLoader:
         Raises:
             FileNotFoundError: If the mock data file doesn't exist
         """
-        endpoint_dir = endpoint.strip("/").replace("/", "_")
-        safe_name = self._sanitize_filename(test_name)
-        stream_fallback_path: Path | None = None
+        fixture = self.get_fixture(provider, endpoint, test_name, is_stream)
         if is_stream:
-            file_path = self.base_dir / provider / endpoint_dir / f"{safe_name}.jsonl"
-            stream_fallback_path = self.base_dir / provider / endpoint_dir / f"{safe_name}.json"
-        else:
-            file_path = self.base_dir / provider / endpoint_dir / f"{safe_name}.json"
-
-        # Backward compatibility: stream mocks previously used `.json` extension.
-        if (
-            is_stream
-            and not file_path.exists()
-            and stream_fallback_path
-            and stream_fallback_path.exists()
-        ):
-            file_path = stream_fallback_path
+            return iter(fixture.frames)
+        return copy.deepcopy(fixture.raw)
 
-        # Fallback: parameterized test variant → base mock file.
-        if not file_path.exists() and "[" in safe_name and "]" in safe_name:
-            base_name = safe_name.split("[", 1)[0]
-            if is_stream:
-                fallback_jsonl = self.base_dir / provider / endpoint_dir / f"{base_name}.jsonl"
-                fallback_json = self.base_dir / provider / endpoint_dir / f"{base_name}.json"
-                if fallback_jsonl.exists():
-                    file_path = fallback_jsonl
-                elif fallback_json.exists():
-                    file_path = fallback_json
-            else:
-                fallback_file = self.base_dir / provider / endpoint_dir / f"{base_name}.json"
-                if fallback_file.exists():
-                    file_path = fallback_file
-
-        if not file_path.exists():
+    def get_fixture(
+        self,
+        provider: str,
+        endpoint: str,
+        test_name: str,
+        is_stream: bool = False,
+    ) -> MockFixture:
+        """Return the cached, pre-encoded fixture for a test case.
+
+        Same lookup rules as ``load_response``; the result is shared and must not
+        be mutated.
+
+        Raises:
+            FileNotFoundError: If the mock data file doesn't exist.
+        """
+        endpoint_dir = endpoint.strip("/").replace("/", "_")
+        safe_name = self._sanitize_filename(test_name)
+        files = self._current_index().get((provider, endpoint_dir), {})
+        entry = self._resolve(files, safe_name, is_stream)
+        if entry is None:
+            ext = "jsonl" if is_stream else "json"
+            file_path = self.base_dir / provider / endpoint_dir / f"{safe_name}.{ext}"
             raise FileNotFoundError(
                 f"Mock data not found: {file_path}\n"
                 f"Please create mock data for {provider}/{endpoint_dir}/{test_name}"
             )
+        path, signature = entry
+        with self._lock:
+            cached = self._fixtures.get((path, is_stream))
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        # Parsed outside the lock; concurrent first lookups may both parse (same result).
+        fixture = self._parse(path, is_stream)
+        with self._lock:
+            self._fixtures[(path, is_stream)] = (signature, fixture)
+        return fixture
 
-        if is_stream:
-            return self._load_stream_response(file_path)
-        else:
-            return self._load_json_response(file_path)
+    def preload(self) -> int:
+        """Index and parse every fixture now (``.jsonl`` as stream, ``.json`` as JSON).
+
+        Files that fail to parse are skipped here and raise on access.
+
+        Returns:
+            Number of fixtures parsed.
+        """
+        loaded = 0
+        for files in self._current_index().values():
+            for path, signature in files.values():
+                is_stream = path.suffix == ".jsonl"
+                with self._lock:
+                    cached = self._fixtures.get((path, is_stream))
+                if cached is not None and cached[0] == signature:
+                    continue
+                try:
+                    fixture = self._parse(path, is_stream)
+                except (OSError, ValueError):
+                    continue
+                with self._lock:
+                    self._fixtures[(path, is_stream)] = (signature, fixture)
+                loaded += 1
+        return loaded
+
+    def providers(self) -> set[str]:
+        """Provider directories present in the index."""
+        return {provider for provider, _ in self._current_index()}
+
+    def reload(self) -> None:
+        """Re-scan fixture files now (changed files are re-parsed on next access)."""
+        self._rebuild_index()
+
+    # ── Index ─────────────────────────────────────────────
+
+    def _current_index(self) -> dict[tuple[str, str], dict[str, tuple[Path, _Signature]]]:
+        index = self._index
+        if index is None or self._tree_changed():
+            index = self._rebuild_index()
+        return index
+
+    def _tree_changed(self) -> bool:
+        """Whether an indexed directory or file changed (throttled to ``check_interval``)."""
+        if self.check_interval is None:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at < self.check_interval:
+                return False
+            self._checked_at = now
+            dir_mtimes = self._dir_mtimes
+            index = self._index or {}
+        if any(_mtime_ns(path) != mtime for path, mtime in dir_mtimes.items()):
+            return True
+        return any(
+            _signature(path) != signature
+            for files in index.values()
+            for path, signature in files.values()
+        )
+
+    def _rebuild_index(self) -> dict[tuple[str, str], dict[str, tuple[Path, _Signature]]]:
+        index: dict[tuple[str, str], dict[str, tuple[Path, _Signature]]] = {}
+        # Stat'ed before listing: a change made during the scan is seen on the next check.
+        dir_mtimes = {self.base_dir: _mtime_ns(self.base_dir)}
+        for provider_entry in _scandir(self.base_dir):
+            if not provider_entry.is_dir():
+                continue
+            dir_mtimes[Path(provider_entry.path)] = _mtime_ns(Path(provider_entry.path))
+            for endpoint_entry in _scandir(Path(provider_entry.path)):
+                if not endpoint_entry.is_dir():
+                    continue
+                dir_mtimes[Path(endpoint_entry.path)] = _mtime_ns(Path(endpoint_entry.path))
+                files: dict[str, tuple[Path, _Signature]] = {}
+                for file_entry in _scandir(Path(endpoint_entry.path)):
+                    if not file_entry.name.endswith((".json", ".jsonl")):
+                        continue
+                    st = file_entry.stat()
+                    files[file_entry.name] = (
+                        Path(file_entry.path),
+                        (st.st_mtime_ns, st.st_size),
+                    )
+                index[(provider_entry.name, endpoint_entry.name)] = files
+        live = {path for files in index.values() for path, _ in files.values()}
+        with self._lock:
+            self._fixtures = {k: v for k, v in self._fixtures.items() if k[0] in live}
+            self._index = index
+            self._dir_mtimes = dir_mtimes
+            self._checked_at = time.monotonic()
+        return index
+
+    @staticmethod
+    def _resolve(
+        files: dict[str, tuple[Path, _Signature]], safe_name: str, is_stream: bool
+    ) -> tuple[Path, _Signature] | None:
+        names = [safe_name]
+        # Fallback: parameterized test variant → base mock file.
+        if "[" in safe_name and "]" in safe_name:
+            names.append(safe_name.split("[", 1)[0])
+        # Stream mocks previously used the `.json` extension (backward compatibility).
+        extensions = (".jsonl", ".json") if is_stream else (".json",)
+        for name in (n + ext for n in names for ext in extensions):
+            entry = files.get(name)
+            if entry is not None:
+                return entry
+        return None
+
+    # ── Parsing ───────────────────────────────────────────
 
     def _sanitize_filename(self, name: str) -> str:
         """Replace unsafe filename characters with underscore."""
         return re.sub(r"[^a-zA-Z0-9_.:\-\[\],]", "_", name)
 
+    def _parse(self, file_path: Path, is_stream: bool) -> MockFixture:
+        if is_stream:
+            return MockFixture(
+                path=file_path,
+                is_stream=True,
+                headers={"content-type": "text/event-stream"},
+                frames=tuple(self._load_stream_response(file_path)),
+            )
+        raw = self._load_json_response(file_path)
+        body = raw.get("body")
+        headers = {str(k).lower(): str(v) for k, v in (raw.get("headers") or {}).items()}
+        headers.pop("content-length", None)
+        headers.setdefault("content-type", "application/json")
+        return MockFixture(
+            path=file_path,
+            is_stream=False,
+            status_code=int(raw.get("status_code", 200)),
+            headers=headers,
+            raw=raw,
+            body_bytes=body.encode() if isinstance(body, str) else json.dumps(body).encode(),
+        )
+
     def _load_json_response(self, file_path: Path) -> dict:
         """Load non-streaming JSON response."""
         with open(file_path, encoding="utf-8") as f:
@@ -126,3 +322,26 @@ class MockDataLoader:
                         yield f"event: {sse_event}\ndata: {data_str}\n\n".encode()
                     else:
                         yield f"data: {data_str}\n\n".encode()
+
+
+def _signature(path: Path) -> _Signature:
+    try:
+        st = path.stat()
+    except OSError:
+        return (-1, -1)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _scandir(path: Path) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
@@ -0,0 +1,463 @@
+"""Local mock LLM server for load, latency and soak testing.
+
+Serves the integration fixtures (``<mocks>/<provider>/<endpoint>/<test>.json[l]``)
+over real HTTP so the full client stack is exercised: ``HTTPClient`` transport,
+connection pooling and SSE framing. The server is a plain ASGI application (no
+framework dependency) and can be run with any ASGI server; ``serve()`` and
+``MockServerThread`` use uvicorn (installed with the ``web`` extra).
+
+Routing:
+
+- ``/<provider>/<endpoint>`` selects *provider* when ``<mocks>/<provider>`` exists,
+  otherwise the whole path is the endpoint of ``default_provider``.
+- The fixture name comes from the ``X-Mock-Test-Name`` header (default ``baseline``;
+  unknown names fall back to ``baseline``).
+- A request streams when its JSON body has ``"stream": true`` or the path contains
+  ``streamGenerateContent``.
+
+Behaviour knobs (``MockServerConfig``) cover response latency, time to first
+stream chunk, per-chunk pacing, chunk fragmentation, per-response throughput,
+a concurrency cap and random 429/500/truncated-stream injection. Faults can also
+be forced per request with ``X-Mock-Error: 429|500|truncate``.
+
+Usage::
+
+    python -m llm_spec.testing.mock_server --port 8900 --latency-ms 300 --chunk-interval-ms 20
+    python -m llm_spec.testing.mock_server --profile realistic --seed 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, MutableMapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from llm_spec.testing.latency import LatencyDistribution, get_latency_profile
+from llm_spec.testing.mock_loader import MockDataLoader, MockFixture
+
+TEST_NAME_HEADER = "X-Mock-Test-Name"
+ERROR_HEADER = "X-Mock-Error"
+STATS_PATH = "/__mock__/stats"
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+@dataclass
+class MockServerConfig:
+    """Behaviour of a ``MockLLMServer``.
+
+    Attributes:
+        base_dir: Fixture root (``<provider>/<endpoint>/<test>.json[l]``).
+        default_provider: Provider used when the path has no provider prefix.
+        latency: Delay before the response headers are sent.
+        ttft: Extra delay before the first stream chunk.
+        chunk_interval: Delay between stream chunks.
+        fragment_size: Re-cut the SSE byte stream into pieces of this many bytes
+            (pieces straddle event boundaries); 0 keeps one piece per event.
+        bytes_per_second: Per-response throughput cap; 0 disables it.
+        max_concurrency: Requests above this many in flight get 429; 0 disables it.
+        error_429_rate: Probability of answering 429.
+        error_500_rate: Probability of answering 500.
+        truncate_rate: Probability of ending the body early (half of the stream
+            events, or half of the JSON bytes).
+        seed: Seed for all random draws (latency and fault injection).
+    """
+
+    base_dir: Path
+    default_provider: str = "openai"
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    ttft: LatencyDistribution = field(default_factory=LatencyDistribution)
+    chunk_interval: LatencyDistribution = field(default_factory=LatencyDistribution)
+    fragment_size: int = 0
+    bytes_per_second: float = 0.0
+    max_concurrency: int = 0
+    error_429_rate: float = 0.0
+    error_500_rate: float = 0.0
+    truncate_rate: float = 0.0
+    seed: int | None = None
+
+
+@dataclass
+class MockServerStats:
+    """Counters exposed at ``/__mock__/stats``."""
+
+    requests: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    bytes_sent: int = 0
+    statuses: Counter[int] = field(default_factory=Counter)
+    faults: Counter[str] = field(default_factory=Counter)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "bytes_sent": self.bytes_sent,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+            "faults": dict(self.faults),
+        }
+
+
+@dataclass
+class _Fixture:
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    pieces: list[bytes]
+    stream: bool
+
+
+def _error_body(status: int, message: str) -> bytes:
+    kind = {429: "rate_limit_error", 404: "not_found_error"}.get(status, "server_error")
+    return json.dumps({"error": {"message": message, "type": kind, "code": status}}).encode()
+
+
+class MockLLMServer:
+    """ASGI application replaying mock fixtures with configurable network behaviour."""
+
+    def __init__(self, config: MockServerConfig) -> None:
+        self.config = config
+        self.stats = MockServerStats()
+        self._loader = MockDataLoader.shared(config.base_dir)
+        self._loader.preload()
+        self._rng = random.Random(config.seed)
+        # Wire form per loader fixture; rebuilt when the loader re-parses a changed file.
+        self._wire: dict[int, tuple[MockFixture, _Fixture]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        stats = self.stats
+        if scope["path"] == STATS_PATH:
+            await self._send_json(send, 200, stats.to_dict())
+            return
+
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        try:
+            await self._handle(scope, body, send)
+        finally:
+            stats.in_flight -= 1
+
+    # ── Request handling ──────────────────────────────────
+
+    async def _handle(self, scope: Scope, body: bytes, send: Send) -> None:
+        cfg, rng = self.config, self._rng
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope["headers"]}
+        forced = headers.get(ERROR_HEADER.lower(), "")
+
+        if cfg.max_concurrency and self.stats.in_flight > cfg.max_concurrency:
+            self.stats.faults["concurrency"] += 1
+            body = _error_body(429, "mock concurrency limit")
+            await self._send_json(send, 429, None, body, [(b"retry-after", b"1")])
+            return
+
+        roll = rng.random()
+        fault = forced
+        if not fault:
+            if roll < cfg.error_429_rate:
+                fault = "429"
+            elif roll < cfg.error_429_rate + cfg.error_500_rate:
+                fault = "500"
+            elif rng.random() < cfg.truncate_rate:
+                fault = "truncate"
+
+        delay = cfg.latency.sample(rng)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if fault in ("429", "500"):
+            self.stats.faults[fault] += 1
+            status = int(fault)
+            extra = [(b"retry-after", b"1")] if status == 429 else []
+            await self._send_json(send, status, None, _error_body(status, "injected"), extra)
+            return
+
+        try:
+            fixture = self._fixture(scope["path"], headers, body)
+        except FileNotFoundError as exc:
+            await self._send_json(send, 404, None, _error_body(404, str(exc)))
+            return
+        except Exception as exc:
+            await self._send_json(send, 500, None, _error_body(500, f"bad fixture: {exc}"))
+            return
+
+        pieces = fixture.pieces
+        if fault == "truncate":
+            self.stats.faults["truncate"] += 1
+            if fixture.stream and len(pieces) > 1:
+                pieces = pieces[: len(pieces) // 2]
+            else:
+                data = b"".join(pieces)
+                pieces = [data[: len(data) // 2]]
+
+        response_headers = list(fixture.headers)
+        if not fixture.stream:
+            response_headers.append((b"content-length", str(sum(map(len, pieces))).encode()))
+        await send(
+            {"type": "http.response.start", "status": fixture.status, "headers": response_headers}
+        )
+        self.stats.statuses[fixture.status] += 1
+        await self._send_pieces(send, pieces, paced=fixture.stream)
+
+    async def _send_pieces(self, send: Send, pieces: list[bytes], *, paced: bool) -> None:
+        cfg, rng = self.config, self._rng
+        started = time.monotonic()
+        sent = 0
+        for i, piece in enumerate(pieces):
+            if paced:
+                delay = (cfg.ttft if i == 0 else cfg.chunk_interval).sample(rng)
+                if delay:
+                    await asyncio.sleep(delay)
+            await send({"type": "http.response.body", "body": piece, "more_body": True})
+            sent += len(piece)
+            if cfg.bytes_per_second > 0:
+                ahead = started + sent / cfg.bytes_per_second - time.monotonic()
+                if ahead > 0:
+                    await asyncio.sleep(ahead)
+        self.stats.bytes_sent += sent
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def _send_json(
+        self,
+        send: Send,
+        status: int,
+        payload: Any,
+        raw: bytes | None = None,
+        extra_headers: list[tuple[bytes, bytes]] | None = None,
+    ) -> None:
+        data = raw if raw is not None else json.dumps(payload).encode()
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(data)).encode()),
+            *(extra_headers or []),
+        ]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": data, "more_body": False})
+        self.stats.statuses[status] += 1
+        self.stats.bytes_sent += len(data)
+
+    # ── Fixtures ──────────────────────────────────────────
+
+    def _fixture(self, path: str, headers: dict[str, str], body: bytes) -> _Fixture:
+        provider, endpoint = self._route(path)
+        try:
+            params = json.loads(body) if body else {}
+        except ValueError:
+            params = {}
+        stream = (isinstance(params, dict) and params.get("stream") is True) or (
+            "streamGenerateContent" in endpoint
+        )
+        test_name = headers.get(TEST_NAME_HEADER.lower()) or "baseline"
+
+        try:
+            fixture = self._loader.get_fixture(provider, endpoint, test_name, is_stream=stream)
+        except FileNotFoundError:
+            if test_name == "baseline":
+                raise
+            fixture = self._loader.get_fixture(provider, endpoint, "baseline", is_stream=stream)
+
+        cached = self._wire.get(id(fixture))
+        if cached is None or cached[0] is not fixture:
+            cached = (fixture, self._build_fixture(fixture))
+            self._wire[id(fixture)] = cached
+        return cached[1]
+
+    def _route(self, path: str) -> tuple[str, str]:
+        head, _, rest = path.lstrip("/").partition("/")
+        if rest and head in self._loader.providers():
+            return head, "/" + rest
+        return self.config.default_provider, path
+
+    def _build_fixture(self, fixture: MockFixture) -> _Fixture:
+        if not fixture.is_stream:
+            return _Fixture(
+                status=fixture.status_code,
+                headers=[(k.encode(), v.encode()) for k, v in fixture.headers.items()],
+                pieces=[fixture.body_bytes],
+                stream=False,
+            )
+
+        events = list(fixture.frames)
+        size = self.config.fragment_size
+        if size > 0:
+            joined = b"".join(events)
+            events = [joined[i : i + size] for i in range(0, len(joined), size)]
+        return _Fixture(
+            status=200,
+            headers=[(b"content-type", b"text/event-stream"), (b"cache-control", b"no-cache")],
+            pieces=events,
+            stream=True,
+        )
+
+
+# ── Running ───────────────────────────────────────────────
+
+
+def _require_uvicorn() -> Any:
+    try:
+        import uvicorn
+    except ImportError as exc:
+        raise RuntimeError(
+            "running the mock server requires uvicorn (install with: pip install 'llm-spec[web]')"
+        ) from exc
+    return uvicorn
+
+
+class MockServerThread:
+    """Run a ``MockLLMServer`` with uvicorn in a background thread.
+
+    Usage::
+
+        with MockServerThread(MockServerConfig(base_dir=mocks)) as server:
+            config.provider_configs["openai"].base_url = server.base_url
+    """
+
+    def __init__(self, config: MockServerConfig, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.app = MockLLMServer(config)
+        self._host = host
+        self._port = port
+        self._server: Any = None
+        self._thread: threading.Thread | None = None
+        self._sock: socket.socket | None = None
+
+    @property
+    def base_url(self) -> str:
+        assert self._sock is not None
+        host, port = self._sock.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> MockServerThread:
+        self.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.stop()
+
+    def start(self, timeout: float = 10.0) -> None:
+        uvicorn = _require_uvicorn()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self._host, self._port))
+        self._sock = sock
+        config = uvicorn.Config(self.app, log_level="warning", lifespan="off", access_log=False)
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(
+            target=self._server.run,
+            kwargs={"sockets": [sock]},
+            name="llm-spec-mock-server",
+            daemon=True,
+        )
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("mock server failed to start")
+            time.sleep(0.01)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        self._server = None
+
+
+def serve(config: MockServerConfig, host: str = "127.0.0.1", port: int = 8900) -> None:
+    """Run a ``MockLLMServer`` in the foreground."""
+    uvicorn = _require_uvicorn()
+    uvicorn.run(MockLLMServer(config), host=host, port=port, log_level="warning", lifespan="off")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Serve llm-spec mock fixtures over HTTP.")
+    parser.add_argument(
+        "--mocks-dir", type=Path, default=Path("packages/core/tests/integration/mocks")
+    )
+    parser.add_argument("--provider", default="openai", help="default provider (no path prefix)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument(
+        "--profile", default=None, help="built-in latency profile (zero, fast, realistic, legacy)"
+    )
+    parser.add_argument(
+        "--distribution", choices=["fixed", "uniform", "normal", "lognormal"], default="fixed"
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-spread-ms", type=float, default=0.0)
+    parser.add_argument("--ttft-ms", type=float, default=0.0)
+    parser.add_argument("--chunk-interval-ms", type=float, default=0.0)
+    parser.add_argument("--fragment-size", type=int, default=0)
+    parser.add_argument("--bytes-per-second", type=float, default=0.0)
+    parser.add_argument("--max-concurrency", type=int, default=0)
+    parser.add_argument("--error-429-rate", type=float, default=0.0)
+    parser.add_argument("--error-500-rate", type=float, default=0.0)
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    profile = get_latency_profile(args.profile) if args.profile else None
+
+    def _dist(mean: float, default: LatencyDistribution | None) -> LatencyDistribution:
+        if not mean and default is not None:
+            return default
+        return LatencyDistribution(args.distribution, mean, args.latency_spread_ms if mean else 0.0)
+
+    config = MockServerConfig(
+        base_dir=args.mocks_dir,
+        default_provider=args.provider,
+        latency=_dist(args.latency_ms, profile and profile.response),
+        ttft=_dist(args.ttft_ms, profile and profile.ttft),
+        chunk_interval=(
+            LatencyDistribution(mean_ms=args.chunk_interval_ms)
+            if args.chunk_interval_ms or profile is None
+            else profile.chunk_interval
+        ),
+        fragment_size=args.fragment_size,
+        bytes_per_second=args.bytes_per_second,
+        max_concurrency=args.max_concurrency,
+        error_429_rate=args.error_429_rate,
+        error_500_rate=args.error_500_rate,
+        truncate_rate=args.truncate_rate,
+        seed=args.seed,
+    )
+    print(f"Serving {config.base_dir} on http://{args.host}:{args.port}")
+    serve(config, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import io
+import threading
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from llm_spec.adapters.api_family import APIFamilyAdapter
+from llm_spec.adapters.cassette import (
+    CassetteMissError,
+    CassetteStore,
+    RecordingAdapter,
+    ReplayAdapter,
+)
+from llm_spec.client.http_client import HTTPClient
+from llm_spec.config.loader import ProviderConfig
+
+
+async def _sse() -> AsyncIterator[bytes]:
+    for chunk in (b"data: 1\n\n", b"data: 2\n\n", b"data: [DONE]\n\n"):
+        yield chunk
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/v1/fail":
+        return httpx.Response(429, json={"error": "slow down"})
+    if b'"stream":true' in request.content.replace(b" ", b""):
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/event-stream"},
+            content=_sse(),
+        )
+    return httpx.Response(200, json={"id": "resp-1"})
+
+
+def _recording_adapter(store: CassetteStore) -> RecordingAdapter:
+    config = ProviderConfig(api_key="sk-test", base_url="https://api.example.test")
+    http_client = HTTPClient()
+    http_client._async_client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    inner = APIFamilyAdapter(config=config, http_client=http_client, api_family="openai")
+    return RecordingAdapter(inner, store, "openai")
+
+
+async def test_record_then_replay(tmp_path: Path) -> None:
+    recorder = _recording_adapter(CassetteStore(tmp_path))
+    live = await recorder.request_async("/v1/chat/completions", {"model": "m"})
+    live_stream = await recorder.stream_async("/v1/chat/completions", {"stream": True})
+    with pytest.raises(httpx.HTTPStatusError):
+        await recorder.stream_async("/v1/fail", {"stream": True})
+
+    # A fresh store reads everything back from disk.
+    replay = ReplayAdapter(
+        ProviderConfig(api_key="", base_url=""), CassetteStore(tmp_path), "openai"
+    )
+    replayed = await replay.request_async("/v1/chat/completions", {"model": "m"})
+    assert replayed.status_code == 200
+    assert replayed.json() == live.json()
+    assert len(live_stream[1]) == 3
+    assert replay.stream("/v1/chat/completions", {"stream": True}) == live_stream
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await replay.stream_async("/v1/fail", {"stream": True})
+    assert exc_info.value.response.status_code == 429
+    assert exc_info.value.response.json() == {"error": "slow down"}
+
+    with pytest.raises(CassetteMissError):
+        await replay.request_async("/v1/chat/completions", {"model": "other"})
+
+
+async def test_uploads_replay_after_the_transport_consumed_them(tmp_path: Path) -> None:
+    def upload() -> dict[str, tuple[str, io.BytesIO, str]]:
+        return {"file": ("a.wav", io.BytesIO(b"RIFF-audio"), "audio/wav")}
+
+    recorder = _recording_adapter(CassetteStore(tmp_path))
+    sent = upload()
+    live = await recorder.request_async("/v1/audio/transcriptions", {"model": "m"}, files=sent)
+    assert sent["file"][1].read() == b""
+
+    replay = ReplayAdapter(
+        ProviderConfig(api_key="", base_url=""), CassetteStore(tmp_path), "openai"
+    )
+    replayed = await replay.request_async(
+        "/v1/audio/transcriptions", {"model": "m"}, files=upload()
+    )
+
+    assert replayed.json() == live.json()
+
+
+async def test_identical_bodies_share_one_blob(tmp_path: Path) -> None:
+    store = CassetteStore(tmp_path)
+    recorder = _recording_adapter(store)
+    await recorder.request_async("/v1/chat/completions", {"model": "a"})
+    await recorder.request_async("/v1/chat/completions", {"model": "b"})
+
+    assert len(store) == 2
+    assert len(list((tmp_path / "blobs").glob("*/*.z"))) == 1
+
+
+async def test_async_replay_reads_the_cassette_off_the_event_loop(tmp_path: Path) -> None:
+    await _recording_adapter(CassetteStore(tmp_path)).request_async("/v1/x", {"model": "m"})
+    store = CassetteStore(tmp_path)
+    readers: list[threading.Thread] = []
+    get_blob = store.get_blob
+
+    def tracking_get_blob(digest: str) -> bytes:
+        readers.append(threading.current_thread())
+        return get_blob(digest)
+
+    store.get_blob = tracking_get_blob  # type: ignore[method-assign]
+    replay = ReplayAdapter(ProviderConfig(api_key="", base_url=""), store, "openai")
+
+    response = await replay.request_async("/v1/x", {"model": "m"})
+
+    assert response.json() == {"id": "resp-1"}
+    assert readers and threading.main_thread() not in readers
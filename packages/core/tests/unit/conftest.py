@@ -0,0 +1,38 @@
+"""Shared fixtures for unit tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+
+import pytest
+
+from llm_spec.suites.types import ExecutableCase, FocusParam, HttpRequest, ValidationSpec
+
+CaseFactory = Callable[..., ExecutableCase]
+
+
+@pytest.fixture
+def make_case() -> CaseFactory:
+    """Factory of minimal OpenAI cases: ``make_case("name", stream=True, ...)``."""
+
+    def _make(
+        name: str = "case",
+        *,
+        endpoint: str = "/v1/chat/completions",
+        model: str = "gpt-4",
+        stream: bool = False,
+        required_fields: Sequence[str] = ("id",),
+        focus: FocusParam | None = None,
+    ) -> ExecutableCase:
+        return ExecutableCase(
+            case_id=name,
+            test_name=name,
+            focus=focus,
+            request=HttpRequest(
+                method="POST", endpoint=endpoint, params={"model": model}, stream=stream
+            ),
+            checks=ValidationSpec(required_fields=list(required_fields)),
+            provider="openai",
+        )
+
+    return _make
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+
+from llm_spec.client.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakers
+from llm_spec.config.loader import AppConfig
+from llm_spec.executor import run_suites
+from llm_spec.suites.registry import Registry
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_on_failure_rate_and_recovers_through_probe() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker(
+        "openai", CircuitBreakerConfig(failure_rate=0.5, min_requests=4, cooldown_s=5), clock
+    )
+
+    for failed in (False, True, False):
+        assert breaker.allow()
+        breaker.record(failed)
+    assert breaker.state == "closed"
+    assert breaker.allow()
+    breaker.record(True)
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert breaker.retry_after() == 5
+
+    clock.now = 5
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()  # one probe at a time
+    breaker.record(True)
+    assert breaker.state == "open"
+
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record(False)
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_breaker_window_forgets_old_failures() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker("openai", CircuitBreakerConfig(min_requests=2, window_s=10), clock)
+    breaker.record(True)
+    clock.now = 11
+    breaker.record(True)
+    assert breaker.state == "closed"
+
+
+async def test_run_suites_fails_fast_while_provider_is_down() -> None:
+    registry = Registry.from_directory(
+        next(p for p in Path(__file__).resolve().parents if (p / "suites-registry").exists())
+        / "suites-registry"
+        / "providers"
+    )
+    suite_ids = registry.suite_ids[:1]
+    sent: list[int] = []
+
+    def factory(_provider: str, _config: AppConfig) -> tuple[MagicMock, MagicMock]:
+        async def request(**_kwargs: Any) -> MagicMock:
+            sent.append(1)
+            raise httpx.ConnectError("Connection refused")
+
+        adapter = MagicMock()
+        adapter.request_async = AsyncMock(side_effect=request)
+        http_client = MagicMock()
+        http_client.close_async = AsyncMock()
+        return http_client, adapter
+
+    breakers = CircuitBreakers(CircuitBreakerConfig(min_requests=3, cooldown_s=60))
+    results = await run_suites(
+        registry,
+        AppConfig(),
+        suite_ids=suite_ids,
+        max_concurrent_tests=1,
+        client_factory=factory,
+        circuit_breakers=breakers,
+    )
+
+    codes = [v.failure.code for v in results[0].verdicts if v.failure]
+    assert len(codes) > 3
+    assert len(sent) == 3
+    assert codes[3:] == ["CIRCUIT_OPEN"] * (len(codes) - 3)
+    assert breakers.states() == {results[0].suite.provider_id: "open"}
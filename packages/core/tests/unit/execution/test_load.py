@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from llm_spec.adapters.api_family import APIFamilyAdapter
+from llm_spec.client.http_client import HTTPClient
+from llm_spec.config.loader import ProviderConfig
+from llm_spec.executor import Executor
+from llm_spec.load import LoadProfile, run_load
+from llm_spec.suites.types import ExecutableCase
+
+CaseFactory = Callable[..., ExecutableCase]
+
+
+def _cases(make_case: CaseFactory) -> list[ExecutableCase]:
+    return [make_case(name, endpoint=f"/v1/{name}", model="m") for name in ("ok", "broken")]
+
+
+class _Target:
+    """Answers every 4th request with a 500 and ``/v1/broken`` without ``id``."""
+
+    def __init__(self) -> None:
+        self.counter = itertools.count(1)
+        self.current = 0
+        self.peak = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        await asyncio.sleep(0.002)
+        self.current -= 1
+        if next(self.counter) % 4 == 0:
+            return httpx.Response(500, json={"error": "overloaded"})
+        if request.url.path == "/v1/broken":
+            return httpx.Response(200, json={"object": "x"})
+        return httpx.Response(200, json={"id": "x"})
+
+
+def _executor(target: _Target) -> Executor:
+    http_client = HTTPClient()
+    http_client._async_client = httpx.AsyncClient(transport=httpx.MockTransport(target.handle))
+    adapter = APIFamilyAdapter(
+        config=ProviderConfig(api_key="k", base_url="https://api.example.test"),
+        http_client=http_client,
+        api_family="openai",
+    )
+    return Executor(client=adapter)
+
+
+async def test_closed_loop_reports_error_and_failure_rates(make_case: CaseFactory) -> None:
+    target = _Target()
+    profile = LoadProfile(concurrency=4, requests=40, weights={"broken": 0}, seed=1)
+
+    report = await run_load(_executor(target), _cases(make_case), profile)
+
+    summary = report.summary()
+    assert summary["requests"] == 40
+    assert target.peak <= 4
+    assert set(summary["tests"]) == {"ok"}
+    assert summary["error_rate"] == 0.25
+    assert summary["fail_rate"] == 0.0
+    assert summary["latency_ms"]["p50"] <= summary["latency_ms"]["p99"]
+    assert sum(w["requests"] for w in report.timeline()) == 40
+
+
+async def test_open_loop_paces_requests_and_stops_at_duration(make_case: CaseFactory) -> None:
+    target = _Target()
+    profile = LoadProfile(rps=200, duration_s=0.2, window_s=0.1, seed=1)
+
+    report = await run_load(_executor(target), _cases(make_case), profile)
+
+    summary = report.summary()
+    assert 30 <= summary["requests"] <= 41
+    assert summary["fail_rate"] > 0
+    assert report.samples[-1].offset_s < 0.2
+    assert [w["t_s"] for w in report.timeline()] == [0.0, 0.1]
+
+
+def test_profile_requires_one_mode_and_a_stop_condition() -> None:
+    with pytest.raises(ValueError):
+        LoadProfile(rps=10, concurrency=2, requests=1)
+    with pytest.raises(ValueError):
+        LoadProfile(concurrency=2)
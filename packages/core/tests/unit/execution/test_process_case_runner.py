@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+from collections.abc import Callable
+from typing import Any
+
+from llm_spec.client.http_client import HTTPClient
+from llm_spec.config.loader import AppConfig
+from llm_spec.distributed import ProcessCaseRunner
+from llm_spec.suites.types import ExecutableCase, FocusParam
+
+CaseFactory = Callable[..., ExecutableCase]
+
+
+class _Response:
+    status_code = 200
+    headers: dict[str, str] = {}
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+
+    def json(self) -> dict[str, Any]:
+        return self._payload
+
+
+class _WorkerAdapter:
+    def __init__(self, delay: float) -> None:
+        self._delay = delay
+        self._test_name: str | None = None
+
+    def set_current_test_name(self, name: str | None) -> None:
+        self._test_name = name
+
+    async def request_async(self, **_kwargs: Any) -> _Response:
+        if self._test_name == "crash":
+            os._exit(3)
+        await asyncio.sleep(30.0 if self._test_name == "slow" else self._delay)
+        return _Response({"pid": os.getpid()})
+
+
+def _factory(_provider: str, _config: AppConfig, delay: float = 0.0) -> tuple[HTTPClient, Any]:
+    return HTTPClient(), _WorkerAdapter(delay)
+
+
+def _slow_factory(provider: str, config: AppConfig) -> tuple[HTTPClient, Any]:
+    return _factory(provider, config, delay=30.0)
+
+
+def _case(make_case: CaseFactory, name: str) -> ExecutableCase:
+    return make_case(
+        name,
+        endpoint="/v1/x",
+        model="m",
+        required_fields=("pid",),
+        focus=FocusParam(name="model", value="m"),
+    )
+
+
+async def test_process_case_runner_executes_cases_in_worker_processes(
+    make_case: CaseFactory,
+) -> None:
+    with ProcessCaseRunner(processes=2, concurrency_per_process=4) as runner:
+        session_id = runner.open_session(_factory, AppConfig())
+        verdicts = await asyncio.gather(
+            *(runner.run(session_id, "openai", _case(make_case, f"t{i}")) for i in range(6))
+        )
+        runner.close_session(session_id)
+
+    assert [v.test_name for v in verdicts] == [f"t{i}" for i in range(6)]
+    assert all(v.status == "pass" for v in verdicts)
+
+
+async def test_process_case_runner_cancellation_does_not_block(make_case: CaseFactory) -> None:
+    with ProcessCaseRunner(processes=1) as runner:
+        session_id = runner.open_session(_slow_factory, AppConfig())
+        task = asyncio.create_task(runner.run(session_id, "openai", _case(make_case, "slow")))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await asyncio.wait_for(task, timeout=5)
+        assert task.cancelled()
+        assert not runner._pending
+
+
+async def test_dead_worker_fails_its_cases_and_is_replaced(make_case: CaseFactory) -> None:
+    with ProcessCaseRunner(processes=1) as runner:
+        session_id = runner.open_session(_factory, AppConfig())
+        slow = asyncio.create_task(runner.run(session_id, "openai", _case(make_case, "slow")))
+        await asyncio.sleep(0.2)
+
+        crashed = await asyncio.wait_for(
+            runner.run(session_id, "openai", _case(make_case, "crash")), timeout=10
+        )
+        lost = await asyncio.wait_for(slow, timeout=10)
+        after = await asyncio.wait_for(
+            runner.run(session_id, "openai", _case(make_case, "after")), timeout=30
+        )
+
+    for verdict in (crashed, lost):
+        assert verdict.status == "error"
+        assert verdict.failure is not None and verdict.failure.code == "WORKER_DIED"
+        assert "exited with code 3" in verdict.failure.message
+    assert after.status == "pass"
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from llm_spec.config.loader import AppConfig
+from llm_spec.executor import run_suites
+from llm_spec.suites.registry import Registry
+
+
+def _repo_root() -> Path:
+    for parent in Path(__file__).resolve().parents:
+        if (parent / "suites-registry").exists():
+            return parent
+    raise RuntimeError("repo root not found for suites-registry")
+
+
+class _InFlight:
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+
+    async def request(self, **_kwargs: Any) -> MagicMock:
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        await asyncio.sleep(0.01)
+        self.current -= 1
+        response = MagicMock()
+        response.status_code = 500
+        response.json.return_value = {}
+        return response
+
+
+def _factory(tracker: _InFlight, http_clients: list[MagicMock]):
+    def factory(_provider: str, _config: AppConfig) -> tuple[MagicMock, MagicMock]:
+        adapter = MagicMock()
+        adapter.request_async = AsyncMock(side_effect=tracker.request)
+        http_client = MagicMock()
+        http_client.close_async = AsyncMock()
+        http_clients.append(http_client)
+        return http_client, adapter
+
+    return factory
+
+
+def _registry_and_ids(count: int) -> tuple[Registry, list[str]]:
+    registry = Registry.from_directory(_repo_root() / "suites-registry" / "providers")
+    return registry, registry.suite_ids[:count]
+
+
+async def test_run_suites_limits_suites_in_flight() -> None:
+    registry, suite_ids = _registry_and_ids(3)
+    tracker = _InFlight()
+    http_clients: list[MagicMock] = []
+    open_suites = 0
+    peak_suites = 0
+
+    async def on_suite_start(_ctx: Any) -> None:
+        nonlocal open_suites, peak_suites
+        open_suites += 1
+        peak_suites = max(peak_suites, open_suites)
+
+    async def on_suite_done(_ctx: Any, _result: Any) -> None:
+        nonlocal open_suites
+        open_suites -= 1
+
+    results = await run_suites(
+        registry,
+        AppConfig(),
+        suite_ids=suite_ids,
+        selected_tests={sid: {"baseline"} for sid in suite_ids},
+        max_concurrent_suites=1,
+        on_suite_start=on_suite_start,
+        on_suite_done=on_suite_done,
+        client_factory=_factory(tracker, http_clients),
+    )
+
+    assert [r.suite.suite_id for r in results] == suite_ids
+    assert peak_suites == 1
+    assert all(c.close_async.await_count == 1 for c in http_clients)
+
+
+async def test_run_suites_shares_global_semaphore_and_keeps_pooled_clients_open() -> None:
+    registry, suite_ids = _registry_and_ids(3)
+    tracker = _InFlight()
+    http_clients: list[MagicMock] = []
+
+    await run_suites(
+        registry,
+        AppConfig(),
+        suite_ids=suite_ids,
+        max_concurrent_tests=10,
+        global_semaphore=asyncio.Semaphore(2),
+        client_factory=_factory(tracker, http_clients),
+        close_clients=False,
+    )
+
+    assert tracker.peak <= 2
+    assert all(c.close_async.await_count == 0 for c in http_clients)
+
+
+async def test_queue_wait_is_recorded_separately_from_latency() -> None:
+    registry, suite_ids = _registry_and_ids(1)
+    tracker = _InFlight()
+    started_while_running: list[int] = []
+
+    async def on_test_start(*_args: Any) -> None:
+        started_while_running.append(tracker.current)
+
+    results = await run_suites(
+        registry,
+        AppConfig(),
+        suite_ids=suite_ids,
+        max_concurrent_tests=1,
+        on_test_start=on_test_start,
+        client_factory=_factory(tracker, []),
+    )
+
+    verdicts = results[0].verdicts
+    assert len(verdicts) > 2
+    # on_test_start fires once the slot is held, never while another case runs.
+    assert started_while_running == [0] * len(verdicts)
+    for verdict in verdicts:
+        assert verdict.queued_at <= verdict.dispatched_at <= verdict.finished_at
+        assert verdict.queue_ms is not None
+    # With one slot, the last case waited for every case before it.
+    assert max(v.queue_ms or 0 for v in verdicts) >= 10 * (len(verdicts) - 1) * 0.9
+    queue = results[0].queue
+    assert queue["count"] == len(verdicts)
+    assert 0 < queue["waited"] <= 1
+
+
+async def test_live_tasks_follow_concurrency_not_plan_size() -> None:
+    registry, suite_ids = _registry_and_ids(6)
+    tracker = _InFlight()
+    live_tasks: list[int] = []
+
+    async def on_test_start(*_args: Any) -> None:
+        live_tasks.append(len(asyncio.all_tasks()))
+
+    results = await run_suites(
+        registry,
+        AppConfig(),
+        suite_ids=suite_ids,
+        max_concurrent_tests=2,
+        on_test_start=on_test_start,
+        client_factory=_factory(tracker, []),
+    )
+
+    total = sum(len(r.verdicts) for r in results)
+    assert len(live_tasks) == total
+    # This test + 2 workers + their 2 case tasks + open suites (one at a time per worker).
+    assert max(live_tasks) <= 1 + 2 + 2 + 2 < total
+    assert tracker.peak <= 2
+
+
+async def test_case_priority_orders_dispatch() -> None:
+    registry, suite_ids = _registry_and_ids(1)
+    order: list[str] = []
+    started: list[str] = []
+
+    async def on_suite_start(ctx: Any) -> None:
+        order.extend(case.test_name for case in ctx.cases)
+
+    async def on_test_start(case: Any, *_args: Any) -> None:
+        started.append(case.test_name)
+
+    await run_suites(
+        registry,
+        AppConfig(),
+        suite_ids=suite_ids,
+        max_concurrent_tests=1,
+        on_suite_start=on_suite_start,
+        on_test_start=on_test_start,
+        client_factory=_factory(_InFlight(), []),
+        case_priority=lambda _suite, case: -order.index(case.test_name),
+    )
+
+    assert len(order) > 2
+    assert started == order[::-1]
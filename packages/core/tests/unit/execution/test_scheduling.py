@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from llm_spec.config.loader import AppConfig
+from llm_spec.executor import run_suites
+from llm_spec.results.result_types import FailureInfo, TestVerdict
+from llm_spec.scheduling import DEFAULT_MS, LatencyEstimator, is_infrastructure_failure
+from llm_spec.suites.registry import Registry
+
+
+def _registry() -> Registry:
+    for parent in Path(__file__).resolve().parents:
+        if (parent / "suites-registry").exists():
+            return Registry.from_directory(parent / "suites-registry" / "providers")
+    raise RuntimeError("repo root not found for suites-registry")
+
+
+def _factory(status_code: int = 500, sent: list[str] | None = None):
+    def factory(_provider: str, _config: AppConfig) -> tuple[MagicMock, MagicMock]:
+        async def request(**_kwargs: Any) -> MagicMock:
+            await asyncio.sleep(0)
+            if sent is not None:
+                sent.append(_provider)
+            if not status_code:
+                raise httpx.ConnectError("Connection refused")
+            response = MagicMock()
+            response.status_code = status_code
+            response.json.return_value = {}
+            return response
+
+        adapter = MagicMock()
+        adapter.request_async = AsyncMock(side_effect=request)
+        http_client = MagicMock()
+        http_client.close_async = AsyncMock()
+        return http_client, adapter
+
+    return factory
+
+
+def test_estimate_falls_back_from_test_to_suite_to_route() -> None:
+    estimator = LatencyEstimator(
+        {
+            ("openai", "a", "chat_completions", "baseline"): 100.0,
+            ("openai", "a", "chat_completions", "stream"): 300.0,
+            ("openai", "b", "responses", "baseline"): 50.0,
+        }
+    )
+
+    assert estimator.estimate("openai", "a", "chat_completions", "stream") == 300.0
+    assert estimator.estimate("openai", "a", "chat_completions", "tools") == 200.0
+    assert estimator.estimate("openai", "c", "responses", "baseline") == 50.0
+    assert estimator.estimate("xai", "m", "images_generations", "baseline") == 20000.0
+    assert estimator.estimate("xai", "m", "unknown", "baseline") == DEFAULT_MS
+
+
+async def test_run_suites_dispatches_longest_expected_first() -> None:
+    registry = _registry()
+    suite_ids = registry.suite_ids[:2]
+    suites = [registry.get_suite(sid) for sid in suite_ids]
+    assert all(s is not None and len(s.tests) > 2 for s in suites)
+    first, second = suites[0], suites[1]
+    assert first is not None and second is not None
+    slow = second.tests[-1].name
+    estimator = LatencyEstimator(
+        {
+            (second.provider_id, second.model_id, second.route_id, slow): 60000.0,
+            (second.provider_id, second.model_id, second.route_id, second.tests[0].name): 10.0,
+            (first.provider_id, first.model_id, first.route_id, first.tests[-1].name): 1.0,
+        }
+    )
+    started: list[tuple[str, str]] = []
+
+    async def on_test_start(case: Any, *_args: Any) -> None:
+        started.append((case.model or "", case.test_name))
+
+    results = await run_suites(
+        registry,
+        AppConfig(),
+        suite_ids=suite_ids,
+        max_concurrent_tests=1,
+        on_test_start=on_test_start,
+        client_factory=_factory(),
+        case_priority=estimator.case_priority,
+        suite_priority=estimator.suite_priority,
+    )
+
+    assert [r.suite.suite_id for r in results] == suite_ids
+    assert started[0] == (second.model_id, slow)
+    assert started[-1] == (first.model_id, first.tests[-1].name)
+
+
+def _failed(
+    http_status: int | None, message: str = "", stage: str = "request", code: str = "X"
+) -> TestVerdict:
+    return TestVerdict(
+        case_id="c",
+        test_name="baseline",
+        status="fail" if http_status else "error",
+        http_status=http_status,
+        failure=FailureInfo(stage=stage, code=code, message=message),
+    )
+
+
+@pytest.mark.parametrize(
+    ("verdict", "expected"),
+    [
+        (_failed(401), True),
+        (_failed(404), True),
+        (_failed(None, "Connection refused", code="CONNECTION_ERROR"), True),
+        (_failed(None, "KeyError: 'x'", code="REQUEST_ERROR"), False),
+        (_failed(400, "HTTP 400: {'error': 'The model `gpt-x` does not exist'}"), True),
+        (_failed(400, "HTTP 400: {'error': 'temperature out of range'}"), False),
+        (_failed(429), False),
+        (_failed(503), False),
+        (_failed(200, stage="schema"), False),
+        (TestVerdict(case_id="c", test_name="baseline", status="pass"), False),
+    ],
+)
+def test_is_infrastructure_failure(verdict: TestVerdict, expected: bool) -> None:
+    assert is_infrastructure_failure(verdict) is expected
+
+
+# status_code 0: the transport raises a connection error.
+@pytest.mark.parametrize(("status_code", "skips"), [(0, True), (500, False)])
+async def test_baseline_first_skips_suite_after_infrastructure_failure(
+    status_code: int, skips: bool
+) -> None:
+    registry = _registry()
+    suite_ids = registry.suite_ids[:2]
+    sent: list[str] = []
+    done: list[str] = []
+
+    async def on_test_done(progress: Any) -> None:
+        done.append(progress.verdict.status)
+
+    results = await run_suites(
+        registry,
+        AppConfig(),
+        suite_ids=suite_ids,
+        max_concurrent_tests=4,
+        on_test_done=on_test_done,
+        client_factory=_factory(status_code, sent),
+        baseline_first=True,
+    )
+
+    total = sum(len(r.verdicts) for r in results)
+    assert len(done) == total
+    for result in results:
+        baseline = next(v for v in result.verdicts if v.test_name == "baseline")
+        others = [v for v in result.verdicts if v is not baseline]
+        if skips:
+            assert {v.status for v in others} == {"skipped"}
+            assert all(v.failure and baseline.case_id in v.failure.message for v in others)
+            assert result.run_result.skipped == len(others)
+        else:
+            assert "skipped" not in {v.status for v in others}
+    # Skipped suites sent only their baseline.
+    assert (len(sent) == len(results)) is skips
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from llm_spec import telemetry
+from llm_spec.client.http_client import HTTPClient
+from llm_spec.client.trace import current_trace
+from llm_spec.results.result_types import TestVerdict
+
+HAS_OTEL_SDK = importlib.util.find_spec("opentelemetry.sdk") is not None
+
+
+def _client() -> HTTPClient:
+    client = HTTPClient()
+    client._async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, json={"id": "x"}))
+    )
+    return client
+
+
+async def test_helpers_are_noops_when_disabled() -> None:
+    assert telemetry.get_telemetry() is None
+    with telemetry.span("llm_spec.case", provider="openai") as case_span:
+        assert case_span is None
+        with telemetry.http_attempt("POST", "https://example.test"):
+            assert current_trace() is None
+        telemetry.record_case(case_span, TestVerdict(case_id="c", test_name="t"))
+    response = await _client().request_async("POST", "https://example.test/v1")
+    assert response.status_code == 200
+
+
+@pytest.mark.skipif(HAS_OTEL_SDK, reason="OpenTelemetry SDK installed")
+def test_configure_without_sdk_explains_extra() -> None:
+    with pytest.raises(RuntimeError, match=r"llm-spec\[otel\]"):
+        telemetry.configure_telemetry("file")
+    assert telemetry.get_telemetry() is None
+
+
+@pytest.mark.skipif(not HAS_OTEL_SDK, reason="OpenTelemetry SDK not installed")
+async def test_file_exporter_writes_nested_spans(tmp_path: Path) -> None:
+    out = tmp_path / "telemetry.jsonl"
+    telemetry.configure_telemetry("file", file_path=out)
+    try:
+        with (
+            telemetry.span("llm_spec.suite", provider="openai", model="m"),
+            telemetry.span("llm_spec.case", test_name="baseline") as case_span,
+        ):
+            await _client().request_async("POST", "https://example.test/v1")
+            telemetry.record_case(
+                case_span, TestVerdict(case_id="c", test_name="baseline", status="pass")
+            )
+    finally:
+        telemetry.shutdown_telemetry()
+
+    records = [json.loads(line) for line in out.read_text().splitlines() if line]
+    spans = {r["name"]: r for r in records if "name" in r}
+    assert {"llm_spec.suite", "llm_spec.case", "HTTP POST"} <= set(spans)
+    http_span = spans["HTTP POST"]
+    assert http_span["parent_id"] == spans["llm_spec.case"]["context"]["span_id"]
+    assert http_span["attributes"]["http.response.status_code"] == 200
+    assert spans["llm_spec.case"]["attributes"]["llm_spec.provider"] == "openai"
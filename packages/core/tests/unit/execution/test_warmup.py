@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from llm_spec.adapters.api_family import APIFamilyAdapter
+from llm_spec.client.http_client import HTTPClient
+from llm_spec.client.trace import trace_transfer
+from llm_spec.client.warmup import warm_up
+from llm_spec.config.loader import AppConfig, ProviderConfig
+from llm_spec.executor import run_suites
+from llm_spec.suites.registry import Registry
+from llm_spec.testing.mock_server import MockServerConfig, MockServerThread
+
+
+def _repo_root() -> Path:
+    for parent in Path(__file__).resolve().parents:
+        if (parent / "suites-registry").exists():
+            return parent
+    raise RuntimeError("repo root not found for suites-registry")
+
+
+async def test_warm_up_leaves_keep_alive_connections(tmp_path: Path) -> None:
+    client = HTTPClient()
+    with MockServerThread(MockServerConfig(base_dir=tmp_path)) as server:
+        try:
+            report = await warm_up(client, server.base_url, 3)
+            with trace_transfer() as trace:
+                await client.request_async("HEAD", server.base_url)
+        finally:
+            await client.close_async()
+
+    assert (report.opened, report.new_connections, report.errors) == (3, 3, [])
+    assert len(report.connect_ms) == 3 and report.elapsed_ms >= max(report.connect_ms)
+    assert trace.phases_ms()["connect"] == 0
+
+
+async def test_warm_up_reports_unreachable_host() -> None:
+    client = HTTPClient()
+    try:
+        report = await warm_up(client, "http://127.0.0.1:9", 2, timeout=1.0)
+    finally:
+        await client.close_async()
+
+    assert report.opened == 0
+    assert len(report.errors) == 2
+
+
+async def test_run_suites_warms_a_shared_client_once(tmp_path: Path) -> None:
+    registry = Registry.from_directory(_repo_root() / "suites-registry" / "providers")
+    suite_ids = ["openai:gpt-4o-mini:chat_completions", "openai:gpt-4o-mini:responses"]
+    client = HTTPClient()
+    with MockServerThread(MockServerConfig(base_dir=tmp_path)) as server:
+        config = ProviderConfig(api_key="k", base_url=server.base_url, api_family="openai")
+
+        def factory(_provider: str, _config: AppConfig) -> tuple[HTTPClient, APIFamilyAdapter]:
+            return client, APIFamilyAdapter(config, client, api_family="openai")
+
+        try:
+            results = await run_suites(
+                registry,
+                AppConfig(),
+                suite_ids=suite_ids,
+                selected_tests={sid: {"baseline"} for sid in suite_ids},
+                max_concurrent_tests=2,
+                client_factory=factory,
+                close_clients=False,
+                warmup_connections=4,
+            )
+        finally:
+            await client.close_async()
+
+    warmups = [r.warmup for r in results if r.warmup is not None]
+    assert len(warmups) == 1
+    assert (warmups[0].requested, warmups[0].new_connections) == (2, 2)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from llm_spec.testing.latency import (
+    LATENCY_PROFILES,
+    LatencyDistribution,
+    LatencyProfile,
+    get_latency_profile,
+)
+
+
+def test_distributions_are_seeded_and_non_negative() -> None:
+    for kind in ("fixed", "uniform", "normal", "lognormal"):
+        dist = LatencyDistribution(kind, mean_ms=100, spread_ms=30)
+        a = [dist.sample(random.Random(1)) for _ in range(3)]
+        b = [dist.sample(random.Random(1)) for _ in range(3)]
+        assert a == b
+        assert all(x >= 0 for x in a)
+    assert LatencyDistribution().sample(random.Random()) == 0.0
+
+
+def test_sampler_depends_only_on_seed_and_key() -> None:
+    profile = get_latency_profile("realistic")
+
+    def draws(key: str) -> list[float]:
+        sampler = profile.sampler(key)
+        return [sampler.response(), sampler.first_chunk(), sampler.chunk(), sampler.chunk()]
+
+    assert draws("openai:/v1/chat:baseline") == draws("openai:/v1/chat:baseline")
+    assert draws("openai:/v1/chat:baseline") != draws("openai:/v1/chat:temperature")
+    assert get_latency_profile("realistic", seed=7).sampler("k").response() != (
+        profile.sampler("k").response()
+    )
+
+
+def test_zero_profile_and_recorded_profile() -> None:
+    assert LATENCY_PROFILES["zero"].is_zero
+    assert not LATENCY_PROFILES["fast"].is_zero
+
+    recorded = LatencyProfile.from_recorded([120, 480, -1])
+    assert recorded.response.samples_ms == (120.0, 480.0)
+    sampler = recorded.sampler("x")
+    assert {sampler.response() for _ in range(50)} == {0.12, 0.48}
+    assert LatencyProfile.from_recorded([]).sampler("x").response() == 0.0
+
+    with pytest.raises(ValueError, match="unknown latency profile"):
+        get_latency_profile("slow")
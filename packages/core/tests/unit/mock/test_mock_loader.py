@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from llm_spec.testing import mock_loader
+from llm_spec.testing.mock_loader import MockDataLoader
+
+
+def _write(path: Path, content: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(content, list):
+        path.write_text("\n".join(json.dumps(line) for line in content))
+    else:
+        path.write_text(json.dumps(content))
+
+
+def _fixtures(base: Path) -> Path:
+    endpoint = base / "openai" / "v1_chat_completions"
+    _write(endpoint / "baseline.json", {"status_code": 200, "headers": {}, "body": {"id": "a"}})
+    _write(endpoint / "stop.json", {"status_code": 200, "body": {"id": "stop"}})
+    _write(endpoint / "stream.jsonl", [{"type": "chunk", "data": {"x": 1}}, {"type": "done"}])
+    return base
+
+
+def test_lookup_fallbacks_and_copies(tmp_path: Path) -> None:
+    loader = MockDataLoader(_fixtures(tmp_path), check_interval=None)
+
+    data = loader.load_response("openai", "/v1/chat/completions", "baseline")
+    assert isinstance(data, dict)
+    data["body"]["id"] = "mutated"
+    again = loader.load_response("openai", "/v1/chat/completions", "baseline")
+    assert isinstance(again, dict) and again["body"] == {"id": "a"}
+
+    variant = loader.get_fixture("openai", "/v1/chat/completions", "stop[array]")
+    assert variant.body == {"id": "stop"}
+    assert variant.headers["content-type"] == "application/json"
+    assert json.loads(variant.body_bytes) == {"id": "stop"}
+
+    frames = list(loader.load_response("openai", "v1/chat/completions", "stream", is_stream=True))
+    assert frames == [b'data: {"x": 1}\n\n', b"data: [DONE]\n\n"]
+    assert loader.get_fixture("openai", "/v1/chat/completions", "stream", True) is (
+        loader.get_fixture("openai", "/v1/chat/completions", "stream", True)
+    )
+    assert loader.providers() == {"openai"}
+
+    with pytest.raises(FileNotFoundError, match="Mock data not found"):
+        loader.load_response("openai", "/v1/chat/completions", "missing")
+
+
+def test_added_and_replaced_files_are_picked_up(tmp_path: Path) -> None:
+    base = _fixtures(tmp_path)
+    loader = MockDataLoader(base, check_interval=0)
+    assert loader.preload() == 3
+
+    endpoint = base / "openai" / "v1_chat_completions"
+    _write(endpoint / "baseline.json.tmp", {"status_code": 201, "body": {"id": "changed"}})
+    os.replace(endpoint / "baseline.json.tmp", endpoint / "baseline.json")
+    _write(base / "openai" / "v1_embeddings" / "baseline.json", {"body": {"data": []}})
+
+    fixture = loader.get_fixture("openai", "/v1/chat/completions", "baseline")
+    assert (fixture.status_code, fixture.body) == (201, {"id": "changed"})
+    assert loader.get_fixture("openai", "/v1/embeddings", "baseline").body == {"data": []}
+
+
+def test_unchanged_directories_are_not_rescanned(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    loader = MockDataLoader(_fixtures(tmp_path), check_interval=0)
+    loader.preload()
+    scans: list[Path] = []
+    scandir = mock_loader._scandir
+
+    def counting_scandir(path: Path) -> list[os.DirEntry[str]]:
+        scans.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(mock_loader, "_scandir", counting_scandir)
+
+    for _ in range(3):
+        loader.get_fixture("openai", "/v1/chat/completions", "baseline")
+
+    assert scans == []
+
+
+def _edit_in_place(path: Path, content: object) -> None:
+    _write(path, content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_in_place_edits_are_picked_up(tmp_path: Path) -> None:
+    base = _fixtures(tmp_path)
+    loader = MockDataLoader(base, check_interval=0.0)
+    loader.preload()
+
+    _edit_in_place(
+        base / "openai" / "v1_chat_completions" / "baseline.json",
+        {"status_code": 201, "body": {"id": "changed"}},
+    )
+
+    fixture = loader.get_fixture("openai", "/v1/chat/completions", "baseline")
+    assert (fixture.status_code, fixture.body) == (201, {"id": "changed"})
+
+
+def test_without_checks_changes_need_reload(tmp_path: Path) -> None:
+    base = _fixtures(tmp_path)
+    loader = MockDataLoader(base, check_interval=None)
+    loader.preload()
+    _edit_in_place(
+        base / "openai" / "v1_chat_completions" / "baseline.json",
+        {"status_code": 201, "body": {"id": "changed"}},
+    )
+    _write(base / "openai" / "v1_embeddings" / "baseline.json", {"body": {}})
+
+    assert loader.get_fixture("openai", "/v1/chat/completions", "baseline").status_code == 200
+    with pytest.raises(FileNotFoundError):
+        loader.get_fixture("openai", "/v1/embeddings", "baseline")
+    loader.reload()
+    assert loader.get_fixture("openai", "/v1/chat/completions", "baseline").status_code == 201
+    assert loader.get_fixture("openai", "/v1/embeddings", "baseline").body == {}
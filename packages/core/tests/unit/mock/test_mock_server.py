@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import httpx
+
+from llm_spec.testing.latency import LatencyDistribution
+from llm_spec.testing.mock_server import (
+    ERROR_HEADER,
+    STATS_PATH,
+    TEST_NAME_HEADER,
+    MockLLMServer,
+    MockServerConfig,
+)
+
+
+def _write_fixtures(base: Path) -> Path:
+    endpoint = base / "openai" / "v1_chat_completions"
+    endpoint.mkdir(parents=True)
+    (endpoint / "baseline.json").write_text(
+        json.dumps({"status_code": 200, "headers": {}, "body": {"id": "base"}})
+    )
+    (endpoint / "temperature.json").write_text(
+        json.dumps({"status_code": 200, "headers": {}, "body": {"id": "temp"}})
+    )
+    lines = [{"type": "chunk", "data": {"i": i}} for i in range(4)] + [{"type": "done"}]
+    (endpoint / "baseline.jsonl").write_text("\n".join(json.dumps(x) for x in lines))
+    return base
+
+
+def _client(config: MockServerConfig) -> tuple[httpx.AsyncClient, MockLLMServer]:
+    app = MockLLMServer(config)
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://mock"), app
+
+
+async def test_serves_fixture_by_header_and_provider_prefix(tmp_path: Path) -> None:
+    client, _ = _client(MockServerConfig(base_dir=_write_fixtures(tmp_path)))
+    async with client:
+        named = await client.post(
+            "/v1/chat/completions", json={}, headers={TEST_NAME_HEADER: "temperature"}
+        )
+        prefixed = await client.post("/openai/v1/chat/completions", json={})
+        unknown = await client.post(
+            "/v1/chat/completions", json={}, headers={TEST_NAME_HEADER: "nope"}
+        )
+        missing = await client.post("/v1/embeddings", json={})
+
+    assert named.json() == {"id": "temp"}
+    assert prefixed.json() == {"id": "base"}
+    assert unknown.json() == {"id": "base"}
+    assert missing.status_code == 404
+
+
+async def test_stream_is_fragmented_and_reassembles(tmp_path: Path) -> None:
+    config = MockServerConfig(
+        base_dir=_write_fixtures(tmp_path),
+        fragment_size=7,
+        chunk_interval=LatencyDistribution(mean_ms=1),
+    )
+    client, app = _client(config)
+    async with client:
+        resp = await client.post("/v1/chat/completions", json={"stream": True})
+
+    assert resp.headers["content-type"] == "text/event-stream"
+    frames = [f for f in resp.text.split("\n\n") if f]
+    assert frames[-1] == "data: [DONE]"
+    assert [json.loads(f.removeprefix("data: ")) for f in frames[:-1]] == [
+        {"i": i} for i in range(4)
+    ]
+    assert app.stats.bytes_sent == len(resp.content)
+
+
+async def test_error_injection(tmp_path: Path) -> None:
+    client, app = _client(MockServerConfig(base_dir=_write_fixtures(tmp_path), error_500_rate=1.0))
+    async with client:
+        injected = await client.post("/v1/chat/completions", json={})
+        rate_limited = await client.post(
+            "/v1/chat/completions", json={}, headers={ERROR_HEADER: "429"}
+        )
+        truncated = await client.post(
+            "/v1/chat/completions", json={"stream": True}, headers={ERROR_HEADER: "truncate"}
+        )
+        stats = (await client.get(STATS_PATH)).json()
+
+    assert injected.status_code == 500
+    assert rate_limited.status_code == 429
+    assert rate_limited.headers["retry-after"] == "1"
+    assert truncated.status_code == 200
+    assert "[DONE]" not in truncated.text
+    assert stats["faults"] == {"500": 1, "429": 1, "truncate": 1}
+    assert app.stats.requests == 3
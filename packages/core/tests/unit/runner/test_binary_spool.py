@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from llm_spec.client.http_client import HTTPClient
+from llm_spec.client.spool import BlobStore, buffer_binary, sniff_content_type, spooled_body
+from llm_spec.runners.parsers import ResponseParser
+
+_MP3 = b"ID3\x04\x00" + bytes(range(256)) * 64
+
+
+async def _chunks(body: bytes) -> AsyncIterator[bytes]:
+    for i in range(0, len(body), 1000):
+        yield body[i : i + 1000]
+
+
+def _client(status: int = 200, content_type: str = "audio/mpeg", **kwargs: object) -> HTTPClient:
+    client = HTTPClient(**kwargs)  # type: ignore[arg-type]
+    client._async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda _: httpx.Response(
+                status, headers={"content-type": content_type}, content=_chunks(_MP3)
+            )
+        )
+    )
+    return client
+
+
+@pytest.mark.parametrize(
+    ("head", "expected"),
+    [
+        (b"\x89PNG\r\n\x1a\n\x00\x00", "image/png"),
+        (b"\xff\xd8\xff\xe0", "image/jpeg"),
+        (b"RIFF\x00\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (b"RIFF\x00\x00\x00\x00WAVEfmt ", "audio/wav"),
+        (b"\xff\xfb\x90\x00", "audio/mpeg"),
+        (b"\xff\xf1\x50\x80", "audio/aac"),
+        (b"\x00\x00\x00\x20ftypM4A ", "audio/mp4"),
+        (b"OggS\x00\x02", "audio/ogg"),
+        (b'{"id": 1}', None),
+    ],
+)
+def test_sniff_content_type(head: bytes, expected: str | None) -> None:
+    assert sniff_content_type(head) == expected
+
+
+async def test_binary_body_is_summarised_without_buffering() -> None:
+    response = await _client().request_async("POST", "https://api.example.test/v1/audio/speech")
+
+    body = spooled_body(response)
+    assert body is not None
+    assert (body.size_bytes, body.sha256) == (len(_MP3), hashlib.sha256(_MP3).hexdigest())
+    assert body.sniffed_type == "audio/mpeg" and body.path is None
+    with pytest.raises(httpx.ResponseNotRead):
+        _ = response.content
+    summary = ResponseParser.parse_response(response)
+    assert summary == {
+        "binary": True,
+        "content_type": "audio/mpeg",
+        "size_bytes": len(_MP3),
+        "sha256": body.sha256,
+        "sniffed_type": "audio/mpeg",
+    }
+
+
+async def test_blob_store_keeps_one_file_per_content(tmp_path: Path) -> None:
+    client = _client(blob_store=BlobStore(tmp_path))
+
+    first = spooled_body(await client.request_async("POST", "https://api.example.test/a"))
+    second = spooled_body(await client.request_async("POST", "https://api.example.test/b"))
+
+    assert first is not None and second is not None
+    assert first.path == second.path
+    assert first.path is not None and first.path.read_bytes() == _MP3
+    assert [p.name for p in tmp_path.rglob("*") if p.is_file()] == [first.sha256]
+
+
+async def test_errors_and_buffered_contexts_keep_the_content() -> None:
+    error = await _client(status=500).request_async("POST", "https://api.example.test/a")
+    with buffer_binary():
+        buffered = await _client().request_async("POST", "https://api.example.test/a")
+    unspooled = await _client(spool_binary=False).request_async("POST", "https://api.example.test")
+
+    for response in (error, buffered, unspooled):
+        assert spooled_body(response) is None
+        assert response.content == _MP3
+    assert ResponseParser.parse_response(buffered)["sha256"] == (  # type: ignore[index]
+        hashlib.sha256(_MP3).hexdigest()
+    )
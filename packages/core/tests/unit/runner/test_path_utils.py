@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from llm_spec.path_utils import compile_path, compile_paths, get_value_at_path
+
+_BODY: dict[str, Any] = {
+    "id": "r1",
+    "choices": [
+        {"message": {"role": "assistant", "content": None}},
+        {"message": {"role": "tool", "content": "hi"}},
+    ],
+    "candidates": [
+        {"content": {"parts": [{"text": "a"}, {"inlineData": {"data": "QUJD"}}]}},
+    ],
+    "usage": {"total_tokens": 0},
+}
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("id", "r1"),
+        ("choices[1].message.content", "hi"),
+        ("choices[0].message.content", None),
+        ("choices[*].message.content", "hi"),
+        ("candidates[0].content.parts[*].inlineData.data", "QUJD"),
+        ("choices[5].message", None),
+        ("usage.total_tokens", 0),
+        ("id.length", None),
+        ("choices.message", None),
+        ("", None),
+    ],
+)
+def test_get_value_at_path(path: str, expected: object) -> None:
+    assert get_value_at_path(_BODY, path) == expected
+
+
+def test_compiled_paths_are_cached() -> None:
+    assert compile_path("choices[0].message") is compile_path("choices[0].message")
+    assert compile_path("choices[0].message").steps == ("choices", 0, "message")
+    assert compile_paths(("id", "usage")) is compile_paths(("id", "usage"))
+
+
+def test_path_set_matches_single_path_lookups() -> None:
+    paths = (
+        "id",
+        "choices[0].message.role",
+        "choices[0].message.content",
+        "choices[*].message.content",
+        "choices[*].message.role",
+        "candidates[0].content.parts[*].text",
+        "candidates[0].content.parts[*].inlineData.data",
+        "usage.total_tokens",
+        "usage.prompt_tokens",
+    )
+
+    resolved = compile_paths(paths).resolve(_BODY)
+
+    assert resolved == {path: get_value_at_path(_BODY, path) for path in paths}
+    assert compile_paths(paths).missing(_BODY) == [
+        "choices[0].message.content",
+        "usage.prompt_tokens",
+    ]
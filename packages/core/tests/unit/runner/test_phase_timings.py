@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+
+import httpx
+
+from llm_spec.adapters.api_family import APIFamilyAdapter
+from llm_spec.client.http_client import HTTPClient
+from llm_spec.client.trace import trace_transfer
+from llm_spec.config.loader import ProviderConfig
+from llm_spec.profiling import add_phase_hook, remove_phase_hook, summarize_timings
+from llm_spec.runners.runner import TestRunner
+from llm_spec.suites.types import ExecutableCase
+from llm_spec.testing.mock_server import MockServerConfig, MockServerThread
+
+CaseFactory = Callable[..., ExecutableCase]
+
+
+async def test_verdict_carries_phase_timings_and_notifies_hooks(make_case: CaseFactory) -> None:
+    http_client = HTTPClient()
+    http_client._async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, json={"id": "x"}))
+    )
+    adapter = APIFamilyAdapter(
+        config=ProviderConfig(api_key="k", base_url="https://api.example.test"),
+        http_client=http_client,
+        api_family="openai",
+    )
+    seen: list[str] = []
+
+    def hook(case: ExecutableCase, phase: str, duration_ms: float) -> None:
+        seen.append(phase)
+
+    add_phase_hook(hook)
+    try:
+        verdict = await TestRunner(adapter).run_async(make_case("timed"))
+    finally:
+        remove_phase_hook(hook)
+
+    assert verdict.status == "pass"
+    assert verdict.started_at <= verdict.first_byte_at <= verdict.finished_at
+    # MockTransport reports no connection events: the exchange is one phase.
+    assert set(verdict.timings) == {"resolve", "request", "parse", "required_fields"}
+    assert seen == list(verdict.timings)
+    summary = summarize_timings([verdict, verdict])
+    assert summary["request"]["count"] == 2
+    assert abs(sum(p["share"] for p in summary.values()) - 1.0) < 0.01
+
+
+async def _sse() -> AsyncIterator[bytes]:
+    for chunk in (b'data: {"id": "x"}\n\n', b"data: [DONE]\n\n"):
+        yield chunk
+
+
+async def test_stream_verdict_records_time_to_first_chunk(make_case: CaseFactory) -> None:
+    http_client = HTTPClient()
+    http_client._async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda _: httpx.Response(
+                200, headers={"content-type": "text/event-stream"}, content=_sse()
+            )
+        )
+    )
+    adapter = APIFamilyAdapter(
+        config=ProviderConfig(api_key="k", base_url="https://api.example.test"),
+        http_client=http_client,
+        api_family="openai",
+    )
+    verdict = await TestRunner(adapter).run_async(make_case("timed", stream=True))
+
+    assert verdict.ttft_ms is not None
+    # First chunk arrives after the headers and before the stream finishes.
+    timings = verdict.timings
+    assert timings["ttfb"] - 0.01 <= verdict.ttft_ms <= timings["ttfb"] + timings["download"] + 0.01
+    assert (await TestRunner(adapter).run_async(make_case("timed"))).ttft_ms is None
+
+
+async def test_http_client_splits_exchange_by_connection_events(tmp_path: Path) -> None:
+    endpoint = tmp_path / "openai" / "v1_chat_completions"
+    endpoint.mkdir(parents=True)
+    (endpoint / "baseline.json").write_text(json.dumps({"status_code": 200, "body": {"id": 1}}))
+
+    client = HTTPClient()
+    with MockServerThread(MockServerConfig(base_dir=tmp_path)) as server:
+        try:
+            with trace_transfer() as trace:
+                await client.request_async("POST", server.base_url + "/v1/chat/completions")
+        finally:
+            await client.close_async()
+
+    phases = trace.phases_ms()
+    assert set(phases) == {"serialize", "connect", "ttfb", "download"}
+    assert phases["connect"] > 0
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+
+import httpx
+import pytest
+
+from llm_spec.adapters.api_family import APIFamilyAdapter
+from llm_spec.client.errors import (
+    DeadlineExceededError,
+    StreamStalledError,
+    transport_error_code,
+)
+from llm_spec.client.http_client import HTTPClient
+from llm_spec.config.loader import ProviderConfig
+from llm_spec.runners.runner import TestRunner
+from llm_spec.suites.types import ExecutableCase
+
+CaseFactory = Callable[..., ExecutableCase]
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def _adapter(
+    handler: Handler,
+    *,
+    stream_idle_timeout: float | None = None,
+    deadline: float | None = None,
+) -> APIFamilyAdapter:
+    http_client = HTTPClient()
+    http_client._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return APIFamilyAdapter(
+        config=ProviderConfig(
+            api_key="k",
+            base_url="https://api.example.test",
+            stream_idle_timeout=stream_idle_timeout,
+            deadline=deadline,
+        ),
+        http_client=http_client,
+        api_family="openai",
+    )
+
+
+async def _trickle(gap_s: float) -> AsyncIterator[bytes]:
+    yield b'data: {"id": "x"}\n\n'
+    for _ in range(5):
+        await asyncio.sleep(gap_s)
+        yield b": keep-alive\n\n"
+    yield b"data: [DONE]\n\n"
+
+
+def _sse(gap_s: float) -> Handler:
+    return lambda _: httpx.Response(
+        200, headers={"content-type": "text/event-stream"}, content=_trickle(gap_s)
+    )
+
+
+def test_phase_timeouts_fall_back_to_timeout() -> None:
+    config = ProviderConfig(api_key="k", base_url="u", timeout=30.0, connect_timeout=2.0)
+
+    timeout = config.http_timeout()
+
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (2.0, 30.0, 30.0, 30.0)
+
+
+@pytest.mark.parametrize(
+    ("exc", "code"),
+    [
+        (httpx.ConnectTimeout("t"), "CONNECT_TIMEOUT"),
+        (httpx.ReadTimeout("t"), "READ_TIMEOUT"),
+        (httpx.PoolTimeout("t"), "POOL_TIMEOUT"),
+        (httpx.ConnectError("refused"), "CONNECTION_ERROR"),
+        (StreamStalledError(1.0), "STREAM_STALLED"),
+        (DeadlineExceededError(1.0), "DEADLINE_EXCEEDED"),
+    ],
+)
+def test_transport_error_code(exc: Exception, code: str) -> None:
+    assert transport_error_code(exc) == code
+
+
+async def test_stream_idle_timeout_fails_trickling_stream(make_case: CaseFactory) -> None:
+    adapter = _adapter(_sse(0.05), stream_idle_timeout=0.02)
+
+    verdict = await TestRunner(adapter).run_async(make_case("slow", stream=True))
+
+    assert verdict.failure is not None
+    assert verdict.failure.code == "STREAM_STALLED"
+    assert verdict.failure.message.startswith("Stream stalled: ")
+
+
+async def test_deadline_bounds_stream_that_never_stalls(make_case: CaseFactory) -> None:
+    adapter = _adapter(_sse(0.02), stream_idle_timeout=0.1, deadline=0.05)
+
+    verdict = await TestRunner(adapter).run_async(make_case("slow", stream=True))
+
+    assert verdict.failure is not None
+    assert verdict.failure.code == "DEADLINE_EXCEEDED"
+    assert verdict.latency_ms is not None and verdict.latency_ms < 100
+
+
+async def test_connect_timeout_gets_its_own_code(make_case: CaseFactory) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    verdict = await TestRunner(_adapter(handler)).run_async(make_case("slow"))
+
+    assert verdict.status == "error"
+    assert verdict.failure is not None
+    assert verdict.failure.code == "CONNECT_TIMEOUT"
+
+
+async def test_quiet_stream_within_limits_is_collected() -> None:
+    adapter = _adapter(_sse(0.0), stream_idle_timeout=0.5, deadline=1.0)
+
+    status, chunks = await adapter.stream_async("/v1/chat/completions", {"model": "gpt-4"})
+
+    assert status == 200
+    assert chunks[-1] == b"data: [DONE]\n\n"
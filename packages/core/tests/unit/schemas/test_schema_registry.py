@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+from pydantic import BaseModel
+
+from llm_spec.runners.schema_registry import (
+    get_schema,
+    list_schemas,
+    preload_schemas,
+    register_schema,
+)
+from llm_spec.validation.schemas.openai.chat import ChatCompletionResponse
+
+_PROBE = """
+import json, sys
+from llm_spec.runners import schema_registry
+before = sorted(m for m in sys.modules if m.startswith("llm_spec.validation.schemas."))
+schema_registry.list_schemas()
+schema_registry.get_schema("openai.ChatCompletionResponse")
+after = sorted(m for m in sys.modules if m.startswith("llm_spec.validation.schemas."))
+print(json.dumps([before, after]))
+"""
+
+
+def test_lookup_imports_only_the_referenced_family() -> None:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True
+    ).stdout
+
+    before, after = json.loads(out)
+
+    assert before == []
+    assert "llm_spec.validation.schemas.openai.chat" in after
+    assert not [m for m in after if m.split(".")[3] in {"gemini", "anthropic", "xai"}]
+
+
+def test_get_schema_resolves_names_and_runtime_registrations() -> None:
+    class Custom(BaseModel):
+        ok: bool
+
+    register_schema("custom.Custom", Custom)
+
+    assert get_schema("openai.ChatCompletionResponse") is ChatCompletionResponse
+    assert get_schema("custom.Custom") is Custom
+    assert get_schema("openai.Nope") is None and get_schema(None) is None
+    assert {"gemini.GenerateContentResponse", "custom.Custom"} <= set(list_schemas())
+
+
+def test_preload_skips_unknown_names() -> None:
+    loaded = preload_schemas(["openai.ChatCompletionResponse", None, "openai.Nope"])
+
+    assert loaded == ["openai.ChatCompletionResponse"]
@@ -363,3 +363,34 @@ def test_anthropic_defaults_include_event_type_match() -> None:
     # Should contain event_missing errors (one per chunk)
     event_errors = [m for m in missing if "event_missing" in m]
     assert len(event_errors) == 6
+
+
+# ---------- binary streams ----------
+
+
+def test_binary_stream_is_one_run_but_counts_every_chunk() -> None:
+    rules = {
+        "extractor": "binary",
+        "min_observations": 4,
+        "checks": [
+            {"type": "required", "values": [{"event": "bytes", "min": 3, "max": 3}]},
+            {"type": "required_terminal", "value": "eof"},
+        ],
+    }
+
+    observations = extract_observations(
+        provider="openai",
+        endpoint="/v1/audio/speech",
+        parsed_chunks=None,
+        raw_chunks=[b"ab", b"cd", b"e"],
+        stream_rules=rules,
+    )
+    missing = validate_stream(
+        provider="openai",
+        endpoint="/v1/audio/speech",
+        observations=observations,
+        stream_rules=rules,
+    )
+
+    assert [(o.name, o.n, o.count) for o in observations] == [("bytes", 5, 3), ("eof", 0, 1)]
+    assert missing == []
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextvars
-import random
+import time
 from pathlib import Path
 from typing import Any
 
@@ -14,11 +14,8 @@ from llm_spec.adapters.base import ProviderAdapter
 from llm_spec.client.http_client import HTTPClient
 from llm_spec.config.loader import ProviderConfig
 from llm_spec.json_types import Headers, JSONValue
-from llm_spec.testing import MockDataLoader
-
-# Mock delay configuration
-MOCK_MIN_DELAY = 1  # Minimum delay in seconds
-MOCK_MAX_DELAY = 3  # Maximum delay in seconds
+from llm_spec.testing.latency import LatencyProfile, LatencySampler
+from llm_spec.testing.mock_loader import MockDataLoader, MockFixture
 
 
 class MockProviderAdapter(ProviderAdapter):
@@ -27,9 +24,13 @@ class MockProviderAdapter(ProviderAdapter):
     This adapter is used for testing purposes, returning pre-recorded
     responses from mock fixture files instead of making real API calls.
 
+    Simulated latency follows a ``LatencyProfile``; delays are seeded per test name,
+    so repeated runs take the same time regardless of scheduling order.
+
     Attributes:
         loader: Mock data loader instance.
         provider_name: Name of the provider being mocked.
+        latency: Latency profile applied to every request.
     """
 
     def __init__(
@@ -37,6 +38,7 @@ class MockProviderAdapter(ProviderAdapter):
         config: ProviderConfig,
         base_dir: str | Path,
         provider_name: str,
+        latency: LatencyProfile | None = None,
     ) -> None:
         """Initialize the mock adapter.
 
@@ -44,10 +46,12 @@ class MockProviderAdapter(ProviderAdapter):
             config: Provider configuration.
             base_dir: Base directory for mock fixture files.
             provider_name: Name of the provider being mocked.
+            latency: Latency profile (default: no delay).
         """
         super().__init__(config=config, http_client=HTTPClient(default_timeout=config.timeout))
-        self.loader = MockDataLoader(Path(base_dir))
+        self.loader = MockDataLoader.shared(Path(base_dir))
         self.provider_name = provider_name
+        self.latency = latency or LatencyProfile()
         # Task-local test name to avoid cross-test contamination under async concurrency.
         self._current_test_name: contextvars.ContextVar[str | None] = contextvars.ContextVar(
             "mock_current_test_name",
@@ -78,6 +82,28 @@ class MockProviderAdapter(ProviderAdapter):
         """Set current test name used to pick mock fixture files."""
         self._current_test_name.set(test_name)
 
+    def _fixture(self, endpoint: str, *, is_stream: bool) -> MockFixture:
+        """Indexed, pre-encoded fixture for the current test."""
+        return self.loader.get_fixture(
+            provider=self.provider_name,
+            endpoint=endpoint,
+            test_name=self._resolve_test_name(),
+            is_stream=is_stream,
+        )
+
+    def _response(self, endpoint: str) -> httpx.Response:
+        """Build a non-streaming response from the pre-encoded fixture body."""
+        fixture = self._fixture(endpoint, is_stream=False)
+        return httpx.Response(
+            status_code=fixture.status_code,
+            headers=fixture.headers,
+            content=fixture.body_bytes,
+        )
+
+    def _sampler(self, endpoint: str) -> LatencySampler:
+        """Seeded latency sampler for the current test."""
+        return self.latency.sampler(f"{self.provider_name}:{endpoint}:{self._resolve_test_name()}")
+
     def request(
         self,
         endpoint: str,
@@ -99,27 +125,13 @@ class MockProviderAdapter(ProviderAdapter):
             Mock HTTP response.
 
         Raises:
-            TypeError: If mock response is not a dict.
+            FileNotFoundError: If no fixture matches the current test.
         """
         del params, additional_headers, method, files
-        # Simulate network latency
-        delay = random.uniform(MOCK_MIN_DELAY, MOCK_MAX_DELAY)
-        import time
-
-        time.sleep(delay)
-        data = self.loader.load_response(
-            provider=self.provider_name,
-            endpoint=endpoint,
-            test_name=self._resolve_test_name(),
-            is_stream=False,
-        )
-        if not isinstance(data, dict):
-            raise TypeError(f"Expected dict mock response, got {type(data)}")
-        return httpx.Response(
-            status_code=int(data.get("status_code", 200)),
-            headers=dict(data.get("headers", {})),
-            json=data.get("body"),
-        )
+        delay = self._sampler(endpoint).response()
+        if delay:
+            time.sleep(delay)
+        return self._response(endpoint)
 
     async def request_async(
         self,
@@ -142,25 +154,13 @@ class MockProviderAdapter(ProviderAdapter):
             Mock HTTP response.
 
         Raises:
-            TypeError: If mock response is not a dict.
+            FileNotFoundError: If no fixture matches the current test.
         """
         del params, additional_headers, method, files
-        # Simulate network latency (async)
-        delay = random.uniform(MOCK_MIN_DELAY, MOCK_MAX_DELAY)
-        await asyncio.sleep(delay)
-        data = self.loader.load_response(
-            provider=self.provider_name,
-            endpoint=endpoint,
-            test_name=self._resolve_test_name(),
-            is_stream=False,
-        )
-        if not isinstance(data, dict):
-            raise TypeError(f"Expected dict mock response, got {type(data)}")
-        return httpx.Response(
-            status_code=int(data.get("status_code", 200)),
-            headers=dict(data.get("headers", {})),
-            json=data.get("body"),
-        )
+        delay = self._sampler(endpoint).response()
+        if delay:
+            await asyncio.sleep(delay)
+        return self._response(endpoint)
 
     def stream(
         self,
@@ -176,26 +176,18 @@ class MockProviderAdapter(ProviderAdapter):
             ``(status_code, chunks)`` tuple.
 
         Raises:
-            TypeError: If mock response is not an iterator.
+            FileNotFoundError: If no fixture matches the current test.
         """
         del params, additional_headers, method, files
-        # Simulate initial connection latency
-        delay = random.uniform(MOCK_MIN_DELAY, MOCK_MAX_DELAY)
-        import time
-
-        time.sleep(delay)
-        data = self.loader.load_response(
-            provider=self.provider_name,
-            endpoint=endpoint,
-            test_name=self._resolve_test_name(),
-            is_stream=True,
-        )
-        if isinstance(data, dict):
-            raise TypeError(f"Expected iterator mock response, got {type(data)}")
-
+        sampler = self._sampler(endpoint)
+        delay = sampler.response()
+        if delay:
+            time.sleep(delay)
         chunks: list[bytes] = []
-        for chunk in data:
-            time.sleep(random.uniform(0.01, 0.05))
+        for chunk in self._fixture(endpoint, is_stream=True).frames:
+            delay = sampler.chunk() if chunks else sampler.first_chunk()
+            if delay:
+                time.sleep(delay)
             chunks.append(chunk)
         return 200, chunks
 
@@ -213,23 +205,17 @@ class MockProviderAdapter(ProviderAdapter):
             ``(status_code, chunks)`` tuple.
 
         Raises:
-            TypeError: If mock response is not an iterator.
+            FileNotFoundError: If no fixture matches the current test.
         """
         del params, additional_headers, method, files
-        # Simulate initial connection latency (async)
-        delay = random.uniform(MOCK_MIN_DELAY, MOCK_MAX_DELAY)
-        await asyncio.sleep(delay)
-        data = self.loader.load_response(
-            provider=self.provider_name,
-            endpoint=endpoint,
-            test_name=self._resolve_test_name(),
-            is_stream=True,
-        )
-        if isinstance(data, dict):
-            raise TypeError(f"Expected iterator mock response, got {type(data)}")
-
+        sampler = self._sampler(endpoint)
+        delay = sampler.response()
+        if delay:
+            await asyncio.sleep(delay)
         chunks: list[bytes] = []
-        for chunk in data:
-            await asyncio.sleep(random.uniform(0.01, 0.05))
+        for chunk in self._fixture(endpoint, is_stream=True).frames:
+            delay = sampler.chunk() if chunks else sampler.first_chunk()
+            if delay:
+                await asyncio.sleep(delay)
             chunks.append(chunk)
         return 200, chunks
@@ -0,0 +1,45 @@
+"""Prometheus scrape endpoint."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.orm import Session
+
+from llm_spec_web.api.deps import get_db
+from llm_spec_web.core.event_bus import event_bus
+from llm_spec_web.core.exceptions import ConfigurationError
+from llm_spec_web.core.execution_pool import execution_pool
+from llm_spec_web.core.metrics import get_metrics
+from llm_spec_web.repositories.run_repo import RunRepository
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def scrape_metrics(db: Session = Depends(get_db)) -> Response:
+    """Expose process metrics in the Prometheus text format.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        Prometheus exposition response.
+
+    Raises:
+        ConfigurationError: If metrics are disabled or prometheus-client is missing.
+    """
+    metrics = get_metrics()
+    if metrics is None:
+        raise ConfigurationError(
+            "metrics are disabled (set LLM_SPEC_WEB_METRICS_ENABLED=true and install "
+            "prometheus-client with: pip install 'llm-spec[web]')"
+        )
+    run_repo = RunRepository(db)
+    metrics.update_state(
+        tasks=run_repo.count_tasks_by_status(),
+        runs=run_repo.count_runs_by_status(),
+        pool=execution_pool.stats(),
+        events=event_bus.stats(),
+    )
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import json
+from typing import Any, Literal
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from llm_spec_web.api.deps import get_db, get_run_service
+from llm_spec_web.config import settings
 from llm_spec_web.core.db import SessionLocal
 from llm_spec_web.core.event_bus import event_bus
 from llm_spec_web.models.run import RunEvent, RunJob
@@ -23,6 +25,29 @@ from llm_spec_web.services.run_service import RunService
 router = APIRouter(prefix="/api/runs", tags=["runs"])
 
 
+def _encode_sse(run_id: str, event: dict[str, Any]) -> str:
+    """Encode one bus event as an SSE frame.
+
+    Bus events are shared by every subscriber of a run, so the frame is cached on the
+    event and serialized only once regardless of how many clients are watching. The
+    ``id:`` line lets browsers resume with ``Last-Event-ID`` after a reconnect.
+    """
+    frame = event.get("_sse")
+    if frame is None:
+        payload = {
+            "run_id": run_id,
+            "seq": event["seq"],
+            "event_type": event["event_type"],
+            "payload": event["payload"],
+            "created_at": event["created_at"],
+        }
+        data = json.dumps(payload, ensure_ascii=False)
+        event_id = f"id: {event['seq']}\n" if event["seq"] is not None else ""
+        frame = f"event: {event['event_type']}\n{event_id}data: {data}\n\n"
+        event["_sse"] = frame
+    return frame
+
+
 @router.post("/{run_id}/tests/retry", response_model=RunJobResponse)
 def retry_run_test(
     run_id: str,
@@ -61,6 +86,9 @@ def list_run_events(
 async def stream_run_events(
     run_id: str,
     after_seq: int = Query(default=0),
+    mode: Literal["events", "coalesced"] = Query(default="events"),
+    interval: float | None = Query(default=None, ge=0.1, le=60.0),
+    last_event_id: int | None = Header(default=None),
 ) -> StreamingResponse:
     """Stream events for a run using Server-Sent Events.
 
@@ -69,10 +97,21 @@ async def stream_run_events(
     Args:
         run_id: Run job ID.
         after_seq: Only return events with seq > after_seq (for reconnection).
+        mode: ``events`` streams every test event; ``coalesced`` replaces per-test
+            events with one ``progress`` snapshot per interval (fetch details via
+            ``/tests/live``).
+        interval: Snapshot interval in seconds for ``coalesced`` mode.
+        last_event_id: ``Last-Event-ID`` sent by a reconnecting EventSource; takes
+            precedence over *after_seq*.
 
     Returns:
         SSE stream of run events.
     """
+    if last_event_id is not None:
+        after_seq = last_event_id
+    coalesce_interval = (
+        (interval or settings.event_coalesce_interval_seconds) if mode == "coalesced" else None
+    )
 
     async def event_generator():
         # First, check if run exists and get any historical events from database
@@ -109,25 +148,18 @@ async def stream_run_events(
         finally:
             db.close()
 
-        # Subscribe to in-memory event bus for real-time updates
-        seq = 0
-        async for event in event_bus.subscribe(run_id, timeout=30.0):
+        # Subscribe to in-memory event bus for real-time updates (recent events after
+        # after_seq are replayed first, so late subscribers see the same seq numbers as
+        # everyone else)
+        async for event in event_bus.subscribe(
+            run_id, timeout=30.0, coalesce_interval=coalesce_interval, after_seq=after_seq
+        ):
             # Skip heartbeat events in SSE output
             if event["event_type"] == "heartbeat":
                 yield ": heartbeat\n\n"
                 continue
 
-            seq += 1
-            payload = {
-                "run_id": run_id,
-                "seq": seq,
-                "event_type": event["event_type"],
-                "payload": event["payload"],
-                "created_at": event["created_at"],
-            }
-            yield (
-                f"event: {event['event_type']}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
-            )
+            yield _encode_sse(run_id, event)
 
             # Terminal event, send done and exit
             if event["event_type"] in ("run_finished", "run_failed", "run_cancelled"):
@@ -185,3 +217,37 @@ def list_run_tests(
         List of test result records.
     """
     return service.list_test_results(db, run_id)
+
+
+@router.get("/{run_id}/tests/live")
+def get_live_test_results(
+    run_id: str,
+    ids: list[str] | None = Query(default=None),
+    db: Session = Depends(get_db),
+    service: RunService = Depends(get_run_service),
+) -> dict:
+    """Get per-test results of a run on demand (companion of coalesced streaming).
+
+    While the run is live, results come from the in-memory event bus; afterwards the
+    persisted test results are returned.
+
+    Args:
+        run_id: Run job ID.
+        ids: Only return these run_case_ids (e.g. ``finished_ids`` of a progress event).
+        db: Database session.
+        service: Run service.
+
+    Returns:
+        ``{"live": bool, "results": {run_case_id: test_result}}``.
+    """
+    live = event_bus.get_test_results(run_id, ids)
+    if live is not None:
+        return {"live": True, "results": live}
+    rows = service.list_test_results(db, run_id)
+    wanted = set(ids) if ids else None
+    results = {
+        row["run_case_id"]: row
+        for row in rows
+        if row.get("run_case_id") and (wanted is None or row["run_case_id"] in wanted)
+    }
+    return {"live": False, "results": results}
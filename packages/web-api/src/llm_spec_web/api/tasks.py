@@ -9,11 +9,13 @@ rename target: the public API is now /api/tasks.
 
 from __future__ import annotations
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
 from llm_spec_web.api.deps import get_db, get_run_service
+from llm_spec_web.config import settings
 from llm_spec_web.core.db import SessionLocal
+from llm_spec_web.core.execution_pool import ExecutionContext, execution_pool
 from llm_spec_web.schemas.run import (
     RunJobResponse,
     TaskCreateRequest,
@@ -26,25 +28,38 @@ from llm_spec_web.services.run_service import RunService
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
 
 
-def _execute_task_in_background(task_id: str, max_concurrent: int = 5) -> None:
-    """Execute a full task in background.
+def _submit_task_execution(
+    task_id: str, max_concurrent: int = 5, mock_latency: str | None = None
+) -> None:
+    """Queue a full task on the shared execution pool.
 
     Args:
         task_id: Task ID.
         max_concurrent: Maximum number of concurrent tests.
+        mock_latency: Mock-mode latency profile name.
     """
-    db = SessionLocal()
-    try:
-        service = RunService()
-        service.execute_task(db, task_id, max_concurrent=max_concurrent)
-    finally:
-        db.close()
+
+    async def _job(context: ExecutionContext) -> None:
+        db = SessionLocal()
+        try:
+            service = RunService()
+            await service.execute_task_async(
+                db,
+                task_id,
+                max_concurrent=max_concurrent,
+                run_concurrency=settings.task_run_concurrency,
+                context=context,
+                mock_latency=mock_latency,
+            )
+        finally:
+            db.close()
+
+    execution_pool.submit(_job)
 
 
 @router.post("", response_model=TaskWithRunsResponse, status_code=status.HTTP_201_CREATED)
 def create_task(
     payload: TaskCreateRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     service: RunService = Depends(get_run_service),
 ) -> TaskWithRunsResponse:
@@ -58,7 +73,7 @@ def create_task(
     )
 
     max_concurrent = payload.max_concurrent or 5
-    background_tasks.add_task(_execute_task_in_background, task.id, max_concurrent)
+    _submit_task_execution(task.id, max_concurrent, payload.mock_latency)
 
     return TaskWithRunsResponse(
         id=task.id,
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,7 +16,34 @@ class WebSettings(BaseSettings):
     suite_registry_cache_ttl_seconds: float = 2.0
     mock_base_dir: str = "packages/core/tests/integration/mocks"
     mock_mode: bool = False
+    mock_latency_profile: str = "fast"
+    cassette_dir: str = "packages/web-api/src/llm_spec_web/.data/cassettes"
+    cassette_record: bool = False
+    cassette_replay_time_scale: float = 0.0
+    binary_blob_dir: str = ""
     cors_origins: list[str] = ["*"]
+    execution_workers: int = 1
+    execution_max_concurrent_tests: int = 32
+    execution_max_active_tasks: int = 4
+    task_run_concurrency: int = 2
+    execution_longest_first: bool = True
+    execution_baseline_first: bool = False
+    execution_warmup_connections: int = 0
+    circuit_breaker_enabled: bool = True
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_min_requests: int = 5
+    circuit_breaker_window_seconds: float = 30.0
+    circuit_breaker_cooldown_seconds: float = 10.0
+    execution_process_workers: int = 0
+    execution_process_concurrency: int = 16
+    event_buffer_size: int = 1000
+    event_replay_size: int = 200
+    event_coalesce_interval_seconds: float = 1.0
+    event_transport: str = "memory"
+    event_transport_url: str = ""
+    otel_exporter: Literal["otlp", "file", "global", "none"] = "none"
+    otel_file_path: str = "packages/web-api/src/llm_spec_web/.data/telemetry.jsonl"
+    metrics_enabled: bool = True
 
     model_config = SettingsConfigDict(
         env_prefix="LLM_SPEC_WEB_",
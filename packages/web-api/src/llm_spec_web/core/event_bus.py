@@ -4,36 +4,256 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
 from datetime import UTC, datetime
+from itertools import count
 from typing import Any
 
+from llm_spec_web.config import settings
+from llm_spec_web.core.event_transport import (
+    EventTransport,
+    InMemoryTransport,
+    create_event_transport,
+)
+
+TERMINAL_EVENT_TYPES = frozenset({"run_finished", "run_failed", "run_cancelled"})
+# Per-test progress events may be dropped when a subscriber falls behind; run-level
+# events (started / finished / failed / cancelled) are always delivered.
+DROPPABLE_EVENT_TYPES = frozenset({"test_started", "test_finished"})
+
+
+class _Subscriber:
+    """One consumer of a run channel with its own bounded ring buffer.
+
+    All buffer mutations happen on the subscriber's event loop; publishers on other
+    threads hand events over with ``call_soon_threadsafe``.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int) -> None:
+        self.loop = loop
+        self._maxsize = max(1, maxsize)
+        self._buffer: deque[dict[str, Any]] = deque()
+        self._dropped = 0
+        self._waiter: asyncio.Future[None] | None = None
+
+    def buffered(self) -> int:
+        """Number of events waiting to be read."""
+        return len(self._buffer)
+
+    def deliver(self, event: dict[str, Any]) -> None:
+        """Append one event, evicting the oldest droppable event when full."""
+        if len(self._buffer) >= self._maxsize:
+            for i, queued in enumerate(self._buffer):
+                if queued["event_type"] in DROPPABLE_EVENT_TYPES:
+                    del self._buffer[i]
+                    self._dropped += 1
+                    break
+            else:
+                if event["event_type"] in DROPPABLE_EVENT_TYPES:
+                    self._dropped += 1
+                    return
+        self._buffer.append(event)
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def get(self, timeout: float) -> dict[str, Any] | None:
+        """Return the next event, or None when *timeout* elapses without one."""
+        if not self._buffer:
+            self._waiter = self.loop.create_future()
+            try:
+                await asyncio.wait_for(self._waiter, timeout=timeout)
+            except TimeoutError:
+                return None
+            finally:
+                self._waiter = None
+
+        if self._dropped:
+            # Coalesce every eviction since the last read into one marker event so the
+            # client knows to re-sync (e.g. refetch the task result).
+            dropped, self._dropped = self._dropped, 0
+            return {
+                "event_type": "events_dropped",
+                "payload": {"count": dropped},
+                "created_at": datetime.now(UTC).isoformat(),
+                "seq": None,
+            }
+        return self._buffer.popleft()
+
+
+class _CoalescingSubscriber(_Subscriber):
+    """Subscriber that folds per-test events into periodic ``progress`` snapshots.
+
+    Run-level events are buffered as usual; per-test events only update counters, so
+    the number of events delivered per interval is constant regardless of throughput.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int) -> None:
+        super().__init__(loop, maxsize)
+        self._started = 0
+        self._done = 0
+        self._total = 0
+        self._passed = 0
+        self._failed = 0
+        self._skipped = 0
+        self._finished_ids: list[str] = []
+        self._latencies: list[int] = []
+        self._last_seq: int | None = None
+        self._dirty = False
+
+    def deliver(self, event: dict[str, Any]) -> None:
+        event_type = event["event_type"]
+        if event_type not in DROPPABLE_EVENT_TYPES:
+            if event_type in TERMINAL_EVENT_TYPES and self._dirty:
+                # Flush the final counters before the terminal event.
+                super().deliver(self.snapshot())
+            super().deliver(event)
+            return
+
+        payload = event["payload"]
+        self._last_seq = event["seq"]
+        self._dirty = True
+        if event_type == "test_started":
+            self._started += 1
+            return
+
+        self._done = max(self._done, payload.get("progress_done") or 0)
+        self._total = max(self._total, payload.get("progress_total") or 0)
+        self._passed = max(self._passed, payload.get("progress_passed") or 0)
+        self._failed = max(self._failed, payload.get("progress_failed") or 0)
+        self._skipped = max(self._skipped, payload.get("progress_skipped") or 0)
+        finished_id = payload.get("run_case_id") or payload.get("test_name")
+        if finished_id:
+            self._finished_ids.append(finished_id)
+        latency = (payload.get("test_result") or {}).get("latency_ms")
+        if isinstance(latency, int):
+            self._latencies.append(latency)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def snapshot(self) -> dict[str, Any]:
+        """Build one ``progress`` event.
+
+        ``finished_ids`` only lists tests finished since the previous snapshot; counters
+        and latency stats are cumulative for the run.
+        """
+        finished_ids, self._finished_ids = self._finished_ids, []
+        self._dirty = False
+        latencies = sorted(self._latencies)
+        latency: dict[str, Any] = {"count": len(latencies)}
+        if latencies:
+            latency.update(
+                min=latencies[0],
+                max=latencies[-1],
+                mean=round(statistics.fmean(latencies), 1),
+                p50=latencies[(len(latencies) - 1) // 2],
+                p95=latencies[int((len(latencies) - 1) * 0.95)],
+            )
+        return {
+            "event_type": "progress",
+            "payload": {
+                "progress_started": self._started,
+                "progress_done": self._done,
+                "progress_total": self._total,
+                "progress_passed": self._passed,
+                "progress_failed": self._failed,
+                "progress_skipped": self._skipped,
+                "finished_ids": finished_ids,
+                "latency_ms": latency,
+            },
+            "created_at": datetime.now(UTC).isoformat(),
+            "seq": self._last_seq,
+        }
+
+
+class _Channel:
+    """Fan-out channel for one run: replay history + live subscribers."""
+
+    def __init__(self, replay_size: int) -> None:
+        self.replay: deque[dict[str, Any]] = deque(maxlen=max(0, replay_size))
+        self.subscribers: set[_Subscriber] = set()
+        # Latest ``test_result`` per finished test, served on demand while the run is live.
+        self.test_results: dict[str, dict[str, Any]] = {}
+
 
 class EventBus:
-    """In-memory event bus for run progress updates.
+    """In-memory pub/sub event bus for run progress updates.
 
     This class provides a lightweight pub/sub mechanism for real-time
     progress updates without frequent database writes.
 
+    - Every subscriber of a run gets every event (multiple tabs / watchers per run).
+    - Each subscriber has a bounded buffer; when it falls behind, the oldest per-test
+      progress events are dropped and replaced by one ``events_dropped`` marker.
+      Run-level events are never dropped.
+    - The last ``replay_size`` events of a run are replayed to late subscribers
+      (only those after ``after_seq`` when a client reconnects).
+    - ``push()`` is thread-safe and may be called from any thread / event loop.
+    - ``seq`` is assigned once by the publishing process (each run has one origin: the
+      worker executing it), so every API worker sees the same seq for an event and a
+      client can resume with ``after_seq`` against any of them. Events of one run are
+      published in seq order; no order is defined across runs.
+    - Events travel through an ``EventTransport`` (in-process by default; Unix socket
+      or Redis to share events between API worker processes).
+    - Subscribers may ask for coalesced delivery: per-test events are folded into a
+      ``progress`` snapshot every ``coalesce_interval`` seconds, and full per-test
+      results are fetched on demand via ``get_test_results()``.
+
     Usage:
         # Push event (called by RunService)
-        await event_bus.push(run_id, "test_finished", {"status": "pass"})
+        event_bus.push(run_id, "test_finished", {"status": "pass"})
 
         # Subscribe to events (called by SSE endpoint)
         async for event in event_bus.subscribe(run_id):
             yield event
     """
 
-    def __init__(self) -> None:
-        # Each run_id has its own queue
-        self._queues: dict[str, asyncio.Queue[dict[str, Any]]] = {}
+    def __init__(
+        self,
+        *,
+        buffer_size: int = 1000,
+        replay_size: int = 200,
+        transport: EventTransport | None = None,
+    ) -> None:
+        self._buffer_size = buffer_size
+        self._replay_size = replay_size
+        self._channels: dict[str, _Channel] = {}
         # Track active runs
         self._active_runs: set[str] = set()
+        self._lock = threading.Lock()
+        # Held from seq assignment to hand-off so a run's events reach the transport
+        # in seq order when several threads push.
+        self._publish_lock = threading.Lock()
+        self._origin_seq: dict[str, Iterator[int]] = {}
+        self._transport = transport or InMemoryTransport()
+        self._transport_started = False
+
+    def _ensure_transport(self) -> None:
+        if self._transport_started:
+            return
+        with self._lock:
+            if self._transport_started:
+                return
+            self._transport_started = True
+        self._transport.start(self._dispatch)
+
+    def close(self) -> None:
+        """Close the transport (called on application shutdown)."""
+        if self._transport_started:
+            self._transport.close()
+            self._transport_started = False
 
-    def get_queue(self, run_id: str) -> asyncio.Queue[dict[str, Any]]:
-        """Get or create queue for a run."""
-        if run_id not in self._queues:
-            self._queues[run_id] = asyncio.Queue()
-        return self._queues[run_id]
+    def _channel(self, run_id: str) -> _Channel:
+        channel = self._channels.get(run_id)
+        if channel is None:
+            channel = _Channel(self._replay_size)
+            self._channels[run_id] = channel
+        return channel
 
     def is_active(self, run_id: str) -> bool:
         """Check if a run is still active."""
@@ -41,93 +261,200 @@ class EventBus:
 
     def start_run(self, run_id: str) -> None:
         """Mark a run as active."""
-        self._active_runs.add(run_id)
+        with self._lock:
+            self._active_runs.add(run_id)
 
     def end_run(self, run_id: str) -> None:
         """Mark a run as finished."""
-        self._active_runs.discard(run_id)
+        with self._lock:
+            self._active_runs.discard(run_id)
+
+    def subscriber_count(self, run_id: str) -> int:
+        """Number of live subscribers of a run."""
+        with self._lock:
+            channel = self._channels.get(run_id)
+            return len(channel.subscribers) if channel is not None else 0
+
+    def stats(self) -> dict[str, int]:
+        """Bus-wide gauges.
+
+        Returns:
+            ``active_runs``, ``channels``, ``subscribers`` and ``buffered_events`` (events
+            queued in subscriber buffers, not yet read).
+        """
+        with self._lock:
+            subscribers = [sub for ch in self._channels.values() for sub in ch.subscribers]
+            active_runs = len(self._active_runs)
+            channels = len(self._channels)
+        return {
+            "active_runs": active_runs,
+            "channels": channels,
+            "subscribers": len(subscribers),
+            "buffered_events": sum(sub.buffered() for sub in subscribers),
+        }
 
     def push(self, run_id: str, event_type: str, payload: dict[str, Any]) -> None:
-        """Push an event to the queue (sync version for non-async context).
+        """Publish an event to every subscriber of a run (thread-safe).
 
         Args:
             run_id: Run job ID.
             event_type: Event type (e.g., "test_finished").
             payload: Event payload.
         """
-        queue = self.get_queue(run_id)
-        event = {
-            "event_type": event_type,
-            "payload": payload,
-            "created_at": datetime.now(UTC).isoformat(),
-        }
-        # Use put_nowait to avoid blocking
-        # Queue is full, drop the event (shouldn't happen with unbounded queue)
-        with contextlib.suppress(asyncio.QueueFull):
-            queue.put_nowait(event)
+        self._ensure_transport()
+        with self._publish_lock:
+            seq = self._origin_seq.get(run_id)
+            if seq is None:
+                seq = self._origin_seq[run_id] = count(1)
+            event = {
+                "event_type": event_type,
+                "payload": payload,
+                "created_at": datetime.now(UTC).isoformat(),
+                "seq": next(seq),
+            }
+            if event_type in TERMINAL_EVENT_TYPES:
+                del self._origin_seq[run_id]
+            self._transport.publish(run_id, event)
+
+    def _dispatch(self, run_id: str, event: dict[str, Any]) -> None:
+        """Deliver one event received from the transport to local subscribers."""
+        event_type = event["event_type"]
+        payload = event["payload"]
+        with self._lock:
+            channel = self._channel(run_id)
+            channel.replay.append(event)
+            if event_type == "test_finished" and "test_result" in payload:
+                key = payload.get("run_case_id") or payload.get("test_name")
+                if key:
+                    channel.test_results[key] = payload["test_result"]
+            if event_type in TERMINAL_EVENT_TYPES:
+                # Release the channel on every worker, not only the one that ran the
+                # task (live subscribers keep draining their own buffers).
+                self._channels.pop(run_id, None)
+            # Hand-offs are queued on each subscriber's loop while the lock is held, so
+            # they run in seq order whichever thread published them (a direct call here
+            # could overtake events another thread already queued).
+            for sub in channel.subscribers:
+                with contextlib.suppress(RuntimeError):
+                    # Subscriber loop already closed; removed when its generator exits.
+                    sub.loop.call_soon_threadsafe(sub.deliver, event)
 
     async def push_async(self, run_id: str, event_type: str, payload: dict[str, Any]) -> None:
-        """Push an event to the queue (async version).
+        """Publish an event (async version, kept for API compatibility).
 
         Args:
             run_id: Run job ID.
             event_type: Event type (e.g., "test_finished").
             payload: Event payload.
         """
-        queue = self.get_queue(run_id)
-        event = {
-            "event_type": event_type,
-            "payload": payload,
-            "created_at": datetime.now(UTC).isoformat(),
-        }
-        await queue.put(event)
+        self.push(run_id, event_type, payload)
+
+    def get_test_results(
+        self, run_id: str, ids: list[str] | None = None
+    ) -> dict[str, dict[str, Any]] | None:
+        """Return the latest per-test results of a live run.
+
+        Args:
+            run_id: Run job ID.
+            ids: Only return these run_case_ids (default: all finished tests).
+
+        Returns:
+            Mapping of run_case_id to ``test_result`` payload, or None when the run
+            has no live channel (use the persisted test results instead).
+        """
+        with self._lock:
+            channel = self._channels.get(run_id)
+            if channel is None:
+                return None
+            if ids is None:
+                return dict(channel.test_results)
+            return {i: channel.test_results[i] for i in ids if i in channel.test_results}
 
     async def subscribe(
         self,
         run_id: str,
         timeout: float = 30.0,
-    ):
+        coalesce_interval: float | None = None,
+        after_seq: int = 0,
+    ) -> AsyncIterator[dict[str, Any]]:
         """Subscribe to events for a run.
 
-        This is an async generator that yields events as they are pushed.
+        This is an async generator that yields the replayed history first, then
+        events as they are pushed.
 
         Args:
             run_id: Run job ID.
-            timeout: Max seconds to wait for each event.
+            timeout: Max seconds without any event before yielding a heartbeat.
+            coalesce_interval: When set, per-test events are folded into one
+                ``progress`` event emitted at most once per interval.
+            after_seq: Only replay events with a greater seq (reconnecting clients).
 
         Yields:
-            Event dictionaries with event_type, payload, created_at.
+            Event dictionaries with event_type, payload, created_at, seq.
         """
-        queue = self.get_queue(run_id)
+        self._ensure_transport()
+        loop = asyncio.get_running_loop()
+        sub: _Subscriber
+        if coalesce_interval is not None:
+            sub = _CoalescingSubscriber(loop, self._buffer_size)
+            wait = min(coalesce_interval, timeout)
+        else:
+            sub = _Subscriber(loop, self._buffer_size)
+            wait = timeout
+        with self._lock:
+            channel = self._channel(run_id)
+            for event in channel.replay:
+                if event["seq"] > after_seq:
+                    sub.deliver(event)
+            channel.subscribers.add(sub)
 
-        while True:
-            try:
-                # Wait for new event
-                event = await asyncio.wait_for(queue.get(), timeout=timeout)
+        last_yield = time.monotonic()
+        try:
+            while True:
+                event = await sub.get(wait)
+                if event is None:
+                    if isinstance(sub, _CoalescingSubscriber) and sub.dirty:
+                        event = sub.snapshot()
+                    elif time.monotonic() - last_yield >= timeout:
+                        # Send heartbeat to keep connection alive
+                        event = {
+                            "event_type": "heartbeat",
+                            "payload": {},
+                            "created_at": datetime.now(UTC).isoformat(),
+                            "seq": None,
+                        }
+                    else:
+                        continue
+
+                last_yield = time.monotonic()
                 yield event
 
                 # Check if this is a terminal event
-                if event["event_type"] in ("run_finished", "run_failed", "run_cancelled"):
+                if event["event_type"] in TERMINAL_EVENT_TYPES:
                     break
-
-            except TimeoutError:
-                # Send heartbeat to keep connection alive
-                yield {
-                    "event_type": "heartbeat",
-                    "payload": {},
-                    "created_at": datetime.now(UTC).isoformat(),
-                }
+        finally:
+            with self._lock:
+                channel.subscribers.discard(sub)
 
     def cleanup(self, run_id: str) -> None:
         """Clean up resources for a finished run.
 
+        Live subscribers keep draining their own buffers; only the channel (replay
+        history) is released.
+
         Args:
             run_id: Run job ID.
         """
-        self._active_runs.discard(run_id)
-        if run_id in self._queues:
-            del self._queues[run_id]
+        with self._lock:
+            self._active_runs.discard(run_id)
+            self._channels.pop(run_id, None)
+        with self._publish_lock:
+            self._origin_seq.pop(run_id, None)
 
 
 # Global event bus instance
-event_bus = EventBus()
+event_bus = EventBus(
+    buffer_size=settings.event_buffer_size,
+    replay_size=settings.event_replay_size,
+    transport=create_event_transport(settings.event_transport, settings.event_transport_url),
+)
@@ -0,0 +1,350 @@
+"""Pluggable transports behind the event bus.
+
+The bus publishes every event through a transport and receives every event back
+from it, so subscribers on any API worker see events published by any other worker:
+
+- ``memory``: in-process delivery (default, single worker).
+- ``unix``: local Unix-socket broker fanning out to every worker on the same host.
+  The first worker to start hosts the broker; it can also run standalone with
+  ``python -m llm_spec_web.core.event_transport <socket-path>``.
+- ``redis``: Redis pub/sub (requires the ``redis`` extra), for multi-host deployments.
+
+Events cross process boundaries as JSON, so payloads must be JSON-serializable.
+Each event carries the ``seq`` its publisher assigned; transports deliver one
+publisher's events in publish order, and the Unix broker sends every client the
+same global order.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from llm_spec_web.core.exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+DeliverFn = Callable[[str, dict[str, Any]], None]
+"""``(run_id, event) → None`` callback invoked for every received event."""
+
+
+class EventTransport:
+    """Base transport: ``publish()`` fans out to every started transport's *deliver*."""
+
+    def start(self, deliver: DeliverFn) -> None:
+        """Begin receiving events."""
+        raise NotImplementedError
+
+    def publish(self, run_id: str, event: dict[str, Any]) -> None:
+        """Send one event to every subscriber (thread-safe)."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release connections and background threads."""
+
+
+class InMemoryTransport(EventTransport):
+    """Deliver events synchronously inside this process."""
+
+    def __init__(self) -> None:
+        self._deliver: DeliverFn | None = None
+
+    def start(self, deliver: DeliverFn) -> None:
+        self._deliver = deliver
+
+    def publish(self, run_id: str, event: dict[str, Any]) -> None:
+        if self._deliver is not None:
+            self._deliver(run_id, event)
+
+
+# ── Unix-socket broker ────────────────────────────────────
+
+
+def _encode(run_id: str, event: dict[str, Any]) -> bytes:
+    return json.dumps({"run_id": run_id, "event": event}, ensure_ascii=False).encode() + b"\n"
+
+
+class UnixSocketBroker:
+    """Minimal fan-out broker: every line received is sent to every connected client."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._server: socket.socket | None = None
+        self._clients: set[socket.socket] = set()
+        self._lock = threading.Lock()
+        # One line at a time: concurrent sendall() calls could interleave bytes on a
+        # client socket, and every client must see the lines in the same order.
+        self._broadcast_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Bind the socket and accept clients in a daemon thread."""
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.path)
+        server.listen()
+        self._server = server
+        self._thread = threading.Thread(
+            target=self._accept_loop, name="llm-spec-event-broker", daemon=True
+        )
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """Start the broker and block (standalone mode)."""
+        self.start()
+        if self._thread is not None:
+            self._thread.join()
+
+    def close(self) -> None:
+        # shutdown() before close(): the accept/read threads still reference these
+        # sockets, so close() alone would neither wake them nor disconnect clients
+        # (which then never notice the broker is gone and never take over).
+        server, self._server = self._server, None
+        if server is not None:
+            with contextlib.suppress(OSError):
+                server.shutdown(socket.SHUT_RDWR)
+            server.close()
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path)
+        with self._lock:
+            clients, self._clients = self._clients, set()
+        for client in clients:
+            with contextlib.suppress(OSError):
+                client.shutdown(socket.SHUT_RDWR)
+            client.close()
+
+    def _accept_loop(self) -> None:
+        while self._server is not None:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            with self._lock:
+                self._clients.add(conn)
+            threading.Thread(target=self._client_loop, args=(conn,), daemon=True).start()
+
+    def _client_loop(self, conn: socket.socket) -> None:
+        try:
+            with conn.makefile("rb") as reader:
+                for line in reader:
+                    self._broadcast(line)
+        except OSError:
+            pass
+        finally:
+            with self._lock:
+                self._clients.discard(conn)
+            conn.close()
+
+    def _broadcast(self, line: bytes) -> None:
+        with self._broadcast_lock:
+            with self._lock:
+                clients = list(self._clients)
+            for client in clients:
+                try:
+                    client.sendall(line)
+                except OSError:
+                    with self._lock:
+                        self._clients.discard(client)
+
+
+class UnixSocketTransport(EventTransport):
+    """Publish/receive events through a ``UnixSocketBroker``.
+
+    When no broker is reachable and *host_broker* is set, this process starts one
+    (guarded by a lock file so only one worker wins).
+    """
+
+    def __init__(self, path: str, *, host_broker: bool = True) -> None:
+        self.path = path
+        self._host_broker = host_broker
+        self._broker: UnixSocketBroker | None = None
+        self._sock: socket.socket | None = None
+        self._send_lock = threading.Lock()
+        self._deliver: DeliverFn | None = None
+        self._closed = False
+        self._reader: threading.Thread | None = None
+
+    def start(self, deliver: DeliverFn) -> None:
+        self._deliver = deliver
+        self._connect()
+        self._reader = threading.Thread(
+            target=self._read_loop, name="llm-spec-event-transport", daemon=True
+        )
+        self._reader.start()
+
+    def _connect(self) -> None:
+        for _ in range(50):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.path)
+            except OSError:
+                sock.close()
+                if self._host_broker:
+                    self._maybe_host_broker()
+                time.sleep(0.05)
+                continue
+            with self._send_lock:
+                self._sock = sock
+            return
+        raise ConnectionError(f"event broker not reachable at {self.path}")
+
+    def _maybe_host_broker(self) -> None:
+        if self._broker is not None:
+            return
+        with open(f"{self.path}.lock", "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return  # another worker is starting the broker
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+                return  # broker came up meanwhile
+            except OSError:
+                broker = UnixSocketBroker(self.path)
+                broker.start()
+                self._broker = broker
+                logger.info("Hosting event broker at %s", self.path)
+            finally:
+                probe.close()
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_loop(self) -> None:
+        while not self._closed:
+            sock = self._sock
+            if sock is None:
+                return
+            try:
+                with sock.makefile("rb") as reader:
+                    for line in reader:
+                        msg = json.loads(line)
+                        if self._deliver is not None:
+                            self._deliver(msg["run_id"], msg["event"])
+            except (OSError, ValueError):
+                logger.exception("Event transport read failed")
+            if self._closed:
+                return
+            # Broker went away (e.g. its host worker exited): reconnect, hosting if needed.
+            try:
+                self._connect()
+            except ConnectionError:
+                logger.exception("Event transport lost its broker")
+                return
+
+    def publish(self, run_id: str, event: dict[str, Any]) -> None:
+        data = _encode(run_id, event)
+        with self._send_lock:
+            if self._sock is None:
+                logger.warning("Dropping event for run %s: transport not connected", run_id)
+                return
+            try:
+                self._sock.sendall(data)
+            except OSError:
+                logger.warning("Dropping event for run %s: broker unavailable", run_id)
+
+    def close(self) -> None:
+        self._closed = True
+        with self._send_lock:
+            sock, self._sock = self._sock, None
+        if sock is not None:
+            with contextlib.suppress(OSError):
+                sock.shutdown(socket.SHUT_RDWR)
+            sock.close()
+        if self._broker is not None:
+            self._broker.close()
+            self._broker = None
+
+
+# ── Redis pub/sub ─────────────────────────────────────────
+
+
+class RedisTransport(EventTransport):
+    """Publish/receive events through Redis pub/sub (one channel per run)."""
+
+    def __init__(self, url: str, *, channel_prefix: str = "llm_spec:events:") -> None:
+        try:
+            import redis
+        except ImportError as exc:
+            raise ConfigurationError(
+                "event_transport=redis requires the redis package "
+                "(install with: pip install 'llm-spec[redis]')"
+            ) from exc
+        self._client = redis.Redis.from_url(url)
+        self._prefix = channel_prefix
+        self._pubsub: Any = None
+        self._thread: threading.Thread | None = None
+        self._deliver: DeliverFn | None = None
+
+    def start(self, deliver: DeliverFn) -> None:
+        self._deliver = deliver
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.psubscribe(f"{self._prefix}*")
+        self._thread = threading.Thread(
+            target=self._read_loop, name="llm-spec-event-transport", daemon=True
+        )
+        self._thread.start()
+
+    def _read_loop(self) -> None:
+        try:
+            for message in self._pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                if self._deliver is not None:
+                    self._deliver(channel[len(self._prefix) :], json.loads(message["data"]))
+        except Exception:
+            if self._pubsub is not None:
+                logger.exception("Redis event transport stopped")
+
+    def publish(self, run_id: str, event: dict[str, Any]) -> None:
+        self._client.publish(f"{self._prefix}{run_id}", json.dumps(event, ensure_ascii=False))
+
+    def close(self) -> None:
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            pubsub.close()
+        self._client.close()
+
+
+def create_event_transport(kind: str, url: str = "") -> EventTransport:
+    """Create a transport from settings.
+
+    Args:
+        kind: ``memory``, ``unix`` or ``redis``.
+        url: Socket path (``unix``) or Redis URL (``redis``).
+
+    Returns:
+        An unstarted transport.
+
+    Raises:
+        ConfigurationError: If *kind* is unknown.
+    """
+    if kind == "memory":
+        return InMemoryTransport()
+    if kind == "unix":
+        return UnixSocketTransport(url or "/tmp/llm-spec-web-events.sock")
+    if kind == "redis":
+        return RedisTransport(url or "redis://localhost:6379/0")
+    raise ConfigurationError(f"unknown event transport: {kind}")
+
+
+def main() -> None:
+    """Run a standalone Unix-socket broker."""
+    path = sys.argv[1] if len(sys.argv) > 1 else "/tmp/llm-spec-web-events.sock"
+    UnixSocketBroker(path).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
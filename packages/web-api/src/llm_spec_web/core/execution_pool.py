@@ -0,0 +1,290 @@
+"""Long-lived execution pool for task runs.
+
+Tasks used to be executed through FastAPI ``BackgroundTasks`` with a fresh
+``asyncio.run()`` per task (new event loop, new HTTP clients, no shared limits).
+This module keeps one or more persistent event loops in dedicated threads instead:
+
+- Jobs are queued and dispatched to the least-loaded worker loop.
+- Each worker runs at most ``max_active_tasks`` jobs at once; the rest wait in FIFO order.
+- Every worker owns one global test semaphore shared by all of its jobs, so concurrent
+  tasks share capacity instead of each spinning up an isolated loop.
+- Every worker owns an ``HTTPClientPool`` so keep-alive connections survive across tasks
+  (binary response bodies are spooled to the optional blob store, not held in memory).
+- Every worker owns per-provider circuit breakers, so an outage detected by one task makes
+  the other tasks on that loop fail fast too.
+- Optionally, a shared ``ProcessCaseRunner`` executes the cases themselves in worker
+  processes, so request I/O and validation scale beyond one core while callbacks
+  (DB writes, SSE pushes) stay in the API process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Literal
+
+from llm_spec.client.circuit_breaker import CircuitBreakerConfig, CircuitBreakers
+from llm_spec.client.client_pool import HTTPClientPool
+from llm_spec.client.spool import BlobStore
+from llm_spec.distributed import ProcessCaseRunner
+from llm_spec_web.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExecutionContext:
+    """Loop-local shared resources handed to every job."""
+
+    global_semaphore: asyncio.Semaphore
+    client_pool: HTTPClientPool
+    case_runner: ProcessCaseRunner | None = None
+    circuit_breakers: CircuitBreakers | None = None
+
+
+Job = Callable[[ExecutionContext], Awaitable[None]]
+
+
+class _CountingSemaphore(asyncio.Semaphore):
+    """Semaphore that counts its waiters and holders (read by ``/metrics``)."""
+
+    def __init__(self, value: int) -> None:
+        super().__init__(value)
+        self.waiting = 0
+        self.held = 0
+
+    async def acquire(self) -> Literal[True]:
+        self.waiting += 1
+        try:
+            await super().acquire()
+        finally:
+            self.waiting -= 1
+        self.held += 1
+        return True
+
+    def release(self) -> None:
+        self.held -= 1
+        super().release()
+
+
+class _Worker:
+    """One daemon thread running one persistent event loop."""
+
+    def __init__(
+        self,
+        index: int,
+        *,
+        max_concurrent_tests: int,
+        max_active_tasks: int,
+        case_runner: ProcessCaseRunner | None = None,
+        circuit_breaker: CircuitBreakerConfig | None = None,
+        blob_store: BlobStore | None = None,
+    ) -> None:
+        self.index = index
+        self.loop = asyncio.new_event_loop()
+        self.pending = 0
+        self._max_concurrent_tests = max_concurrent_tests
+        self._max_active_tasks = max_active_tasks
+        self._case_runner = case_runner
+        self._circuit_breaker = circuit_breaker
+        self._blob_store = blob_store
+        self._ready = threading.Event()
+        self._task_slots: asyncio.Semaphore | None = None
+        self._tests: _CountingSemaphore | None = None
+        self._context: ExecutionContext | None = None
+        self._thread = threading.Thread(
+            target=self._run_loop, name=f"llm-spec-exec-{index}", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self._task_slots = asyncio.Semaphore(self._max_active_tasks)
+        self._tests = _CountingSemaphore(self._max_concurrent_tests)
+        self._context = ExecutionContext(
+            global_semaphore=self._tests,
+            client_pool=HTTPClientPool(blob_store=self._blob_store),
+            case_runner=self._case_runner,
+            circuit_breakers=(
+                CircuitBreakers(self._circuit_breaker) if self._circuit_breaker else None
+            ),
+        )
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    async def _run_job(self, job: Job) -> None:
+        assert self._task_slots is not None and self._context is not None
+        try:
+            async with self._task_slots:
+                await job(self._context)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Execution job failed on worker %s", self.index)
+
+    def test_slots(self) -> tuple[int, int]:
+        """``(waiting, running)`` tests on the global semaphore."""
+        if self._tests is None:
+            return (0, 0)
+        return (self._tests.waiting, self._tests.held)
+
+    def submit(self, job: Job) -> Future[None]:
+        return asyncio.run_coroutine_threadsafe(self._run_job(job), self.loop)
+
+    async def _shutdown(self) -> None:
+        current = asyncio.current_task()
+        pending = [t for t in asyncio.all_tasks() if t is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if self._context is not None:
+            await self._context.client_pool.close_async()
+
+    def stop(self, timeout: float) -> None:
+        if not self._thread.is_alive():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result(timeout)
+        except Exception:
+            logger.exception("Execution worker %s did not shut down cleanly", self.index)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+
+
+class ExecutionPool:
+    """Job queue + persistent worker loops shared by all task executions.
+
+    Usage::
+
+        pool = ExecutionPool(workers=1, max_concurrent_tests=32, max_active_tasks=4)
+        pool.start()
+        pool.submit(lambda ctx: service.execute_task_async(db, task_id, context=ctx))
+        pool.stop()
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 1,
+        max_concurrent_tests: int = 32,
+        max_active_tasks: int = 4,
+        process_workers: int = 0,
+        process_concurrency: int = 16,
+        circuit_breaker: CircuitBreakerConfig | None = None,
+        blob_store: BlobStore | None = None,
+    ) -> None:
+        self._num_workers = max(1, workers)
+        self._max_concurrent_tests = max(1, max_concurrent_tests)
+        self._max_active_tasks = max(1, max_active_tasks)
+        self._process_workers = max(0, process_workers)
+        self._process_concurrency = max(1, process_concurrency)
+        self._circuit_breaker = circuit_breaker
+        self._blob_store = blob_store
+        self._case_runner: ProcessCaseRunner | None = None
+        self._workers: list[_Worker] = []
+        self._lock = threading.Lock()
+
+    @property
+    def started(self) -> bool:
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Start worker threads (idempotent)."""
+        with self._lock:
+            if self._workers:
+                return
+            if self._process_workers:
+                self._case_runner = ProcessCaseRunner(
+                    self._process_workers,
+                    concurrency_per_process=self._process_concurrency,
+                )
+                self._case_runner.start()
+            for i in range(self._num_workers):
+                worker = _Worker(
+                    i,
+                    max_concurrent_tests=self._max_concurrent_tests,
+                    max_active_tasks=self._max_active_tasks,
+                    case_runner=self._case_runner,
+                    circuit_breaker=self._circuit_breaker,
+                    blob_store=self._blob_store,
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Cancel in-flight jobs, close pooled clients and join worker threads."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+            case_runner, self._case_runner = self._case_runner, None
+        for worker in workers:
+            worker.stop(timeout)
+        if case_runner is not None:
+            case_runner.close(timeout)
+
+    def submit(self, job: Job) -> Future[None]:
+        """Queue one job on the least-loaded worker (starts the pool lazily)."""
+        self.start()
+        with self._lock:
+            worker = min(self._workers, key=lambda w: w.pending)
+            worker.pending += 1
+
+        future = worker.submit(job)
+
+        def _done(_f: Future[None]) -> None:
+            with self._lock:
+                worker.pending -= 1
+
+        future.add_done_callback(_done)
+        return future
+
+    def pending_jobs(self) -> int:
+        """Number of jobs queued or running across all workers."""
+        with self._lock:
+            return sum(w.pending for w in self._workers)
+
+    def stats(self) -> dict[str, int]:
+        """Queue depths across all workers.
+
+        Returns:
+            ``pending_jobs`` (queued or running jobs), ``tests_waiting`` (cases queued
+            on a global test semaphore) and ``tests_running`` (cases holding a slot).
+        """
+        with self._lock:
+            workers = list(self._workers)
+        slots = [w.test_slots() for w in workers]
+        return {
+            "pending_jobs": sum(w.pending for w in workers),
+            "tests_waiting": sum(waiting for waiting, _ in slots),
+            "tests_running": sum(running for _, running in slots),
+        }
+
+
+# Global execution pool instance (started/stopped by the FastAPI lifespan)
+execution_pool = ExecutionPool(
+    workers=settings.execution_workers,
+    max_concurrent_tests=settings.execution_max_concurrent_tests,
+    max_active_tasks=settings.execution_max_active_tasks,
+    process_workers=settings.execution_process_workers,
+    process_concurrency=settings.execution_process_concurrency,
+    circuit_breaker=(
+        CircuitBreakerConfig(
+            failure_rate=settings.circuit_breaker_failure_rate,
+            min_requests=settings.circuit_breaker_min_requests,
+            window_s=settings.circuit_breaker_window_seconds,
+            cooldown_s=settings.circuit_breaker_cooldown_seconds,
+        )
+        if settings.circuit_breaker_enabled
+        else None
+    ),
+    blob_store=BlobStore(settings.binary_blob_dir) if settings.binary_blob_dir else None,
+)
@@ -0,0 +1,249 @@
+"""Prometheus metrics for the web API (served at ``GET /metrics``).
+
+Requires ``prometheus-client`` (part of the ``web`` extra). Until
+``configure_metrics()`` is called every ``record_*`` helper is a no-op.
+
+Recorded as they happen:
+
+- ``llm_spec_cases_total`` (provider, status)
+- ``llm_spec_case_latency_seconds`` / ``llm_spec_case_ttft_seconds`` (provider)
+- ``llm_spec_case_queue_seconds`` (provider; wait for a concurrency slot)
+- ``llm_spec_registry_cache_lookups_total`` (result: ``hit``, ``revalidated``, ``rebuild``)
+- ``llm_spec_registry_rebuild_seconds``
+- ``llm_spec_db_commit_seconds`` (session flush + commit, i.e. DB write latency)
+
+Read at scrape time (``update_state``):
+
+- ``llm_spec_tasks`` / ``llm_spec_runs`` (status; rows in the database)
+- ``llm_spec_execution_pending_jobs``, ``llm_spec_execution_tests_waiting`` (semaphore
+  queue depth), ``llm_spec_execution_tests_running``
+- ``llm_spec_event_active_runs``, ``llm_spec_event_subscribers``,
+  ``llm_spec_event_buffered_events``
+
+Values are per API process; with several workers, scrape each one.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+
+from llm_spec_web.core.exceptions import ConfigurationError
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session, sessionmaker
+
+    from llm_spec.results.result_types import TestVerdict
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+QUEUE_BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+TTFT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+REBUILD_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+DB_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+_COMMIT_STARTED = "llm_spec_commit_started"
+
+
+class WebMetrics:
+    """Registry and instruments of one API process."""
+
+    def __init__(self) -> None:
+        from prometheus_client import (
+            CollectorRegistry,
+            Counter,
+            Gauge,
+            GCCollector,
+            Histogram,
+            ProcessCollector,
+        )
+
+        self.registry = CollectorRegistry()
+        ProcessCollector(registry=self.registry)
+        GCCollector(registry=self.registry)
+
+        def gauge(name: str, doc: str, labels: tuple[str, ...] = ()) -> Any:
+            return Gauge(name, doc, labels, registry=self.registry)
+
+        self.cases = Counter(
+            "llm_spec_cases", "Finished cases", ("provider", "status"), registry=self.registry
+        )
+        self.case_latency = Histogram(
+            "llm_spec_case_latency_seconds",
+            "Case latency (request to verdict)",
+            ("provider",),
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.case_ttft = Histogram(
+            "llm_spec_case_ttft_seconds",
+            "Time to first stream chunk",
+            ("provider",),
+            buckets=TTFT_BUCKETS,
+            registry=self.registry,
+        )
+        self.case_queue = Histogram(
+            "llm_spec_case_queue_seconds",
+            "Wait for a concurrency slot",
+            ("provider",),
+            buckets=QUEUE_BUCKETS,
+            registry=self.registry,
+        )
+        self.registry_lookups = Counter(
+            "llm_spec_registry_cache_lookups",
+            "Suite registry cache lookups",
+            ("result",),
+            registry=self.registry,
+        )
+        self.registry_rebuild = Histogram(
+            "llm_spec_registry_rebuild_seconds",
+            "Suite registry rebuild time",
+            buckets=REBUILD_BUCKETS,
+            registry=self.registry,
+        )
+        self.db_commit = Histogram(
+            "llm_spec_db_commit_seconds",
+            "Session flush + commit time",
+            buckets=DB_BUCKETS,
+            registry=self.registry,
+        )
+        self.tasks = gauge("llm_spec_tasks", "Tasks by status", ("status",))
+        self.runs = gauge("llm_spec_runs", "Runs by status", ("status",))
+        self.pool = {
+            "pending_jobs": gauge("llm_spec_execution_pending_jobs", "Task jobs queued or running"),
+            "tests_waiting": gauge(
+                "llm_spec_execution_tests_waiting", "Cases waiting for a test slot"
+            ),
+            "tests_running": gauge("llm_spec_execution_tests_running", "Cases holding a test slot"),
+        }
+        self.events = {
+            "active_runs": gauge("llm_spec_event_active_runs", "Runs publishing events"),
+            "subscribers": gauge("llm_spec_event_subscribers", "Live event subscribers"),
+            "buffered_events": gauge(
+                "llm_spec_event_buffered_events", "Events queued in subscriber buffers"
+            ),
+        }
+
+    def update_state(
+        self,
+        *,
+        tasks: Mapping[str, int],
+        runs: Mapping[str, int],
+        pool: Mapping[str, int],
+        events: Mapping[str, int],
+    ) -> None:
+        """Refresh the scrape-time gauges.
+
+        Args:
+            tasks: Task count per status.
+            runs: Run count per status.
+            pool: ``ExecutionPool.stats()``.
+            events: ``EventBus.stats()``.
+        """
+        for metric, counts in ((self.tasks, tasks), (self.runs, runs)):
+            metric.clear()
+            for status, count in counts.items():
+                metric.labels(status=status).set(count)
+        for gauges, values in ((self.pool, pool), (self.events, events)):
+            for name, metric in gauges.items():
+                metric.set(values.get(name, 0))
+
+    def render(self) -> tuple[bytes, str]:
+        """Return ``(body, content_type)`` in the Prometheus text format."""
+        from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+        return generate_latest(self.registry), CONTENT_TYPE_LATEST
+
+
+_metrics: WebMetrics | None = None
+
+
+def configure_metrics(session_factory: sessionmaker[Session] | None = None) -> WebMetrics:
+    """Create the process-wide metrics (idempotent).
+
+    Args:
+        session_factory: Sessions whose commits are timed as DB writes.
+
+    Returns:
+        The active metrics.
+
+    Raises:
+        ConfigurationError: If prometheus-client is not installed.
+    """
+    global _metrics
+    if _metrics is None:
+        try:
+            _metrics = WebMetrics()
+        except ImportError as exc:
+            raise ConfigurationError(
+                "metrics require the prometheus-client package "
+                "(install with: pip install 'llm-spec[web]')"
+            ) from exc
+    if session_factory is not None and not event.contains(
+        session_factory, "before_commit", _on_before_commit
+    ):
+        event.listen(session_factory, "before_commit", _on_before_commit)
+        event.listen(session_factory, "after_commit", _on_after_commit)
+        event.listen(session_factory, "after_rollback", _on_after_rollback)
+    return _metrics
+
+
+def shutdown_metrics(session_factory: sessionmaker[Session] | None = None) -> None:
+    """Disable metrics and detach the session hooks."""
+    global _metrics
+    _metrics = None
+    if session_factory is not None and event.contains(
+        session_factory, "before_commit", _on_before_commit
+    ):
+        event.remove(session_factory, "before_commit", _on_before_commit)
+        event.remove(session_factory, "after_commit", _on_after_commit)
+        event.remove(session_factory, "after_rollback", _on_after_rollback)
+
+
+def get_metrics() -> WebMetrics | None:
+    """Return the active metrics, if configured."""
+    return _metrics
+
+
+# ── Recording helpers ─────────────────────────────────────
+
+
+def record_case(provider: str, verdict: TestVerdict) -> None:
+    """Count one finished case and observe its latency / TTFT / queue wait."""
+    metrics = _metrics
+    if metrics is None:
+        return
+    metrics.cases.labels(provider=provider, status=verdict.status).inc()
+    if verdict.latency_ms is not None:
+        metrics.case_latency.labels(provider=provider).observe(verdict.latency_ms / 1000)
+    if verdict.ttft_ms is not None:
+        metrics.case_ttft.labels(provider=provider).observe(verdict.ttft_ms / 1000)
+    if verdict.queue_ms is not None:
+        metrics.case_queue.labels(provider=provider).observe(verdict.queue_ms / 1000)
+
+
+def record_registry_lookup(result: str, rebuild_seconds: float | None = None) -> None:
+    """Count one suite registry cache lookup (and its rebuild time, if any)."""
+    metrics = _metrics
+    if metrics is None:
+        return
+    metrics.registry_lookups.labels(result=result).inc()
+    if rebuild_seconds is not None:
+        metrics.registry_rebuild.observe(rebuild_seconds)
+
+
+def _on_before_commit(session: Session) -> None:
+    session.info[_COMMIT_STARTED] = time.perf_counter()
+
+
+def _on_after_commit(session: Session) -> None:
+    started = session.info.pop(_COMMIT_STARTED, None)
+    metrics = _metrics
+    if started is not None and metrics is not None:
+        metrics.db_commit.observe(time.perf_counter() - started)
+
+
+def _on_after_rollback(session: Session) -> None:
+    session.info.pop(_COMMIT_STARTED, None)
@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
+import logging
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from llm_spec.telemetry import configure_telemetry, shutdown_telemetry
+from llm_spec_web.api.metrics import router as metrics_router
 from llm_spec_web.api.provider_configs import router as provider_config_router
 from llm_spec_web.api.runs import router as runs_router
 from llm_spec_web.api.settings import router as settings_router
 from llm_spec_web.api.suites import router as suites_router
 from llm_spec_web.api.tasks import router as tasks_router
 from llm_spec_web.config import settings
-from llm_spec_web.core.db import Base, engine
+from llm_spec_web.core.db import Base, SessionLocal, engine
 from llm_spec_web.core.error_handler import llm_spec_exception_handler
-from llm_spec_web.core.exceptions import LlmSpecError
+from llm_spec_web.core.event_bus import event_bus
+from llm_spec_web.core.exceptions import ConfigurationError, LlmSpecError
+from llm_spec_web.core.execution_pool import execution_pool
+from llm_spec_web.core.metrics import configure_metrics, shutdown_metrics
+
+logger = logging.getLogger(__name__)
 
 
 def init_db() -> None:
@@ -29,7 +37,20 @@ async def lifespan(_app: FastAPI):
     """Application lifecycle hooks."""
     if settings.auto_init_db:
         init_db()
-    yield
+    configure_telemetry(settings.otel_exporter, file_path=settings.otel_file_path)
+    if settings.metrics_enabled:
+        try:
+            configure_metrics(SessionLocal)
+        except ConfigurationError as exc:
+            logger.warning("/metrics is unavailable: %s", exc.message)
+    execution_pool.start()
+    try:
+        yield
+    finally:
+        execution_pool.stop()
+        event_bus.close()
+        shutdown_telemetry()
+        shutdown_metrics(SessionLocal)
 
 
 def create_app() -> FastAPI:
@@ -73,6 +94,7 @@ def create_app() -> FastAPI:
     app.include_router(runs_router)
     app.include_router(tasks_router)
     app.include_router(settings_router)
+    app.include_router(metrics_router)
 
     return app
 
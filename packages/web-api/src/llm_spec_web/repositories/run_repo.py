@@ -125,6 +125,15 @@ class RunRepository:
         tasks = self.db.execute(stmt).scalars().all()
         return tasks, total
 
+    def count_tasks_by_status(self) -> dict[str, int]:
+        """Count tasks per status.
+
+        Returns:
+            Mapping of status to number of tasks.
+        """
+        stmt = select(Task.status, func.count()).group_by(Task.status)
+        return {status: int(n) for status, n in self.db.execute(stmt).all()}
+
     def list_runs_by_task(self, task_id: str) -> Sequence[RunJob]:
         """List all runs in a task.
 
@@ -171,6 +180,15 @@ class RunRepository:
             stmt = stmt.where(RunJob.status == status_filter)
         return self.db.execute(stmt).scalars().all()
 
+    def count_runs_by_status(self) -> dict[str, int]:
+        """Count run jobs per status.
+
+        Returns:
+            Mapping of status to number of run jobs.
+        """
+        stmt = select(RunJob.status, func.count()).group_by(RunJob.status)
+        return {status: int(n) for status, n in self.db.execute(stmt).all()}
+
     def create(self, run_job: RunJob) -> RunJob:
         """Create a new run job.
 
@@ -395,6 +413,61 @@ class RunRepository:
         )
         return self.db.execute(stmt).scalars().all()
 
+    def list_recorded_latencies(self, provider: str, limit: int = 1000) -> list[int]:
+        """List the latest per-test latencies measured in real-mode runs.
+
+        Args:
+            provider: Provider ID.
+            limit: Maximum number of samples.
+
+        Returns:
+            Latencies in milliseconds, newest runs first.
+        """
+        stmt = (
+            select(RunTestResult.latency_ms)
+            .join(RunJob, RunJob.id == RunTestResult.run_id)
+            .where(
+                RunJob.mode == "real",
+                RunJob.provider == provider,
+                RunTestResult.latency_ms.is_not(None),
+            )
+            .order_by(RunJob.finished_at.desc())
+            .limit(limit)
+        )
+        return [int(v) for v in self.db.execute(stmt).scalars().all() if v is not None]
+
+    def latency_history(
+        self, providers: set[str]
+    ) -> dict[tuple[str, str | None, str | None, str], float]:
+        """Mean real-mode latency per test, for longest-first scheduling.
+
+        Args:
+            providers: Provider IDs to include.
+
+        Returns:
+            Mean latency in milliseconds keyed by ``(provider, model, route, test_name)``.
+        """
+        stmt = (
+            select(
+                RunJob.provider,
+                RunJob.model,
+                RunJob.route,
+                RunTestResult.test_name,
+                func.avg(RunTestResult.latency_ms),
+            )
+            .join(RunJob, RunJob.id == RunTestResult.run_id)
+            .where(
+                RunJob.mode == "real",
+                RunJob.provider.in_(providers),
+                RunTestResult.latency_ms.is_not(None),
+            )
+            .group_by(RunJob.provider, RunJob.model, RunJob.route, RunTestResult.test_name)
+        )
+        return {
+            (provider, model, route, test_name): float(mean)
+            for provider, model, route, test_name, mean in self.db.execute(stmt).all()
+        }
+
     def complete_run_with_results(
         self,
         *,
@@ -404,8 +477,13 @@ class RunRepository:
         progress_failed: int,
         test_results: list[RunTestResult],
         result_json: dict,
+        progress_skipped: int = 0,
     ) -> RunJob:
-        """Persist run test rows + run result, mark final run status, and commit."""
+        """Persist run test rows + run result, mark final run status, and commit.
+
+        Skipped cases (baseline failed) count toward neither passed nor failed; the run
+        fails only when *progress_failed* is non-zero.
+        """
         for row in test_results:
             self.add_test_result(row)
 
@@ -429,6 +507,7 @@ class RunRepository:
                 "status": run_job.status,
                 "passed": run_job.progress_passed,
                 "failed": run_job.progress_failed,
+                "skipped": progress_skipped,
             },
         )
         self.db.commit()
@@ -12,7 +12,7 @@ class TaskCreateRequest(BaseModel):
     """Request body for creating a new task."""
 
     suite_ids: list[str] = Field(..., min_length=1)
-    mode: Literal["real", "mock"] | None = None
+    mode: Literal["real", "mock", "replay"] | None = None
     selected_tests_by_suite: dict[str, list[str]] | None = Field(
         default=None, description="Map of suite_id to list of test names"
     )
@@ -22,6 +22,9 @@ class TaskCreateRequest(BaseModel):
     max_concurrent: int | None = Field(
         default=None, ge=1, le=50, description="Maximum concurrent tests per run (1-50)"
     )
+    mock_latency: Literal["zero", "fast", "realistic", "legacy", "recorded"] | None = Field(
+        default=None, description="Mock-mode latency profile (default: server setting)"
+    )
 
 
 class TaskUpdateRequest(BaseModel):
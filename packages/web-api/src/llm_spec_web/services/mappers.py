@@ -141,10 +141,20 @@ def verdict_to_case_row(verdict: TestVerdict, run_case_id: str | None = None) ->
             else "str",
         }
     if verdict.http_status is not None or verdict.latency_ms is not None:
-        row["request"] = {
+        request: dict[str, Any] = {
             "http_status": verdict.http_status or 0,
             "latency_ms": verdict.latency_ms or 0,
         }
+        if verdict.timings:
+            request["timings"] = dict(verdict.timings)
+        if verdict.ttft_ms is not None:
+            request["ttft_ms"] = verdict.ttft_ms
+        if verdict.queue_ms is not None:
+            request["queue_ms"] = verdict.queue_ms
+        for key in ("queued_at", "dispatched_at", "first_byte_at", "finished_at"):
+            if value := getattr(verdict, key):
+                request[key] = value
+        row["request"] = request
     row["result"] = {
         "status": verdict.status,
     }
@@ -170,4 +180,6 @@ def run_result_to_dict(
         "version": result.version,
         "run_id": result.run_id,
         "cases": [verdict_to_case_row(v, mapping.get(v.case_id)) for v in result.verdicts],
+        "timings": result.timing_summary(),
+        "queue": result.queue_summary(),
     }
@@ -7,12 +7,18 @@ injecting web-layer side-effects (DB writes, SSE events) via callbacks.
 from __future__ import annotations
 
 import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TypeVar
 
 from sqlalchemy.orm import Session
 
+from llm_spec import telemetry
+from llm_spec.adapters.cassette import CassetteStore, RecordingAdapter, ReplayAdapter
+from llm_spec.client.client_pool import HTTPClientPool
 from llm_spec.client.http_client import HTTPClient
 from llm_spec.config.loader import AppConfig, ProviderConfig, load_config
 from llm_spec.executor import (
@@ -24,11 +30,15 @@ from llm_spec.executor import (
     run_suites,
     run_task_suites,
 )
-from llm_spec.results.result_types import TestVerdict
+from llm_spec.results.result_types import RunResult, TestVerdict
+from llm_spec.scheduling import LatencyEstimator
 from llm_spec.suites import ExecutableCase
+from llm_spec.testing.latency import LatencyProfile, get_latency_profile
 from llm_spec_web.config import settings
+from llm_spec_web.core import metrics
 from llm_spec_web.core.event_bus import event_bus
 from llm_spec_web.core.exceptions import ConfigurationError, NotFoundError, ValidationError
+from llm_spec_web.core.execution_pool import ExecutionContext
 from llm_spec_web.models.run import RunJob, RunTestResult
 from llm_spec_web.repositories.run_repo import RunRepository
 from llm_spec_web.services.mappers import (
@@ -41,13 +51,24 @@ from llm_spec_web.services.mappers import (
 from llm_spec_web.services.suite_service import SuiteService
 from llm_spec_web.services.task_service import TaskService
 
+# Modes that never reach a real provider (no provider config required).
+_OFFLINE_MODES = {"mock", "replay"}
+
 
 def _create_client(
     provider: str,
     app_config: AppConfig,
     mode: str,
+    client_pool: HTTPClientPool | None = None,
+    mock_latency: dict[str, LatencyProfile] | None = None,
 ) -> tuple[HTTPClient, Any]:
-    """Create (HTTPClient, ProviderAdapter) — delegates to core for real mode."""
+    """Create (HTTPClient, ProviderAdapter) — delegates to core for real mode.
+
+    When *client_pool* is given, real-mode adapters share its pooled HTTPClient and
+    the caller must not close it. *mock_latency* maps provider → latency profile
+    for mock mode. ``replay`` serves responses recorded in ``settings.cassette_dir``;
+    real-mode traffic is recorded there when ``settings.cassette_record`` is set.
+    """
     if mode == "mock":
         from llm_spec_web.adapters.mock_adapter import MockProviderAdapter
 
@@ -56,8 +77,109 @@ def _create_client(
             config=config,
             base_dir=settings.mock_base_dir,
             provider_name=provider,
+            latency=(mock_latency or {}).get(provider),
+        )
+    if mode == "replay":
+        config = ProviderConfig(api_key="", base_url="", timeout=30.0)
+        return HTTPClient(), ReplayAdapter(
+            config=config,
+            store=CassetteStore.shared(settings.cassette_dir),
+            provider_name=provider,
+            time_scale=settings.cassette_replay_time_scale,
         )
-    return create_provider_adapter(provider, app_config)
+    http_client = None
+    if client_pool is not None:
+        provider_cfg = app_config.get_provider_config(provider)
+        http_client = client_pool.get(provider, provider_cfg.base_url, provider_cfg.timeout)
+    http_client, adapter = create_provider_adapter(provider, app_config, http_client=http_client)
+    if settings.cassette_record:
+        adapter = RecordingAdapter(adapter, CassetteStore.shared(settings.cassette_dir), provider)
+    return http_client, adapter
+
+
+def _resolve_mock_latency(
+    run_repo: RunRepository, name: str | None, providers: set[str]
+) -> dict[str, LatencyProfile]:
+    """Resolve a mock latency profile name into one profile per provider.
+
+    ``recorded`` replays the latencies of each provider's latest real-mode results.
+
+    Raises:
+        ValidationError: If *name* is not a known profile.
+    """
+    name = name or settings.mock_latency_profile
+    if name == "recorded":
+        return {
+            p: LatencyProfile.from_recorded(run_repo.list_recorded_latencies(p)) for p in providers
+        }
+    try:
+        profile = get_latency_profile(name)
+    except ValueError as err:
+        raise ValidationError(str(err)) from err
+    return dict.fromkeys(providers, profile)
+
+
+def _scheduling(run_repo: RunRepository, providers: set[str]) -> dict[str, Any]:
+    """Return the ``run_suites`` ordering hooks (longest expected case first).
+
+    The order is approximate: suites open slowest-first as concurrency frees up, and
+    cases are ranked only among the suites already open, not across the whole task.
+    Empty when ``settings.execution_longest_first`` is off (registry order).
+    """
+    if not settings.execution_longest_first:
+        return {}
+    estimator = LatencyEstimator(run_repo.latency_history(providers))
+    return {
+        "case_priority": estimator.case_priority,
+        "suite_priority": estimator.suite_priority,
+    }
+
+
+def _warmup_connections(mode: str) -> int:
+    """Connections to pre-open per client (none for offline modes: they have no upstream)."""
+    return 0 if mode in _OFFLINE_MODES else settings.execution_warmup_connections
+
+
+def _result_json(
+    result: SuiteResult, run_result: RunResult, cid_to_rcid: dict[str, str]
+) -> dict[str, Any]:
+    """Serialize a finished run's result, with the connection warm-up cost if any."""
+    result_json = run_result_to_dict(run_result, cid_to_rcid)
+    if result.warmup is not None:
+        result_json["warmup"] = result.warmup.to_dict()
+    return result_json
+
+
+# Index into a run's ``[passed, failed, skipped]`` progress counters. Cases skipped
+# because their baseline failed are not failures of their own.
+_COUNTER_INDEX = {"pass": 0, "skipped": 2}
+
+
+def _count_verdict(counters: list[int], status: str) -> None:
+    counters[_COUNTER_INDEX.get(status, 1)] += 1
+
+
+_T = TypeVar("_T")
+
+
+class _DbWriter:
+    """Runs a task's session work on one dedicated thread.
+
+    Task callbacks run on the shared execution-pool loop; synchronous SQLAlchemy
+    commits there would stall the cases of every task on that loop. The session is not
+    thread-safe, so all of its work goes through this single thread, in order.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+
+    async def __call__(self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def aclose(self) -> None:
+        """Wait for queued writes, then stop the thread."""
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
 
 
 class RunExecutionService:
@@ -83,7 +205,7 @@ class RunExecutionService:
         target_case = run_case_to_test_case(run_case)
 
         app_config = load_config(settings.app_toml_path)
-        if run_job.mode != "mock":
+        if run_job.mode not in _OFFLINE_MODES:
             try:
                 app_config.get_provider_config(run_job.provider)
             except KeyError as err:
@@ -116,10 +238,25 @@ class RunExecutionService:
     ) -> None:
         http_client = None
         try:
-            http_client, client = _create_client(run_job.provider, app_config, run_job.mode)
+            mock_latency = None
+            if run_job.mode == "mock":
+                mock_latency = _resolve_mock_latency(run_repo, None, {run_job.provider})
+            http_client, client = _create_client(
+                run_job.provider, app_config, run_job.mode, mock_latency=mock_latency
+            )
 
             executor = Executor(client=client)
-            verdict = await executor.run_one(target_case)
+            with telemetry.span(
+                "llm_spec.retry",
+                provider=run_job.provider,
+                model=run_job.model,
+                route=run_job.route,
+                test_name=target_case.test_name,
+            ) as retry_span:
+                telemetry.record_retry()
+                verdict = await executor.run_one(target_case)
+                telemetry.record_case(retry_span, verdict)
+            metrics.record_case(run_job.provider, verdict)
 
             # Upsert test result
             run_repo.upsert_test_result_by_run_case_id(
@@ -144,17 +281,15 @@ class RunExecutionService:
             # Recalculate progress from cases
             cases_raw = updated_json.get("cases", [])
             total = len(cases_raw)
-            passed = sum(
-                1
-                for c in cases_raw
-                if isinstance(c, dict)
-                and isinstance(c.get("result"), dict)
-                and c["result"].get("status") == "pass"
-            )
+            counters = [0, 0, 0]
+            for c in cases_raw:
+                result = c.get("result") if isinstance(c, dict) else None
+                status = result.get("status") if isinstance(result, dict) else None
+                _count_verdict(counters, str(status))
             run_job.progress_total = total
             run_job.progress_done = total
-            run_job.progress_passed = passed
-            run_job.progress_failed = total - passed
+            run_job.progress_passed = counters[0]
+            run_job.progress_failed = counters[1]
             run_job.status = "success" if run_job.progress_failed == 0 else "failed"
             run_job.error_message = None if run_job.status == "success" else run_job.error_message
             run_job.finished_at = datetime.now(UTC)
@@ -187,7 +322,7 @@ class RunExecutionService:
             return
 
         app_config = load_config(settings.app_toml_path)
-        if run_job.mode != "mock":
+        if run_job.mode not in _OFFLINE_MODES:
             try:
                 app_config.get_provider_config(run_job.provider)
             except KeyError:
@@ -211,9 +346,12 @@ class RunExecutionService:
         executors: dict[str, Executor] = {}
 
         mode = run_job.mode
+        mock_latency = (
+            _resolve_mock_latency(run_repo, None, {run_job.provider}) if mode == "mock" else None
+        )
 
         def _client_factory(provider: str, cfg: AppConfig) -> tuple[HTTPClient, Any]:
-            return _create_client(provider, cfg, mode)
+            return _create_client(provider, cfg, mode, mock_latency=mock_latency)
 
         async def _on_suite_start(ctx: SuiteContext) -> None:
             sid = ctx.suite.suite_id
@@ -223,7 +361,7 @@ class RunExecutionService:
             rc = [test_case_to_run_case(job.id, c) for c in cases]
             persisted = run_repo.replace_run_cases(job.id, rc)
             case_id_maps[sid] = {row.case_id: row.id for row in persisted}
-            progress_counters[sid] = [0, 0]  # [passed, failed]
+            progress_counters[sid] = [0, 0, 0]  # [passed, failed, skipped]
             run_repo.mark_run_running(job, progress_total=len(cases))
             event_bus.start_run(job.id)
             event_bus.push(
@@ -253,14 +391,13 @@ class RunExecutionService:
                 if case.case_id in cmap:
                     job = run_map[sid]
                     counters = progress_counters[sid]
-                    if verdict.status == "pass":
-                        counters[0] += 1
-                    else:
-                        counters[1] += 1
+                    metrics.record_case(job.provider, verdict)
+                    _count_verdict(counters, verdict.status)
                     event_bus.push(
                         job.id,
                         "test_finished",
                         {
+                            "run_case_id": cmap[case.case_id],
                             "test_name": case.test_name,
                             "index": progress.index + 1,
                             "status": verdict.status,
@@ -268,6 +405,7 @@ class RunExecutionService:
                             "progress_total": progress.total,
                             "progress_passed": counters[0],
                             "progress_failed": counters[1],
+                            "progress_skipped": counters[2],
                             "test_result": _verdict_to_sse_payload(verdict),
                         },
                     )
@@ -282,12 +420,12 @@ class RunExecutionService:
             sid = ctx.suite.suite_id
             job = run_map[sid]
             cmap = case_id_maps.get(sid, {})
-            counters = progress_counters.get(sid, [0, 0])
+            counters = progress_counters.get(sid, [0, 0, 0])
             verdicts = result.verdicts
 
             run_repo.refresh(job)
             if job.status == "cancelled" or ctx.executor.cancelled:
-                done_count = counters[0] + counters[1]
+                done_count = sum(counters)
                 event_bus.push(
                     job.id,
                     "run_cancelled",
@@ -327,8 +465,9 @@ class RunExecutionService:
                 progress_done=len(verdicts),
                 progress_passed=counters[0],
                 progress_failed=counters[1],
+                progress_skipped=counters[2],
                 test_results=test_rows,
-                result_json=run_result_to_dict(run_result, cid_to_rcid),
+                result_json=_result_json(result, run_result, cid_to_rcid),
             )
             event_bus.push(
                 job.id,
@@ -337,6 +476,7 @@ class RunExecutionService:
                     "status": job.status,
                     "passed": job.progress_passed,
                     "failed": job.progress_failed,
+                    "skipped": counters[2],
                 },
             )
             event_bus.end_run(job.id)
@@ -367,6 +507,9 @@ class RunExecutionService:
                     on_suite_done=_on_suite_done,
                     on_suite_error=_on_suite_error,
                     client_factory=_client_factory,
+                    baseline_first=settings.execution_baseline_first,
+                    warmup_connections=_warmup_connections(mode),
+                    **_scheduling(run_repo, {run_job.provider}),
                 )
             )
         except Exception as exc:
@@ -384,13 +527,72 @@ class RunExecutionService:
         *,
         max_concurrent: int = 5,
         run_concurrency: int = 2,
+        mock_latency: str | None = None,
+    ) -> None:
+        """Execute one task on a private event loop (blocking)."""
+        asyncio.run(
+            self.execute_task_async(
+                db,
+                task_id,
+                max_concurrent=max_concurrent,
+                run_concurrency=run_concurrency,
+                mock_latency=mock_latency,
+            )
+        )
+
+    async def execute_task_async(
+        self,
+        db: Session,
+        task_id: str,
+        *,
+        max_concurrent: int = 5,
+        run_concurrency: int = 2,
+        context: ExecutionContext | None = None,
+        mock_latency: str | None = None,
+    ) -> None:
+        """Execute one task (all child runs) via core run_suites().
+
+        Args:
+            db: Database session owned by the caller.
+            task_id: Task ID.
+            max_concurrent: Maximum concurrent tests for this task.
+            run_concurrency: Maximum number of runs (suites) executing at once.
+            context: Shared execution resources (global semaphore + HTTP client pool)
+                when running on the execution pool.
+            mock_latency: Latency profile name for mock mode
+                (default: ``settings.mock_latency_profile``).
+        """
+        # Session work runs on a per-task writer thread, never on the shared loop.
+        db_call = _DbWriter(f"llm-spec-db-{task_id[:8]}")
+        try:
+            await self._execute_task_with_writer(
+                db,
+                db_call,
+                task_id,
+                max_concurrent=max_concurrent,
+                run_concurrency=run_concurrency,
+                context=context,
+                mock_latency=mock_latency,
+            )
+        finally:
+            await db_call.aclose()
+
+    async def _execute_task_with_writer(
+        self,
+        db: Session,
+        db_call: _DbWriter,
+        task_id: str,
+        *,
+        max_concurrent: int,
+        run_concurrency: int,
+        context: ExecutionContext | None,
+        mock_latency: str | None,
     ) -> None:
-        """Execute one task (all child runs) via core run_suites()."""
         run_repo = RunRepository(db)
-        task = run_repo.get_task_by_id(task_id)
+        task = await db_call(run_repo.get_task_by_id, task_id)
         if task is None:
             raise NotFoundError("Task", task_id)
-        runs = run_repo.list_runs_by_task(task_id)
+        runs = await db_call(run_repo.list_runs_by_task, task_id)
         active_runs = [r for r in runs if r.status in {"queued", "running"}]
         if not active_runs:
             return
@@ -403,7 +605,7 @@ class RunExecutionService:
 
         for run_job in active_runs:
             if run_job.suite_id is None:
-                run_repo.fail_run_with_event(run_job, "suite_id is None")
+                await db_call(run_repo.fail_run_with_event, run_job, "suite_id is None")
                 continue
             run_map[run_job.suite_id] = run_job
             suite_ids.append(run_job.suite_id)
@@ -420,29 +622,58 @@ class RunExecutionService:
 
         # Per-suite mutable state closed over by callbacks
         case_id_maps: dict[str, dict[str, str]] = {}
-        progress_counters: dict[str, list[int]] = {}  # [passed, failed]
+        progress_counters: dict[str, list[int]] = {}  # [passed, failed, skipped]
         executors: dict[str, Executor] = {}
 
-        def _client_factory(provider: str, cfg: AppConfig) -> tuple[HTTPClient, Any]:
-            return _create_client(provider, cfg, mode)
+        case_runner = context.case_runner if context is not None else None
+        # Pooled clients are loop-bound; worker processes build their own clients.
+        client_pool = context.client_pool if context is not None and case_runner is None else None
+        # A partial (not a closure) so it can be pickled to case worker processes.
+        mock_latency_profiles = (
+            await db_call(
+                _resolve_mock_latency, run_repo, mock_latency, {r.provider for r in active_runs}
+            )
+            if mode == "mock"
+            else None
+        )
+        client_factory = functools.partial(
+            _create_client,
+            mode=mode,
+            client_pool=client_pool,
+            mock_latency=mock_latency_profiles,
+        )
+
+        # ORM objects are only touched on the writer thread once cases start; the loop
+        # works from these snapshots.
+        run_ids = {sid: job.id for sid, job in run_map.items()}
+        run_providers = {sid: job.provider for sid, job in run_map.items()}
+
+        def _current_status(job: RunJob) -> str:
+            run_repo.refresh(job)
+            return job.status
 
         async def _on_suite_start(ctx: SuiteContext) -> None:
             sid = ctx.suite.suite_id
             job = run_map[sid]
+            run_id = run_ids[sid]
             cases = ctx.cases
             executors[sid] = ctx.executor
-            rc = [test_case_to_run_case(job.id, c) for c in cases]
-            persisted = run_repo.replace_run_cases(job.id, rc)
-            case_id_maps[sid] = {row.case_id: row.id for row in persisted}
-            progress_counters[sid] = [0, 0]
-            run_repo.mark_run_running(job, progress_total=len(cases))
-            event_bus.start_run(job.id)
+            rc = [test_case_to_run_case(run_id, c) for c in cases]
+
+            def _persist_cases() -> dict[str, str]:
+                persisted = run_repo.replace_run_cases(run_id, rc)
+                run_repo.mark_run_running(job, progress_total=len(cases))
+                return {row.case_id: row.id for row in persisted}
+
+            case_id_maps[sid] = await db_call(_persist_cases)
+            progress_counters[sid] = [0, 0, 0]
+            event_bus.start_run(run_id)
             event_bus.push(
-                job.id,
+                run_id,
                 "run_started",
                 {
-                    "mode": job.mode,
-                    "progress_total": job.progress_total,
+                    "mode": mode,
+                    "progress_total": len(cases),
                     "test_order": [c.test_name for c in cases],
                     "max_concurrent": max_concurrent,
                 },
@@ -451,9 +682,10 @@ class RunExecutionService:
         async def _on_test_start(case: ExecutableCase, idx: int, total: int) -> None:
             for sid, cmap in case_id_maps.items():
                 if case.case_id in cmap:
-                    job = run_map[sid]
                     event_bus.push(
-                        job.id, "test_started", {"test_name": case.test_name, "index": idx + 1}
+                        run_ids[sid],
+                        "test_started",
+                        {"test_name": case.test_name, "index": idx + 1},
                     )
                     return
 
@@ -462,16 +694,14 @@ class RunExecutionService:
             verdict = progress.verdict
             for sid, cmap in case_id_maps.items():
                 if case.case_id in cmap:
-                    job = run_map[sid]
                     counters = progress_counters[sid]
-                    if verdict.status == "pass":
-                        counters[0] += 1
-                    else:
-                        counters[1] += 1
+                    metrics.record_case(run_providers[sid], verdict)
+                    _count_verdict(counters, verdict.status)
                     event_bus.push(
-                        job.id,
+                        run_ids[sid],
                         "test_finished",
                         {
+                            "run_case_id": cmap[case.case_id],
                             "test_name": case.test_name,
                             "index": progress.index + 1,
                             "status": verdict.status,
@@ -479,11 +709,11 @@ class RunExecutionService:
                             "progress_total": progress.total,
                             "progress_passed": counters[0],
                             "progress_failed": counters[1],
+                            "progress_skipped": counters[2],
                             "test_result": _verdict_to_sse_payload(verdict),
                         },
                     )
-                    run_repo.refresh(job)
-                    if job.status == "cancelled":
+                    if await db_call(_current_status, run_map[sid]) == "cancelled":
                         executor = executors.get(sid)
                         if executor:
                             executor.cancel()
@@ -492,25 +722,27 @@ class RunExecutionService:
         async def _on_suite_done(ctx: SuiteContext, result: SuiteResult) -> None:
             sid = ctx.suite.suite_id
             job = run_map[sid]
+            run_id = run_ids[sid]
             cmap = case_id_maps.get(sid, {})
-            counters = progress_counters.get(sid, [0, 0])
+            counters = progress_counters.get(sid, [0, 0, 0])
             verdicts = result.verdicts
 
-            run_repo.refresh(job)
-            if job.status == "cancelled" or ctx.executor.cancelled:
-                done_count = counters[0] + counters[1]
+            status = await db_call(_current_status, job)
+            if status == "cancelled" or ctx.executor.cancelled:
+                done_count = sum(counters)
                 event_bus.push(
-                    job.id,
+                    run_id,
                     "run_cancelled",
                     {"progress_done": done_count, "progress_total": len(verdicts)},
                 )
-                run_repo.append_event_and_commit(
-                    job.id,
+                await db_call(
+                    run_repo.append_event_and_commit,
+                    run_id,
                     "run_cancelled",
                     {"progress_done": done_count, "progress_total": len(verdicts)},
                 )
-                event_bus.end_run(job.id)
-                event_bus.cleanup(job.id)
+                event_bus.end_run(run_id)
+                event_bus.cleanup(run_id)
                 return
 
             test_rows: list[RunTestResult] = []
@@ -518,68 +750,75 @@ class RunExecutionService:
             for v in verdicts:
                 rcid = cmap.get(v.case_id, "")
                 cid_to_rcid[v.case_id] = rcid
-                test_rows.append(verdict_to_test_result_row(job.id, rcid, v))
+                test_rows.append(verdict_to_test_result_row(run_id, rcid, v))
 
             from llm_spec.results.task_result import build_run_result
 
-            run_result = build_run_result(
-                run_id=job.id,
-                started_at=job.started_at.isoformat() if job.started_at else "",
-                finished_at=datetime.now(UTC).isoformat(),
-                provider=job.provider,
-                model=job.model,
-                route=job.route,
-                endpoint=job.endpoint,
-                suite_name=job.suite_name or "",
-                verdicts=verdicts,
-            )
-            run_repo.complete_run_with_results(
-                run_job=job,
-                progress_done=len(verdicts),
-                progress_passed=counters[0],
-                progress_failed=counters[1],
-                test_results=test_rows,
-                result_json=run_result_to_dict(run_result, cid_to_rcid),
-            )
-            event_bus.push(
-                job.id,
-                "run_finished",
-                {
+            def _complete() -> dict[str, Any]:
+                run_result = build_run_result(
+                    run_id=run_id,
+                    started_at=job.started_at.isoformat() if job.started_at else "",
+                    finished_at=datetime.now(UTC).isoformat(),
+                    provider=job.provider,
+                    model=job.model,
+                    route=job.route,
+                    endpoint=job.endpoint,
+                    suite_name=job.suite_name or "",
+                    verdicts=verdicts,
+                )
+                run_repo.complete_run_with_results(
+                    run_job=job,
+                    progress_done=len(verdicts),
+                    progress_passed=counters[0],
+                    progress_failed=counters[1],
+                    progress_skipped=counters[2],
+                    test_results=test_rows,
+                    result_json=_result_json(result, run_result, cid_to_rcid),
+                )
+                finished = {
                     "status": job.status,
                     "passed": job.progress_passed,
                     "failed": job.progress_failed,
-                },
-            )
-            event_bus.end_run(job.id)
-            event_bus.cleanup(job.id)
+                    "skipped": counters[2],
+                }
+                if job.task_id:
+                    self._task_service.update_task_status(db, job.task_id)
+                return finished
 
-            if job.task_id:
-                self._task_service.update_task_status(db, job.task_id)
+            event_bus.push(run_id, "run_finished", await db_call(_complete))
+            event_bus.end_run(run_id)
+            event_bus.cleanup(run_id)
 
         async def _on_suite_error(ctx: SuiteContext, exc: Exception) -> None:
             sid = ctx.suite.suite_id
-            job = run_map[sid]
-            run_repo.fail_run_with_event(job, str(exc))
-            event_bus.push(job.id, "run_failed", {"error": str(exc)})
-            event_bus.end_run(job.id)
-            event_bus.cleanup(job.id)
+            run_id = run_ids[sid]
+            await db_call(run_repo.fail_run_with_event, run_map[sid], str(exc))
+            event_bus.push(run_id, "run_failed", {"error": str(exc)})
+            event_bus.end_run(run_id)
+            event_bus.cleanup(run_id)
 
         try:
-            asyncio.run(
-                run_task_suites(
-                    task_id=task_id,
-                    registry=suites_registry,
-                    config=app_config,
-                    suite_ids=suite_ids,
-                    selected_tests=selected_tests or None,
-                    max_concurrent_tests=max_concurrent,
-                    on_test_start=_on_test_start,
-                    on_test_done=_on_test_done,
-                    on_suite_start=_on_suite_start,
-                    on_suite_done=_on_suite_done,
-                    on_suite_error=_on_suite_error,
-                    client_factory=_client_factory,
-                )
+            await run_task_suites(
+                task_id=task_id,
+                registry=suites_registry,
+                config=app_config,
+                suite_ids=suite_ids,
+                selected_tests=selected_tests or None,
+                max_concurrent_tests=max_concurrent,
+                max_concurrent_suites=run_concurrency,
+                global_semaphore=context.global_semaphore if context is not None else None,
+                on_test_start=_on_test_start,
+                on_test_done=_on_test_done,
+                on_suite_start=_on_suite_start,
+                on_suite_done=_on_suite_done,
+                on_suite_error=_on_suite_error,
+                client_factory=client_factory,
+                close_clients=client_pool is None,
+                case_runner=case_runner,
+                baseline_first=settings.execution_baseline_first,
+                circuit_breakers=context.circuit_breakers if context is not None else None,
+                warmup_connections=_warmup_connections(mode),
+                **await db_call(_scheduling, run_repo, {r.provider for r in active_runs}),
             )
         except asyncio.CancelledError:
             return
@@ -42,6 +42,7 @@ class RunQueryService:
         for r in results:
             out.append(
                 {
+                    "run_case_id": r.run_case_id,
                     "case_id": r.case_id,
                     "test_name": r.test_name,
                     "focus_name": r.focus_name,
@@ -15,6 +15,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from llm_spec_web.core.execution_pool import ExecutionContext
 from llm_spec_web.models.run import RunEvent, RunJob, Task
 from llm_spec_web.services.run_execution_service import (
     RunExecutionService,
@@ -99,9 +100,33 @@ class RunService:
         *,
         max_concurrent: int = 5,
         run_concurrency: int = 2,
+        mock_latency: str | None = None,
     ) -> None:
         return self._exec.execute_task(
-            db, task_id, max_concurrent=max_concurrent, run_concurrency=run_concurrency
+            db,
+            task_id,
+            max_concurrent=max_concurrent,
+            run_concurrency=run_concurrency,
+            mock_latency=mock_latency,
+        )
+
+    async def execute_task_async(
+        self,
+        db: Session,
+        task_id: str,
+        *,
+        max_concurrent: int = 5,
+        run_concurrency: int = 2,
+        context: ExecutionContext | None = None,
+        mock_latency: str | None = None,
+    ) -> None:
+        await self._exec.execute_task_async(
+            db,
+            task_id,
+            max_concurrent=max_concurrent,
+            run_concurrency=run_concurrency,
+            context=context,
+            mock_latency=mock_latency,
         )
 
 
@@ -8,6 +8,7 @@ from threading import Lock
 
 from llm_spec.suites import Registry, SuiteSpec
 from llm_spec_web.core.exceptions import NotFoundError
+from llm_spec_web.core.metrics import record_registry_lookup
 
 
 class SuiteService:
@@ -51,15 +52,18 @@ class SuiteService:
                 self._registry is not None
                 and (now_monotonic - self._cache_built_at) <= self._cache_ttl_seconds
             ):
+                record_registry_lookup("hit")
                 return self._registry
 
         signature = self._registry_signature()
         with self._cache_lock:
             if self._registry is not None and self._cache_registry_signature == signature:
                 self._cache_built_at = now_monotonic
+                record_registry_lookup("revalidated")
                 return self._registry
 
         registry = Registry.from_directory(self.registry_dir)
+        record_registry_lookup("rebuild", time.monotonic() - now_monotonic)
 
         with self._cache_lock:
             self._registry = registry
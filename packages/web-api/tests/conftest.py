@@ -0,0 +1,39 @@
+"""Shared fixtures for web-api tests."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+# Settings are read at import time: point the app at a throwaway database before
+# any ``llm_spec_web`` module is imported.
+_DB_DIR = Path(tempfile.mkdtemp(prefix="llm-spec-web-"))
+os.environ["LLM_SPEC_WEB_DATABASE_URL"] = f"sqlite:///{_DB_DIR / 'test.db'}"
+
+
+@pytest.fixture
+def db() -> Iterator[Session]:
+    """Session on a freshly created schema."""
+    from llm_spec_web.core.db import Base, SessionLocal, engine
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db: Session) -> TestClient:
+    """API client without the lifespan hooks (no execution pool or telemetry)."""
+    from llm_spec_web.main import create_app
+
+    return TestClient(create_app())
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from llm_spec.results.result_types import TestVerdict
+from llm_spec_web.core import metrics
+from llm_spec_web.core.db import SessionLocal
+from llm_spec_web.models.run import RunJob, Task
+from llm_spec_web.repositories.run_repo import RunRepository
+
+
+@pytest.fixture
+def web_metrics() -> Iterator[metrics.WebMetrics]:
+    pytest.importorskip("prometheus_client")
+    yield metrics.configure_metrics(SessionLocal)
+    metrics.shutdown_metrics(SessionLocal)
+
+
+def test_metrics_endpoint_reports_disabled_metrics(client: TestClient) -> None:
+    resp = client.get("/metrics")
+
+    assert resp.status_code >= 400
+    assert resp.json()["error"]["code"] == "CONFIGURATION_ERROR"
+
+
+def test_recording_is_a_noop_until_configured() -> None:
+    metrics.record_case("openai", TestVerdict(case_id="a", test_name="a", status="pass"))
+    metrics.record_registry_lookup("hit")
+
+    assert metrics.get_metrics() is None
+
+
+def test_scrape_after_a_run(
+    web_metrics: metrics.WebMetrics, client: TestClient, db: Session
+) -> None:
+    RunRepository(db).create_task_with_runs(
+        Task(name="t", status="completed"),
+        [
+            RunJob(provider="openai", endpoint="/v1/chat/completions", status="success"),
+            RunJob(provider="openai", endpoint="/v1/responses", status="failed"),
+        ],
+    )
+    for verdict in (
+        TestVerdict(case_id="a", test_name="a", status="pass", latency_ms=120),
+        TestVerdict(case_id="b", test_name="b", status="pass", latency_ms=80),
+        TestVerdict(case_id="c", test_name="c", status="fail", latency_ms=300),
+    ):
+        metrics.record_case("openai", verdict)
+
+    resp = client.get("/metrics")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    body = resp.text
+    assert 'llm_spec_cases_total{provider="openai",status="pass"} 2.0' in body
+    assert 'llm_spec_cases_total{provider="openai",status="fail"} 1.0' in body
+    assert 'llm_spec_case_latency_seconds_count{provider="openai"} 3.0' in body
+    assert 'llm_spec_runs{status="success"} 1.0' in body
+    assert 'llm_spec_runs{status="failed"} 1.0' in body
+    assert 'llm_spec_tasks{status="completed"} 1.0' in body
+    assert "llm_spec_db_commit_seconds_count 0.0" not in body
+    assert "llm_spec_event_subscribers 0.0" in body
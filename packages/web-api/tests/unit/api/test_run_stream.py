@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Any
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from llm_spec_web.api.runs import _encode_sse
+from llm_spec_web.core.event_bus import event_bus
+from llm_spec_web.models.run import RunJob
+
+
+def _running_run(db: Session) -> str:
+    run = RunJob(status="running", provider="openai", endpoint="/v1/chat/completions")
+    db.add(run)
+    db.commit()
+    return run.id
+
+
+def _frames(body: str) -> list[tuple[str, dict[str, Any]]]:
+    frames = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+        if "event" in lines:
+            frames.append((lines["event"], json.loads(lines["data"])))
+    return frames
+
+
+def _finish_when_subscribed(run_id: str) -> threading.Thread:
+    def finish() -> None:
+        deadline = time.monotonic() + 5
+        while event_bus.subscriber_count(run_id) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        event_bus.push(run_id, "run_finished", {"status": "success"})
+
+    thread = threading.Thread(target=finish)
+    thread.start()
+    return thread
+
+
+def test_encode_sse_serializes_each_event_once() -> None:
+    event = {"event_type": "run_started", "payload": {"n": 1}, "created_at": "t", "seq": 1}
+
+    frame = _encode_sse("r1", event)
+    event["payload"] = {"n": 2}
+
+    assert _encode_sse("r1", event) is frame
+    assert frame.startswith("event: run_started\nid: 1\ndata: ")
+    assert json.loads(frame.split("data: ", 1)[1])["payload"] == {"n": 1}
+
+
+def test_coalesced_stream_sends_progress_then_terminal(client: TestClient, db: Session) -> None:
+    run_id = _running_run(db)
+    event_bus.push(run_id, "run_started", {})
+    for i in range(3):
+        event_bus.push(
+            run_id,
+            "test_finished",
+            {"run_case_id": f"c{i}", "progress_done": i + 1, "test_result": {"status": "pass"}},
+        )
+    finisher = _finish_when_subscribed(run_id)
+
+    resp = client.get(f"/api/runs/{run_id}/events/stream", params={"mode": "coalesced"})
+    finisher.join()
+
+    frames = _frames(resp.text)
+    assert [name for name, _ in frames] == ["run_started", "progress", "run_finished", "done"]
+    progress = frames[1][1]
+    assert progress["seq"] == 4 and progress["payload"]["finished_ids"] == ["c0", "c1", "c2"]
+    assert frames[2][1]["seq"] == 5
+
+
+def test_stream_resumes_after_seq(client: TestClient, db: Session) -> None:
+    run_id = _running_run(db)
+    event_bus.push(run_id, "run_started", {})
+    event_bus.push(run_id, "test_finished", {"run_case_id": "c0"})
+    finisher = _finish_when_subscribed(run_id)
+
+    resp = client.get(f"/api/runs/{run_id}/events/stream", params={"after_seq": 1})
+    finisher.join()
+
+    frames = _frames(resp.text)
+    assert [(name, data.get("seq")) for name, data in frames] == [
+        ("test_finished", 2),
+        ("run_finished", 3),
+        ("done", None),
+    ]
+
+
+def test_live_test_results_come_from_the_bus_then_the_database(
+    client: TestClient, db: Session
+) -> None:
+    run_id = _running_run(db)
+    for name in ("a", "b"):
+        event_bus.push(
+            run_id, "test_finished", {"run_case_id": name, "test_result": {"status": "pass"}}
+        )
+
+    live = client.get(f"/api/runs/{run_id}/tests/live", params={"ids": ["b", "x"]}).json()
+    event_bus.cleanup(run_id)
+    persisted = client.get(f"/api/runs/{run_id}/tests/live").json()
+
+    assert live == {"live": True, "results": {"b": {"status": "pass"}}}
+    assert persisted == {"live": False, "results": {}}
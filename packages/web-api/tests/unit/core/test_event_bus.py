@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+from llm_spec_web.core.event_bus import EventBus
+
+
+async def _collect(bus: EventBus, run_id: str, **kwargs: Any) -> list[dict[str, Any]]:
+    return [event async for event in bus.subscribe(run_id, timeout=5.0, **kwargs)]
+
+
+async def _subscribed(bus: EventBus, run_id: str, count: int) -> None:
+    while bus.subscriber_count(run_id) < count:
+        await asyncio.sleep(0)
+
+
+def _types(events: list[dict[str, Any]]) -> list[str]:
+    return [e["event_type"] for e in events]
+
+
+async def test_every_subscriber_gets_every_event() -> None:
+    bus = EventBus()
+    watchers = [asyncio.create_task(_collect(bus, "r1")) for _ in range(3)]
+    await _subscribed(bus, "r1", 3)
+
+    bus.push("r1", "run_started", {})
+    for i in range(5):
+        bus.push("r1", "test_finished", {"test_name": f"t{i}"})
+    bus.push("r1", "run_finished", {"status": "success"})
+
+    results = await asyncio.wait_for(asyncio.gather(*watchers), timeout=5)
+
+    for events in results:
+        assert _types(events) == ["run_started", *["test_finished"] * 5, "run_finished"]
+        assert [e["seq"] for e in events] == list(range(1, 8))
+    assert bus.subscriber_count("r1") == 0
+
+
+async def test_slow_subscriber_drops_test_events_but_keeps_run_events() -> None:
+    bus = EventBus(buffer_size=3)
+    watcher = asyncio.create_task(_collect(bus, "r1"))
+    await _subscribed(bus, "r1", 1)
+
+    # Published without yielding, so the subscriber cannot drain its buffer.
+    bus.push("r1", "run_started", {})
+    for i in range(10):
+        bus.push("r1", "test_finished", {"test_name": f"t{i}"})
+    bus.push("r1", "run_finished", {"status": "success"})
+
+    events = await asyncio.wait_for(watcher, timeout=5)
+
+    assert _types(events) == ["events_dropped", "run_started", "test_finished", "run_finished"]
+    assert events[0]["payload"] == {"count": 9}
+    assert events[2]["payload"] == {"test_name": "t9"}
+
+
+async def test_late_subscriber_replays_history_after_seq() -> None:
+    bus = EventBus(replay_size=10)
+    bus.push("r1", "run_started", {})
+    for i in range(3):
+        bus.push("r1", "test_finished", {"test_name": f"t{i}"})
+    bus.push("r1", "run_finished", {"status": "success"})
+    # The terminal event releases the channel; replay covers runs still in flight.
+    bus.push("r2", "run_started", {})
+    for i in range(3):
+        bus.push("r2", "test_finished", {"test_name": f"t{i}"})
+
+    full = asyncio.create_task(_collect(bus, "r2"))
+    resumed = asyncio.create_task(_collect(bus, "r2", after_seq=2))
+    await _subscribed(bus, "r2", 2)
+    bus.push("r2", "run_finished", {"status": "success"})
+
+    assert [e["seq"] for e in await full] == [1, 2, 3, 4, 5]
+    assert [e["seq"] for e in await resumed] == [3, 4, 5]
+
+
+async def test_push_from_other_threads_reaches_the_subscriber_loop() -> None:
+    bus = EventBus()
+    watcher = asyncio.create_task(_collect(bus, "r1"))
+    await _subscribed(bus, "r1", 1)
+
+    def pool_loop(index: int) -> None:
+        async def publish() -> None:
+            for i in range(20):
+                bus.push("r1", "test_finished", {"test_name": f"w{index}-{i}"})
+
+        asyncio.run(publish())
+
+    threads = [threading.Thread(target=pool_loop, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    bus.push("r1", "run_finished", {"status": "success"})
+
+    events = await asyncio.wait_for(watcher, timeout=5)
+
+    assert len(events) == 81 and events[-1]["event_type"] == "run_finished"
+    assert [e["seq"] for e in events] == list(range(1, 82))
+    names = {e["payload"]["test_name"] for e in events[:-1]}
+    assert names == {f"w{t}-{i}" for t in range(4) for i in range(20)}
+
+
+def _finished(name: str, done: int, passed: int, latency_ms: int) -> dict[str, Any]:
+    return {
+        "run_case_id": name,
+        "progress_done": done,
+        "progress_total": 4,
+        "progress_passed": passed,
+        "progress_failed": done - passed,
+        "test_result": {"status": "pass", "latency_ms": latency_ms},
+    }
+
+
+async def test_coalesced_subscriber_merges_test_events_into_progress() -> None:
+    bus = EventBus()
+    watcher = asyncio.create_task(_collect(bus, "r1", coalesce_interval=0.05))
+    await _subscribed(bus, "r1", 1)
+
+    bus.push("r1", "run_started", {})
+    bus.push("r1", "test_started", {"run_case_id": "a"})
+    bus.push("r1", "test_started", {"run_case_id": "b"})
+    bus.push("r1", "test_finished", _finished("a", 1, 1, 10))
+    bus.push("r1", "test_finished", _finished("b", 2, 1, 30))
+    await asyncio.sleep(0.2)
+    bus.push("r1", "test_finished", _finished("c", 3, 2, 20))
+    bus.push("r1", "run_finished", {"status": "success"})
+
+    events = await asyncio.wait_for(watcher, timeout=5)
+
+    assert _types(events) == ["run_started", "progress", "progress", "run_finished"]
+    first, final = events[1]["payload"], events[2]["payload"]
+    assert first["progress_started"] == 2 and first["progress_done"] == 2
+    assert first["finished_ids"] == ["a", "b"]
+    assert first["latency_ms"]["count"] == 2 and first["latency_ms"]["max"] == 30
+    assert final["finished_ids"] == ["c"]
+    assert (final["progress_done"], final["progress_passed"], final["progress_failed"]) == (3, 2, 1)
+    assert final["latency_ms"]["p50"] == 20
+    assert events[2]["seq"] == 6 and events[3]["seq"] == 7
+    bus.cleanup("r1")
+    assert bus.get_test_results("r1") is None
+
+
+async def test_terminal_event_flushes_pending_progress_first() -> None:
+    bus = EventBus(buffer_size=2)
+    # A long interval: only the terminal event can flush the counters.
+    watcher = asyncio.create_task(_collect(bus, "r1", coalesce_interval=60.0))
+    await _subscribed(bus, "r1", 1)
+
+    for i in range(50):
+        bus.push("r1", "test_finished", _finished(f"t{i}", i + 1, i + 1, 5))
+    bus.push("r1", "run_failed", {"error": "boom"})
+
+    events = await asyncio.wait_for(watcher, timeout=5)
+
+    assert _types(events) == ["progress", "run_failed"]
+    assert events[0]["payload"]["progress_done"] == 50
+    assert len(events[0]["payload"]["finished_ids"]) == 50
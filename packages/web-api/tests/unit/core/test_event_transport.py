@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from llm_spec_web.core.event_bus import EventBus
+from llm_spec_web.core.event_transport import UnixSocketTransport
+
+
+class _Inbox:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, Any]]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, run_id: str, event: dict[str, Any]) -> None:
+        with self._lock:
+            self.events.append((run_id, event))
+
+    def names(self) -> list[str]:
+        with self._lock:
+            return [event["name"] for _, event in self.events]
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def socket_path() -> Iterator[str]:
+    # Short directory: AF_UNIX paths are limited to ~100 bytes.
+    with tempfile.TemporaryDirectory(prefix="ev-") as tmp:
+        yield str(Path(tmp) / "events.sock")
+
+
+def test_unix_transports_round_trip_through_the_hosted_broker(socket_path: str) -> None:
+    host, peer = UnixSocketTransport(socket_path), UnixSocketTransport(socket_path)
+    host_inbox, peer_inbox = _Inbox(), _Inbox()
+    host.start(host_inbox)
+    peer.start(peer_inbox)
+    try:
+        assert host._broker is not None and peer._broker is None
+        _wait_for(lambda: host._broker is not None and len(host._broker._clients) == 2)
+
+        host.publish("r1", {"name": "a"})
+        peer.publish("r1", {"name": "b"})
+
+        for inbox in (host_inbox, peer_inbox):
+            _wait_for(lambda inbox=inbox: len(inbox.events) == 2)
+        assert host_inbox.events == peer_inbox.events
+        assert sorted(peer_inbox.names()) == ["a", "b"]
+    finally:
+        peer.close()
+        host.close()
+
+
+def test_peer_takes_over_the_broker_when_the_host_exits(socket_path: str) -> None:
+    host, peer = UnixSocketTransport(socket_path), UnixSocketTransport(socket_path)
+    host.start(_Inbox())
+    peer_inbox = _Inbox()
+    peer.start(peer_inbox)
+    late = UnixSocketTransport(socket_path)
+    try:
+        host.close()
+        _wait_for(lambda: peer._broker is not None)
+
+        late_inbox = _Inbox()
+        late.start(late_inbox)
+        assert late._broker is None
+        _wait_for(lambda: peer._broker is not None and len(peer._broker._clients) == 2)
+        late.publish("r1", {"name": "after-takeover"})
+
+        _wait_for(lambda: peer_inbox.names() == ["after-takeover"])
+        _wait_for(lambda: late_inbox.names() == ["after-takeover"])
+    finally:
+        late.close()
+        peer.close()
+
+
+async def test_workers_agree_on_seq_assigned_by_the_origin(socket_path: str) -> None:
+    origin_transport = UnixSocketTransport(socket_path)
+    origin = EventBus(transport=origin_transport)
+    watcher = EventBus(transport=UnixSocketTransport(socket_path))
+    try:
+        # Connect both before publishing so the watcher receives every line.
+        origin._ensure_transport()
+        watcher._ensure_transport()
+        broker = origin_transport._broker
+        assert broker is not None
+        _wait_for(lambda: len(broker._clients) == 2)
+        origin.push("r1", "run_started", {})
+        origin.push("r1", "test_finished", {"test_name": "t0"})
+
+        def replayed() -> int:
+            with watcher._lock:
+                return len(watcher._channel("r1").replay)
+
+        _wait_for(lambda: replayed() == 2)
+        # The watcher's subscriber joins mid-run: it must keep the origin's numbering.
+        stream = asyncio.create_task(_drain(watcher.subscribe("r1", timeout=5.0)))
+        while watcher.subscriber_count("r1") == 0:
+            await asyncio.sleep(0.01)
+
+        def publish(worker: int) -> None:
+            for i in range(25):
+                origin.push("r1", "test_finished", {"test_name": f"w{worker}-{i}"})
+
+        threads = [threading.Thread(target=publish, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        origin.push("r1", "run_finished", {"status": "success"})
+
+        events = await asyncio.wait_for(stream, timeout=5)
+
+        assert [e["seq"] for e in events] == list(range(1, 104))
+        assert events[-1]["event_type"] == "run_finished"
+    finally:
+        watcher.close()
+        origin.close()
+
+
+async def _drain(stream: AsyncIterator[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [event async for event in stream]
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, cast
+
+import pytest
+from sqlalchemy.orm import Session
+
+from llm_spec.config.loader import AppConfig
+from llm_spec.executor import (
+    ExecutionProgress,
+    Executor,
+    SuiteContext,
+    SuiteResult,
+    _skipped_verdict,
+)
+from llm_spec.results.result_types import FailureInfo, TestVerdict
+from llm_spec.results.task_result import build_run_result
+from llm_spec.suites.types import ExecutableCase, HttpRequest, SuiteSpec, ValidationSpec
+from llm_spec_web.core.event_bus import event_bus
+from llm_spec_web.models.run import RunJob, Task
+from llm_spec_web.repositories.run_repo import RunRepository
+from llm_spec_web.services import run_execution_service
+from llm_spec_web.services.run_execution_service import RunExecutionService
+
+
+def _case(name: str) -> ExecutableCase:
+    return ExecutableCase(
+        case_id=name,
+        test_name=name,
+        request=HttpRequest(method="POST", endpoint="/v1/chat/completions", params={}),
+        checks=ValidationSpec(),
+        provider="openai",
+    )
+
+
+def _verdicts(cases: list[ExecutableCase], statuses: list[str]) -> list[TestVerdict]:
+    baseline = TestVerdict(
+        case_id=cases[0].case_id,
+        test_name=cases[0].test_name,
+        status="fail",
+        failure=FailureInfo(stage="validation", code="SCHEMA", message="bad"),
+    )
+    out: list[TestVerdict] = []
+    for case, status in zip(cases, statuses, strict=True):
+        if status == "skipped":
+            out.append(_skipped_verdict(case, baseline))
+        elif status == "fail":
+            out.append(baseline)
+        else:
+            out.append(TestVerdict(case_id=case.case_id, test_name=case.test_name, status="pass"))
+    return out
+
+
+def _fake_run_task_suites(statuses: list[str]) -> Any:
+    async def run_task_suites(
+        *, suite_ids: list[str], on_suite_start, on_test_done, on_suite_done, **_: Any
+    ) -> None:
+        for sid in suite_ids:
+            suite = SuiteSpec(
+                suite_id=sid,
+                suite_name=sid,
+                provider_id="openai",
+                model_id="m",
+                route_id="chat",
+                api_family="openai",
+                endpoint="/v1/chat/completions",
+            )
+            cases = [_case(f"t{i}") for i in range(len(statuses))]
+            ctx = SuiteContext(suite=suite, cases=cases, executor=Executor(client=cast(Any, None)))
+            await on_suite_start(ctx)
+            verdicts = _verdicts(cases, statuses)
+            for i, (case, verdict) in enumerate(zip(cases, verdicts, strict=True)):
+                await on_test_done(ExecutionProgress(case, verdict, i, i + 1, len(cases)))
+            run_result = build_run_result(
+                run_id=sid,
+                started_at="",
+                finished_at="",
+                provider="openai",
+                model="m",
+                route="chat",
+                endpoint=suite.endpoint,
+                verdicts=verdicts,
+            )
+            await on_suite_done(ctx, SuiteResult(suite, verdicts, run_result))
+
+    return run_task_suites
+
+
+@pytest.mark.parametrize(
+    ("statuses", "expected"),
+    [
+        (["fail", "skipped", "skipped", "pass"], ("failed", 1, 1, 2)),
+        (["pass", "skipped", "pass"], ("success", 2, 0, 1)),
+    ],
+)
+async def test_baseline_skips_are_not_counted_as_failures(
+    db: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    statuses: list[str],
+    expected: tuple[str, int, int, int],
+) -> None:
+    monkeypatch.setattr(run_execution_service, "run_task_suites", _fake_run_task_suites(statuses))
+    monkeypatch.setattr(run_execution_service, "load_config", lambda _path: AppConfig())
+    monkeypatch.setattr(run_execution_service.SuiteService, "get_registry", lambda _self: None)
+    task, (run,) = RunRepository(db).create_task_with_runs(
+        Task(name="t"),
+        [RunJob(provider="openai", endpoint="/v1/chat/completions", suite_id="s1")],
+    )
+    events = asyncio.create_task(_drain(run.id))
+    while event_bus.subscriber_count(run.id) == 0:
+        await asyncio.sleep(0.01)
+
+    await RunExecutionService().execute_task_async(db, task.id)
+
+    finished = [e["payload"] for e in await asyncio.wait_for(events, 5) if e["seq"]]
+    db.refresh(run)
+    status, passed, failed, skipped = expected
+    assert (run.status, run.progress_passed, run.progress_failed) == (status, passed, failed)
+    assert finished[-1] == {
+        "status": status,
+        "passed": passed,
+        "failed": failed,
+        "skipped": skipped,
+    }
+    last_test = finished[-2]
+    assert (last_test["progress_failed"], last_test["progress_skipped"]) == (failed, skipped)
+
+
+async def _drain(run_id: str) -> list[dict[str, Any]]:
+    return [event async for event in event_bus.subscribe(run_id, timeout=5.0)]
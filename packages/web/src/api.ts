@@ -30,10 +30,11 @@ export function refreshSuiteRegistryCache(): Promise<{
 // Task API functions
 export function createTask(input: {
   suite_ids: string[];
-  mode?: "real" | "mock";
+  mode?: "real" | "mock" | "replay";
   selected_tests_by_suite?: Record<string, string[]>;
   name?: string;
   max_concurrent?: number;
+  mock_latency?: "zero" | "fast" | "realistic" | "legacy" | "recorded";
 }): Promise<TaskWithRuns> {
   return request<TaskWithRuns>("/api/tasks", {
     method: "POST",
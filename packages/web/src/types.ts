@@ -134,6 +134,16 @@ export type TestResultRow = {
   request?: {
     http_status: number;
     latency_ms: number;
+    // Milliseconds per execution phase (resolve, connect, ttfb, schema, callback, ...)
+    timings?: Record<string, number>;
+    // Milliseconds until the first stream chunk (streaming cases)
+    ttft_ms?: number;
+    // Wait for a concurrency slot, kept out of latency_ms
+    queue_ms?: number;
+    queued_at?: string;
+    dispatched_at?: string;
+    first_byte_at?: string;
+    finished_at?: string;
   };
   result?: {
     status: string;